@@ -1,3 +1,4 @@
+from app.adapters.audio.alsa_mixer_volume_controller import AlsaMixerVolumeController
 from app.adapters.audio.alsa_volume_controller import AlsaVolumeController
 from app.adapters.audio.macos_volume_controller import MacOSVolumeController
 from app.adapters.audio.unsupported_volume_controller import (
@@ -6,6 +7,7 @@ from app.adapters.audio.unsupported_volume_controller import (
 )
 
 __all__ = [
+    "AlsaMixerVolumeController",
     "AlsaVolumeController",
     "MacOSVolumeController",
     "UnavailableVolumeController",
@@ -0,0 +1,177 @@
+import select
+import threading
+from importlib import import_module
+from typing import Any, Callable, Optional
+
+from app.core.logger import Logger
+from app.exceptions.audio import AudioVolumeError, AudioVolumeUnavailable
+
+_log = Logger(name=__name__)
+
+_POLL_TIMEOUT_MS = 500
+
+
+def _open_mixer(control: str) -> Any:
+    try:
+        alsaaudio: Any = import_module("alsaaudio")
+    except (ImportError, OSError) as error:
+        raise AudioVolumeUnavailable(
+            f"ALSA mixer control is unavailable: {error}"
+        ) from error
+    try:
+        return alsaaudio.Mixer(control)
+    except alsaaudio.ALSAAudioError as error:
+        raise AudioVolumeUnavailable(
+            f"ALSA mixer control '{control}' is unavailable: {error}"
+        ) from error
+
+
+class AlsaMixerVolumeController:
+    """
+    Controls an ALSA mixer element directly through the optional ``pyalsaaudio``
+    package, without spawning ``amixer``.
+
+    The volume is cached. ``set_volume`` only records the requested value and
+    returns; a writer thread applies the latest request, so a burst of requests
+    from a dragged slider results in a few mixer writes. A failed write is
+    therefore not raised to the caller: the actual volume is re-read and
+    reported to the change listener instead. Changes made by other programs are
+    picked up by polling the mixer's event descriptors and reported to the
+    change listener.
+    """
+
+    def __init__(
+        self,
+        control: str = "Master",
+        mixer_factory: Optional[Callable[[str], Any]] = None,
+    ) -> None:
+        self._mixer = (mixer_factory or _open_mixer)(control)
+        self._mixer_lock = threading.Lock()
+        self._cond = threading.Condition()
+        self._volume: Optional[int] = None
+        self._pending: Optional[int] = None
+        self._closed = False
+        self._listener: Optional[Callable[[int], None]] = None
+        self._writer = threading.Thread(
+            target=self._write_loop, name="alsa-volume-writer", daemon=True
+        )
+        self._writer.start()
+        self._poller: Optional[threading.Thread] = None
+
+    def get_volume(self) -> int:
+        with self._cond:
+            if self._volume is not None:
+                return self._volume
+        volume = self._read_volume()
+        with self._cond:
+            if self._volume is None:
+                self._volume = volume
+            return self._volume
+
+    def set_volume(self, volume: int) -> None:
+        with self._cond:
+            if self._closed:
+                raise AudioVolumeUnavailable("ALSA mixer control is closed.")
+            self._volume = volume
+            self._pending = volume
+            self._cond.notify()
+
+    def set_change_listener(self, listener: Optional[Callable[[int], None]]) -> None:
+        """
+        Registers a callback invoked from a background thread with the new
+        volume whenever another program changes it.
+        """
+        self._listener = listener
+        if listener is not None and self._poller is None:
+            self._poller = threading.Thread(
+                target=self._poll_loop, name="alsa-volume-events", daemon=True
+            )
+            self._poller.start()
+
+    def close(self) -> None:
+        with self._cond:
+            self._closed = True
+            self._cond.notify()
+        self._writer.join(timeout=1)
+        if self._poller is not None:
+            self._poller.join(timeout=1)
+
+    def _read_volume(self) -> int:
+        try:
+            with self._mixer_lock:
+                channels = self._mixer.getvolume()
+        except Exception as error:
+            raise AudioVolumeError(
+                f"Failed to read the ALSA volume: {error}"
+            ) from error
+        if not channels:
+            raise AudioVolumeError("The ALSA mixer reported no volume channels.")
+        return round(sum(channels) / len(channels))
+
+    def _write_loop(self) -> None:
+        while True:
+            with self._cond:
+                while self._pending is None and not self._closed:
+                    self._cond.wait()
+                if self._closed:
+                    return
+                volume = self._pending
+                self._pending = None
+            try:
+                with self._mixer_lock:
+                    self._mixer.setvolume(volume)
+            except Exception as error:
+                _log.error("Failed to set the ALSA volume to %s%%: %s", volume, error)
+                self._restore_volume()
+
+    def _restore_volume(self) -> None:
+        """
+        Re-reads the volume after a failed write and reports it to the change
+        listener, so that clients already told about the requested volume
+        correct themselves.
+        """
+        try:
+            volume: Optional[int] = self._read_volume()
+        except AudioVolumeError as error:
+            _log.error("%s", error)
+            volume = None
+        with self._cond:
+            if self._pending is not None:
+                return
+            self._volume = volume
+        listener = self._listener
+        if listener is not None and volume is not None:
+            listener(volume)
+
+    def _poll_loop(self) -> None:
+        try:
+            with self._mixer_lock:
+                descriptors = self._mixer.polldescriptors()
+        except Exception as error:
+            _log.warning("ALSA mixer events are unavailable: %s", error)
+            return
+
+        poller = select.poll()
+        for fd, eventmask in descriptors:
+            poller.register(fd, eventmask)
+
+        while not self._closed:
+            if not poller.poll(_POLL_TIMEOUT_MS):
+                continue
+            try:
+                with self._mixer_lock:
+                    self._mixer.handleevents()
+                volume = self._read_volume()
+            except Exception as error:
+                _log.error("Failed to handle ALSA mixer events: %s", error)
+                continue
+            self._on_external_volume(volume)
+
+    def _on_external_volume(self, volume: int) -> None:
+        with self._cond:
+            if self._pending is not None or volume == self._volume:
+                return
+            self._volume = volume
+        listener = self._listener
+        if listener is not None:
+            listener(volume)
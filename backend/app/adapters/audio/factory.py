@@ -2,20 +2,31 @@ import platform
 import shutil
 from typing import Callable, Optional
 
+from app.adapters.audio.alsa_mixer_volume_controller import AlsaMixerVolumeController
 from app.adapters.audio.alsa_volume_controller import AlsaVolumeController
 from app.adapters.audio.macos_volume_controller import MacOSVolumeController
 from app.adapters.audio.unsupported_volume_controller import (
     UnavailableVolumeController,
     UnsupportedVolumeController,
 )
+from app.core.logger import Logger
+from app.exceptions.audio import AudioVolumeUnavailable
 from app.services.media.volume_controller import VolumeController
 
+_log = Logger(name=__name__)
+
 
 def create_volume_controller(
     system_name: Optional[str] = None,
     command_lookup: Callable[[str], Optional[str]] = shutil.which,
+    alsa_mixer_factory: Callable[[], VolumeController] = AlsaMixerVolumeController,
 ) -> VolumeController:
-    """Create the best system volume controller for the current platform."""
+    """
+    Create the best system volume controller for the current platform.
+
+    On Linux, the ALSA mixer is controlled directly when ``pyalsaaudio`` is
+    installed, falling back to the ``amixer`` command otherwise.
+    """
     current_system = system_name or platform.system()
 
     if current_system == "Darwin":
@@ -26,6 +37,10 @@ def create_volume_controller(
         )
 
     if current_system == "Linux":
+        try:
+            return alsa_mixer_factory()
+        except AudioVolumeUnavailable as error:
+            _log.info("%s Falling back to amixer.", error)
         if command_lookup("amixer") is not None:
             return AlsaVolumeController()
         return UnavailableVolumeController(
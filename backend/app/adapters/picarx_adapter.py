@@ -7,6 +7,7 @@ from app.exceptions.robot import (
     RobotI2CTimeout,
     ServoNotFoundError,
 )
+from app.managers.i2c_bus_scheduler import BusPriority, I2CBusScheduler
 from app.schemas.robot.config import HardwareConfig
 from app.schemas.robot.motors import (
     GPIODCMotorConfig,
@@ -37,10 +38,14 @@ if TYPE_CHECKING:
 
 class PicarxAdapter:
     def __init__(
-        self, config_manager: "JsonDataManager", smbus_manager: SMBusManager
+        self,
+        config_manager: "JsonDataManager",
+        smbus_manager: SMBusManager,
+        bus_scheduler: Optional[I2CBusScheduler] = None,
     ) -> None:
         self.config_manager = config_manager
         self.smbus_manager = smbus_manager
+        self.bus = bus_scheduler or I2CBusScheduler()
         self._motor_addresses: List[int] = []
         self.cam_pan_servo: Optional[ServoService] = None
         self.cam_tilt_servo: Optional[ServoService] = None
@@ -112,7 +117,12 @@ class PicarxAdapter:
         if not self.steering_servo:
             raise ServoNotFoundError("Steering servo not configured")
         try:
-            self.steering_servo.set_angle(value)
+            steering_servo = self.steering_servo
+            self.bus.call(
+                BusPriority.STEERING,
+                lambda: steering_servo.set_angle(value),
+                key="steering",
+            )
         except TimeoutError:
             raise RobotI2CTimeout(
                 operation="set direction servo angle",
@@ -141,7 +151,12 @@ class PicarxAdapter:
         if not self.cam_pan_servo:
             raise ServoNotFoundError("Pan servo is not configured")
         try:
-            self.cam_pan_servo.set_angle(value)
+            cam_pan_servo = self.cam_pan_servo
+            self.bus.call(
+                BusPriority.CAMERA,
+                lambda: cam_pan_servo.set_angle(value),
+                key="cam_pan",
+            )
         except TimeoutError:
             raise RobotI2CTimeout(
                 operation="set camera pan angle",
@@ -171,7 +186,12 @@ class PicarxAdapter:
             raise ServoNotFoundError("Tilt servo is not configured")
 
         try:
-            self.cam_tilt_servo.set_angle(value)
+            cam_tilt_servo = self.cam_tilt_servo
+            self.bus.call(
+                BusPriority.CAMERA,
+                lambda: cam_tilt_servo.set_angle(value),
+                key="cam_tilt",
+            )
         except TimeoutError:
             raise RobotI2CTimeout(
                 operation="set camera tilt angle",
@@ -195,7 +215,12 @@ class PicarxAdapter:
         """
         if not self.motor_controller:
             raise MotorNotFoundError("Motors not found or not configured")
-        self.motor_controller.move(speed, direction)
+        motor_controller = self.motor_controller
+        self.bus.call(
+            BusPriority.MOTOR,
+            lambda: motor_controller.move(speed, direction),
+            key="motors",
+        )
 
     def forward(self, speed: int) -> None:
         """
@@ -270,7 +295,9 @@ class PicarxAdapter:
         if not self.motor_controller:
             raise MotorNotFoundError("Motors not found or not configured")
         try:
-            return self.motor_controller.stop_all()
+            return self.bus.call(
+                BusPriority.EMERGENCY, self.motor_controller.stop_all, key="stop"
+            )
         except TimeoutError:
             raise RobotI2CTimeout(
                 operation="stop motors",
@@ -0,0 +1,453 @@
+import ctypes
+import fcntl
+import mmap
+import os
+import select
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from fractions import Fraction
+from typing import Any, Iterator, List, Optional, Tuple
+
+import cv2
+import numpy as np
+from app.core.logger import Logger
+from app.core.video_capture_abc import VideoCaptureABC
+from app.exceptions.camera import CameraDeviceError
+from app.schemas.camera import CameraSettings
+from app.services.camera.v4l2_service import V4L2Service
+from v4l2 import (
+    V4L2_BUF_TYPE_VIDEO_CAPTURE,
+    V4L2_CAP_STREAMING,
+    V4L2_CAP_VIDEO_CAPTURE,
+    V4L2_FIELD_ANY,
+    V4L2_MEMORY_MMAP,
+    VIDIOC_DQBUF,
+    VIDIOC_G_FMT,
+    VIDIOC_QBUF,
+    VIDIOC_QUERYBUF,
+    VIDIOC_QUERYCAP,
+    VIDIOC_REQBUFS,
+    VIDIOC_S_FMT,
+    VIDIOC_S_PARM,
+    VIDIOC_STREAMOFF,
+    VIDIOC_STREAMON,
+    v4l2_buffer,
+    v4l2_capability,
+    v4l2_format,
+    v4l2_requestbuffers,
+    v4l2_streamparm,
+)
+
+_log = Logger(name=__name__)
+
+# not defined by the v4l2 module
+V4L2_BUF_FLAG_ERROR = 0x00000040
+V4L2_BUF_FLAG_TIMESTAMP_MASK = 0x0000E000
+V4L2_BUF_FLAG_TIMESTAMP_MONOTONIC = 0x00002000
+V4L2_CAP_DEVICE_CAPS = 0x80000000
+
+SUPPORTED_PIXEL_FORMATS = ("YUYV", "NV12", "MJPG", "JPEG")
+
+
+def str_to_fourcc(pixel_format: str) -> int:
+    """
+    Returns the FOURCC code of a pixel format string, e.g. 'YUYV'.
+    """
+    code = pixel_format.ljust(4)[:4]
+    return sum(ord(char) << (8 * i) for i, char in enumerate(code))
+
+
+@dataclass(frozen=True)
+class V4L2Frame:
+    """
+    A captured frame whose `data` is a view over the memory-mapped driver
+    buffer, valid until the buffer is queued back to the driver.
+
+    `timestamp` is the capture time reported by the kernel, comparable with
+    `time.monotonic()`, and `sequence` the frame counter of the driver.
+    """
+
+    data: np.ndarray
+    index: int
+    sequence: int
+    timestamp: float
+    pixel_format: str
+    width: int
+    height: int
+    bytes_per_line: int
+
+
+def frame_to_bgr(frame: V4L2Frame) -> np.ndarray:
+    """
+    Converts a raw frame into a new BGR image, reading the driver buffer in
+    place.
+
+    Raises:
+        ValueError: If the pixel format is not supported or the frame is
+        truncated.
+    """
+    width, height, stride = frame.width, frame.height, frame.bytes_per_line
+    data = frame.data
+    pixel_format = frame.pixel_format
+
+    if pixel_format in ("MJPG", "JPEG"):
+        image = cv2.imdecode(data, cv2.IMREAD_COLOR)
+        if image is None:
+            raise ValueError("Failed to decode a JPEG frame")
+        return image
+
+    if pixel_format == "YUYV":
+        shape, strides = (height, width, 2), (stride, 2, 1)
+        code = cv2.COLOR_YUV2BGR_YUYV
+    elif pixel_format == "NV12":
+        shape, strides = (height * 3 // 2, width), (stride, 1)
+        code = cv2.COLOR_YUV2BGR_NV12
+    else:
+        raise ValueError(f"Unsupported pixel format {pixel_format!r}")
+
+    needed = (shape[0] - 1) * stride + shape[1] * strides[1]
+    if len(data) < needed:
+        raise ValueError(f"Truncated frame: {len(data)} of {needed} bytes")
+    image = np.ndarray(shape, dtype=np.uint8, buffer=data, strides=strides)
+    return cv2.cvtColor(image, code)
+
+
+def _ioctl(fd: int, request: int, arg: Any) -> Any:
+    while True:
+        try:
+            return fcntl.ioctl(fd, request, arg)
+        except InterruptedError:
+            continue
+
+
+class V4L2MmapStream:
+    """
+    Streaming capture from a V4L2 device through a queue of memory-mapped
+    driver buffers (`VIDIOC_REQBUFS`, `VIDIOC_QBUF`, `VIDIOC_DQBUF`).
+
+    Dequeued frames are views over the driver buffers, so no frame is copied
+    before a consumer converts it; the buffer returns to the driver once the
+    frame is requeued. Gaps in the driver frame counter are counted in
+    `dropped_frames`.
+    """
+
+    def __init__(
+        self,
+        device_path: str,
+        width: Optional[int] = None,
+        height: Optional[int] = None,
+        pixel_format: Optional[str] = None,
+        fps: Optional[float] = None,
+        buffer_count: int = 4,
+    ) -> None:
+        self.device_path = device_path
+        self.fd = os.open(device_path, os.O_RDWR | os.O_NONBLOCK)
+        self._maps: List[mmap.mmap] = []
+        self._buffers: List[np.ndarray] = []
+        self._streaming = False
+        self._last_sequence: Optional[int] = None
+        self.dropped_frames = 0
+        self.fps: Optional[float] = None
+        try:
+            self._check_capabilities()
+            self._set_format(width, height, pixel_format)
+            if fps:
+                self._set_fps(fps)
+            self._request_buffers(buffer_count)
+            for index in range(len(self._buffers)):
+                self._queue(index)
+            _ioctl(self.fd, VIDIOC_STREAMON, ctypes.c_int(V4L2_BUF_TYPE_VIDEO_CAPTURE))
+            self._streaming = True
+        except BaseException:
+            self.close()
+            raise
+
+    def _check_capabilities(self) -> None:
+        cap = v4l2_capability()
+        _ioctl(self.fd, VIDIOC_QUERYCAP, cap)
+        caps = cap.capabilities
+        if caps & V4L2_CAP_DEVICE_CAPS:
+            # the capabilities of this device node, stored after `capabilities`
+            caps = cap.reserved[0]
+        if not caps & V4L2_CAP_VIDEO_CAPTURE or not caps & V4L2_CAP_STREAMING:
+            raise CameraDeviceError(
+                f"{self.device_path} does not support streaming capture"
+            )
+
+    def _set_format(
+        self,
+        width: Optional[int],
+        height: Optional[int],
+        pixel_format: Optional[str],
+    ) -> None:
+        fmt = v4l2_format()
+        fmt.type = V4L2_BUF_TYPE_VIDEO_CAPTURE
+        _ioctl(self.fd, VIDIOC_G_FMT, fmt)
+        if width and height:
+            fmt.fmt.pix.width = width
+            fmt.fmt.pix.height = height
+        if pixel_format:
+            fmt.fmt.pix.pixelformat = str_to_fourcc(pixel_format)
+        fmt.fmt.pix.field = V4L2_FIELD_ANY
+        _ioctl(self.fd, VIDIOC_S_FMT, fmt)
+
+        self.width = int(fmt.fmt.pix.width)
+        self.height = int(fmt.fmt.pix.height)
+        self.pixel_format = V4L2Service.fourcc_to_str(fmt.fmt.pix.pixelformat)
+        self.bytes_per_line = int(fmt.fmt.pix.bytesperline)
+        if self.pixel_format not in SUPPORTED_PIXEL_FORMATS:
+            raise CameraDeviceError(
+                f"Unsupported pixel format {self.pixel_format!r} for mmap capture"
+            )
+        if not self.bytes_per_line:
+            self.bytes_per_line = self.width * (2 if self.pixel_format == "YUYV" else 1)
+
+    def _set_fps(self, fps: float) -> None:
+        interval = 1 / Fraction(fps).limit_denominator(1001)
+        parm = v4l2_streamparm()
+        parm.type = V4L2_BUF_TYPE_VIDEO_CAPTURE
+        parm.parm.capture.timeperframe.numerator = interval.numerator
+        parm.parm.capture.timeperframe.denominator = interval.denominator
+        try:
+            _ioctl(self.fd, VIDIOC_S_PARM, parm)
+        except OSError as e:
+            _log.warning("Failed to set %s fps on %s: %s", fps, self.device_path, e)
+            return
+        frame_interval = parm.parm.capture.timeperframe
+        if frame_interval.numerator:
+            self.fps = frame_interval.denominator / frame_interval.numerator
+
+    def _request_buffers(self, count: int) -> None:
+        req = v4l2_requestbuffers()
+        req.count = count
+        req.type = V4L2_BUF_TYPE_VIDEO_CAPTURE
+        req.memory = V4L2_MEMORY_MMAP
+        _ioctl(self.fd, VIDIOC_REQBUFS, req)
+        if req.count < 2:
+            raise CameraDeviceError(
+                f"{self.device_path} granted {req.count} capture buffers"
+            )
+
+        for index in range(req.count):
+            buf = self._new_buffer(index)
+            _ioctl(self.fd, VIDIOC_QUERYBUF, buf)
+            mapping = mmap.mmap(
+                self.fd,
+                buf.length,
+                flags=mmap.MAP_SHARED,
+                prot=mmap.PROT_READ | mmap.PROT_WRITE,
+                offset=buf.m.offset,
+            )
+            self._maps.append(mapping)
+            self._buffers.append(np.frombuffer(mapping, dtype=np.uint8))
+
+    @staticmethod
+    def _new_buffer(index: int = 0) -> v4l2_buffer:
+        buf = v4l2_buffer()
+        buf.index = index
+        buf.type = V4L2_BUF_TYPE_VIDEO_CAPTURE
+        buf.memory = V4L2_MEMORY_MMAP
+        return buf
+
+    def _queue(self, index: int) -> None:
+        _ioctl(self.fd, VIDIOC_QBUF, self._new_buffer(index))
+
+    @property
+    def buffer_count(self) -> int:
+        return len(self._buffers)
+
+    def dequeue(self, timeout: Optional[float] = None) -> Optional[V4L2Frame]:
+        """
+        Waits up to `timeout` seconds for the next filled buffer and returns
+        it as a frame, or None on timeout. The frame must be passed to
+        `requeue` once it is no longer used.
+        """
+        buf = self._new_buffer()
+        while True:
+            try:
+                _ioctl(self.fd, VIDIOC_DQBUF, buf)
+                break
+            except BlockingIOError:
+                readable, _, _ = select.select([self.fd], [], [], timeout)
+                if not readable:
+                    return None
+
+        if buf.flags & V4L2_BUF_FLAG_ERROR:
+            _log.debug("Buffer %s of %s is corrupted", buf.index, self.device_path)
+
+        if (
+            buf.flags & V4L2_BUF_FLAG_TIMESTAMP_MASK
+        ) == V4L2_BUF_FLAG_TIMESTAMP_MONOTONIC:
+            timestamp = buf.timestamp.secs + buf.timestamp.usecs / 1e6
+        else:
+            timestamp = time.monotonic()
+
+        self._count_dropped(buf.sequence)
+        return V4L2Frame(
+            data=self._buffers[buf.index][: buf.bytesused],
+            index=buf.index,
+            sequence=buf.sequence,
+            timestamp=timestamp,
+            pixel_format=self.pixel_format,
+            width=self.width,
+            height=self.height,
+            bytes_per_line=self.bytes_per_line,
+        )
+
+    def _count_dropped(self, sequence: int) -> None:
+        last = self._last_sequence
+        if last is not None and sequence > last + 1:
+            self.dropped_frames += sequence - last - 1
+        self._last_sequence = sequence
+
+    def requeue(self, frame: V4L2Frame) -> None:
+        """
+        Returns the buffer of a frame to the driver.
+        """
+        if self._streaming:
+            self._queue(frame.index)
+
+    def close(self) -> None:
+        if self.fd < 0:
+            return
+        if self._streaming:
+            self._streaming = False
+            try:
+                _ioctl(
+                    self.fd,
+                    VIDIOC_STREAMOFF,
+                    ctypes.c_int(V4L2_BUF_TYPE_VIDEO_CAPTURE),
+                )
+            except OSError as e:
+                _log.warning("VIDIOC_STREAMOFF failed on %s: %s", self.device_path, e)
+        self._buffers.clear()
+        unmapped = True
+        for mapping in self._maps:
+            try:
+                mapping.close()
+            except BufferError:
+                # a consumer still holds a view; the mapping is unmapped once
+                # the view is garbage collected.
+                unmapped = False
+        if self._maps and unmapped:
+            req = v4l2_requestbuffers()
+            req.count = 0
+            req.type = V4L2_BUF_TYPE_VIDEO_CAPTURE
+            req.memory = V4L2_MEMORY_MMAP
+            try:
+                _ioctl(self.fd, VIDIOC_REQBUFS, req)
+            except OSError:
+                pass
+        self._maps.clear()
+        try:
+            os.close(self.fd)
+        finally:
+            self.fd = -1
+
+
+class V4l2MmapCaptureAdapter(VideoCaptureABC):
+    """
+    Captures from a V4L2 device through memory-mapped driver buffers.
+
+    Unlike `V4l2CaptureAdapter`, which lets OpenCV copy each frame into its
+    own buffer before converting it, frames are converted to BGR straight
+    from the driver buffers, and only in `read`: `raw_frame` exposes the
+    driver buffer itself. Frames carry the kernel capture timestamps, and
+    gaps in the driver frame counter are reported as `dropped_frames`.
+    """
+
+    BUFFER_COUNT = 4
+    READ_TIMEOUT = 5.0
+
+    def __init__(
+        self,
+        device: str,
+        camera_settings: CameraSettings,
+        service: V4L2Service,
+    ) -> None:
+        super().__init__(service=service)
+        self.service = service
+        self._frame_timestamp: Optional[float] = None
+        self._stream, self._settings = self._open(device, camera_settings)
+
+    @property
+    def settings(self) -> CameraSettings:
+        return self._settings
+
+    @property
+    def frame_timestamp(self) -> Optional[float]:
+        return self._frame_timestamp
+
+    @property
+    def dropped_frames(self) -> int:
+        return self._stream.dropped_frames
+
+    @contextmanager
+    def raw_frame(self, timeout: Optional[float] = None) -> Iterator[V4L2Frame]:
+        """
+        Yields the next frame as a view over the driver buffer, and returns
+        the buffer to the driver on exit.
+
+        Raises:
+            CameraDeviceError: If no frame arrives within the timeout.
+        """
+        frame = self._stream.dequeue(self.READ_TIMEOUT if timeout is None else timeout)
+        if frame is None:
+            raise CameraDeviceError("Timed out waiting for a frame")
+        self._frame_timestamp = frame.timestamp
+        try:
+            yield frame
+        finally:
+            self._stream.requeue(frame)
+
+    def read(self) -> Tuple[bool, np.ndarray]:
+        try:
+            with self.raw_frame() as frame:
+                return True, frame_to_bgr(frame)
+        except (CameraDeviceError, ValueError, OSError) as e:
+            _log.error("Failed to read a frame: %s", e)
+            return False, np.empty((0, 0), dtype=np.uint8)
+
+    def release(self) -> None:
+        self._stream.close()
+
+    def _open(
+        self, device: str, camera_settings: CameraSettings
+    ) -> Tuple[V4L2MmapStream, CameraSettings]:
+        try:
+            stream = V4L2MmapStream(
+                device,
+                width=camera_settings.width,
+                height=camera_settings.height,
+                pixel_format=camera_settings.pixel_format,
+                fps=camera_settings.fps,
+                buffer_count=self.BUFFER_COUNT,
+            )
+        except OSError as e:
+            raise CameraDeviceError(f"Video capture failed: {e}") from e
+
+        try:
+            frame = stream.dequeue(self.READ_TIMEOUT)
+            if frame is None:
+                raise CameraDeviceError("Video capture failed")
+            try:
+                frame_to_bgr(frame)
+            except ValueError as e:
+                raise CameraDeviceError(f"Video capture failed: {e}") from e
+            finally:
+                stream.requeue(frame)
+        except BaseException:
+            stream.close()
+            raise
+
+        updated_settings = {
+            **camera_settings.model_dump(),
+            "use_gstreamer": False,
+            "device": device,
+            "width": stream.width,
+            "height": stream.height,
+            "fps": stream.fps or camera_settings.fps,
+            "pixel_format": stream.pixel_format,
+        }
+        return stream, CameraSettings(**updated_settings)
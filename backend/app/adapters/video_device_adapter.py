@@ -4,6 +4,7 @@ from app.adapters.avfoundation_capture_adapter import AVFoundationCaptureAdapter
 from app.adapters.gstreamer_capture_adapter import GStreamerCaptureAdapter
 from app.adapters.picamera_capture_adapter import PicameraCaptureAdapter
 from app.adapters.v4l2_capture_adapter import V4l2CaptureAdapter
+from app.adapters.v4l2_mmap_capture_adapter import V4l2MmapCaptureAdapter
 from app.core.gstreamer_parser import GStreamerParser
 from app.core.logger import Logger
 from app.core.video_capture_abc import VideoCaptureABC
@@ -64,11 +65,7 @@ class VideoDeviceAdapter:
                 device_path, camera_settings=camera_settings, service=self.picam_service
             ),
             "v4l2": lambda: (
-                V4l2CaptureAdapter(
-                    device_path,
-                    camera_settings=camera_settings,
-                    service=self.v4l2_service,
-                )
+                self._open_v4l2(device_path, camera_settings)
                 if not camera_settings.use_gstreamer
                 else GStreamerCaptureAdapter(
                     device,
@@ -88,6 +85,31 @@ class VideoDeviceAdapter:
         cap = cap_worker()
         return cap, cap.settings
 
+    def _open_v4l2(
+        self, device_path: str, camera_settings: CameraSettings
+    ) -> VideoCaptureABC:
+        """
+        Opens a V4L2 device with memory-mapped capture, falling back to OpenCV
+        for devices or pixel formats it does not support.
+        """
+        try:
+            return V4l2MmapCaptureAdapter(
+                device_path,
+                camera_settings=camera_settings,
+                service=self.v4l2_service,
+            )
+        except CameraDeviceError as e:
+            _log.warning(
+                "Memory-mapped capture failed on %s, falling back to OpenCV: %s",
+                device_path,
+                e,
+            )
+        return V4l2CaptureAdapter(
+            device_path,
+            camera_settings=camera_settings,
+            service=self.v4l2_service,
+        )
+
     def list_devices(self) -> List[DeviceType]:
         if is_macos():
             self.devices = self.avfoundation_service.list_video_devices()
@@ -2,14 +2,26 @@ import app.api.control.battery as battery
 import app.api.control.car_control as car_control
 import app.api.control.distance as distance
 import app.api.control.integration as integration
+import app.api.control.ipc as ipc
 import app.api.control.pinout as pinout
 import app.api.control.settings as settings
 import app.api.control.system as system
+import app.api.control.telemetry as telemetry
 from app.util.endpoints_metadata import build_routers_and_metadata
 from fastapi import APIRouter
 
 routers, tags_metadata = build_routers_and_metadata(
-    [system, settings, car_control, battery, distance, integration, pinout]
+    [
+        system,
+        settings,
+        car_control,
+        battery,
+        distance,
+        integration,
+        pinout,
+        telemetry,
+        ipc,
+    ]
 )
 
 api_router = APIRouter()
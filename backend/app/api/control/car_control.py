@@ -4,16 +4,22 @@ WebSocket endpoint for controlling and interacting with the robot.
 
 import asyncio
 import json
-from typing import TYPE_CHECKING, Annotated
+from typing import TYPE_CHECKING, Annotated, Set
 
 from app.api import robot_deps
 from app.core.px_logger import Logger
 from app.exceptions.robot import (
+    ControlProtocolError,
     MotorNotFoundError,
     RobotI2CBusError,
     RobotI2CTimeout,
     ServoNotFoundError,
 )
+from app.services.control.control_protocol import (
+    BINARY_SUBPROTOCOL,
+    ControlCommand,
+    decode_command,
+)
 from fastapi import APIRouter, Depends, WebSocket, WebSocketDisconnect
 from starlette.websockets import WebSocketState
 
@@ -37,10 +43,38 @@ async def websocket_endpoint(
 ):
     """
     WebSocket endpoint for controlling the robot.
+
+    Clients that offer the `px-binary.v1` subprotocol may also send drive
+    commands as binary frames (see `app.services.control.control_protocol`),
+    which are acknowledged with binary frames once applied.
     """
     battery_manager: "BatteryService" = websocket.app.state.battery_service
+    binary = BINARY_SUBPROTOCOL in websocket.scope.get("subprotocols", [])
+    ack_tasks: Set[asyncio.Task] = set()
+
+    async def acknowledge(command: ControlCommand, generation: int) -> None:
+        try:
+            ack = await car_manager.acknowledge_command(command, generation)
+            if websocket.application_state == WebSocketState.CONNECTED:
+                await websocket.send_bytes(ack)
+        except Exception as e:
+            logger.debug("Failed to acknowledge control command %s: %s", command.seq, e)
+
+    def process_binary_command(frame: bytes) -> None:
+        if not binary:
+            raise ControlProtocolError(
+                f"Binary control frames require the '{BINARY_SUBPROTOCOL}' subprotocol"
+            )
+        command = decode_command(frame)
+        generation = car_manager.submit_command(command)
+        task = asyncio.create_task(acknowledge(command, generation))
+        ack_tasks.add(task)
+        task.add_done_callback(ack_tasks.discard)
+
     try:
-        await connection_manager.connect(websocket)
+        await connection_manager.connect(
+            websocket, subprotocol=BINARY_SUBPROTOCOL if binary else None
+        )
         if (
             len(connection_manager.active_connections) > 1
             and battery_manager.enabled_batteries
@@ -53,14 +87,30 @@ async def websocket_endpoint(
         await car_manager.broadcast()
 
         while websocket.application_state == WebSocketState.CONNECTED:
-            raw_data = await websocket.receive_text()
-            data = json.loads(raw_data)
-            action: str = data.get("action")
-            payload = data.get("payload")
+            message = await websocket.receive()
+            if message["type"] == "websocket.disconnect":
+                raise WebSocketDisconnect(message.get("code", 1000))
+
+            frame = message.get("bytes")
+            if frame is None:
+                data = json.loads(message["text"])
+                action: str = data.get("action")
+                payload = data.get("payload")
+                logger.debug("%s", data)
+            else:
+                action = "binaryCommand"
 
-            logger.debug("%s", data)
             try:
-                await car_manager.process_action(action, payload, websocket)
+                if frame is None:
+                    await car_manager.process_action(action, payload, websocket)
+                else:
+                    process_binary_command(frame)
+            except ControlProtocolError as e:
+                err_msg = str(e)
+                logger.warning(err_msg)
+                await websocket.send_text(
+                    json.dumps({"error": err_msg, "type": action})
+                )
             except (RobotI2CTimeout, RobotI2CBusError) as e:
                 err_msg = str(e)
                 logger.error(err_msg)
@@ -93,4 +143,6 @@ async def websocket_endpoint(
         await connection_manager.disconnect(websocket)
     finally:
         logger.info("Robot Connection Manager: Cleaning up WebSocket connection.")
+        for task in ack_tasks:
+            task.cancel()
         connection_manager.remove(websocket)
@@ -0,0 +1,69 @@
+"""
+Event channel between the main application and the robot application.
+
+The main application keeps the event stream open over a persistent
+connection, preferably through the Unix domain socket of the robot
+application, and pushes its own events over the same connection pool.
+"""
+
+from typing import TYPE_CHECKING, Annotated
+
+from app.api import robot_deps
+from app.core.px_logger import Logger
+from app.schemas.ipc import IPCEvent
+from fastapi import APIRouter, Depends
+from fastapi.responses import StreamingResponse
+
+if TYPE_CHECKING:
+    from app.services.control.ipc_event_service import IPCEventService
+
+_log = Logger(name=__name__)
+
+router = APIRouter()
+
+
+@router.get(
+    "/px/api/ipc/events",
+    summary="Stream the events of the robot application.",
+    response_class=StreamingResponse,
+    responses={
+        200: {
+            "description": "Newline-delimited JSON events. "
+            "Empty lines are heartbeats.",
+            "content": {
+                "application/x-ndjson": {
+                    "example": '{"type":"distance","payload":{"distance":42.5,'
+                    '"speed":0.4}}\n'
+                }
+            },
+        }
+    },
+)
+def stream_events(
+    ipc_event_service: Annotated[
+        "IPCEventService", Depends(robot_deps.get_ipc_event_service)
+    ],
+):
+    """
+    Stream the events of the robot application, such as distance measurements,
+    until the robot application stops.
+    """
+    return StreamingResponse(
+        ipc_event_service.stream(),
+        media_type="application/x-ndjson",
+        headers={"Cache-Control": "no-cache"},
+    )
+
+
+@router.post(
+    "/px/api/ipc/events",
+    status_code=204,
+    summary="Push an event of the main application to the robot services.",
+)
+async def push_event(
+    event: IPCEvent,
+    ipc_event_service: Annotated[
+        "IPCEventService", Depends(robot_deps.get_ipc_event_service)
+    ],
+):
+    await ipc_event_service.dispatch(event.type, event.payload)
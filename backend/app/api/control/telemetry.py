@@ -0,0 +1,118 @@
+"""
+Endpoints for recording and downloading telemetry sessions.
+"""
+
+from typing import TYPE_CHECKING, Annotated, List, Optional
+
+from app.api import robot_deps
+from app.core.px_logger import Logger
+from app.exceptions.robot import TelemetrySessionNotFound
+from app.schemas.robot.telemetry import TelemetrySession
+from fastapi import APIRouter, Depends, HTTPException
+from fastapi.responses import StreamingResponse
+
+if TYPE_CHECKING:
+    from app.services.control.telemetry_service import TelemetryService
+
+logger = Logger(name=__name__)
+
+router = APIRouter()
+
+
+@router.get(
+    "/px/api/telemetry/sessions",
+    response_model=List[TelemetrySession],
+    summary="List the recorded telemetry sessions, newest first.",
+)
+def list_telemetry_sessions(
+    telemetry_service: Annotated[
+        "TelemetryService", Depends(robot_deps.get_telemetry_service)
+    ],
+):
+    return telemetry_service.list_sessions()
+
+
+@router.post(
+    "/px/api/telemetry/start",
+    response_model=TelemetrySession,
+    summary="Start recording a new telemetry session.",
+)
+def start_telemetry_session(
+    telemetry_service: Annotated[
+        "TelemetryService", Depends(robot_deps.get_telemetry_service)
+    ],
+):
+    """
+    Start recording distance samples, speed estimates, avoid obstacles state
+    transitions, applied drive commands with their I2C latency, and battery
+    readings. The current session, if any, is stopped.
+    """
+    return telemetry_service.start()
+
+
+@router.post(
+    "/px/api/telemetry/stop",
+    response_model=Optional[TelemetrySession],
+    summary="Stop recording the current telemetry session.",
+    response_description="The stopped session, or null if nothing was recorded.",
+)
+def stop_telemetry_session(
+    telemetry_service: Annotated[
+        "TelemetryService", Depends(robot_deps.get_telemetry_service)
+    ],
+):
+    return telemetry_service.stop()
+
+
+@router.get(
+    "/px/api/telemetry/sessions/{session_id}",
+    summary="Download or stream a telemetry session.",
+    response_class=StreamingResponse,
+    responses={
+        200: {"content": {"application/octet-stream": {}}},
+        404: {"description": "Telemetry session not found"},
+    },
+)
+def download_telemetry_session(
+    session_id: str,
+    telemetry_service: Annotated[
+        "TelemetryService", Depends(robot_deps.get_telemetry_service)
+    ],
+    follow: bool = False,
+):
+    """
+    Download a session as a single binary log file, which can be loaded with
+    `app.managers.telemetry_log.load_session`.
+
+    With `follow`, a session that is being recorded is streamed until the
+    recording stops.
+    """
+    try:
+        chunks = telemetry_service.stream_session(session_id, follow=follow)
+    except TelemetrySessionNotFound as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    return StreamingResponse(
+        chunks,
+        media_type="application/octet-stream",
+        headers={"Content-Disposition": f'attachment; filename="{session_id}.ptl"'},
+    )
+
+
+@router.delete(
+    "/px/api/telemetry/sessions/{session_id}",
+    summary="Delete a recorded telemetry session.",
+)
+def delete_telemetry_session(
+    session_id: str,
+    telemetry_service: Annotated[
+        "TelemetryService", Depends(robot_deps.get_telemetry_service)
+    ],
+):
+    try:
+        telemetry_service.delete_session(session_id)
+    except TelemetrySessionNotFound as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    except ValueError as e:
+        raise HTTPException(status_code=409, detail=str(e))
+    logger.info("Deleted telemetry session %s", session_id)
+    return {"id": session_id}
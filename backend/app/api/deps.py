@@ -1,81 +1,96 @@
 import os
 from functools import lru_cache
-from typing import Annotated, AsyncGenerator, Dict, TypedDict
+from typing import TYPE_CHECKING, Annotated, AsyncGenerator, Dict, TypedDict
 
-from app.adapters.audio.factory import create_volume_controller
-from app.adapters.video_device_adapter import VideoDeviceAdapter
 from app.config.config import settings as app_config
 from app.core.logger import Logger
-from app.managers.file_management.file_manager import FileManager
 from app.schemas.file_management import AliasDir
 from app.schemas.music import MusicPlayerMode
-from app.services.camera.camera_service import CameraService
-from app.services.camera.avfoundation_service import AVFoundationService
-from app.services.camera.gstreamer_service import GStreamerService
-from app.services.camera.picamera2_service import PicameraService
-from app.services.camera.stream_service import StreamService
-from app.services.camera.v4l2_service import V4L2Service
-from app.services.connection_service import ConnectionService
-from app.services.detection.detection_file_service import DetectionFileService
-from app.services.detection.detection_profile_service import DetectionProfileService
-from app.services.detection.detection_service import DetectionService
-from app.services.domain.settings_service import SettingsService
-from app.services.file_management.file_filter_service import FileFilterService
-from app.services.file_management.file_manager_service import FileManagerService
-from app.services.integration.robot_communication_service import (
-    RobotCommunicationService,
-)
-from app.services.media.audio_service import AudioService
-from app.services.media.audio_metadata_service import AudioMetadataService
-from app.services.media.audio_stream_service import AudioStreamService
-from app.services.media.music_file_service import MusicFileService
-from app.services.media.music_service import MusicService
-from app.services.media.tts_service import TTSService
-from app.services.media.video_recorder_service import VideoRecorderService
 from fastapi import Depends, Path
 
+if TYPE_CHECKING:
+    from app.adapters.video_device_adapter import VideoDeviceAdapter
+    from app.managers.file_management.file_manager import FileManager
+    from app.services.camera.avfoundation_service import AVFoundationService
+    from app.services.camera.camera_service import CameraService
+    from app.services.camera.gstreamer_service import GStreamerService
+    from app.services.camera.picamera2_service import PicameraService
+    from app.services.camera.stream_service import StreamService
+    from app.services.camera.v4l2_service import V4L2Service
+    from app.services.connection_service import ConnectionService
+    from app.services.detection.detection_profile_service import DetectionProfileService
+    from app.services.detection.detection_service import DetectionService
+    from app.services.domain.settings_service import SettingsService
+    from app.services.file_management.file_filter_service import FileFilterService
+    from app.services.file_management.file_manager_service import FileManagerService
+    from app.services.file_management.upload_service import UploadService
+    from app.services.integration.robot_communication_service import (
+        RobotCommunicationService,
+    )
+    from app.services.media.audio_service import AudioService
+    from app.services.media.audio_stream_service import AudioStreamService
+    from app.services.media.music_file_service import MusicFileService
+    from app.services.media.music_service import MusicService
+    from app.services.media.thumbnail_service import ThumbnailService
+    from app.services.media.tts_service import TTSService
+    from app.services.media.video_recorder_service import VideoRecorderService
+
 logger = Logger(__name__)
 
 
 @lru_cache()
-def get_connection_service() -> ConnectionService:
+def get_connection_service() -> "ConnectionService":
+    from app.services.connection_service import ConnectionService
+
     return ConnectionService(log_prefix="App Synchronizer: ")
 
 
 @lru_cache()
-def get_detection_notifier() -> ConnectionService:
+def get_detection_notifier() -> "ConnectionService":
+    from app.services.connection_service import ConnectionService
+
     return ConnectionService(log_prefix="Detection Notifier: ")
 
 
 @lru_cache(maxsize=1)
-def get_v4l2_service() -> V4L2Service:
+def get_v4l2_service() -> "V4L2Service":
+    from app.services.camera.v4l2_service import V4L2Service
+
     return V4L2Service()
 
 
 @lru_cache(maxsize=1)
-def get_gstreamer_service() -> GStreamerService:
+def get_gstreamer_service() -> "GStreamerService":
+    from app.services.camera.gstreamer_service import GStreamerService
+
     return GStreamerService()
 
 
 @lru_cache(maxsize=1)
-def get_picamera_service() -> PicameraService:
+def get_picamera_service() -> "PicameraService":
+    from app.services.camera.picamera2_service import PicameraService
+
     return PicameraService()
 
 
 @lru_cache(maxsize=1)
-def get_avfoundation_service() -> AVFoundationService:
+def get_avfoundation_service() -> "AVFoundationService":
+    from app.services.camera.avfoundation_service import AVFoundationService
+
     return AVFoundationService()
 
 
 @lru_cache(maxsize=1)
 def get_video_device_adapter(
-    v4l2_service: Annotated[V4L2Service, Depends(get_v4l2_service)],
-    gstreamer_service: Annotated[GStreamerService, Depends(get_gstreamer_service)],
-    picam_service: Annotated[PicameraService, Depends(get_picamera_service)],
+    v4l2_service: Annotated["V4L2Service", Depends(get_v4l2_service)],
+    gstreamer_service: Annotated["GStreamerService", Depends(get_gstreamer_service)],
+    picam_service: Annotated["PicameraService", Depends(get_picamera_service)],
     avfoundation_service: Annotated[
-        AVFoundationService, Depends(get_avfoundation_service)
+        "AVFoundationService", Depends(get_avfoundation_service)
     ],
-) -> VideoDeviceAdapter:
+) -> "VideoDeviceAdapter":
+    from app.adapters.video_device_adapter import VideoDeviceAdapter
+
     return VideoDeviceAdapter(
         v4l2_service=v4l2_service,
         gstreamer_service=gstreamer_service,
@@ -84,13 +99,25 @@ def get_video_device_adapter(
     )
 
 
-def get_robot_communication_service() -> RobotCommunicationService:
+@lru_cache(maxsize=1)
+def get_robot_communication_service() -> "RobotCommunicationService":
+    from app.services.integration.robot_communication_service import (
+        RobotCommunicationService,
+    )
+
     control_port = os.getenv("PX_CONTROL_APP_PORT", "8001")
-    return RobotCommunicationService(base_url=f"http://127.0.0.1:{control_port}")
+    return RobotCommunicationService(
+        base_url=f"http://127.0.0.1:{control_port}",
+        socket_path=app_config.PX_CONTROL_APP_SOCKET or None,
+    )
 
 
 @lru_cache()
-def get_audio_service() -> AudioService:
+def get_audio_service() -> "AudioService":
+    from app.adapters.audio.factory import create_volume_controller
+    from app.services.media.audio_metadata_service import AudioMetadataService
+    from app.services.media.audio_service import AudioService
+
     return AudioService(
         volume_controller=create_volume_controller(),
         metadata_service=AudioMetadataService(),
@@ -98,27 +125,35 @@ def get_audio_service() -> AudioService:
 
 
 @lru_cache()
-def get_audio_stream_service() -> AudioStreamService:
+def get_audio_stream_service() -> "AudioStreamService":
+    from app.services.media.audio_stream_service import AudioStreamService
+
     return AudioStreamService()
 
 
 @lru_cache()
-def get_file_filter_service() -> FileFilterService:
+def get_file_filter_service() -> "FileFilterService":
+    from app.services.file_management.file_filter_service import FileFilterService
+
     return FileFilterService()
 
 
 @lru_cache(maxsize=1)
 def get_custom_file_manager(
-    filter_service: Annotated[FileFilterService, Depends(get_file_filter_service)],
-) -> FileManager:
+    filter_service: Annotated["FileFilterService", Depends(get_file_filter_service)],
+) -> "FileManager":
+    from app.managers.file_management.file_manager import FileManager
+
     return FileManager(filter_service=filter_service)
 
 
 @lru_cache(maxsize=1)
 def get_photo_file_manager(
-    file_manager: Annotated[FileManager, Depends(get_custom_file_manager)],
-    filter_service: Annotated[FileFilterService, Depends(get_file_filter_service)],
-) -> FileManagerService:
+    file_manager: Annotated["FileManager", Depends(get_custom_file_manager)],
+    filter_service: Annotated["FileFilterService", Depends(get_file_filter_service)],
+) -> "FileManagerService":
+    from app.services.file_management.file_manager_service import FileManagerService
+
     return FileManagerService(
         root_directory=app_config.PX_PHOTO_DIR,
         cache_dir=os.path.join(app_config.PX_CACHE_DIR, "Pictures"),
@@ -129,9 +164,11 @@ def get_photo_file_manager(
 
 @lru_cache(maxsize=1)
 def get_video_file_manager(
-    file_manager: Annotated[FileManager, Depends(get_custom_file_manager)],
-    filter_service: Annotated[FileFilterService, Depends(get_file_filter_service)],
-) -> FileManagerService:
+    file_manager: Annotated["FileManager", Depends(get_custom_file_manager)],
+    filter_service: Annotated["FileFilterService", Depends(get_file_filter_service)],
+) -> "FileManagerService":
+    from app.services.file_management.file_manager_service import FileManagerService
+
     return FileManagerService(
         root_directory=app_config.PX_VIDEO_DIR,
         cache_dir=os.path.join(app_config.PX_CACHE_DIR, "Video"),
@@ -142,9 +179,11 @@ def get_video_file_manager(
 
 @lru_cache(maxsize=1)
 def get_data_file_manager(
-    file_manager: Annotated[FileManager, Depends(get_custom_file_manager)],
-    filter_service: Annotated[FileFilterService, Depends(get_file_filter_service)],
-) -> FileManagerService:
+    file_manager: Annotated["FileManager", Depends(get_custom_file_manager)],
+    filter_service: Annotated["FileFilterService", Depends(get_file_filter_service)],
+) -> "FileManagerService":
+    from app.services.detection.detection_file_service import DetectionFileService
+
     return DetectionFileService(
         root_directory=app_config.DATA_DIR,
         cache_dir=os.path.join(app_config.PX_CACHE_DIR, "data"),
@@ -153,21 +192,46 @@ def get_data_file_manager(
     )
 
 
+@lru_cache(maxsize=1)
+def get_upload_service() -> "UploadService":
+    from app.services.file_management.upload_service import UploadService
+
+    return UploadService(
+        sessions_dir=os.path.join(app_config.PX_CACHE_DIR, "uploads"),
+    )
+
+
+@lru_cache(maxsize=1)
+def get_thumbnail_service() -> "ThumbnailService":
+    from app.services.media.thumbnail_service import ThumbnailService
+
+    return ThumbnailService(
+        cache_dir=os.path.join(app_config.PX_CACHE_DIR, "thumbnails"),
+        max_cache_bytes=app_config.PX_THUMBNAIL_CACHE_SIZE_MB * 1024 * 1024,
+    )
+
+
 @lru_cache()
-def get_settings_service() -> SettingsService:
+def get_settings_service() -> "SettingsService":
+    from app.services.domain.settings_service import SettingsService
+
     return SettingsService()
 
 
 @lru_cache(maxsize=1)
-def get_detection_profile_service() -> DetectionProfileService:
+def get_detection_profile_service() -> "DetectionProfileService":
+    from app.services.detection.detection_profile_service import DetectionProfileService
+
     return DetectionProfileService()
 
 
 @lru_cache(maxsize=1)
 def get_music_service(
-    settings_service: Annotated[SettingsService, Depends(get_settings_service)],
-    connection_manager: Annotated[ConnectionService, Depends(get_connection_service)],
-) -> MusicService:
+    settings_service: Annotated["SettingsService", Depends(get_settings_service)],
+    connection_manager: Annotated["ConnectionService", Depends(get_connection_service)],
+) -> "MusicService":
+    from app.services.media.music_service import MusicService
+
     return MusicService(
         connection_manager=connection_manager,
         music_dir=app_config.PX_MUSIC_DIR,
@@ -179,10 +243,12 @@ def get_music_service(
 
 @lru_cache(maxsize=1)
 def get_music_file_service(
-    file_manager: Annotated[FileManager, Depends(get_custom_file_manager)],
-    filter_service: Annotated[FileFilterService, Depends(get_file_filter_service)],
-    music_service: Annotated[MusicService, Depends(get_music_service)],
-) -> MusicFileService:
+    file_manager: Annotated["FileManager", Depends(get_custom_file_manager)],
+    filter_service: Annotated["FileFilterService", Depends(get_file_filter_service)],
+    music_service: Annotated["MusicService", Depends(get_music_service)],
+) -> "MusicFileService":
+    from app.services.media.music_file_service import MusicFileService
+
     return MusicFileService(
         default_music_dir=app_config.DEFAULT_MUSIC_DIR,
         root_directory=app_config.PX_MUSIC_DIR,
@@ -194,11 +260,15 @@ def get_music_file_service(
 
 
 def get_directory_handlers(
-    photo_file_manager: Annotated[FileManagerService, Depends(get_photo_file_manager)],
-    video_file_manager: Annotated[FileManagerService, Depends(get_video_file_manager)],
-    music_file_manager: Annotated[MusicFileService, Depends(get_music_file_service)],
-    data_file_manager: Annotated[FileManagerService, Depends(get_data_file_manager)],
-) -> Dict[AliasDir, FileManagerService]:
+    photo_file_manager: Annotated[
+        "FileManagerService", Depends(get_photo_file_manager)
+    ],
+    video_file_manager: Annotated[
+        "FileManagerService", Depends(get_video_file_manager)
+    ],
+    music_file_manager: Annotated["MusicFileService", Depends(get_music_file_service)],
+    data_file_manager: Annotated["FileManagerService", Depends(get_data_file_manager)],
+) -> Dict[AliasDir, "FileManagerService"]:
     handlers = {
         AliasDir.image: photo_file_manager,
         AliasDir.video: video_file_manager,
@@ -213,48 +283,55 @@ def get_directory_handler_by_alias(
         AliasDir, Path(description="Directory alias for application content")
     ],
     handlers: Annotated[
-        Dict[AliasDir, FileManagerService], Depends(get_directory_handlers)
+        Dict[AliasDir, "FileManagerService"], Depends(get_directory_handlers)
     ],
-) -> FileManagerService:
+) -> "FileManagerService":
     return handlers[alias_dir]
 
 
 @lru_cache()
 def get_video_recorder_service(
-    file_manager: Annotated[FileManagerService, Depends(get_video_file_manager)],
-) -> VideoRecorderService:
+    file_manager: Annotated["FileManagerService", Depends(get_video_file_manager)],
+) -> "VideoRecorderService":
+    from app.services.media.video_recorder_service import VideoRecorderService
+
     return VideoRecorderService(file_manager=file_manager)
 
 
 @lru_cache(maxsize=1)
 def get_detection_service(
-    settings_service: Annotated[SettingsService, Depends(get_settings_service)],
-    connection_manager: Annotated[ConnectionService, Depends(get_connection_service)],
-    file_manager: Annotated[FileManagerService, Depends(get_data_file_manager)],
+    settings_service: Annotated["SettingsService", Depends(get_settings_service)],
+    connection_manager: Annotated["ConnectionService", Depends(get_connection_service)],
+    file_manager: Annotated["FileManagerService", Depends(get_data_file_manager)],
     profile_service: Annotated[
-        DetectionProfileService, Depends(get_detection_profile_service)
+        "DetectionProfileService", Depends(get_detection_profile_service)
     ],
-) -> DetectionService:
+) -> "DetectionService":
+    from app.services.detection.detection_service import DetectionService
+
     return DetectionService(
         settings_service=settings_service,
         file_manager=file_manager,
         connection_manager=connection_manager,
         profile_service=profile_service,
+        feed_path=app_config.PX_DETECTION_FEED_PATH,
     )
 
 
 @lru_cache(maxsize=1)
 def get_camera_service(
-    detection_service: Annotated[DetectionService, Depends(get_detection_service)],
-    settings_service: Annotated[SettingsService, Depends(get_settings_service)],
-    connection_manager: Annotated[ConnectionService, Depends(get_connection_service)],
+    detection_service: Annotated["DetectionService", Depends(get_detection_service)],
+    settings_service: Annotated["SettingsService", Depends(get_settings_service)],
+    connection_manager: Annotated["ConnectionService", Depends(get_connection_service)],
     video_device_adapter: Annotated[
-        VideoDeviceAdapter, Depends(get_video_device_adapter)
+        "VideoDeviceAdapter", Depends(get_video_device_adapter)
     ],
     video_recorder: Annotated[
-        VideoRecorderService, Depends(get_video_recorder_service)
+        "VideoRecorderService", Depends(get_video_recorder_service)
     ],
-) -> CameraService:
+) -> "CameraService":
+    from app.services.camera.camera_service import CameraService
+
     return CameraService(
         detection_service=detection_service,
         settings_service=settings_service,
@@ -266,33 +343,54 @@ def get_camera_service(
 
 @lru_cache(maxsize=1)
 def get_stream_service(
-    camera_manager: Annotated[CameraService, Depends(get_camera_service)],
-) -> StreamService:
+    camera_manager: Annotated["CameraService", Depends(get_camera_service)],
+) -> "StreamService":
+    from app.services.camera.stream_service import StreamService
+
     return StreamService(camera_service=camera_manager)
 
 
 @lru_cache()
-def get_tts_service() -> TTSService:
-    return TTSService()
+def get_tts_service() -> "TTSService":
+    from app.services.media.tts_cache import TTSAudioCache
+    from app.services.media.tts_service import TTSService
+
+    return TTSService(
+        cache=TTSAudioCache(
+            cache_dir=os.path.join(app_config.PX_CACHE_DIR, "tts"),
+            max_cache_bytes=app_config.PX_TTS_CACHE_SIZE_MB * 1024 * 1024,
+        )
+    )
 
 
 class LifespanAppDeps(TypedDict):
-    connection_manager: ConnectionService
-    detection_manager: DetectionService
-    music_file_service: MusicFileService
-    tts_service: TTSService
+    connection_manager: "ConnectionService"
+    detection_manager: "DetectionService"
+    music_file_service: "MusicFileService"
+    tts_service: "TTSService"
+    settings_service: "SettingsService"
+    audio_service: "AudioService"
+    robot_communication_service: "RobotCommunicationService"
 
 
 async def get_lifespan_dependencies(
-    connection_manager: Annotated[ConnectionService, Depends(get_connection_service)],
-    detection_manager: Annotated[DetectionService, Depends(get_detection_service)],
-    music_file_service: Annotated[MusicFileService, Depends(get_music_file_service)],
-    tts_service: Annotated[TTSService, Depends(get_tts_service)],
+    connection_manager: Annotated["ConnectionService", Depends(get_connection_service)],
+    detection_manager: Annotated["DetectionService", Depends(get_detection_service)],
+    music_file_service: Annotated["MusicFileService", Depends(get_music_file_service)],
+    tts_service: Annotated["TTSService", Depends(get_tts_service)],
+    settings_service: Annotated["SettingsService", Depends(get_settings_service)],
+    audio_service: Annotated["AudioService", Depends(get_audio_service)],
+    robot_communication_service: Annotated[
+        "RobotCommunicationService", Depends(get_robot_communication_service)
+    ],
 ) -> AsyncGenerator[LifespanAppDeps, None]:
     deps: LifespanAppDeps = {
         "connection_manager": connection_manager,
         "detection_manager": detection_manager,
         "music_file_service": music_file_service,
         "tts_service": tts_service,
+        "settings_service": settings_service,
+        "audio_service": audio_service,
+        "robot_communication_service": robot_communication_service,
     }
     yield deps
@@ -12,8 +12,8 @@ from app.exceptions.audio import (
     AudioVolumeUnavailable,
     AudioVolumeUnsupported,
 )
-from app.schemas.audio import VolumeData
-from fastapi import APIRouter, Depends, HTTPException, Request, WebSocket
+from app.schemas.audio import AudioStreamCodec, VolumeData
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, WebSocket
 
 if TYPE_CHECKING:
     from app.services.connection_service import ConnectionService
@@ -209,8 +209,35 @@ async def audio_stream_ws(
     audio_service: Annotated[
         "AudioStreamService", Depends(deps.get_audio_stream_service)
     ],
+    codec: Annotated[
+        AudioStreamCodec,
+        Query(description="The encoding of the audio stream."),
+    ] = AudioStreamCodec.pcm,
+    frame_ms: Annotated[
+        int,
+        Query(
+            ge=10,
+            le=100,
+            description="The duration of each encoded frame in milliseconds. "
+            "Opus supports 10, 20, 40 and 60. Ignored for `pcm`.",
+        ),
+    ] = 20,
+    bitrate: Annotated[
+        int,
+        Query(
+            ge=6000,
+            le=510000,
+            description="The target bitrate in bits per second. Used by Opus only.",
+        ),
+    ] = 32000,
 ):
     """
     WebSocket endpoint for providing audio stream to a client.
+
+    By default, the stream consists of raw 16-bit PCM messages. With an
+    encoded `codec`, the first message is a JSON text message of type `format`
+    describing the stream, followed by one encoded frame per binary message.
     """
-    await audio_service.audio_stream_to_ws(websocket)
+    await audio_service.audio_stream_to_ws(
+        websocket, codec=codec, frame_ms=frame_ms, bitrate=bitrate
+    )
@@ -14,9 +14,7 @@ from app.exceptions.camera import (
     CameraShutdownInProgressError,
 )
 from app.schemas.camera import CameraDevicesResponse, CameraSettings, PhotoResponse
-from app.types.detection import DetectionQueueData, DetectionResultData
 from app.util.doc_util import build_response_description
-from app.util.photo import capture_photo, prepare_photo_frame
 from fastapi import APIRouter, Depends, HTTPException, Request
 
 if TYPE_CHECKING:
@@ -26,6 +24,7 @@ if TYPE_CHECKING:
     from app.services.connection_service import ConnectionService
     from app.services.detection.detection_service import DetectionService
     from app.services.file_management.file_manager_service import FileManagerService
+    from app.types.detection import DetectionQueueData, DetectionResultData
 
 router = APIRouter()
 _log = Logger(__name__)
@@ -178,7 +177,9 @@ async def take_photo(
     if frame is None:
         raise HTTPException(status_code=503, detail="Camera is not ready")
 
-    detection_state: DetectionResultData | DetectionQueueData | None = None
+    from app.util.photo import capture_photo, prepare_photo_frame
+
+    detection_state: "DetectionResultData | DetectionQueueData | None" = None
     if detection_service.detection_settings.active:
         detection_service.poll_detection_result()
         detection_state = detection_service.current_state
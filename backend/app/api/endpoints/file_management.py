@@ -23,12 +23,21 @@ from app.api.responses.file_management import (
     write_file_responses,
 )
 from app.core.logger import Logger
-from app.exceptions.file_exceptions import DefaultFileRemoveAttempt, InvalidFileName
+from app.exceptions.file_exceptions import (
+    DefaultFileRemoveAttempt,
+    InvalidFileName,
+    UploadIntegrityError,
+    UploadOffsetMismatch,
+    UploadSessionNotFound,
+)
 from app.exceptions.music import ActiveMusicTrackRemovalError
 from app.managers.file_management.file_manager import FileManager
 from app.schemas.file_filter import (
     FileFilterRequest,
     FileFlatFilterRequest,
+    FileFlatPageRequest,
+    FilePageRequest,
+    FilePageResponseModel,
     FileResponseModel,
     OrderingModel,
 )
@@ -44,10 +53,16 @@ from app.schemas.file_management import (
     RenameFileRequest,
     RenameFileResponse,
     SaveFileRequest,
+    ThumbnailSize,
     UploadFileResponse,
+    UploadSessionRequest,
+    UploadSessionResponse,
 )
 from app.services.file_management.file_manager_service import FileManagerService
+from app.services.file_management.upload_service import UploadService, UploadSession
 from app.services.media.music_file_service import MusicFileService
+from app.services.media.thumbnail_service import ThumbnailService
+from app.services.media.video_converter import VideoConverter
 from app.util.atomic_write import atomic_write
 from app.util.doc_util import build_response_description
 from app.util.file_handlers import find_file_handler
@@ -56,6 +71,7 @@ from app.util.file_util import (
     expand_home_dir,
     file_name_parent_directory,
     file_to_relative,
+    is_parent_directory,
     resolve_absolute_path,
     zip_files_generator,
 )
@@ -122,6 +138,29 @@ data_file_manager_dep = Annotated[
 
 global_file_manager_dep = Annotated[FileManager, Depends(deps.get_custom_file_manager)]
 
+thumbnail_service_dep = Annotated[ThumbnailService, Depends(deps.get_thumbnail_service)]
+
+upload_service_dep = Annotated[UploadService, Depends(deps.get_upload_service)]
+
+upload_id_param = Annotated[
+    str, Path(description="The identifier of the upload session.")
+]
+
+thumbnail_size_query = Annotated[
+    Optional[ThumbnailSize],
+    Query(
+        description="Return a downscaled JPEG of the given size instead of the original image.",
+    ),
+]
+
+thumbnail_version_query = Annotated[
+    Optional[str],
+    Query(
+        description="Any value identifying the revision of the source file, e.g. its modification time. "
+        "When provided together with `size`, the thumbnail may be cached by the client for a year.",
+    ),
+]
+
 alias_handlers = Annotated[
     Dict[AliasDir, FileManagerService], Depends(deps.get_directory_handlers)
 ]
@@ -207,6 +246,240 @@ async def upload_file_in_aliased_dir(
         raise HTTPException(status_code=500, detail="Failed to upload the file.")
 
 
+UPLOAD_CHUNK_BUFFER_SIZE = 1024 * 1024
+
+upload_session_responses = {
+    404: {
+        "description": "Not Found. The upload session does not exist.",
+        "content": {"application/json": {"example": {"detail": "Upload not found"}}},
+    },
+    **alias_dir_validation_error_response,
+}
+
+
+def _upload_session_response(session: UploadSession) -> Dict:
+    return {
+        "upload_id": session.upload_id,
+        "filename": session.filename,
+        "offset": session.offset,
+        "size": session.size,
+    }
+
+
+def _get_upload_session(
+    service: UploadService, manager: FileManagerService, upload_id: str
+) -> UploadSession:
+    try:
+        session = service.get(upload_id)
+    except UploadSessionNotFound:
+        raise HTTPException(status_code=404, detail="Upload not found")
+    if not is_parent_directory(manager.root_directory, session.part_path):
+        raise HTTPException(status_code=404, detail="Upload not found")
+    return session
+
+
+@router.post(
+    "/files/uploads/{alias_dir}",
+    response_model=UploadSessionResponse,
+    summary="Start a resumable upload in the specified aliased directory.",
+    response_description="The created upload session.",
+    responses={**upload_responses, **alias_dir_validation_error_response},
+)
+def create_upload_in_aliased_dir(
+    request_data: UploadSessionRequest,
+    manager: manager,
+    service: upload_service_dep,
+):
+    """
+    Start a resumable upload for the specified media type.
+
+    The file content is then sent in one or more `PATCH` requests, each starting
+    at the current offset, and the upload is completed with the `finalize`
+    request. An interrupted upload can be resumed from the offset returned by
+    the `GET` request.
+    """
+    directory = (
+        resolve_absolute_path(request_data.dir, manager.root_directory)
+        if request_data.dir
+        else manager.root_directory
+    )
+    target_path = resolve_absolute_path(request_data.filename, directory)
+    if not is_parent_directory(manager.root_directory, target_path):
+        raise HTTPException(status_code=400, detail="Invalid filename.")
+    try:
+        session = service.create(
+            directory,
+            request_data.filename,
+            request_data.size,
+            request_data.checksum,
+        )
+    except InvalidFileName:
+        raise HTTPException(status_code=400, detail="Invalid filename.")
+    return _upload_session_response(session)
+
+
+@router.get(
+    "/files/uploads/{alias_dir}/{upload_id}",
+    response_model=UploadSessionResponse,
+    summary="Return the state of a resumable upload.",
+    response_description="The upload session, including the offset to resume from.",
+    responses=upload_session_responses,
+)
+def get_upload_in_aliased_dir(
+    upload_id: upload_id_param,
+    manager: manager,
+    service: upload_service_dep,
+):
+    """
+    Return the state of a resumable upload, including the number of bytes
+    received so far.
+    """
+    return _upload_session_response(_get_upload_session(service, manager, upload_id))
+
+
+@router.patch(
+    "/files/uploads/{alias_dir}/{upload_id}",
+    response_model=UploadSessionResponse,
+    summary="Append a chunk to a resumable upload.",
+    response_description="The upload session with the updated offset.",
+    responses={
+        **upload_session_responses,
+        409: {
+            "description": "Conflict. The chunk does not start at the current offset.",
+            "content": {
+                "application/json": {
+                    "example": {"detail": "Expected offset 1048576, got 0"}
+                }
+            },
+        },
+        422: {
+            "description": "Unprocessable Entity. The chunk exceeds the declared size.",
+            "content": {
+                "application/json": {
+                    "example": {
+                        "detail": "Chunk exceeds the declared size of 1048576 bytes"
+                    }
+                }
+            },
+        },
+    },
+)
+async def append_upload_chunk_in_aliased_dir(
+    request: Request,
+    upload_id: upload_id_param,
+    manager: manager,
+    service: upload_service_dep,
+    upload_offset: Annotated[
+        int,
+        Header(
+            ge=0,
+            description="The offset of the chunk, which must be equal to the current offset of the upload.",
+        ),
+    ],
+):
+    """
+    Append the request body to a resumable upload.
+
+    The body is streamed to disk in buffers of about 1 MiB, so the chunk may be
+    of any size. On `409 Conflict`, the client should resume from the offset
+    in the `Upload-Offset` response header.
+    """
+    session = _get_upload_session(service, manager, upload_id)
+    offset = upload_offset
+    buffer = bytearray()
+
+    try:
+        async for data in request.stream():
+            buffer.extend(data)
+            if len(buffer) >= UPLOAD_CHUNK_BUFFER_SIZE:
+                offset = await asyncio.to_thread(
+                    service.write, upload_id, offset, bytes(buffer)
+                )
+                buffer.clear()
+        if buffer:
+            offset = await asyncio.to_thread(
+                service.write, upload_id, offset, bytes(buffer)
+            )
+    except UploadOffsetMismatch as e:
+        raise HTTPException(
+            status_code=409,
+            detail=str(e),
+            headers={"Upload-Offset": str(e.offset)},
+        )
+    except UploadIntegrityError as e:
+        raise HTTPException(status_code=422, detail=str(e))
+    except UploadSessionNotFound:
+        raise HTTPException(status_code=404, detail="Upload not found")
+
+    return _upload_session_response(session)
+
+
+@router.post(
+    "/files/uploads/{alias_dir}/{upload_id}/finalize",
+    response_model=UploadFileResponse,
+    summary="Complete a resumable upload.",
+    response_description="A response describing the result of the file upload.",
+    responses={
+        **upload_session_responses,
+        422: {
+            "description": "Unprocessable Entity. The size or the checksum of the received file does not match.",
+            "content": {
+                "application/json": {"example": {"detail": "Checksum mismatch"}}
+            },
+        },
+    },
+)
+async def finalize_upload_in_aliased_dir(
+    request: Request,
+    alias_dir: alias_dir_param,
+    upload_id: upload_id_param,
+    manager: manager,
+    service: upload_service_dep,
+):
+    """
+    Verify the received file and move it into place.
+    """
+    connection_manager: "ConnectionService" = request.app.state.app_manager
+    _get_upload_session(service, manager, upload_id)
+    try:
+        file_path = await asyncio.to_thread(service.finalize, upload_id)
+    except UploadIntegrityError as e:
+        raise HTTPException(status_code=422, detail=str(e))
+    except UploadSessionNotFound:
+        raise HTTPException(status_code=404, detail="Upload not found")
+
+    await asyncio.to_thread(manager.on_file_added, file_path)
+    filename = file_to_relative(file_path, manager.root_directory)
+    await connection_manager.broadcast_json(
+        {
+            "type": "uploaded",
+            "payload": [{"file": filename, "type": alias_dir}],
+        }
+    )
+    return {"success": True, "filename": filename}
+
+
+@router.delete(
+    "/files/uploads/{alias_dir}/{upload_id}",
+    summary="Cancel a resumable upload.",
+    status_code=204,
+    responses=upload_session_responses,
+)
+def abort_upload_in_aliased_dir(
+    upload_id: upload_id_param,
+    manager: manager,
+    service: upload_service_dep,
+):
+    """
+    Cancel a resumable upload and remove the received data.
+    """
+    _get_upload_session(service, manager, upload_id)
+    try:
+        service.abort(upload_id)
+    except UploadSessionNotFound:
+        raise HTTPException(status_code=404, detail="Upload not found")
+
+
 @router.delete(
     "/files/remove",
     response_model=BatchFileResult,
@@ -483,6 +756,9 @@ def download_files_as_archive_from_aliased_dir(
 )
 def preview_image(
     filename: abs_file_name_query,
+    thumbnail_service: thumbnail_service_dep,
+    size: thumbnail_size_query = None,
+    version: thumbnail_version_query = None,
 ):
     """
     Return a preview image for the specified file.
@@ -491,6 +767,8 @@ def preview_image(
     filename = expand_home_dir(filename)
 
     try:
+        if size is not None:
+            return _thumbnail_response(thumbnail_service, filename, size, version)
         return FileResponse(
             path=filename,
             media_type=(
@@ -504,6 +782,36 @@ def preview_image(
         raise HTTPException(status_code=404, detail="File not found")
 
 
+def _thumbnail_response(
+    thumbnail_service: ThumbnailService,
+    full_path: str,
+    size: ThumbnailSize,
+    version: Optional[str] = None,
+) -> FileResponse:
+    if not os.path.isfile(full_path):
+        raise HTTPException(status_code=404, detail="File not found")
+
+    if VideoConverter.is_video_file(full_path):
+        raise HTTPException(
+            status_code=400, detail="Use the video preview endpoint for video files"
+        )
+
+    thumbnail = thumbnail_service.get_thumbnail(full_path, size)
+    if thumbnail is None:
+        raise HTTPException(status_code=415, detail="Unsupported image format")
+
+    return FileResponse(
+        path=thumbnail,
+        media_type="image/jpeg",
+        filename=os.path.basename(thumbnail),
+        headers={
+            "Cache-Control": (
+                "public, max-age=31536000, immutable" if version else "no-cache"
+            )
+        },
+    )
+
+
 @router.get(
     "/files/preview-image/{alias_dir}",
     response_class=FileResponse,
@@ -514,6 +822,9 @@ def preview_image(
 def preview_image_in_aliased_dir(
     filename: relative_file_name_query,
     manager: manager,
+    thumbnail_service: thumbnail_service_dep,
+    size: thumbnail_size_query = None,
+    version: thumbnail_version_query = None,
 ):
     """
     Return a preview image for the specified file.
@@ -521,6 +832,8 @@ def preview_image_in_aliased_dir(
     try:
         directory = manager.root_directory
         full_path = f"{directory}/{filename}"
+        if size is not None:
+            return _thumbnail_response(thumbnail_service, full_path, size, version)
         return FileResponse(
             path=full_path,
             media_type=(
@@ -544,6 +857,9 @@ def preview_image_in_aliased_dir(
 def preview_video_in_aliased_dir(
     filename: relative_file_name_query,
     manager: manager,
+    thumbnail_service: thumbnail_service_dep,
+    size: thumbnail_size_query = None,
+    version: thumbnail_version_query = None,
 ):
     """
     Return a preview image for the specified video file.
@@ -552,6 +868,8 @@ def preview_video_in_aliased_dir(
         full_path = manager.get_video_poster(filename)
         if not full_path or not os.path.exists(full_path):
             raise HTTPException(status_code=404, detail=f"File {filename} not found")
+        if size is not None:
+            return _thumbnail_response(thumbnail_service, full_path, size, version)
         return FileResponse(
             path=full_path,
             media_type=(
@@ -592,6 +910,38 @@ def list_files(
         raise HTTPException(status_code=403, detail="Permission denied")
 
 
+@router.post(
+    "/files/list/page",
+    response_model=FilePageResponseModel,
+    summary="Return a page of the files in a directory.",
+    response_description=build_response_description(FilePageResponseModel),
+)
+def list_files_page(
+    request_data: FileFlatPageRequest,
+    file_manager: "FileManager" = Depends(deps.get_custom_file_manager),
+):
+    """
+    Return a paginated list of the direct children of `root_dir`, with
+    directories placed before files. As in `/files/list`, paths are absolute.
+    """
+    try:
+        return file_manager.get_files_page(
+            root_dir=request_data.root_dir,
+            filter_model=request_data.filters,
+            search=request_data.search,
+            ordering=request_data.ordering,
+            offset=request_data.offset,
+            limit=request_data.limit,
+            lazy=True,
+            relative_path=False,
+        )
+    except FileNotFoundError:
+        raise HTTPException(status_code=404, detail="Directory not found")
+    except PermissionError as e:
+        _log.error("Permission denied: %s", e)
+        raise HTTPException(status_code=403, detail="Permission denied")
+
+
 @router.post(
     "/files/list/{alias_dir}",
     summary="Return a hierarchical files tree in the specified aliased directory.",
@@ -617,6 +967,79 @@ def list_files_in_aliased_dir(
         raise HTTPException(status_code=403, detail="Permission denied")
 
 
+@router.post(
+    "/files/list/{alias_dir}/page",
+    response_model=FilePageResponseModel,
+    summary="Return a page of files in the specified aliased directory.",
+    response_description=build_response_description(FilePageResponseModel),
+    responses=alias_dir_validation_error_response,
+)
+def list_files_page_in_aliased_dir(
+    request_data: FilePageRequest,
+    manager: manager,
+):
+    """
+    Return a flat, paginated list of files for the specified media type.
+
+    With `lazy` enabled, only the direct children of `dir` are listed, so the
+    client can expand the tree one directory at a time.
+    """
+    try:
+        return manager.get_files_page(
+            filter_model=request_data.filters,
+            search=request_data.search,
+            ordering=request_data.ordering,
+            subdir=request_data.dir,
+            offset=request_data.offset,
+            limit=request_data.limit,
+            lazy=request_data.lazy,
+        )
+    except FileNotFoundError:
+        raise HTTPException(status_code=404, detail="Directory not found")
+    except PermissionError as e:
+        _log.error("Permission denied: %s", e)
+        raise HTTPException(status_code=403, detail="Permission denied")
+
+
+@router.post(
+    "/files/list/{alias_dir}/stream",
+    response_class=StreamingResponse,
+    summary="Stream files in the specified aliased directory as NDJSON.",
+    response_description=(
+        "Newline-delimited JSON, one file per line. "
+        "The total number of files is sent in the `X-Total-Count` header."
+    ),
+    responses=alias_dir_validation_error_response,
+)
+def stream_files_in_aliased_dir(
+    request_data: FilePageRequest,
+    manager: manager,
+):
+    """
+    Stream the filtered and ordered files for the specified media type, one JSON
+    object per line. Pagination fields are ignored.
+    """
+    try:
+        total, lines = manager.stream_files(
+            filter_model=request_data.filters,
+            search=request_data.search,
+            ordering=request_data.ordering,
+            subdir=request_data.dir,
+            lazy=request_data.lazy,
+        )
+    except FileNotFoundError:
+        raise HTTPException(status_code=404, detail="Directory not found")
+    except PermissionError as e:
+        _log.error("Permission denied: %s", e)
+        raise HTTPException(status_code=403, detail="Permission denied")
+
+    return StreamingResponse(
+        lines,
+        media_type="application/x-ndjson",
+        headers={"X-Total-Count": str(total)},
+    )
+
+
 @router.get(
     "/files/download-last-video",
     response_description="A response containing the most recent recorded video.",
@@ -18,7 +18,8 @@ from app.schemas.music import (
     MusicTrackPayload,
 )
 from app.services.media.music_file_service import MusicFileService
-from fastapi import APIRouter, Depends, HTTPException, Request
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi.responses import FileResponse
 
 if TYPE_CHECKING:
     from app.services.connection_service import ConnectionService
@@ -483,3 +484,36 @@ async def get_music_tracks(
     except Exception:
         _log.error("Unexpected error while retrieving music files.", exc_info=True)
         raise HTTPException(status_code=500, detail="Failed to retrieve music files.")
+
+
+@router.get(
+    "/music/cover",
+    response_class=FileResponse,
+    summary="Get the cover art embedded in a music track.",
+    response_description="A JPEG thumbnail of the cover art.",
+    responses={
+        404: {
+            "description": "Not Found: The track has no cover art.",
+            "content": {
+                "application/json": {"example": {"detail": "Cover art not found"}}
+            },
+        },
+    },
+)
+def get_music_cover(
+    file_manager: Annotated["MusicFileService", Depends(deps.get_music_file_service)],
+    filename: str = Query(
+        ..., description="The track's name (relative to the music directory)"
+    ),
+):
+    """
+    Return the cover art thumbnail of a music track.
+    """
+    cover = file_manager.get_cover(filename)
+    if cover is None:
+        raise HTTPException(status_code=404, detail="Cover art not found")
+    return FileResponse(
+        path=cover,
+        media_type="image/jpeg",
+        headers={"Cache-Control": "no-cache"},
+    )
@@ -6,12 +6,16 @@ from app.config.config import settings as app_config
 from app.core.async_emitter import AsyncEventEmitter
 from app.core.logger import Logger
 from app.managers.async_task_manager import AsyncTaskManager
+from app.managers.detection_feed import DetectionFeedReader
 from app.managers.file_management.json_data_manager import JsonDataManager
+from app.managers.i2c_bus_scheduler import I2CBusScheduler
 from app.migrations.robot_config import create_robot_config_migrator
 from app.services.connection_service import ConnectionService
 from app.services.control.calibration_service import CalibrationService
 from app.services.control.car_service import CarService
+from app.services.control.ipc_event_service import IPCEventService
 from app.services.control.settings_service import SettingsService
+from app.services.control.telemetry_service import TelemetryService
 from app.services.sensors.distance_service import DistanceService
 from app.services.sensors.led_service import LEDService
 from app.services.sensors.pinout_service import PinoutService
@@ -89,12 +93,37 @@ def get_smbus_manager() -> SMBusManager:
     return SMBusManager()
 
 
+@lru_cache()
+def get_i2c_bus_scheduler() -> I2CBusScheduler:
+    return I2CBusScheduler()
+
+
+@lru_cache()
+def get_telemetry_service() -> TelemetryService:
+    return TelemetryService(root_dir=app_config.PX_TELEMETRY_DIR)
+
+
+@lru_cache()
+def get_detection_feed() -> DetectionFeedReader:
+    return DetectionFeedReader(app_config.PX_DETECTION_FEED_PATH)
+
+
+@lru_cache()
+def get_ipc_event_service() -> IPCEventService:
+    return IPCEventService()
+
+
 @lru_cache(maxsize=1)
 def get_picarx_adapter(
     config_manager: Annotated[JsonDataManager, Depends(get_config_manager)],
     smbus_manager: Annotated[SMBusManager, Depends(get_smbus_manager)],
+    bus_scheduler: Annotated[I2CBusScheduler, Depends(get_i2c_bus_scheduler)],
 ) -> PicarxAdapter:
-    return PicarxAdapter(config_manager=config_manager, smbus_manager=smbus_manager)
+    return PicarxAdapter(
+        config_manager=config_manager,
+        smbus_manager=smbus_manager,
+        bus_scheduler=bus_scheduler,
+    )
 
 
 @lru_cache(maxsize=1)
@@ -125,6 +154,8 @@ def get_robot_service(
     config_manager: Annotated[JsonDataManager, Depends(get_config_manager)],
     led_service: Annotated[LEDService, Depends(get_led_service)],
     speed_estimator: Annotated[SpeedEstimator, Depends(get_speed_estimator)],
+    telemetry_service: Annotated[TelemetryService, Depends(get_telemetry_service)],
+    detection_feed: Annotated[DetectionFeedReader, Depends(get_detection_feed)],
 ) -> CarService:
     return CarService(
         connection_manager=connection_manager,
@@ -135,6 +166,8 @@ def get_robot_service(
         config_manager=config_manager,
         led_service=led_service,
         speed_estimator=speed_estimator,
+        telemetry_service=telemetry_service,
+        detection_feed=detection_feed,
     )
 
 
@@ -151,6 +184,9 @@ class LifespanAppDeps(TypedDict):
     speed_estimator: SpeedEstimator
     config_manager: JsonDataManager
     smbus_manager: SMBusManager
+    bus_scheduler: I2CBusScheduler
+    telemetry_service: TelemetryService
+    ipc_event_service: IPCEventService
 
 
 async def get_lifespan_dependencies(
@@ -162,6 +198,9 @@ async def get_lifespan_dependencies(
     speed_estimator: Annotated[SpeedEstimator, Depends(get_speed_estimator)],
     config_manager: Annotated[JsonDataManager, Depends(get_config_manager)],
     smbus_manager: Annotated[SMBusManager, Depends(get_smbus_manager)],
+    bus_scheduler: Annotated[I2CBusScheduler, Depends(get_i2c_bus_scheduler)],
+    telemetry_service: Annotated[TelemetryService, Depends(get_telemetry_service)],
+    ipc_event_service: Annotated[IPCEventService, Depends(get_ipc_event_service)],
 ) -> AsyncGenerator[LifespanAppDeps, None]:
     deps: LifespanAppDeps = {
         "connection_service": connection_service,
@@ -172,5 +211,8 @@ async def get_lifespan_dependencies(
         "speed_estimator": speed_estimator,
         "config_manager": config_manager,
         "smbus_manager": smbus_manager,
+        "bus_scheduler": bus_scheduler,
+        "telemetry_service": telemetry_service,
+        "ipc_event_service": ipc_event_service,
     }
     yield deps
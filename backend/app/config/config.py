@@ -20,6 +20,7 @@ _TEMPLATE_DIR = path.join(_FRONTED_APP_DIR, "dist")
 _STATIC_DIR = path.join(_FRONTED_APP_DIR, _TEMPLATE_DIR, "assets")
 
 _USER_CONFIG_DIR = user_config_dir()
+_SHARED_MEMORY_DIR = "/dev/shm" if path.isdir("/dev/shm") else user_cache_dir()
 
 env_file = path.join(
     _PROJECT_DIR,
@@ -64,6 +65,63 @@ class AppConfig(BaseSettings):
         str, Field(..., description="The directory to save preview images for videos.")
     ] = path.join(user_cache_dir(), APP_NAME, "video_preview")
 
+    PX_THUMBNAIL_CACHE_SIZE_MB: Annotated[
+        int,
+        Field(
+            ...,
+            ge=1,
+            description="Disk budget for generated photo and video thumbnails. "
+            "The least recently used thumbnails are evicted when it is exceeded.",
+        ),
+    ] = 256
+
+    PX_TTS_CACHE_SIZE_MB: Annotated[
+        int,
+        Field(
+            ...,
+            ge=1,
+            description="Disk budget for synthesized speech. "
+            "The least recently played phrases are evicted when it is exceeded.",
+        ),
+    ] = 64
+
+    PX_TELEMETRY_DIR: Annotated[
+        str,
+        Field(
+            ...,
+            description="The directory to record telemetry sessions of the robot.",
+        ),
+    ] = path.join(user_cache_dir(), APP_NAME, "telemetry")
+
+    PX_CONTROL_APP_SOCKET: Annotated[
+        str,
+        Field(
+            ...,
+            description="The Unix domain socket the control app listens on in "
+            "addition to its TCP port, used by the main app to reach it. "
+            "An empty value disables the socket.",
+        ),
+    ] = path.join(user_cache_dir(), APP_NAME, "control.sock")
+
+    PX_DETECTION_FEED_PATH: Annotated[
+        str,
+        Field(
+            ...,
+            description="The memory-mapped file through which the main app "
+            "shares the latest detection result with the control app.",
+        ),
+    ] = path.join(_SHARED_MEMORY_DIR, APP_NAME, "detections.feed")
+
+    PX_DETECTION_PREWARM: Annotated[
+        bool,
+        Field(
+            ...,
+            description="Whether to start the detection worker with the app, so "
+            "that it has imported the detection libraries by the time detection "
+            "is enabled. Disable it to save the memory the idle worker uses.",
+        ),
+    ] = True
+
     PX_SETTINGS_FILE: Annotated[
         str, Field(..., description="The location to write user settings.")
     ] = path.join(_USER_CONFIG_DIR, APP_NAME, "user_settings.json")
@@ -1,27 +1,44 @@
-from app.util.video_enhancers import (
-    preprocess_frame,
-    preprocess_frame_clahe,
-    preprocess_frame_combined,
-    preprocess_frame_edge_enhancement,
-    preprocess_frame_fisheye,
-    preprocess_frame_soft_colors,
-    preprocess_frame_ycrcb,
-    simulate_infrared_vision,
-    simulate_predator_vision,
-    simulate_robocop_vision,
-    simulate_ultrasonic_vision,
-)
-
-frame_enhancers = {
-    "robocop_vision": simulate_robocop_vision,
-    "soft_colors": preprocess_frame_soft_colors,
-    "brightness": preprocess_frame,
-    "fisheye": preprocess_frame_fisheye,
-    "clahe": preprocess_frame_clahe,
-    "combined": preprocess_frame_combined,
-    "edge_enhancement": preprocess_frame_edge_enhancement,
-    "ycrcb": preprocess_frame_ycrcb,
-    "predator_vision": simulate_predator_vision,
-    "infrared_vision": simulate_infrared_vision,
-    "ultrasonic_vision": simulate_ultrasonic_vision,
+from typing import TYPE_CHECKING, Callable, Iterator, Mapping
+
+if TYPE_CHECKING:
+    import numpy as np
+
+FrameEnhancer = Callable[["np.ndarray"], "np.ndarray"]
+
+_FRAME_ENHANCER_FUNCTIONS = {
+    "robocop_vision": "simulate_robocop_vision",
+    "soft_colors": "preprocess_frame_soft_colors",
+    "brightness": "preprocess_frame",
+    "fisheye": "preprocess_frame_fisheye",
+    "clahe": "preprocess_frame_clahe",
+    "combined": "preprocess_frame_combined",
+    "edge_enhancement": "preprocess_frame_edge_enhancement",
+    "ycrcb": "preprocess_frame_ycrcb",
+    "predator_vision": "simulate_predator_vision",
+    "infrared_vision": "simulate_infrared_vision",
+    "ultrasonic_vision": "simulate_ultrasonic_vision",
 }
+
+
+class FrameEnhancers(Mapping[str, FrameEnhancer]):
+    """
+    Maps the enhance modes to their functions in `app.util.video_enhancers`.
+
+    The functions are looked up on access, so listing the modes (as the
+    settings schemas do, including in the control app) does not import
+    OpenCV.
+    """
+
+    def __getitem__(self, name: str) -> FrameEnhancer:
+        from app.util import video_enhancers
+
+        return getattr(video_enhancers, _FRAME_ENHANCER_FUNCTIONS[name])
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(_FRAME_ENHANCER_FUNCTIONS)
+
+    def __len__(self) -> int:
+        return len(_FRAME_ENHANCER_FUNCTIONS)
+
+
+frame_enhancers = FrameEnhancers()
@@ -22,8 +22,11 @@ if TYPE_CHECKING:
     from robot_hat.i2c.smbus_manager import SMBusManager
 
     from app.managers.file_management.json_data_manager import JsonDataManager
+    from app.managers.i2c_bus_scheduler import I2CBusScheduler
     from app.services.connection_service import ConnectionService
     from app.services.control.car_service import CarService
+    from app.services.control.ipc_event_service import IPCEventService
+    from app.services.control.telemetry_service import TelemetryService
     from app.services.sensors.distance_service import DistanceService
     from app.services.sensors.led_service import LEDService
     from app.services.sensors.speed_estimator import SpeedEstimator
@@ -44,6 +47,9 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     speed_estimator: Optional["SpeedEstimator"] = None
     config_manager: Optional["JsonDataManager"] = None
     smbus_manager: Optional["SMBusManager"] = None
+    bus_scheduler: Optional["I2CBusScheduler"] = None
+    telemetry_service: Optional["TelemetryService"] = None
+    ipc_event_service: Optional["IPCEventService"] = None
     battery_service: Optional["BatteryService"] = None
     try:
 
@@ -60,6 +66,9 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
             speed_estimator = deps.get("speed_estimator")
             config_manager = deps.get("config_manager")
             smbus_manager = deps.get("smbus_manager")
+            bus_scheduler = deps.get("bus_scheduler")
+            telemetry_service = deps.get("telemetry_service")
+            ipc_event_service = deps.get("ipc_event_service")
 
         app_loop = asyncio.get_running_loop()
 
@@ -67,6 +76,8 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
             connection_manager=connection_service,
             config_manager=config_manager,
             smbus_manager=smbus_manager,
+            bus_scheduler=bus_scheduler,
+            telemetry_service=telemetry_service,
             app_loop=app_loop,
         )
 
@@ -81,12 +92,23 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
                     distance,
                     distance_service.interval,
                     relative_speed=rel_speed,
+                    direction=(
+                        cast(int, robot_service.current_state["direction"])
+                        if robot_service
+                        else 0
+                    ),
                 )
                 if speed_estimator
                 else None
             )
+            telemetry_service.record_distance_samples(distance_service.ring)
+            telemetry_service.record_speed(
+                speed, distance, distance_service.interval, rel_speed
+            )
+            payload = {"distance": distance, "speed": speed}
+            ipc_event_service.publish("distance", payload)
             await connection_service.broadcast_json(
-                {"type": "distance", "payload": {"distance": distance, "speed": speed}}
+                {"type": "distance", "payload": payload}
             )
 
         battery_service.setup_connection_manager()
@@ -116,6 +138,9 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
             "Lifespan was cancelled mid-shutdown (first-level). Proceeding to final cleanup."
         )
 
+    if ipc_event_service:
+        ipc_event_service.close()
+
     if battery_service:
         try:
             await battery_service.cleanup_connection_manager()
@@ -150,6 +175,15 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
         except Exception as e:
             logger.error("Failed to cleanup LED service: %s", e)
 
+    if telemetry_service:
+        try:
+            await asyncio.to_thread(telemetry_service.close)
+        except Exception as e:
+            logger.error("Failed to close telemetry session: %s", e)
+
+    if bus_scheduler:
+        await asyncio.to_thread(bus_scheduler.close)
+
     logger.info(f"Stopped {app.title}")
 
 
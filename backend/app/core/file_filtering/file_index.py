@@ -0,0 +1,106 @@
+from __future__ import annotations
+
+import os
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from app.schemas.file_filter import FileDetail
+from rapidfuzz import fuzz, process
+
+
+class FileIndex:
+    """
+    Column-oriented view over a listing of files used by the filter service.
+
+    Lowercased search columns and parent directory chains are computed once per
+    listing, so repeated queries over the same files only pay for the scoring.
+    """
+
+    def __init__(
+        self, files: Sequence[FileDetail], signature: Optional[int] = None
+    ) -> None:
+        self.signature: int = (
+            signature if signature is not None else self.compute_signature(files)
+        )
+        self._files = files
+        self._columns: Dict[str, List[str]] = {}
+        self._dir_indexes: Dict[str, int] = {
+            f.path: i for i, f in enumerate(files) if f.is_dir
+        }
+        self._parents_cache: Dict[str, Tuple[int, ...]] = {}
+
+    @staticmethod
+    def compute_signature(files: Sequence[FileDetail]) -> int:
+        """
+        Cheap fingerprint of a listing; changes whenever a file is added, removed,
+        resized or touched.
+        """
+        return hash(tuple((f.path, f.modified, f.size) for f in files))
+
+    def column(self, field: str) -> List[str]:
+        """
+        Returns the lowercased string values of `field` for every file.
+        """
+        values = self._columns.get(field)
+        if values is None:
+            values = [str(getattr(f, field, None) or "").lower() for f in self._files]
+            self._columns[field] = values
+        return values
+
+    def search(
+        self,
+        query: str,
+        field: str,
+        candidates: Sequence[int],
+        min_score: float,
+    ) -> List[int]:
+        """
+        Scores the candidate rows against `query` in one batch and returns the
+        indexes scoring at least `min_score`, in their original order.
+        """
+        column = self.column(field)
+        choices = {i: column[i] for i in candidates}
+        matches = process.extract(
+            query.lower(),
+            choices,
+            scorer=fuzz.WRatio,
+            score_cutoff=min_score,
+            limit=None,
+        )
+        return sorted(key for _, _, key in matches)
+
+    def parent_dirs(self, path: str) -> Tuple[int, ...]:
+        """
+        Returns the indexes of the listed ancestor directories of `path`.
+        """
+        parent = os.path.dirname(path)
+        if not parent or parent == path:
+            return ()
+        cached = self._parents_cache.get(parent)
+        if cached is None:
+            own = self._dir_indexes.get(parent)
+            cached = self.parent_dirs(parent) + ((own,) if own is not None else ())
+            self._parents_cache[parent] = cached
+        return cached
+
+    def with_parent_dirs(self, matched: Sequence[int]) -> List[int]:
+        """
+        Appends the listed parent directories of matched files to `matched`,
+        without duplicates.
+        """
+        result: List[int] = list(matched)
+        seen = set(matched)
+        for i in matched:
+            f = self._files[i]
+            if f.is_dir:
+                continue
+            for parent in self.parent_dirs(f.path):
+                if parent not in seen:
+                    seen.add(parent)
+                    result.append(parent)
+        return result
+
+    def rebind(self, files: Sequence[FileDetail]) -> None:
+        """
+        Points the index to a new listing with the same signature.
+        """
+        self._files = files
@@ -1,5 +1,5 @@
 from abc import ABCMeta, abstractmethod
-from typing import Tuple
+from typing import Optional, Tuple
 
 import numpy as np
 from app.core.logger import Logger
@@ -30,3 +30,16 @@ class VideoCaptureABC(metaclass=ABCMeta):
     @abstractmethod
     def release(self) -> None:
         pass
+
+    @property
+    def frame_timestamp(self) -> Optional[float]:
+        """
+        The capture time of the last read frame as reported by the device, in
+        `time.monotonic()` seconds, or None if the device does not report it.
+        """
+        return None
+
+    @property
+    def dropped_frames(self) -> int:
+        """The number of frames the device dropped since capture started."""
+        return 0
@@ -20,3 +20,9 @@ class AmixerNotInstalled(AudioVolumeUnavailable):
     """Deprecated compatibility exception for unavailable ALSA volume control."""
 
     pass
+
+
+class AudioCodecUnavailable(Exception):
+    """Exception raised when an audio stream codec cannot be used."""
+
+    pass
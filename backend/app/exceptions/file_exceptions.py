@@ -18,3 +18,29 @@ class InvalidMediaType(Exception):
     """
 
     pass
+
+
+class UploadSessionNotFound(Exception):
+    """
+    Exception raised when a resumable upload session does not exist.
+    """
+
+    pass
+
+
+class UploadOffsetMismatch(Exception):
+    """
+    Exception raised when an upload chunk does not start at the current offset.
+    """
+
+    def __init__(self, message: str, offset: int) -> None:
+        super().__init__(message)
+        self.offset = offset
+
+
+class UploadIntegrityError(Exception):
+    """
+    Exception raised when a finalized upload has an unexpected size or checksum.
+    """
+
+    pass
@@ -65,3 +65,21 @@ class MotorNotFoundError(ValueError):
     """
 
     pass
+
+
+class ControlProtocolError(ValueError):
+    """
+    Exception raised when a binary control frame is malformed.
+    """
+
+    pass
+
+
+class TelemetrySessionNotFound(Exception):
+    """
+    Exception raised when a telemetry session does not exist.
+    """
+
+    def __init__(self, session_id: str) -> None:
+        super().__init__(f"Telemetry session '{session_id}' not found")
+        self.session_id = session_id
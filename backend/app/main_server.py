@@ -27,6 +27,10 @@ from app.util.get_ip_address import get_ip_address
 if TYPE_CHECKING:
     from app.services.connection_service import ConnectionService
     from app.services.detection.detection_service import DetectionService
+    from app.services.integration.robot_communication_service import (
+        RobotCommunicationService,
+    )
+    from app.services.media.audio_service import AudioService
     from app.services.media.music_file_service import MusicFileService
     from app.services.media.tts_service import TTSService
 
@@ -46,6 +50,8 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     detection_manager: Optional["DetectionService"] = None
     music_file_service: Optional["MusicFileService"] = None
     tts_service: Optional["TTSService"] = None
+    audio_service: Optional["AudioService"] = None
+    robot_communication_service: Optional["RobotCommunicationService"] = None
 
     def cancel_server(*_) -> None:
         _log.info(f"🛑 Received signal to stop {app.title}")
@@ -65,6 +71,12 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
             detection_manager = deps.get("detection_manager")
             music_file_service = deps.get("music_file_service")
             tts_service = deps.get("tts_service")
+            settings_service = deps.get("settings_service")
+            audio_service = deps.get("audio_service")
+            robot_communication_service = deps.get("robot_communication_service")
+
+        if settings.PX_DETECTION_PREWARM:
+            detection_manager.start_worker()
 
         app.state.template_folder = settings.TEMPLATE_DIR
         app.state.app_manager = connection_manager
@@ -79,6 +91,30 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
         music_file_service.music_service.update_tracks(sorted_tracks)
         music_file_service.music_service.start_broadcast_task()
 
+        loop = asyncio.get_running_loop()
+
+        def broadcast_volume(volume: int) -> None:
+            asyncio.run_coroutine_threadsafe(
+                connection_manager.broadcast_json(
+                    {"type": "volume", "payload": volume}
+                ),
+                loop,
+            )
+
+        audio_service.set_volume_listener(broadcast_volume)
+
+        tts_settings = settings_service.load_settings().get("tts") or {}
+        if tts_settings.get("prewarm_cache"):
+            default_lang = tts_settings.get("default_tts_language") or "en"
+            phrases = [
+                (item["text"], item.get("language") or default_lang)
+                for item in tts_settings.get("texts") or []
+                if item.get("text")
+            ]
+            app.state.tts_prewarm_task = asyncio.create_task(
+                asyncio.to_thread(tts_service.prewarm, phrases)
+            )
+
         if signal_file_path:
             try:
                 with open(signal_file_path, "w") as f:
@@ -105,6 +141,16 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
         except Exception:
             _log.error("Failed to clean up tts_service.", exc_info=True)
 
+        try:
+            if audio_service:
+                audio_service.set_volume_listener(None)
+                await asyncio.to_thread(audio_service.close)
+        except asyncio.CancelledError:
+            _log.warning("Cancelled while cleaning up audio_service.")
+            raise
+        except Exception:
+            _log.error("Failed to clean up audio_service.", exc_info=True)
+
         try:
             if music_file_service:
                 await music_file_service.music_service.close()
@@ -121,6 +167,15 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
             _log.warning("Cancelled while cleaning up detection_manager.")
             raise
 
+        try:
+            if robot_communication_service:
+                await robot_communication_service.aclose()
+        except asyncio.CancelledError:
+            _log.warning("Cancelled while closing robot_communication_service.")
+            raise
+        except Exception:
+            _log.error("Failed to close robot_communication_service.", exc_info=True)
+
         if signal_file_path and os.path.exists(signal_file_path):
             os.remove(signal_file_path)
 
@@ -1,3 +1,4 @@
+import os
 import queue
 import sys
 import time
@@ -6,7 +7,8 @@ from typing import TYPE_CHECKING, List, Optional, Union
 from app.core.logger import Logger
 from app.exceptions.detection import DetectionDimensionMismatch
 from app.managers.detection.object_detection import perform_detection
-from app.managers.model_manager import ModelManager
+from app.managers.detection_feed import DetectionFeedWriter
+from app.managers.model_manager import ModelManager, preload_detection_libraries
 from app.types.detection import (
     DetectionControlMessage,
     DetectionErrorMessage,
@@ -15,6 +17,7 @@ from app.types.detection import (
     DetectionProcessOutput,
     DetectionQueueData,
     DetectionReadyMessage,
+    DetectionWorkerCommand,
     SegmentationDetail,
 )
 from app.util.queue_helpers import put_to_queue
@@ -49,6 +52,7 @@ def detection_process_func(
     detection_queue: "mp.Queue[DetectionQueueData]",
     control_queue: "mp.Queue[DetectionControlMessage]",
     out_queue: "mp.Queue[Union[DetectionReadyMessage, DetectionLoadErrorMessage, DetectionErrorMessage]]",
+    feed_path: Optional[str] = None,
 ) -> None:
     """
     A function that runs in a separate multiprocessing process to perform object detection on input frames.
@@ -60,15 +64,19 @@ def detection_process_func(
         detection_queue: A queue where object detection results are placed.
         control_queue: A queue for control commands (e.g., updating confidence thresholds or detection labels).
         out_queue: A queue for sending the detection process's success or error statuses.
+        feed_path: Optional path of the detection feed file (see `DetectionFeedWriter`)
+            to publish every detection result to for other processes.
 
     Behavior:
         - Loads the specified YOLO model and initializes required settings.
         - Processes frames from the `frame_queue` and performs object detection.
         - Updates detection settings dynamically using messages from the `control_queue`.
-        - Outputs detection results with timestamps to the `detection_queue`.
+        - Outputs detection results with timestamps to the `detection_queue`, and to
+          the detection feed if `feed_path` is given.
         - Sends success or error messages to the `out_queue`.
         - Stops gracefully when the `stop_event` is set.
     """
+    feed: Optional[DetectionFeedWriter] = None
     with ModelManager(model) as pair:
         try:
             yolo_model, err_msg = pair
@@ -94,6 +102,12 @@ def detection_process_func(
             labels: Optional[List[str]] = None
             segmentation_detail: SegmentationDetail = "balanced"
 
+            if feed_path:
+                try:
+                    feed = DetectionFeedWriter(feed_path)
+                except (OSError, ValueError) as e:
+                    _log.warning("Failed to open detection feed %s: %s", feed_path, e)
+
             while not stop_event.is_set():
                 try:
                     while not control_queue.empty():
@@ -174,6 +188,13 @@ def detection_process_func(
                     )
                     prev_time = time.time()
 
+                if feed is not None:
+                    feed.publish(
+                        detection_result_with_timestamp,
+                        frame_width=frame_data["original_width"],
+                        frame_height=frame_data["original_height"],
+                    )
+
                 put_to_queue(
                     detection_queue, detection_result_with_timestamp, reraise=True
                 )
@@ -193,4 +214,99 @@ def detection_process_func(
             stop_event.set()
 
         finally:
+            if feed is not None:
+                feed.close()
             _log.info("Detection process is finished.")
+
+
+def detection_worker_func(
+    stop_event: "Event",
+    idle_event: "Event",
+    frame_queue: "mp.Queue[DetectionFrameData]",
+    detection_queue: "mp.Queue[DetectionQueueData]",
+    control_queue: "mp.Queue[Union[DetectionWorkerCommand, DetectionControlMessage]]",
+    out_queue: "mp.Queue[Union[DetectionReadyMessage, DetectionLoadErrorMessage, DetectionErrorMessage]]",
+    feed_path: Optional[str] = None,
+) -> None:
+    """
+    Runs in a long-lived process that performs object detection with whichever
+    model it is told to load.
+
+    The worker imports the detection libraries once, at start, and then waits
+    for commands on the `control_queue`:
+        - `load_model` runs `detection_process_func` with the model, which
+          reports readiness to the `out_queue` and detects until the
+          `stop_event` is set or detection fails. The model is then released
+          and the worker waits for the next command.
+        - `shutdown` exits the worker.
+
+    The `idle_event` is set while the worker has no model loaded. The worker
+    also exits if the process that started it is gone.
+    """
+    parent_pid = os.getppid()
+    started_at = time.monotonic()
+    err_msg = preload_detection_libraries()
+    if err_msg:
+        _log.warning(err_msg)
+    else:
+        _log.info(
+            "Detection worker has imported the detection libraries in %.1fs",
+            time.monotonic() - started_at,
+        )
+    idle_event.set()
+
+    try:
+        while True:
+            try:
+                message = control_queue.get(timeout=1)
+            except queue.Empty:
+                if os.getppid() != parent_pid:
+                    _log.warning("Detection worker's parent has exited, stopping.")
+                    return
+                continue
+
+            command = message.get("command")
+            if command == "shutdown":
+                return
+            if command != "load_model":
+                continue
+
+            model = message["model"]
+            idle_event.clear()
+            try:
+                detection_process_func(
+                    model,
+                    stop_event,
+                    frame_queue,
+                    detection_queue,
+                    control_queue,
+                    out_queue,
+                    feed_path,
+                )
+            except (ConnectionError, EOFError):
+                raise
+            except Exception as e:
+                # keep the worker for the next model when this one cannot load
+                _log.error("Detection failed with model %s", model, exc_info=True)
+                err: DetectionLoadErrorMessage = {
+                    "success": False,
+                    "error": f"Failed to load the model {model}: {e}",
+                }
+                put_to_queue(out_queue, err, reraise=True)
+            finally:
+                idle_event.set()
+    except (
+        ConnectionError,
+        ConnectionRefusedError,
+        BrokenPipeError,
+        EOFError,
+        ConnectionResetError,
+    ) as e:
+        _log.warning(
+            "Connection-related error occurred in detection worker: %s",
+            type(e).__name__,
+        )
+    except KeyboardInterrupt:
+        _log.warning("Detection worker received keyboard interrupt, exiting.")
+    finally:
+        _log.info("Detection worker is finished.")
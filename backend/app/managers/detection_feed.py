@@ -0,0 +1,343 @@
+import mmap
+import os
+import struct
+import time
+from dataclasses import dataclass
+from typing import BinaryIO, List, NamedTuple, Optional, Sequence, Tuple
+
+import numpy as np
+from app.types.detection import DetectionQueueData
+
+MAGIC = b"PXDET1"
+FORMAT_VERSION = 1
+
+HEADER = struct.Struct("<6sHHH")
+HEADER_SIZE = 64
+LABEL_SIZE = 32
+
+DETECTION_DTYPE = np.dtype(
+    [
+        ("bbox", "<f4", (4,)),
+        ("confidence", "<f4"),
+        ("track_id", "<i4"),
+        ("label", f"S{LABEL_SIZE}"),
+    ]
+)
+
+
+def slot_dtype(max_detections: int) -> np.dtype:
+    return np.dtype(
+        [
+            ("start_seq", "<u8"),
+            ("timestamp", "<f8"),
+            ("published_at", "<f8"),
+            ("frame_width", "<f4"),
+            ("frame_height", "<f4"),
+            ("count", "<u4"),
+            ("reserved", "<u4"),
+            ("detections", DETECTION_DTYPE, (max_detections,)),
+            ("end_seq", "<u8"),
+        ]
+    )
+
+
+class FeedDetection(NamedTuple):
+    """
+    A detected object. `track_id` is the tracker id of the object, or -1 if
+    the model does not track objects.
+    """
+
+    bbox: Tuple[float, float, float, float]
+    label: str
+    confidence: float
+    track_id: int
+
+    @property
+    def center(self) -> Tuple[float, float]:
+        x1, y1, x2, y2 = self.bbox
+        return (x1 + x2) / 2, (y1 + y2) / 2
+
+    @property
+    def width(self) -> float:
+        return self.bbox[2] - self.bbox[0]
+
+    @property
+    def height(self) -> float:
+        return self.bbox[3] - self.bbox[1]
+
+
+@dataclass(frozen=True)
+class DetectionFrame:
+    """
+    The detections of one camera frame.
+
+    `timestamp` is the wall-clock capture time of the frame, as in
+    `DetectionQueueData`; `published_at` is the `time.monotonic()` at which
+    the result was written to the feed.
+    """
+
+    seq: int
+    timestamp: float
+    published_at: float
+    frame_width: float
+    frame_height: float
+    detections: List[FeedDetection]
+
+    def age(self, now: Optional[float] = None) -> float:
+        return (time.monotonic() if now is None else now) - self.published_at
+
+
+def _open_mapping(path: str, size: int, writable: bool) -> Tuple[BinaryIO, mmap.mmap]:
+    file = open(path, "r+b" if writable else "rb")
+    try:
+        if writable and os.fstat(file.fileno()).st_size != size:
+            file.truncate(size)
+        mapping = mmap.mmap(
+            file.fileno(),
+            size,
+            access=mmap.ACCESS_WRITE if writable else mmap.ACCESS_READ,
+        )
+    except BaseException:
+        file.close()
+        raise
+    return file, mapping
+
+
+class DetectionFeedWriter:
+    """
+    Publishes the latest detection result into a memory-mapped file that other
+    processes read without any system call.
+
+    The file holds a single slot guarded by a sequence number written before
+    and after its payload, like `DistanceRing`, so readers in other processes
+    drop a result that was overwritten while they were copying it instead of
+    returning a torn one. Keep the file on a RAM-backed file system, such as
+    `/dev/shm`, so that publishing never touches the disk.
+
+    An existing feed file is reused, and its sequence continued, so readers
+    that mapped it before keep working when the detection process restarts.
+    """
+
+    DEFAULT_MAX_DETECTIONS = 64
+
+    def __init__(self, path: str, max_detections: int = DEFAULT_MAX_DETECTIONS) -> None:
+        if max_detections < 1:
+            raise ValueError("Max detections must be positive")
+        self.path = path
+        self.max_detections = max_detections
+        self.dtype = slot_dtype(max_detections)
+        size = HEADER_SIZE + self.dtype.itemsize
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        seq = _read_seq(path, max_detections)
+        if not os.path.exists(path):
+            open(path, "wb").close()
+        self._file, self._map = _open_mapping(path, size, writable=True)
+        header = bytearray(HEADER_SIZE)
+        HEADER.pack_into(header, 0, MAGIC, FORMAT_VERSION, max_detections, LABEL_SIZE)
+        self._map[:HEADER_SIZE] = bytes(header)
+        self._slot = np.frombuffer(
+            self._map, dtype=self.dtype, count=1, offset=HEADER_SIZE
+        )
+        if seq is None:
+            self._slot[:] = np.zeros(1, dtype=self.dtype)
+        self.seq = seq or 0
+
+    @property
+    def closed(self) -> bool:
+        return self._map.closed
+
+    def publish(
+        self,
+        data: DetectionQueueData,
+        frame_width: float = 0,
+        frame_height: float = 0,
+    ) -> int:
+        """
+        Publishes a detection result, replacing the previous one, and returns
+        its sequence number. Results beyond `max_detections` are dropped.
+        """
+        results = data["detection_result"][: self.max_detections]
+        detections = np.zeros(len(results), dtype=DETECTION_DTYPE)
+        for i, result in enumerate(results):
+            detections[i] = (
+                result["bbox"][:4],
+                result["confidence"],
+                result.get("track_id", -1),
+                result["label"].encode()[:LABEL_SIZE],
+            )
+
+        seq = self.seq + 1
+        slot = self._slot
+        slot["start_seq"] = seq
+        slot["timestamp"] = data["timestamp"]
+        slot["published_at"] = time.monotonic()
+        slot["frame_width"] = frame_width
+        slot["frame_height"] = frame_height
+        slot["count"] = len(detections)
+        slot["detections"][0, : len(detections)] = detections
+        slot["end_seq"] = seq
+        self.seq = seq
+        return seq
+
+    def close(self) -> None:
+        if self._map.closed:
+            return
+        del self._slot
+        self._map.close()
+        self._file.close()
+
+
+def _read_header(data: bytes) -> Optional[int]:
+    """
+    Returns the max detections of a feed file header, or None if it is not a
+    feed file of this version.
+    """
+    if len(data) < HEADER_SIZE:
+        return None
+    magic, version, max_detections, label_size = HEADER.unpack_from(data)
+    if magic != MAGIC or version != FORMAT_VERSION or label_size != LABEL_SIZE:
+        return None
+    return max_detections
+
+
+def _read_seq(path: str, max_detections: int) -> Optional[int]:
+    """
+    Returns the last sequence number of an existing feed file with the same
+    layout, or None.
+    """
+    reader = DetectionFeedReader(path)
+    try:
+        frame = reader.read()
+        if reader.max_detections != max_detections:
+            return None
+        return frame.seq if frame is not None else 0
+    finally:
+        reader.close()
+
+
+class DetectionFeedReader:
+    """
+    Reads the latest result of a `DetectionFeedWriter`.
+
+    The feed file may not exist yet when the reader is created, and may be
+    recreated with a different layout; the reader (re)maps it when needed,
+    checking the file at most every `recheck_s` seconds.
+    """
+
+    def __init__(self, path: str, recheck_s: float = 1.0) -> None:
+        self.path = path
+        self.recheck_s = recheck_s
+        self.max_detections: Optional[int] = None
+        self._file: Optional[BinaryIO] = None
+        self._map: Optional[mmap.mmap] = None
+        self._slot: Optional[np.ndarray] = None
+        self._stat: Optional[Tuple[int, int]] = None
+        self._checked_at: Optional[float] = None
+
+    def _check(self) -> bool:
+        now = time.monotonic()
+        if self._checked_at is not None and now - self._checked_at < self.recheck_s:
+            return self._slot is not None
+        self._checked_at = now
+        try:
+            stat = os.stat(self.path)
+        except FileNotFoundError:
+            self.close()
+            return False
+        key = (stat.st_ino, stat.st_size)
+        if self._slot is not None and key == self._stat:
+            return True
+        self.close()
+        try:
+            with open(self.path, "rb") as file:
+                max_detections = _read_header(file.read(HEADER_SIZE))
+            if max_detections is None:
+                return False
+            dtype = slot_dtype(max_detections)
+            size = HEADER_SIZE + dtype.itemsize
+            if stat.st_size < size:
+                return False
+            self._file, self._map = _open_mapping(self.path, size, writable=False)
+        except (FileNotFoundError, ValueError, OSError):
+            self.close()
+            return False
+        self._slot = np.frombuffer(self._map, dtype=dtype, count=1, offset=HEADER_SIZE)
+        self.max_detections = max_detections
+        self._stat = key
+        return True
+
+    @property
+    def seq(self) -> int:
+        """
+        The sequence number of the latest published result, or 0.
+        """
+        return int(self._slot["end_seq"][0]) if self._slot is not None else 0
+
+    def read(self, retries: int = 3) -> Optional[DetectionFrame]:
+        """
+        Returns the latest published result, or None if there is none or it
+        was being overwritten on every attempt.
+        """
+        if not self._check():
+            return None
+        slot = self._slot
+        assert slot is not None
+        for _ in range(retries):
+            end_seq = int(slot["end_seq"][0])
+            if end_seq == 0:
+                return None
+            snapshot = slot.copy()[0]
+            if not (
+                int(snapshot["start_seq"])
+                == int(snapshot["end_seq"])
+                == end_seq
+                == int(slot["start_seq"][0])
+            ):
+                continue
+            count = min(int(snapshot["count"]), len(snapshot["detections"]))
+            return DetectionFrame(
+                seq=end_seq,
+                timestamp=float(snapshot["timestamp"]),
+                published_at=float(snapshot["published_at"]),
+                frame_width=float(snapshot["frame_width"]),
+                frame_height=float(snapshot["frame_height"]),
+                detections=_to_detections(snapshot["detections"][:count]),
+            )
+        return None
+
+    def read_new(self, last_seq: int) -> Optional[DetectionFrame]:
+        """
+        Returns the latest result if it is newer than the result `last_seq`.
+        """
+        if not self._check() or self.seq == last_seq:
+            return None
+        frame = self.read()
+        if frame is None or frame.seq == last_seq:
+            return None
+        return frame
+
+    def close(self) -> None:
+        self._slot = None
+        self._stat = None
+        self.max_detections = None
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+def _to_detections(records: Sequence) -> List[FeedDetection]:
+    return [
+        FeedDetection(
+            bbox=tuple(float(v) for v in record["bbox"]),  # type: ignore[arg-type]
+            label=bytes(record["label"]).decode(errors="replace"),
+            confidence=float(record["confidence"]),
+            track_id=int(record["track_id"]),
+        )
+        for record in records
+    ]
@@ -3,6 +3,7 @@ from time import sleep
 from typing import TYPE_CHECKING, Union
 
 from app.core.px_logger import Logger
+from app.managers.distance_ring import DistanceRing, DistanceStatus
 from gpiozero.exc import PinError, PinFixedPull
 from robot_hat import (
     InvalidPin,
@@ -20,7 +21,6 @@ else:
 
 
 if TYPE_CHECKING:
-    from multiprocessing.sharedctypes import Synchronized
     from multiprocessing.synchronize import Event
 
 
@@ -31,7 +31,7 @@ def distance_process(
     trig_pin: Union[int, str],
     echo_pin: Union[int, str],
     stop_event: "Event",
-    value: "Synchronized[float]",
+    ring: DistanceRing,
     interval: float = 0.01,
     timeout=0.017,
 ) -> None:
@@ -44,10 +44,10 @@ def distance_process(
         while not stop_event.is_set():
             try:
                 val = float(ultrasonic.read())
-                value.value = val
+                ring.append(val, DistanceStatus.from_reading(val))
                 _log.debug(
                     "Distance process read value=%s with interval %s",
-                    value.value,
+                    val,
                     interval,
                 )
 
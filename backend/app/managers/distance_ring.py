@@ -0,0 +1,219 @@
+import ctypes
+import multiprocessing as mp
+import time
+from enum import IntEnum
+from typing import Any, Dict, NamedTuple, Optional
+
+import numpy as np
+
+_END_SEQ, _TS, _DISTANCE, _STATUS, _START_SEQ = range(5)
+_FIELDS = 5
+
+
+class DistanceStatus(IntEnum):
+    OK = 0
+    TIMEOUT = 1
+    ERROR = 2
+
+    @classmethod
+    def from_reading(cls, value: float) -> "DistanceStatus":
+        """
+        Maps an ultrasonic reading to a status: the sensor reports a timeout as
+        -1 and other failures as other negative values.
+        """
+        if value >= 0:
+            return cls.OK
+        return cls.TIMEOUT if value == -1 else cls.ERROR
+
+
+class DistanceSamples(NamedTuple):
+    """
+    Samples in write order, as parallel arrays.
+    """
+
+    seq: np.ndarray
+    ts: np.ndarray
+    distance: np.ndarray
+    status: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.seq)
+
+    @property
+    def last_seq(self) -> Optional[int]:
+        return int(self.seq[-1]) if len(self.seq) else None
+
+    def valid(self) -> "DistanceSamples":
+        """
+        Returns only the samples with a successful reading.
+        """
+        mask = self.status == DistanceStatus.OK
+        return DistanceSamples(*(field[mask] for field in self))
+
+
+class DistanceRing:
+    """
+    Fixed-size ring of timestamped distance samples in shared memory.
+
+    The distance process is the single writer; any number of readers in other
+    processes or threads read it without locks. Each slot is guarded by a
+    sequence number written before and after its payload (in reverse order of
+    the reader's copy), so a reader drops slots that were overwritten while it
+    was copying them instead of returning torn samples.
+
+    Timestamps are `time.monotonic()` of the writer, which on Linux is the same
+    clock in every process, so readers can compare them with their own clock.
+    """
+
+    DEFAULT_CAPACITY = 512
+
+    def __init__(self, capacity: int = DEFAULT_CAPACITY) -> None:
+        if capacity < 1:
+            raise ValueError("Capacity must be positive")
+        self.capacity = capacity
+        self._slots = mp.RawArray(ctypes.c_double, capacity * _FIELDS)
+        self._head = mp.RawValue(ctypes.c_int64, 0)
+        self._view: Optional[np.ndarray] = None
+
+    def __getstate__(self) -> Dict[str, Any]:
+        state = self.__dict__.copy()
+        state["_view"] = None
+        return state
+
+    @property
+    def _rows(self) -> np.ndarray:
+        if self._view is None:
+            self._view = np.frombuffer(self._slots, dtype=np.float64).reshape(
+                self.capacity, _FIELDS
+            )
+        return self._view
+
+    @property
+    def head(self) -> int:
+        """
+        The total number of samples written, which is also the sequence number
+        of the latest sample.
+        """
+        return self._head.value
+
+    def append(
+        self,
+        distance: float,
+        status: DistanceStatus = DistanceStatus.OK,
+        ts: Optional[float] = None,
+    ) -> int:
+        """
+        Writes a sample and returns its sequence number. Must only be called by
+        the single writer.
+        """
+        seq = self._head.value + 1
+        row = self._rows[(seq - 1) % self.capacity]
+        row[_START_SEQ] = seq
+        row[_TS] = time.monotonic() if ts is None else ts
+        row[_DISTANCE] = distance
+        row[_STATUS] = status
+        row[_END_SEQ] = seq
+        self._head.value = seq
+        return seq
+
+    def reset(self) -> None:
+        """
+        Discards all samples. Must not be called while the writer is running.
+        """
+        self._rows.fill(0)
+        self._head.value = 0
+
+    def read_since(self, seq: int = 0) -> DistanceSamples:
+        """
+        Returns the samples written after the sample `seq`, oldest first.
+
+        A reader that passes the `last_seq` of the previous result sees every
+        sample exactly once, unless it falls behind by more than `capacity`
+        samples, in which case the overwritten samples are skipped. A `seq`
+        ahead of the head means that the ring was reset since, so all of its
+        samples are returned.
+        """
+        head = self.head
+        if seq > head:
+            seq = 0
+        first = max(seq, head - self.capacity) + 1
+        if first > head:
+            return _EMPTY_SAMPLES
+
+        expected = np.arange(first, head + 1, dtype=np.float64)
+        rows = self._rows[(expected.astype(np.int64) - 1) % self.capacity].copy()
+        intact = (rows[:, _END_SEQ] == expected) & (rows[:, _START_SEQ] == expected)
+        rows = rows[intact]
+        return DistanceSamples(
+            seq=rows[:, _END_SEQ].astype(np.int64),
+            ts=rows[:, _TS],
+            distance=rows[:, _DISTANCE],
+            status=rows[:, _STATUS].astype(np.int8),
+        )
+
+    def window(self, seconds: float, now: Optional[float] = None) -> DistanceSamples:
+        """
+        Returns the samples taken within the last `seconds`.
+        """
+        samples = self.read_since(0)
+        cutoff = (time.monotonic() if now is None else now) - seconds
+        mask = samples.ts >= cutoff
+        return DistanceSamples(*(field[mask] for field in samples))
+
+    def latest(self) -> Optional[DistanceSamples]:
+        """
+        Returns the latest sample, or None if nothing has been written yet.
+        """
+        samples = self.read_since(max(0, self.head - 1))
+        return samples if len(samples) else None
+
+
+_EMPTY_SAMPLES = DistanceSamples(
+    seq=np.empty(0, dtype=np.int64),
+    ts=np.empty(0, dtype=np.float64),
+    distance=np.empty(0, dtype=np.float64),
+    status=np.empty(0, dtype=np.int8),
+)
+
+
+def reject_outliers(distances: np.ndarray, threshold: float = 3.0) -> np.ndarray:
+    """
+    Returns a mask of the distances within `threshold` scaled median absolute
+    deviations of the median.
+    """
+    if len(distances) < 3:
+        return np.ones(len(distances), dtype=bool)
+    median = np.median(distances)
+    deviation = np.abs(distances - median)
+    mad = 1.4826 * np.median(deviation)
+    if mad == 0:
+        return deviation == 0
+    return deviation <= threshold * mad
+
+
+def median_distance(samples: DistanceSamples) -> Optional[float]:
+    """
+    Returns the median of the valid samples after rejecting outliers.
+    """
+    distances = samples.valid().distance
+    if not len(distances):
+        return None
+    return float(np.median(distances[reject_outliers(distances)]))
+
+
+def estimate_velocity(samples: DistanceSamples) -> Optional[float]:
+    """
+    Returns the rate of change of the distance in units per second, as the
+    least-squares slope over the valid, non-outlier samples. Negative values
+    mean that the obstacle is approaching.
+    """
+    valid = samples.valid()
+    mask = reject_outliers(valid.distance)
+    ts, distances = valid.ts[mask], valid.distance[mask]
+    if len(ts) < 2:
+        return None
+    t = ts - ts.mean()
+    denominator = float(np.dot(t, t))
+    if denominator == 0:
+        return None
+    return float(np.dot(t, distances - distances.mean()) / denominator)
@@ -2,11 +2,23 @@ from __future__ import annotations
 
 import json
 import os
+import sqlite3
+import threading
 from dataclasses import asdict, dataclass
-from typing import Any, Callable, Dict, Generic, Optional, TypeVar
+from pathlib import Path
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Generic,
+    Iterable,
+    Optional,
+    Set,
+    Tuple,
+    TypeVar,
+)
 
 from app.core.logger import Logger
-from app.util.atomic_write import atomic_write
 
 T = TypeVar("T")
 
@@ -17,68 +29,285 @@ _log = Logger(__name__)
 class CacheEntry(Generic[T]):
     modified_time: float
     details: T
+    size: Optional[int] = None
 
+    def is_fresh(self, modified_time: float, size: Optional[int] = None) -> bool:
+        """
+        Whether the entry still describes a file with the given mtime and size.
 
-T = TypeVar("T")
+        Entries written before the size was tracked only compare the mtime.
+        """
+        if self.modified_time != modified_time:
+            return False
+        return self.size is None or size is None or self.size == size
+
+
+class _TrackedDict(Dict[str, CacheEntry[T]]):
+    """
+    A dict that records which keys were assigned or removed since the last flush.
+    """
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.changed: Set[str] = set()
+        self.removed: Set[str] = set()
+
+    def _touch(self, key: str) -> None:
+        self.changed.add(key)
+        self.removed.discard(key)
+
+    def _drop(self, key: str) -> None:
+        self.removed.add(key)
+        self.changed.discard(key)
+
+    def __setitem__(self, key: str, value: CacheEntry[T]) -> None:
+        super().__setitem__(key, value)
+        self._touch(key)
+
+    def __delitem__(self, key: str) -> None:
+        super().__delitem__(key)
+        self._drop(key)
+
+    def pop(self, key: str, *args: Any) -> Any:
+        if key in self:
+            self._drop(key)
+        return super().pop(key, *args)
+
+    def popitem(self) -> Tuple[str, CacheEntry[T]]:
+        key, value = super().popitem()
+        self._drop(key)
+        return key, value
+
+    def setdefault(self, key: str, default: Any = None) -> Any:
+        if key not in self:
+            self._touch(key)
+        return super().setdefault(key, default)
+
+    def update(self, *args, **kwargs) -> None:
+        for key, value in dict(*args, **kwargs).items():
+            self[key] = value
+
+    def clear(self) -> None:
+        for key in list(self.keys()):
+            self._drop(key)
+        super().clear()
+
+    def reset_tracking(self) -> None:
+        self.changed.clear()
+        self.removed.clear()
 
 
 class CacheManager(Generic[T]):
+    """
+    Metadata cache backed by an SQLite database in WAL mode.
+
+    Entries are kept in memory and keyed by the relative file path. Only the
+    entries that were assigned, removed or explicitly marked as dirty are written
+    back, so a single rename or duration update costs one row upsert instead of
+    rewriting the whole cache.
+    """
+
+    _SCHEMA = (
+        "CREATE TABLE IF NOT EXISTS entries ("
+        "path TEXT PRIMARY KEY, "
+        "modified_time REAL NOT NULL, "
+        "size INTEGER, "
+        "details TEXT NOT NULL)"
+    )
+
     def __init__(
         self,
         cache_file: str,
         details_factory: Callable[[Dict[str, Any]], T],
+        legacy_cache_file: Optional[str] = None,
+        key_exists: Optional[Callable[[str], bool]] = None,
     ) -> None:
         """
-        details_factory: a function that converts a dict (from JSON)
-                         into an instance of type T.
+        Args:
+            `cache_file`: Path to the SQLite database.
+            `details_factory`: A function that converts a dict (from JSON)
+                into an instance of type T.
+            `legacy_cache_file`: Optional JSON cache written by older versions,
+                imported once when the database is empty.
+            `key_exists`: Optional predicate used to evict entries of deleted
+                files when the cache is loaded.
         """
         self.cache_file: str = cache_file
         self.details_factory: Callable[[Dict[str, Any]], T] = details_factory
-        self._cache: Optional[Dict[str, CacheEntry[T]]] = None
-        self._dirty: bool = False
+        self.legacy_cache_file = legacy_cache_file
+        self.key_exists = key_exists
+        self._cache: Optional[_TrackedDict[T]] = None
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.RLock()
+        self._full_flush: bool = False
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            Path(self.cache_file).parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(self.cache_file, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(self._SCHEMA)
+            conn.commit()
+            self._conn = conn
+        return self._conn
+
+    def _entry_from_row(self, row: Tuple[str, float, Optional[int], str]):
+        path, modified_time, size, details = row
+        return path, CacheEntry(
+            modified_time=modified_time,
+            size=size,
+            details=self.details_factory(json.loads(details)),
+        )
+
+    def _import_legacy(self) -> None:
+        legacy_file = self.legacy_cache_file
+        if self._cache is None or not legacy_file or not os.path.exists(legacy_file):
+            return
+
+        _log.info("Importing legacy cache from %s", legacy_file)
+        with open(legacy_file, "r", encoding="utf-8") as f:
+            loaded: Dict[str, Any] = json.load(f)
+
+        self._cache.update(
+            {
+                key: CacheEntry(
+                    modified_time=value["modified_time"],
+                    details=self.details_factory(value["details"]),
+                )
+                for key, value in loaded.items()
+            }
+        )
+        self.save_cache()
+        if not self.dirty:
+            os.remove(legacy_file)
 
     def get_cache(self) -> Dict[str, CacheEntry[T]]:
         if self._cache is not None:
             return self._cache
 
-        if os.path.exists(self.cache_file):
+        with self._lock:
+            if self._cache is not None:
+                return self._cache
             try:
-                with open(self.cache_file, "r", encoding="utf-8") as f:
-                    loaded: Dict[str, Any] = json.load(f)
-                    self._cache = {
-                        key: CacheEntry(
-                            modified_time=value["modified_time"],
-                            details=self.details_factory(value["details"]),
-                        )
-                        for key, value in loaded.items()
-                    }
+                conn = self._connect()
+                rows = conn.execute(
+                    "SELECT path, modified_time, size, details FROM entries"
+                ).fetchall()
+                cache: _TrackedDict[T] = _TrackedDict(
+                    self._entry_from_row(row) for row in rows
+                )
+                self._cache = cache
+                if not rows:
+                    self._import_legacy()
+                self.evict_missing()
             except Exception:
                 _log.error(
                     "Unhandled error loading cache from %s",
                     self.cache_file,
                     exc_info=True,
                 )
-                self._cache = {}
-        else:
-            self._cache = {}
+                self._cache = _TrackedDict()
         return self._cache
 
-    def mark_dirty(self) -> None:
-        self._dirty = True
+    def mark_dirty(self, key: Optional[str] = None) -> None:
+        """
+        Marks an entry that was mutated in place as needing a write.
+
+        Without a key, the whole cache is rewritten on the next save.
+        """
+        if self._cache is None:
+            return
+        if key is None:
+            self._full_flush = True
+        elif key in self._cache:
+            self._cache._touch(key)
+
+    @property
+    def dirty(self) -> bool:
+        return self._cache is not None and (
+            self._full_flush or bool(self._cache.changed or self._cache.removed)
+        )
 
     def maybe_save(self) -> None:
-        if self._dirty:
+        if self.dirty:
+            self.save_cache()
+
+    def evict(self, keys: Iterable[str]) -> int:
+        """
+        Removes the given keys from the cache, returning the number of evicted entries.
+        """
+        cache = self.get_cache()
+        count = 0
+        for key in keys:
+            if key in cache:
+                del cache[key]
+                count += 1
+        return count
+
+    def evict_missing(self) -> int:
+        """
+        Evicts entries whose files no longer exist according to `key_exists`.
+        """
+        if self._cache is None or self.key_exists is None:
+            return 0
+        stale = [key for key in self._cache if not self.key_exists(key)]
+        if stale:
+            _log.info("Evicting %d stale entries from %s", len(stale), self.cache_file)
+            self.evict(stale)
             self.save_cache()
-            self._dirty = False
+        return len(stale)
+
+    def _row(self, key: str, entry: CacheEntry[T]) -> Tuple[str, float, Any, str]:
+        details: Any = entry.details
+        return (
+            key,
+            entry.modified_time,
+            entry.size,
+            json.dumps(asdict(details) if details is not None else None),
+        )
 
     def save_cache(self) -> None:
         if self._cache is None:
             return
 
-        serializable: Dict[str, Any] = {k: asdict(v) for k, v in self._cache.items()}
-        try:
-            with atomic_write(self.cache_file, mode="w", encoding="utf-8") as f:
-                json.dump(serializable, f, indent=2)
-            _log.info(f"Cache saved to {self.cache_file}")
-        except Exception as e:
-            _log.error(f"Error saving cache: {e}")
+        with self._lock:
+            cache = self._cache
+            if self._full_flush:
+                upserts = list(cache.keys())
+                removed = []
+            else:
+                upserts = [key for key in cache.changed if key in cache]
+                removed = list(cache.removed)
+            try:
+                conn = self._connect()
+                with conn:
+                    if self._full_flush:
+                        conn.execute("DELETE FROM entries")
+                    if removed:
+                        conn.executemany(
+                            "DELETE FROM entries WHERE path = ?",
+                            [(key,) for key in removed],
+                        )
+                    if upserts:
+                        conn.executemany(
+                            "INSERT OR REPLACE INTO entries "
+                            "(path, modified_time, size, details) VALUES (?, ?, ?, ?)",
+                            [self._row(key, cache[key]) for key in upserts],
+                        )
+                cache.reset_tracking()
+                self._full_flush = False
+                _log.debug(
+                    "Cache %s: %d upserted, %d removed",
+                    self.cache_file,
+                    len(upserts),
+                    len(removed),
+                )
+            except Exception as e:
+                _log.error(f"Error saving cache: {e}")
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
@@ -3,7 +3,7 @@ from __future__ import annotations
 import os
 import shutil
 from pathlib import Path
-from typing import Callable, Dict, List, Optional, Tuple
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
 
 from app.core.logger import Logger
 from app.exceptions.file_exceptions import InvalidFileName
@@ -11,6 +11,7 @@ from app.schemas.file_filter import (
     FileDetail,
     FileFilterModel,
     FileFlatResponseModel,
+    FilePageResponseModel,
     FileResponseModel,
     FilterInfo,
     GroupedFile,
@@ -28,6 +29,7 @@ from app.util.file_util import (
     expand_home_dir,
     file_name_parent_directory,
     file_to_relative,
+    is_parent_directory,
     resolve_absolute_path,
 )
 from app.util.mime_type_helper import guess_mime_type
@@ -189,6 +191,12 @@ class FileManager:
                     total_size += os.path.getsize(filepath)
         return total_size
 
+    def file_detail(self, full_path: str, root_dir: Optional[str] = None) -> FileDetail:
+        """
+        Returns the metadata of a single file, with the path relative to `root_dir`.
+        """
+        return self._file_to_model(full_path, root_dir)
+
     def _file_to_model(
         self, full_path: str, root_dir: Optional[str] = None
     ) -> FileDetail:
@@ -411,13 +419,14 @@ class FileManager:
         Group files and directories into a hierarchical tree.
 
         Directories are always placed before files within each folder.
+
+        The files are sorted once up front, so children are appended to their
+        parents already in order and the tree never needs to be re-sorted.
         """
         nodes: Dict[str, GroupedFile] = {}
-        order_map: Dict[str, int] = {}
-        for idx, f in enumerate(files):
+        for f in sorted(files, key=lambda f: not f.is_dir):
             node = GroupedFile(**f.model_dump(), children=[] if f.is_dir else None)
             nodes[node.path] = node
-            order_map[node.path] = idx
 
         roots: List[GroupedFile] = []
         for node in nodes.values():
@@ -430,24 +439,146 @@ class FileManager:
             else:
                 roots.append(node)
 
-        def sort_children(node: GroupedFile) -> None:
-            if node.children is not None and node.children:
-                node.children.sort(
-                    key=lambda child: (
-                        0 if child.is_dir else 1,
-                        order_map.get(child.path, 0),
-                    )
-                )
-                for child in node.children:
-                    sort_children(child)
+        return roots
+
+    def query_files(
+        self,
+        root_dir: str,
+        subdir: Optional[str] = None,
+        filter_model: Optional[FileFilterModel] = None,
+        search: Optional[SearchModel] = None,
+        ordering: Optional[OrderingModel] = None,
+        lazy: bool = False,
+        extra_files: Optional[List[FileDetail]] = None,
+        filtered_file_transformer: Optional[Callable[[FileDetail], FileDetail]] = None,
+        relative_path: bool = True,
+    ) -> List[FileDetail]:
+        """
+        List, filter and order files without grouping them into a tree.
 
-        roots.sort(
-            key=lambda node: (0 if node.is_dir else 1, order_map.get(node.path, 0))
+        In lazy mode only the direct children of `subdir` are listed. Directories
+        are then always kept (placed before files), so that the client can expand
+        them one level at a time, while filters and search apply to files. Their
+        paths are relative to `root_dir` unless `relative_path` is False.
+
+        Raises:
+            FileNotFoundError: If `subdir` is outside of `root_dir`.
+        """
+        root_dir = expand_home_dir(root_dir)
+        if subdir is not None and not is_parent_directory(
+            root_dir, os.path.join(root_dir, subdir)
+        ):
+            raise FileNotFoundError(f"Directory not found: '{subdir}'")
+        if lazy:
+            files = self.list_files(root_dir, subdir, relative_path=relative_path)
+        else:
+            files = self.list_files_recursively(root_dir, subdir)
+
+        if extra_files:
+            files.extend(extra_files)
+
+        if not lazy:
+            return self.sort_files(
+                self.filter_service.filter_files(
+                    files,
+                    filter_model=filter_model,
+                    search=search,
+                    filtered_file_transformer=filtered_file_transformer,
+                ),
+                ordering,
+            )
+
+        dirs = [f for f in files if f.is_dir]
+        matched = self.filter_service.filter_files(
+            [f for f in files if not f.is_dir],
+            filter_model=filter_model,
+            search=search,
+            filtered_file_transformer=filtered_file_transformer,
         )
-        for node in roots:
-            sort_children(node)
+        return self.sort_files(dirs, ordering) + self.sort_files(matched, ordering)
 
-        return roots
+    @staticmethod
+    def paginate(
+        files: List[FileDetail], offset: int = 0, limit: Optional[int] = None
+    ) -> Tuple[List[FileDetail], Optional[int]]:
+        """
+        Slice a page from `files`, returning the page and the offset of the next
+        page (None when there are no more files).
+        """
+        end = len(files) if limit is None else min(offset + limit, len(files))
+        next_offset = end if end < len(files) else None
+        return files[offset:end], next_offset
+
+    def get_files_page(
+        self,
+        root_dir: str,
+        subdir: Optional[str] = None,
+        filter_model: Optional[FileFilterModel] = None,
+        search: Optional[SearchModel] = None,
+        ordering: Optional[OrderingModel] = None,
+        offset: int = 0,
+        limit: Optional[int] = None,
+        lazy: bool = False,
+        filtered_file_transformer: Optional[Callable[[FileDetail], FileDetail]] = None,
+        extra_files: Optional[List[FileDetail]] = None,
+        relative_path: bool = True,
+    ) -> FilePageResponseModel:
+        """
+        Return one page of the filtered and ordered files.
+
+        The transformer (e.g. duration lookup) is applied to the returned page
+        only, unless the ordering depends on the fields it fills in.
+        """
+        transform_first = self.needs_transform_before_sort(ordering)
+        files = self.query_files(
+            root_dir,
+            subdir=subdir,
+            filter_model=filter_model,
+            search=search,
+            ordering=ordering,
+            lazy=lazy,
+            extra_files=extra_files,
+            filtered_file_transformer=(
+                filtered_file_transformer if transform_first else None
+            ),
+            relative_path=relative_path,
+        )
+        if transform_first:
+            filtered_file_transformer = None
+
+        page, next_offset = self.paginate(files, offset, limit)
+        if filtered_file_transformer:
+            page = [filtered_file_transformer(f) for f in page]
+
+        return FilePageResponseModel(
+            data=page,
+            total=len(files),
+            offset=offset,
+            next_offset=next_offset,
+            filter_info=FilterInfo(type=self.file_types),
+            dir=subdir,
+            root_dir=abbreviate_path(expand_home_dir(root_dir)),
+        )
+
+    def iter_files(
+        self,
+        files: List[FileDetail],
+        filtered_file_transformer: Optional[Callable[[FileDetail], FileDetail]] = None,
+    ) -> Iterator[str]:
+        """
+        Yield the files as newline-delimited JSON, transforming each file lazily.
+        """
+        for f in files:
+            if filtered_file_transformer:
+                f = filtered_file_transformer(f)
+            yield f.model_dump_json() + "\n"
+
+    @staticmethod
+    def needs_transform_before_sort(ordering: Optional[OrderingModel]) -> bool:
+        """
+        Whether the ordering field is filled in by a file transformer.
+        """
+        return bool(ordering and ordering.field in ("duration", "order"))
 
     def save_uploaded_file(
         self, file: UploadFile, directory: Optional[str] = None
@@ -475,7 +606,7 @@ class FileManager:
         file_path = resolve_absolute_path(filename, directory)
 
         with atomic_write(file_path, mode="wb") as buffer:
-            buffer.write(file.file.read())
+            shutil.copyfileobj(file.file, buffer, 1024 * 1024)
         return file_path
 
 
@@ -0,0 +1,259 @@
+import asyncio
+import heapq
+import itertools
+import threading
+import time
+from concurrent.futures import Future
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from dataclasses import dataclass, field
+from enum import IntEnum
+from typing import Any, Callable, Dict, List, Optional, Tuple, TypeVar
+
+from app.core.px_logger import Logger
+
+_log = Logger(name=__name__)
+
+T = TypeVar("T")
+
+
+class BusPriority(IntEnum):
+    """
+    Lanes of the I2C bus scheduler, from the most to the least urgent.
+    """
+
+    EMERGENCY = 0
+    MOTOR = 1
+    STEERING = 2
+    CAMERA = 3
+    TELEMETRY = 4
+
+
+@dataclass
+class BusLaneStats:
+    transactions: int = 0
+    merged: int = 0
+    superseded: int = 0
+    errors: int = 0
+    last_ms: float = 0.0
+    max_ms: float = 0.0
+    total_ms: float = 0.0
+    max_wait_ms: float = 0.0
+
+    @property
+    def avg_ms(self) -> float:
+        return self.total_ms / self.transactions if self.transactions else 0.0
+
+
+@dataclass(order=True)
+class _Job:
+    priority: int
+    seq: int
+    fn: Callable[[], Any] = field(compare=False)
+    key: Optional[str] = field(compare=False)
+    future: Future = field(compare=False)
+    submitted_at: float = field(compare=False)
+    followers: List[Future] = field(compare=False, default_factory=list)
+
+
+class I2CBusScheduler:
+    """
+    Owns the I2C bus: every transaction runs on a single worker thread, taken
+    from prioritized lanes (see `BusPriority`).
+
+    A job submitted with a `key` replaces a queued, not yet started job with
+    the same key and priority, so a burst of writes to the same register
+    results in one write of the latest value; the callers of the merged jobs
+    receive its result. An `EMERGENCY` job also supersedes all queued `MOTOR`
+    jobs, which resolve with `None` instead of running after the stop.
+
+    Calls made from the worker thread itself run inline, so a transaction may
+    call other scheduled operations without deadlocking.
+    """
+
+    DEFAULT_TIMEOUT = 2.0
+
+    def __init__(self) -> None:
+        self._cond = threading.Condition()
+        self._queue: List[_Job] = []
+        self._keyed: Dict[Tuple[int, str], _Job] = {}
+        self._seq = itertools.count()
+        self._stats: Dict[BusPriority, BusLaneStats] = {
+            lane: BusLaneStats() for lane in BusPriority
+        }
+        self._closed = False
+        self._worker = threading.Thread(
+            target=self._run, name="i2c-bus-scheduler", daemon=True
+        )
+        self._worker.start()
+
+    def submit(
+        self,
+        priority: BusPriority,
+        fn: Callable[[], T],
+        key: Optional[str] = None,
+    ) -> "Future[T]":
+        """
+        Queues `fn` to run on the bus worker and returns a future for its result.
+        """
+        future: Future = Future()
+        if threading.current_thread() is self._worker:
+            self._execute(_Job(priority, 0, fn, key, future, time.monotonic()))
+            return future
+
+        with self._cond:
+            if self._closed:
+                raise RuntimeError("I2C bus scheduler is closed")
+            if priority == BusPriority.EMERGENCY:
+                self._supersede_lane(BusPriority.MOTOR)
+
+            queued = self._keyed.get((priority, key)) if key is not None else None
+            if queued is not None:
+                queued.followers.append(queued.future)
+                queued.future = future
+                queued.fn = fn
+                self._stats[priority].merged += 1
+                return future
+
+            job = _Job(priority, next(self._seq), fn, key, future, time.monotonic())
+            heapq.heappush(self._queue, job)
+            if key is not None:
+                self._keyed[(priority, key)] = job
+            self._cond.notify()
+        return future
+
+    def call(
+        self,
+        priority: BusPriority,
+        fn: Callable[[], T],
+        key: Optional[str] = None,
+        timeout: Optional[float] = DEFAULT_TIMEOUT,
+    ) -> T:
+        """
+        Runs `fn` on the bus worker and waits for its result.
+
+        Raises:
+            TimeoutError: If the job does not complete within `timeout` seconds.
+        """
+        future = self.submit(priority, fn, key=key)
+        try:
+            return future.result(timeout=timeout)
+        except FutureTimeoutError as e:
+            future.cancel()
+            raise TimeoutError(
+                f"I2C transaction did not complete within {timeout}s"
+            ) from e
+
+    async def run(
+        self,
+        priority: BusPriority,
+        fn: Callable[[], T],
+        key: Optional[str] = None,
+    ) -> T:
+        """
+        Runs `fn` on the bus worker without blocking the event loop.
+        """
+        return await asyncio.wrap_future(self.submit(priority, fn, key=key))
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Returns per-lane transaction counts and timings in milliseconds.
+        """
+        with self._cond:
+            return {
+                lane.name.lower(): {
+                    "transactions": lane_stats.transactions,
+                    "merged": lane_stats.merged,
+                    "superseded": lane_stats.superseded,
+                    "errors": lane_stats.errors,
+                    "last_ms": round(lane_stats.last_ms, 3),
+                    "avg_ms": round(lane_stats.avg_ms, 3),
+                    "max_ms": round(lane_stats.max_ms, 3),
+                    "max_wait_ms": round(lane_stats.max_wait_ms, 3),
+                }
+                for lane, lane_stats in self._stats.items()
+            }
+
+    def last_ms(self, priority: BusPriority) -> Optional[float]:
+        """
+        Returns the duration of the latest transaction of a lane in
+        milliseconds, or None if it has none yet.
+        """
+        lane_stats = self._stats[priority]
+        return lane_stats.last_ms if lane_stats.transactions else None
+
+    def close(self) -> None:
+        """
+        Stops the worker after the queued jobs have run.
+        """
+        with self._cond:
+            self._closed = True
+            self._cond.notify()
+        if threading.current_thread() is not self._worker:
+            self._worker.join(timeout=self.DEFAULT_TIMEOUT)
+
+    def _supersede_lane(self, priority: BusPriority) -> None:
+        remaining = []
+        for job in self._queue:
+            if job.priority != priority:
+                remaining.append(job)
+                continue
+            self._stats[priority].superseded += 1
+            for future in (*job.followers, job.future):
+                if future.set_running_or_notify_cancel():
+                    future.set_result(None)
+            if job.key is not None:
+                self._keyed.pop((job.priority, job.key), None)
+        if len(remaining) != len(self._queue):
+            heapq.heapify(remaining)
+            self._queue = remaining
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                while not self._queue and not self._closed:
+                    self._cond.wait()
+                if not self._queue:
+                    return
+                job = heapq.heappop(self._queue)
+                if job.key is not None:
+                    self._keyed.pop((job.priority, job.key), None)
+            self._execute(job)
+
+    def _execute(self, job: _Job) -> None:
+        futures = [
+            future
+            for future in (*job.followers, job.future)
+            if future.set_running_or_notify_cancel()
+        ]
+        if not futures:
+            return
+
+        started = time.monotonic()
+        error: Optional[BaseException] = None
+        result: Any = None
+        try:
+            result = job.fn()
+        except BaseException as e:
+            error = e
+        finished = time.monotonic()
+
+        with self._cond:
+            lane_stats = self._stats[BusPriority(job.priority)]
+            elapsed_ms = (finished - started) * 1000
+            lane_stats.transactions += 1
+            lane_stats.last_ms = elapsed_ms
+            lane_stats.total_ms += elapsed_ms
+            lane_stats.max_ms = max(lane_stats.max_ms, elapsed_ms)
+            lane_stats.max_wait_ms = max(
+                lane_stats.max_wait_ms, (started - job.submitted_at) * 1000
+            )
+            if error is not None:
+                lane_stats.errors += 1
+
+        if error is not None:
+            _log.debug("I2C transaction failed: %s", error)
+        for future in futures:
+            if error is not None:
+                future.set_exception(error)
+            else:
+                future.set_result(result)
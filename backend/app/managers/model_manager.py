@@ -31,6 +31,20 @@ def _load_yolo_class() -> Type["YOLO"]:
     return YOLO
 
 
+def preload_detection_libraries() -> Optional[str]:
+    """
+    Imports Ultralytics, and with it PyTorch, ahead of loading a model, so that
+    loading the model later only has to read its weights.
+
+    Returns an error message if the libraries could not be imported.
+    """
+    try:
+        _load_yolo_class()
+    except Exception as e:
+        return f"Failed to import ultralytics: {e}"
+    return None
+
+
 class ModelManager:
     """
     ModelManager is a context manager for loading and managing a YOLO detection model.
@@ -0,0 +1,302 @@
+import mmap
+import os
+import re
+import struct
+import threading
+import time
+from enum import IntEnum
+from typing import BinaryIO, Dict, List, Optional, Tuple
+
+import numpy as np
+
+MAGIC = b"PXTLM1"
+FORMAT_VERSION = 1
+
+HEADER = struct.Struct("<6sHHHdd")
+HEADER_SIZE = 64
+COUNT = struct.Struct("<Q")
+COUNT_OFFSET = HEADER.size
+UNKNOWN_COUNT = 2**64 - 1
+
+RECORD = struct.Struct("<dHH7f")
+RECORD_SIZE = RECORD.size
+RECORD_VALUES = 7
+
+RECORD_DTYPE = np.dtype(
+    [
+        ("ts", "<f8"),
+        ("kind", "<u2"),
+        ("source", "<u2"),
+        ("values", "<f4", (RECORD_VALUES,)),
+    ]
+)
+
+SEGMENT_SUFFIX = ".ptl"
+_SEGMENT_RE = re.compile(r"^segment-(\d+)\.ptl$")
+
+
+class TelemetryKind(IntEnum):
+    """
+    Record types of a telemetry log and the meaning of their values.
+    """
+
+    DISTANCE = 1
+    SPEED = 2
+    AVOID_STATE = 3
+    DRIVE = 4
+    BATTERY = 5
+
+
+RECORD_FIELDS: Dict[TelemetryKind, Tuple[str, ...]] = {
+    TelemetryKind.DISTANCE: ("distance", "status", "seq"),
+    TelemetryKind.SPEED: ("speed_kmh", "distance", "interval", "relative_speed"),
+    TelemetryKind.AVOID_STATE: ("state", "distance", "prefer_right"),
+    TelemetryKind.DRIVE: (
+        "speed",
+        "steering",
+        "pan",
+        "tilt",
+        "latency_ms",
+        "motor_i2c_ms",
+        "servo_i2c_ms",
+    ),
+    TelemetryKind.BATTERY: ("voltage", "current", "percentage"),
+}
+
+
+def encode_header(created_at: float, created_monotonic: float, count: int) -> bytes:
+    """
+    Returns the fixed-size header of a log file.
+
+    `created_monotonic` is the `time.monotonic()` matching the wall-clock
+    `created_at`, so record timestamps can be converted to wall-clock time.
+    """
+    header = bytearray(HEADER_SIZE)
+    HEADER.pack_into(
+        header,
+        0,
+        MAGIC,
+        FORMAT_VERSION,
+        RECORD_SIZE,
+        0,
+        created_at,
+        created_monotonic,
+    )
+    COUNT.pack_into(header, COUNT_OFFSET, count)
+    return bytes(header)
+
+
+def decode_header(data: bytes) -> Tuple[float, float, int]:
+    """
+    Returns the creation time, its monotonic counterpart and the record count
+    of a log file header.
+
+    Raises:
+        ValueError: If the header is not a telemetry log header of this version.
+    """
+    if len(data) < HEADER_SIZE:
+        raise ValueError("Telemetry log header is truncated")
+    magic, version, record_size, _, created_at, created_monotonic = HEADER.unpack_from(
+        data
+    )
+    if magic != MAGIC or version != FORMAT_VERSION or record_size != RECORD_SIZE:
+        raise ValueError("Not a telemetry log of a supported version")
+    (count,) = COUNT.unpack_from(data, COUNT_OFFSET)
+    return created_at, created_monotonic, count
+
+
+def segment_paths(directory: str) -> List[str]:
+    """
+    Returns the segment files of a session in write order.
+    """
+    try:
+        names = os.listdir(directory)
+    except FileNotFoundError:
+        return []
+    numbered = []
+    for name in names:
+        match = _SEGMENT_RE.match(name)
+        if match:
+            numbered.append((int(match.group(1)), name))
+    return [os.path.join(directory, name) for _, name in sorted(numbered)]
+
+
+class TelemetryLogWriter:
+    """
+    Append-only log of fixed-size records in memory-mapped segment files.
+
+    Each segment is preallocated for `segment_records` records and mapped into
+    memory, so an append is a copy into the page cache without a system call.
+    The record count in the segment header is updated after the record is
+    written, so a reader of a live segment never sees a partial record. A full
+    segment is truncated to its used size and the next one is started; when
+    there are more than `max_segments`, the oldest segment is deleted.
+
+    Appends may come from any thread.
+    """
+
+    DEFAULT_SEGMENT_RECORDS = 65536
+    DEFAULT_MAX_SEGMENTS = 64
+
+    def __init__(
+        self,
+        directory: str,
+        segment_records: int = DEFAULT_SEGMENT_RECORDS,
+        max_segments: int = DEFAULT_MAX_SEGMENTS,
+    ) -> None:
+        if segment_records < 1 or max_segments < 1:
+            raise ValueError("Segment size and count must be positive")
+        self.directory = directory
+        self.segment_records = segment_records
+        self.max_segments = max_segments
+        self.records = 0
+        self._lock = threading.Lock()
+        self._file: Optional[BinaryIO] = None
+        self._map: Optional[mmap.mmap] = None
+        self._count = 0
+        self._index = -1
+        self._created_at = time.time()
+        self._created_monotonic = time.monotonic()
+        os.makedirs(directory, exist_ok=True)
+        for path in segment_paths(directory)[-1:]:
+            match = _SEGMENT_RE.match(os.path.basename(path))
+            self._index = int(match.group(1)) if match else self._index
+        self._open_segment()
+
+    @property
+    def closed(self) -> bool:
+        return self._map is None
+
+    def append(
+        self,
+        kind: TelemetryKind,
+        *values: float,
+        ts: Optional[float] = None,
+        source: int = 0,
+    ) -> None:
+        """
+        Appends a record with up to seven values; missing values are NaN.
+        """
+        padded = values + (float("nan"),) * (RECORD_VALUES - len(values))
+        with self._lock:
+            if self._map is None:
+                raise ValueError("Telemetry log is closed")
+            if self._count == self.segment_records:
+                self._rotate()
+                assert self._map is not None
+            RECORD.pack_into(
+                self._map,
+                HEADER_SIZE + self._count * RECORD_SIZE,
+                time.monotonic() if ts is None else ts,
+                kind,
+                source,
+                *padded,
+            )
+            self._count += 1
+            COUNT.pack_into(self._map, COUNT_OFFSET, self._count)
+            self.records += 1
+
+    def close(self) -> None:
+        with self._lock:
+            self._close_segment()
+
+    def _segment_path(self, index: int) -> str:
+        return os.path.join(self.directory, f"segment-{index:05d}{SEGMENT_SUFFIX}")
+
+    def _open_segment(self) -> None:
+        self._index += 1
+        self._count = 0
+        size = HEADER_SIZE + self.segment_records * RECORD_SIZE
+        file = open(self._segment_path(self._index), "w+b")
+        file.truncate(size)
+        file.write(
+            encode_header(self._created_at, self._created_monotonic, self._count)
+        )
+        file.flush()
+        self._file = file
+        self._map = mmap.mmap(file.fileno(), size)
+
+    def _close_segment(self) -> None:
+        if self._map is None or self._file is None:
+            return
+        self._map.flush()
+        self._map.close()
+        self._file.truncate(HEADER_SIZE + self._count * RECORD_SIZE)
+        self._file.close()
+        self._map = None
+        self._file = None
+
+    def _rotate(self) -> None:
+        self._close_segment()
+        self._open_segment()
+        for path in segment_paths(self.directory)[: -self.max_segments]:
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+
+
+def read_segment(path: str, start: int = 0) -> np.ndarray:
+    """
+    Returns the records of a segment file from the record `start` on, as a
+    structured array of `RECORD_DTYPE`.
+
+    Only the records published in the header count are returned, so reading a
+    segment that is still being written is safe.
+    """
+    with open(path, "rb") as file:
+        _, _, count = decode_header(file.read(HEADER_SIZE))
+        count = min(
+            count, (os.fstat(file.fileno()).st_size - HEADER_SIZE) // RECORD_SIZE
+        )
+        if start >= count:
+            return np.empty(0, dtype=RECORD_DTYPE)
+        file.seek(HEADER_SIZE + start * RECORD_SIZE)
+        data = file.read((count - start) * RECORD_SIZE)
+    return np.frombuffer(data, dtype=RECORD_DTYPE, count=len(data) // RECORD_SIZE)
+
+
+def read_records(path: str) -> np.ndarray:
+    """
+    Returns all records of a session directory or of a single log file, such
+    as a downloaded session, in write order.
+    """
+    paths = segment_paths(path) if os.path.isdir(path) else [path]
+    chunks = []
+    for segment in paths:
+        try:
+            chunks.append(read_segment(segment))
+        except FileNotFoundError:
+            continue
+    if not chunks:
+        return np.empty(0, dtype=RECORD_DTYPE)
+    return np.concatenate(chunks)
+
+
+def split_records(records: np.ndarray) -> Dict[str, np.ndarray]:
+    """
+    Splits records by kind into structured arrays with a `ts` and a `source`
+    column and one named column per value (see `RECORD_FIELDS`), keyed by the
+    lowercase kind name.
+    """
+    result: Dict[str, np.ndarray] = {}
+    for kind, names in RECORD_FIELDS.items():
+        selected = records[records["kind"] == kind]
+        columns = np.empty(
+            len(selected),
+            dtype=[("ts", "<f8"), ("source", "<u2")] + [(n, "<f4") for n in names],
+        )
+        columns["ts"] = selected["ts"]
+        columns["source"] = selected["source"]
+        for i, name in enumerate(names):
+            columns[name] = selected["values"][:, i]
+        result[kind.name.lower()] = columns
+    return result
+
+
+def load_session(path: str) -> Dict[str, np.ndarray]:
+    """
+    Loads a session directory or a downloaded session file into one
+    structured array per record kind.
+    """
+    return split_records(read_records(path))
@@ -1,3 +1,6 @@
+from enum import Enum
+from typing import Optional
+
 from pydantic import BaseModel, Field, field_validator
 
 
@@ -57,3 +60,50 @@ class VolumeData(BaseModel):
         elif isinstance(value, int):
             return value
         raise ValueError("Volume must be a number.")
+
+
+class AudioStreamCodec(str, Enum):
+    """
+    Encoding of the microphone audio stream.
+
+    - `pcm`: Raw 16-bit little-endian samples.
+    - `mulaw`: G.711 µ-law, 8 bits per sample.
+    - `opus`: One Opus packet per websocket message.
+    """
+
+    pcm = "pcm"
+    mulaw = "mulaw"
+    opus = "opus"
+
+
+class AudioStreamFormat(BaseModel):
+    """
+    Format of the audio stream, sent to the client as the first message of an
+    encoded stream.
+    """
+
+    codec: AudioStreamCodec = Field(
+        ...,
+        description="The encoding of the audio messages.",
+        examples=["opus"],
+    )
+    sample_rate: int = Field(
+        ...,
+        description="The sample rate in Hz.",
+        examples=[48000],
+    )
+    channels: int = Field(
+        ...,
+        description="The number of channels.",
+        examples=[1],
+    )
+    frame_size: int = Field(
+        ...,
+        description="The number of samples per channel in each message.",
+        examples=[960],
+    )
+    bitrate: Optional[int] = Field(
+        None,
+        description="The target bitrate in bits per second, for Opus.",
+        examples=[32000],
+    )
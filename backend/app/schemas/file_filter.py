@@ -333,6 +333,42 @@ class FileDetail(BaseModel):
         ),
     ] = None
 
+    title: Annotated[
+        Optional[str],
+        Field(
+            ...,
+            description="Title tag of an audio file.",
+            examples=["Nightcall"],
+        ),
+    ] = None
+
+    artist: Annotated[
+        Optional[str],
+        Field(
+            ...,
+            description="Artist tag of an audio file.",
+            examples=["Kavinsky"],
+        ),
+    ] = None
+
+    album: Annotated[
+        Optional[str],
+        Field(
+            ...,
+            description="Album tag of an audio file.",
+            examples=["OutRun"],
+        ),
+    ] = None
+
+    has_cover: Annotated[
+        bool,
+        Field(
+            ...,
+            description="Whether the audio file embeds cover art.",
+            examples=[True, False],
+        ),
+    ] = False
+
     removable: Annotated[
         bool,
         Field(
@@ -533,3 +569,92 @@ class FileFlatResponseModel(BaseModel):
         ...,
         description="The root directory (typically the media type base) for the returned files.",
     )
+
+
+class PaginationRequest(BaseModel):
+    """
+    Model representing the position and size of a requested page.
+    """
+
+    offset: Annotated[
+        int,
+        Field(
+            ...,
+            ge=0,
+            description="Number of matching files to skip.",
+            examples=[0, 100],
+        ),
+    ] = 0
+    limit: Annotated[
+        Optional[int],
+        Field(
+            ...,
+            ge=1,
+            description="Maximum number of files to return. All remaining files are returned if omitted.",
+            examples=[100],
+        ),
+    ] = None
+
+
+class FileFlatPageRequest(FileFlatFilterRequest, PaginationRequest):
+    """
+    Model representing filter, search, and ordering criteria for a single page of
+    the direct children of a directory.
+    """
+
+
+class FilePageRequest(FileFilterRequest, PaginationRequest):
+    """
+    Model representing filter, search, and ordering criteria for a single page of files.
+    """
+
+    lazy: Annotated[
+        bool,
+        Field(
+            ...,
+            description=(
+                "Whether to list only the direct children of `dir` instead of walking "
+                "the whole tree. Directories are always included and carry their "
+                "`children_count`, so the client can expand them on demand."
+            ),
+            examples=[True, False],
+        ),
+    ] = False
+
+
+class FilePageResponseModel(BaseModel):
+    """
+    A single page of a flat, filtered and ordered files listing.
+    """
+
+    data: List[FileDetail] = Field(
+        ...,
+        description="The files and directories of the page.",
+    )
+    total: int = Field(
+        ...,
+        description="Total number of files matching the criteria.",
+        examples=[1250],
+    )
+    offset: int = Field(
+        ...,
+        description="Offset of the first returned file.",
+        examples=[0],
+    )
+    next_offset: Optional[int] = Field(
+        None,
+        description="Offset of the next page, or null if this is the last page.",
+        examples=[100, None],
+    )
+    filter_info: FilterInfo = Field(
+        ...,
+        description="Information about available filters.",
+    )
+    dir: Optional[str] = Field(
+        None,
+        description="The subdirectory (relative to its aliased directory) that was queried.",
+    )
+    root_dir: str = Field(
+        ...,
+        description="The root directory (typically the media type base) for the returned files.",
+    )
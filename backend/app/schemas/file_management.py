@@ -234,3 +234,77 @@ class DownloadArchiveRequestPayload(BaseModel):
         if not self.archive_name.lower().endswith(".zip"):
             self.archive_name = f"{self.archive_name}.zip"
         return self
+
+
+class ThumbnailSize(str, Enum):
+    """
+    Predefined thumbnail sizes, by the longest side of the generated image.
+    """
+
+    thumbnail = "thumbnail"
+    preview = "preview"
+    poster = "poster"
+
+    @property
+    def max_side(self) -> int:
+        return {
+            ThumbnailSize.thumbnail: 256,
+            ThumbnailSize.preview: 1024,
+            ThumbnailSize.poster: 1920,
+        }[self]
+
+
+class UploadSessionRequest(BaseModel):
+    """
+    Request model for starting a resumable upload.
+    """
+
+    filename: str = Field(
+        ...,
+        min_length=1,
+        description="The name of the file to upload (relative to the target directory).",
+        examples=["yolo11n_ncnn_model.zip"],
+    )
+    dir: Optional[str] = Field(
+        None,
+        description="The target directory, relative to the media type directory.",
+        examples=["models"],
+    )
+    size: int = Field(
+        ...,
+        ge=0,
+        description="The total size of the file in bytes.",
+        examples=[104857600],
+    )
+    checksum: Optional[str] = Field(
+        None,
+        pattern=r"^[0-9a-fA-F]{64}$",
+        description="Optional SHA-256 hex digest of the whole file, verified on finalize.",
+    )
+
+
+class UploadSessionResponse(BaseModel):
+    """
+    State of a resumable upload.
+    """
+
+    upload_id: str = Field(
+        ...,
+        description="The identifier of the upload session.",
+        examples=["4b1e9f0a2c5d4e8f9a7b6c3d2e1f0a9b"],
+    )
+    filename: str = Field(
+        ...,
+        description="The name of the uploaded file (relative to the target directory).",
+        examples=["yolo11n_ncnn_model.zip"],
+    )
+    offset: int = Field(
+        ...,
+        description="The number of bytes received so far. The next chunk must start at this offset.",
+        examples=[52428800],
+    )
+    size: int = Field(
+        ...,
+        description="The total size of the file in bytes.",
+        examples=[104857600],
+    )
@@ -0,0 +1,14 @@
+from typing import Any
+
+from pydantic import BaseModel, Field
+
+
+class IPCEvent(BaseModel):
+    """
+    An event exchanged between the main app and the control app.
+    """
+
+    type: str = Field(
+        ..., description="The name of the event.", examples=["distance", "detection"]
+    )
+    payload: Any = Field(None, description="The JSON data of the event.")
@@ -83,20 +83,23 @@ class MusicPlayerState(BaseModel):
 
     Attributes:
     - `track`: The name of the current track.
-    - `position`: The position in seconds of the current track.
+    - `position`: The position in seconds of the current track when the state was sent.
     - `is_playing`: A boolean indicating whether the track is currently playing.
     - `duration`: The duration in seconds of the current track.
     - `mode`: The playback mode for the music player.
+    - `rate`: The rate at which the position advances after the state was sent.
     """
 
     track: Optional[str] = Field(
         None, description="The name of the current track.", examples=["my-song.mp3"]
     )
-    position: int = Field(
+    position: Union[float, int] = Field(
         ...,
         ge=0,
-        description="The position in seconds of the current track.",
-        examples=[30],
+        description="The position in seconds of the current track when the state was sent. "
+        "The state is only broadcast when it changes, so clients should advance "
+        "the position locally by `rate` seconds per second.",
+        examples=[30.25],
     )
     is_playing: bool = Field(
         ..., description="A boolean indicating whether the track is currently playing."
@@ -110,6 +113,11 @@ class MusicPlayerState(BaseModel):
     mode: MusicPlayerMode = Field(
         ..., description="The playback mode for the music player."
     )
+    rate: float = Field(
+        0.0,
+        description="The playback rate: 1.0 while playing, 0.0 while paused or stopped.",
+        examples=[1.0],
+    )
 
 
 class MusicOrder(BaseModel):
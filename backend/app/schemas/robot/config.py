@@ -3,6 +3,7 @@ from typing import List, Literal, Optional, Union
 from app.schemas.robot.avoid_obstacles import AvoidParams
 from app.schemas.robot.battery import BatteryConfig
 from app.schemas.robot.distance import UltrasonicConfig
+from app.schemas.robot.follow import FollowParams
 from app.schemas.robot.led import LedConfig
 from app.schemas.robot.motors import (
     GPIODCMotorConfig,
@@ -125,6 +126,15 @@ class HardwareConfig(BaseModel):
         ),
     ] = AvoidParams()
 
+    follow_params: Annotated[
+        FollowParams,
+        Field(
+            ...,
+            title="Follow Target Config",
+            description="Parameters for Follow Target Mode",
+        ),
+    ] = FollowParams()
+
     @model_validator(mode="after")
     def validate_unique_battery_names(self) -> "HardwareConfig":
         names = [battery.name.strip().casefold() for battery in self.batteries]
@@ -0,0 +1,101 @@
+from enum import Enum, auto
+from typing import Annotated, List
+
+from pydantic import BaseModel, ConfigDict, Field, model_validator
+from typing_extensions import Self
+
+
+class FollowState(Enum):
+    SEARCH = auto()
+    FOLLOW = auto()
+    HOLD = auto()
+
+
+class FollowParams(BaseModel):
+    """
+    The configuration for the follow target mode.
+    """
+
+    target_labels: Annotated[
+        List[str],
+        Field(description="Labels of the objects to follow, e.g. person."),
+    ] = ["person"]
+    min_confidence: Annotated[
+        float,
+        Field(ge=0, le=1, description="Ignore detections below this confidence."),
+    ] = 0.4
+    min_iou: Annotated[
+        float,
+        Field(
+            ge=0,
+            le=1,
+            description="Min overlap with the previous box to keep following "
+            "the same object when the model has no tracker ids.",
+        ),
+    ] = 0.2
+
+    camera_fov_deg: Annotated[
+        float,
+        Field(
+            gt=0, le=180, description="Horizontal field of view of the camera (deg)."
+        ),
+    ] = 62.2
+    steering_gain: Annotated[
+        float,
+        Field(ge=0, description="Steering angle per degree of target bearing."),
+    ] = 1.0
+    max_steering: Annotated[
+        float,
+        Field(ge=0, le=45, description="Max steering angle while following (deg)."),
+    ] = 30.0
+
+    target_height: Annotated[
+        float,
+        Field(
+            gt=0,
+            le=1,
+            description="Target box height, as a fraction of the frame height, "
+            "at which the car holds its distance.",
+        ),
+    ] = 0.6
+    forward_speed: Annotated[
+        int, Field(ge=0, le=100, description="Speed when the target is far (%).")
+    ] = 40
+    min_speed: Annotated[
+        int,
+        Field(ge=0, le=100, description="Lowest speed that still moves the car (%)."),
+    ] = 20
+    stop_distance: Annotated[
+        float,
+        Field(ge=0, description="Stop if the ultrasonic distance is below this (cm)."),
+    ] = 25.0
+
+    lost_timeout_s: Annotated[
+        float,
+        Field(gt=0, description="Stop when the target is not seen for this long (s)."),
+    ] = 0.6
+    stale_timeout_s: Annotated[
+        float,
+        Field(
+            gt=0,
+            description="Treat detection as stopped if no result arrives for this long (s).",
+        ),
+    ] = 1.0
+    loop_period_s: Annotated[
+        float, Field(gt=0, description="Control loop period (s).")
+    ] = 0.03
+
+    accel_rate: Annotated[
+        float, Field(gt=0, description="Max speed increase per second (%/s).")
+    ] = 100.0
+    decel_rate: Annotated[
+        float, Field(gt=0, description="Max speed decrease per second (%/s).")
+    ] = 500.0
+
+    model_config = ConfigDict(validate_assignment=True)
+
+    @model_validator(mode="after")
+    def _speeds_ok(self) -> Self:
+        if self.min_speed > self.forward_speed:
+            raise ValueError("Min speed must not exceed forward speed")
+        return self
@@ -0,0 +1,22 @@
+from typing import Optional
+
+from pydantic import BaseModel, Field
+
+
+class TelemetrySession(BaseModel):
+    """
+    A recorded or recording telemetry session.
+    """
+
+    id: str = Field(..., description="The identifier of the session.")
+    started_at: Optional[float] = Field(
+        None, description="The UNIX time when the recording started."
+    )
+    records: int = Field(..., description="The number of recorded samples.")
+    segments: int = Field(..., description="The number of log segment files.")
+    size: int = Field(
+        ..., description="The size of the session as a single log file, in bytes."
+    )
+    recording: bool = Field(
+        ..., description="Whether the session is still being recorded."
+    )
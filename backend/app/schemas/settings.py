@@ -194,6 +194,15 @@ class RobotSettings(BaseModel):
         "The value must be at least 500 ms.",
         examples=[1000, 2000],
     )
+    state_broadcast_rate_hz: Optional[int] = Field(
+        None,
+        ge=1,
+        le=60,
+        description="The maximum number of times per second the robot state is "
+        "broadcast to clients. Stops and obstacle avoidance state changes are "
+        "always sent immediately.",
+        examples=[10, 20],
+    )
 
 
 class Settings(BaseModel):
@@ -59,6 +59,11 @@ class TTSSettings(BaseModel):
         description="A list of enabled language codes.",
         examples=["en", "en-us", "es"],
     )
+    prewarm_cache: Optional[bool] = Field(
+        None,
+        description="Whether to synthesize `texts` in the background at startup, "
+        "so that they play without a network round trip, even offline.",
+    )
 
 
 class LanguageOption(BaseModel):
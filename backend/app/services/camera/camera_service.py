@@ -69,6 +69,7 @@ class CameraService:
         self.current_frame_timestamp = None
 
         self.actual_fps = None
+        self.dropped_frames = 0
 
         self.camera_run = False
         self.img: Optional[np.ndarray] = None
@@ -239,6 +240,7 @@ class CameraService:
         self.stream_img = None
         self.current_frame_timestamp = None
         self.actual_fps = None
+        self.dropped_frames = 0
         self.frame_timestamps.clear()
 
     def _persist_camera_settings(self, settings: CameraSettings) -> None:
@@ -318,8 +320,24 @@ class CameraService:
                 if self.camera_device_error:
                     self._dispatch_camera_error(None)
 
-                prev_fps = self._update_actual_fps(frame_start_time, prev_fps)
-                self.current_frame_timestamp = time.time()
+                captured_at = getattr(cap, "frame_timestamp", None)
+                if captured_at is None:
+                    prev_fps = self._update_actual_fps(frame_start_time, prev_fps)
+                    self.current_frame_timestamp = time.time()
+                else:
+                    prev_fps = self._update_actual_fps(captured_at, prev_fps)
+                    # the wall-clock time at which the device captured the frame
+                    self.current_frame_timestamp = time.time() - (
+                        time.monotonic() - captured_at
+                    )
+
+                dropped_frames = getattr(cap, "dropped_frames", 0)
+                if dropped_frames != self.dropped_frames:
+                    _log.debug(
+                        "Camera dropped %s frame(s)",
+                        dropped_frames - self.dropped_frames,
+                    )
+                    self.dropped_frames = dropped_frames
 
                 enhance_mode = self.stream_settings.enhance_mode
                 frame_enhancer = (
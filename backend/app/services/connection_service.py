@@ -61,7 +61,9 @@ class ConnectionService(AsyncEventEmitter):
         self._log_prefix = "" if log_prefix is None else log_prefix
         self.active_connections: list[WebSocket] = []
 
-    async def connect(self, websocket: WebSocket) -> None:
+    async def connect(
+        self, websocket: WebSocket, subprotocol: Optional[str] = None
+    ) -> None:
         """
         Establishes a WebSocket connection by accepting it and adding it to the active connections list.
 
@@ -73,6 +75,7 @@ class ConnectionService(AsyncEventEmitter):
 
         Args:
             websocket: The WebSocket connection object representing the client's connection.
+            subprotocol: The WebSocket subprotocol to accept, if one was negotiated.
 
         Side Effects:
             - Adds the WebSocket to the list of active connections.
@@ -86,7 +89,7 @@ class ConnectionService(AsyncEventEmitter):
             await service.connect(websocket)
             ```
         """
-        await websocket.accept()
+        await websocket.accept(subprotocol=subprotocol)
 
         self.active_connections.append(websocket)
         clients_count = len(self.active_connections)
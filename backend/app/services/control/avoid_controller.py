@@ -0,0 +1,207 @@
+import math
+from dataclasses import dataclass
+from typing import Callable, Optional
+
+from app.core.px_logger import Logger
+from app.managers.distance_ring import DistanceSamples, reject_outliers
+from app.schemas.robot.avoid_obstacles import AvoidParams, AvoidState
+from robot_hat.services.motor_service import MotorServiceDirection
+
+_log = Logger(name=__name__)
+
+
+@dataclass(frozen=True)
+class AvoidCommand:
+    """
+    The drive output of one avoid obstacles step.
+
+    `stop_first` means the motors must be stopped before the command is
+    applied, because the car is reversing its direction.
+    """
+
+    direction: MotorServiceDirection
+    speed: int
+    steering: float
+    stop_first: bool = False
+
+
+class AvoidController:
+    """
+    State machine of the avoid obstacles mode.
+
+    The controller has no I/O: it is fed distance samples and asked for the
+    next drive command, with the current time passed in by the caller. The
+    same code therefore runs against the real clock in `CarService` and
+    against simulated time in the simulator.
+    """
+
+    def __init__(
+        self,
+        params: AvoidParams,
+        on_transition: Optional[Callable[[AvoidState], None]] = None,
+    ) -> None:
+        self.params = params
+        self.on_transition = on_transition
+        self.state: Optional[AvoidState] = None
+        self.prefer_right = True
+        self.state_since = 0.0
+        self.ema_distance: Optional[float] = None
+        self.last_distance_ts: Optional[float] = None
+
+    def reset(self, now: float) -> None:
+        self.state = AvoidState.CRUISE
+        self.prefer_right = True
+        self.state_since = now
+        self.ema_distance = None
+        self.last_distance_ts = None
+
+    def feed(self, samples: DistanceSamples) -> Optional[float]:
+        """
+        Feeds the samples, except failed readings and outliers, into the moving
+        average and returns it.
+        """
+        valid = samples.valid()
+        keep = reject_outliers(valid.distance)
+        for ts, distance in zip(valid.ts[keep], valid.distance[keep]):
+            self.smooth(float(distance), float(ts))
+        return self.ema_distance
+
+    def smooth(self, d: float, ts: float) -> Optional[float]:
+        if not math.isfinite(d) or d < 0:
+            return self.ema_distance
+
+        d_val = min(d, self.params.max_range_cm)
+
+        self.last_distance_ts = ts
+
+        if self.ema_distance is None:
+            self.ema_distance = d_val
+        else:
+            a: float = float(self.params.ema_alpha)
+            self.ema_distance = a * d_val + (1.0 - a) * self.ema_distance
+        return self.ema_distance
+
+    def is_stale(self, now: float) -> bool:
+        if self.last_distance_ts is None:
+            return True
+        return (now - self.last_distance_ts) > self.params.stale_timeout_s
+
+    def state_time(self, now: float) -> float:
+        return now - self.state_since
+
+    def transition(self, new_state: AvoidState, now: float) -> None:
+        self.state = new_state
+        self.state_since = now
+        if self.on_transition is not None:
+            self.on_transition(new_state)
+
+    @staticmethod
+    def ramp(
+        current: float, target: float, dt: float, accel: float, decel: float
+    ) -> float:
+        delta = target - current
+        if delta > 0:
+            max_step = accel * dt
+            delta = min(delta, max_step)
+        else:
+            max_step = decel * dt
+            delta = max(delta, -max_step)
+        return current + delta
+
+    def step(
+        self,
+        now: float,
+        dt: float,
+        current_speed: float,
+        current_direction: MotorServiceDirection,
+    ) -> AvoidCommand:
+        """
+        Advances the state machine and returns the drive command for the
+        current speed and direction of the car.
+        """
+        p = self.params
+        d = self.ema_distance
+
+        target_dir: MotorServiceDirection = 0
+        target_speed = 0
+        target_steer = 0.0
+
+        if self.is_stale(now):
+            if self.state != AvoidState.WAIT:
+                self.transition(AvoidState.WAIT, now)
+        else:
+            dval = d if d is not None else 0.0
+
+            if self.state == AvoidState.CRUISE:
+                if dval < p.stop:
+                    self.transition(AvoidState.REVERSE, now)
+                elif dval < p.danger:
+                    self.transition(AvoidState.TURN, now)
+                else:
+                    if dval <= p.caution:
+                        target_speed = p.turn_speed
+                    elif dval >= p.safe:
+                        target_speed = p.forward_speed
+                    else:
+                        frac = (dval - p.caution) / (p.safe - p.caution)
+                        target_speed = int(
+                            p.turn_speed + frac * (p.forward_speed - p.turn_speed)
+                        )
+                    target_dir = 1
+
+            elif self.state == AvoidState.TURN:
+                target_dir = 1
+                target_speed = p.turn_speed
+                target_steer = p.turn_angle if self.prefer_right else -p.turn_angle
+
+                if dval < p.stop:
+                    self.transition(AvoidState.REVERSE, now)
+                elif dval >= p.safe and self.state_time(now) >= p.hold_cruise_s:
+                    self.transition(AvoidState.CRUISE, now)
+
+            elif self.state == AvoidState.REVERSE:
+                target_dir = -1
+                target_speed = p.reverse_speed
+                target_steer = (
+                    -p.reverse_angle if self.prefer_right else p.reverse_angle
+                )
+
+                if self.state_time(now) >= p.reverse_time_s:
+                    self.transition(AvoidState.WAIT, now)
+                    self.prefer_right = not self.prefer_right
+
+            elif self.state == AvoidState.WAIT:
+                if self.state_time(now) >= p.wait_time_s:
+                    self.transition(AvoidState.TURN, now)
+            else:
+                self.transition(AvoidState.CRUISE, now)
+            _log.debug("target_steer=%s, dval=%s", target_steer, dval)
+
+        ramp_target_speed = target_speed
+        if target_dir != current_direction and current_speed > 0:
+            ramp_target_speed = 0
+
+        ramped = self.ramp(
+            current=current_speed,
+            target=ramp_target_speed,
+            dt=dt if dt > 0 else p.loop_period_s,
+            accel=p.accel_rate,
+            decel=p.decel_rate,
+        )
+        stop_first = (
+            ramped == 0 and current_speed != 0 and target_dir != current_direction
+        )
+
+        out_speed = int(round(ramped))
+        out_dir: MotorServiceDirection = current_direction
+        if out_speed == 0:
+            out_dir = 0
+        elif current_speed == 0 and target_dir != 0:
+            out_dir = target_dir
+
+        return AvoidCommand(
+            direction=out_dir,
+            speed=out_speed,
+            steering=target_steer,
+            stop_first=stop_first,
+        )
@@ -1,6 +1,7 @@
 from typing import TYPE_CHECKING, Any, Dict, Optional
 
 from app.core.px_logger import Logger
+from app.managers.i2c_bus_scheduler import BusPriority
 from robot_hat import constrain
 from robot_hat.data_types.config.motor import MotorDirection
 from robot_hat.interfaces.motor_abc import MotorABC
@@ -41,14 +42,11 @@ class CalibrationService:
         return self.current_calibration_settings()
 
     def _update_servo_angle(self, servo: "ServoService", value: float) -> None:
-        servo.update_calibration(
-            round(
-                constrain(
-                    value, self.MIN_SERVO_ANGLE_OFFSET, self.MAX_SERVO_ANGLE_OFFSET
-                ),
-                2,
-            )
+        offset = round(
+            constrain(value, self.MIN_SERVO_ANGLE_OFFSET, self.MAX_SERVO_ANGLE_OFFSET),
+            2,
         )
+        self.px.bus.call(BusPriority.CAMERA, lambda: servo.update_calibration(offset))
 
     def _increase_servo_angle(self, servo: "ServoService") -> None:
         self._update_servo_angle(
@@ -1,15 +1,25 @@
 import asyncio
 import inspect
 import json
-import math
 import time
-from typing import TYPE_CHECKING, Any, Awaitable, Callable, Dict, Union, cast
+from typing import TYPE_CHECKING, Any, Callable, Dict, Optional, Union
 
 from app.core.px_logger import Logger
 from app.exceptions.robot import RobotI2CBusError, RobotI2CTimeout, ServoNotFoundError
+from app.managers.distance_ring import median_distance
+from app.managers.i2c_bus_scheduler import BusPriority
 from app.schemas.robot.avoid_obstacles import AvoidState
 from app.schemas.robot.config import HardwareConfig
 from app.schemas.settings import Settings
+from app.services.control.avoid_controller import AvoidController
+from app.services.control.car_state_publisher import CarStatePublisher
+from app.services.control.control_protocol import (
+    ControlCommand,
+    ControlOpcode,
+    encode_ack,
+)
+from app.services.control.drive_control_loop import DriveControlLoop
+from app.services.control.follow_controller import FollowController
 from app.types.car import CarServiceBroadcastPayload, CarServiceState
 from fastapi import WebSocket
 from robot_hat import constrain
@@ -18,15 +28,27 @@ from robot_hat.sunfounder.utils import reset_mcu_sync
 
 if TYPE_CHECKING:
     from app.adapters.picarx_adapter import PicarxAdapter
+    from app.managers.detection_feed import DetectionFeedReader
     from app.managers.file_management.json_data_manager import JsonDataManager
     from app.services.connection_service import ConnectionService
     from app.services.control.calibration_service import CalibrationService
     from app.services.sensors.distance_service import DistanceService
     from app.services.sensors.led_service import LEDService
+    from app.services.control.telemetry_service import TelemetryService
     from app.services.sensors.speed_estimator import SpeedEstimator
 
 _log = Logger(name=__name__)
 
+DRIVE_ACTIONS = {
+    "move",
+    "update",
+    "setServoDirAngle",
+    "setCamTiltAngle",
+    "setCamPanAngle",
+}
+
+URGENT_ACTIONS = {"stop", "avoidObstacles", "followTarget"}
+
 
 class CarService:
     def __init__(
@@ -39,6 +61,8 @@ class CarService:
         config_manager: "JsonDataManager",
         led_service: "LEDService",
         speed_estimator: "SpeedEstimator",
+        telemetry_service: "TelemetryService",
+        detection_feed: "DetectionFeedReader",
     ) -> None:
         self.px = px
         self.connection_manager = connection_manager
@@ -46,6 +70,8 @@ class CarService:
         self.config_manager = config_manager
         self.led_service = led_service
         self.speed_estimator = speed_estimator
+        self.telemetry = telemetry_service
+        self.detection_feed = detection_feed
 
         self.app_settings_manager = app_settings_manager
 
@@ -72,6 +98,7 @@ class CarService:
         self.auto_measure_distance_mode = False
         self.led_blinking = False
         self.avoid_obstacles_mode = False
+        self.follow_target_mode = False
         self.max_speed = self.app_settings.robot.max_speed
         self.distance_service = distance_service
         for name, fn in [
@@ -93,25 +120,81 @@ class CarService:
                 )
 
         self._avoid_task: Union[asyncio.Task, None] = None
-        self._avoid_state: Union[AvoidState, None] = None
-        self._avoid_params = self.config.avoid_obstacles_params
-        self._prefer_right: bool = True
-        self._state_since: float = time.monotonic()
-        self._ema_distance: Union[float, None] = None
-        self._last_distance_ts: Union[float, None] = None
+        self.avoid = AvoidController(
+            self.config.avoid_obstacles_params,
+            on_transition=self._on_avoid_transition,
+        )
+        self._follow_task: Union[asyncio.Task, None] = None
+        self.follow = FollowController(self.config.follow_params)
+        self._distance_cursor = 0
         self._last_cmd = {"dir": 0, "speed": 0, "steer": 0.0}
         self._prev_distance_interval: Union[float, None] = None
-        self._last_broadcast: float = 0.0
+        self._loop: Union[asyncio.AbstractEventLoop, None] = None
+        self.state_publisher = CarStatePublisher(
+            connection_manager=self.connection_manager,
+            get_state=lambda: self.current_state,
+            rate_hz=self.app_settings.robot.state_broadcast_rate_hz,
+        )
+        self.drive = DriveControlLoop(
+            px=self.px,
+            on_applied=self._on_drive_applied,
+            on_error=self._on_drive_error,
+        )
+
+        self._calibration_actions: Dict[str, Callable[[], Any]] = {
+            "increaseCamPanCali": self.calibration.increase_cam_pan_angle,
+            "decreaseCamPanCali": self.calibration.decrease_cam_pan_angle,
+            "increaseCamTiltCali": self.calibration.increase_cam_tilt_angle,
+            "decreaseCamTiltCali": self.calibration.decrease_cam_tilt_angle,
+            "increaseServoDirCali": self.calibration.increase_servo_dir_angle,
+            "decreaseServoDirCali": self.calibration.decrease_servo_dir_angle,
+            "resetCalibration": self.calibration.reset_calibration,
+            "saveCalibration": self.calibration.save_calibration,
+            "getCalibrationData": self.calibration.current_calibration_settings,
+        }
+
+        self._calibration_actions_with_payload: Dict[str, Callable[[Any], Any]] = {
+            "updateServoDirCali": self.calibration.update_servo_dir_angle,
+            "updateCamPanCali": self.calibration.update_cam_pan_angle,
+            "updateCamTiltCali": self.calibration.update_cam_tilt_angle,
+            "reverseMotor": self.calibration.reverse_motor,
+            "updateMotorCaliDir": self.calibration.update_motor_direction,
+        }
+
+        self._actions: Dict[str, Callable[[Any], Any]] = {
+            "move": self.handle_move,
+            "update": self.handle_update,
+            "setServoDirAngle": self.handle_set_servo_dir_angle,
+            "setCamTiltAngle": self.handle_set_cam_tilt_angle,
+            "setCamPanAngle": self.handle_set_cam_pan_angle,
+            "stop": self.handle_stop,
+            "avoidObstacles": self.handle_avoid_obstacles,
+            "followTarget": self.handle_follow_target,
+            "startAutoMeasureDistance": self.start_auto_measure_distance,
+            "stopAutoMeasureDistance": self.stop_auto_measure_distance,
+            "setMaxSpeed": self.handle_max_speed,
+            "servoTest": self.servos_test,
+            "resetMCU": self.reset_mcu,
+            "setLedPin": self.handle_set_led_pin,
+            "setLedInterval": self.handle_set_led_interval,
+            "startLED": self.start_led_blinking,
+            "stopLED": self.stop_led_blinking,
+        }
 
     def refresh_config(self, data: Dict[str, Any]) -> None:
         self.config = HardwareConfig(**data)
-        self._avoid_params = self.config.avoid_obstacles_params
+        self.avoid.params = self.config.avoid_obstacles_params
+        self.follow.params = self.config.follow_params
 
     def refresh_settings(self, data: Dict[str, Any]) -> None:
         self.app_settings = Settings(**data)
+        self.state_publisher.rate_hz = self.app_settings.robot.state_broadcast_rate_hz
 
     async def broadcast(self) -> None:
-        await self.connection_manager.broadcast_json(self.broadcast_payload)
+        """
+        Broadcasts the whole current state immediately.
+        """
+        await self.state_publisher.publish_full()
 
     async def broadcast_calibration(self) -> None:
         await self.connection_manager.broadcast_json(
@@ -134,8 +217,11 @@ class CarService:
         - "camPan": Current camera pan angle.
         - "camTilt": Current camera tilt angle.
         - "avoidObstacles": Whether avoid obstacles mode is on.
+        - "followTarget": Whether follow target mode is on.
         - "distance": The measured distance in centimeters.
         - "autoMeasureDistanceMode": Whether the auto measure distance mode is on.
+        - "commandLatency": Milliseconds between the last drive command and
+          its application to the hardware.
         """
         return {
             "speed": self.px.state["speed"],
@@ -145,9 +231,15 @@ class CarService:
             "camTilt": self.px.state["cam_tilt_angle"],
             "maxSpeed": self.max_speed,
             "avoidObstacles": self.avoid_obstacles_mode,
+            "followTarget": self.follow_target_mode,
             "distance": self.distance_service.distance,
             "autoMeasureDistanceMode": self.auto_measure_distance_mode,
             "ledBlinking": self.led_blinking,
+            "commandLatency": (
+                round(self.drive.stats.last_latency_ms, 1)
+                if self.drive.stats.last_latency_ms is not None
+                else None
+            ),
         }
 
     @property
@@ -173,47 +265,8 @@ class CarService:
             payload: The payload data associated with the action.
             websocket (WebSocket): WebSocket connection instance.
         """
-        calibration_actions_map = {
-            "increaseCamPanCali": self.calibration.increase_cam_pan_angle,
-            "decreaseCamPanCali": self.calibration.decrease_cam_pan_angle,
-            "increaseCamTiltCali": self.calibration.increase_cam_tilt_angle,
-            "decreaseCamTiltCali": self.calibration.decrease_cam_tilt_angle,
-            "increaseServoDirCali": self.calibration.increase_servo_dir_angle,
-            "decreaseServoDirCali": self.calibration.decrease_servo_dir_angle,
-            "resetCalibration": self.calibration.reset_calibration,
-            "saveCalibration": self.calibration.save_calibration,
-            "getCalibrationData": self.calibration.current_calibration_settings,
-        }
-
-        calibration_actions_with_payload = {
-            "updateServoDirCali": self.calibration.update_servo_dir_angle,
-            "updateCamPanCali": self.calibration.update_cam_pan_angle,
-            "updateCamTiltCali": self.calibration.update_cam_tilt_angle,
-            "reverseMotor": self.calibration.reverse_motor,
-            "updateMotorCaliDir": self.calibration.update_motor_direction,
-        }
-
-        actions_map = {
-            "move": self.handle_move,
-            "update": self.handle_update,
-            "setServoDirAngle": self.handle_set_servo_dir_angle,
-            "setCamTiltAngle": self.handle_set_cam_tilt_angle,
-            "setCamPanAngle": self.handle_set_cam_pan_angle,
-            "stop": self.handle_stop,
-            "avoidObstacles": self.handle_avoid_obstacles,
-            "startAutoMeasureDistance": self.start_auto_measure_distance,
-            "stopAutoMeasureDistance": self.stop_auto_measure_distance,
-            "setMaxSpeed": self.handle_max_speed,
-            "servoTest": self.servos_test,
-            "resetMCU": self.reset_mcu,
-            "setLedPin": self.handle_set_led_pin,
-            "setLedInterval": self.handle_set_led_interval,
-            "startLED": self.start_led_blinking,
-            "stopLED": self.stop_led_blinking,
-        }
-
-        if action in calibration_actions_map:
-            handler = calibration_actions_map[action]
+        if action in self._calibration_actions:
+            handler = self._calibration_actions[action]
             if inspect.iscoroutinefunction(handler):
                 calibrationData = await handler()
             else:
@@ -232,8 +285,8 @@ class CarService:
                     }
                 )
 
-        elif action in calibration_actions_with_payload:
-            func = calibration_actions_with_payload[action]
+        elif action in self._calibration_actions_with_payload:
+            func = self._calibration_actions_with_payload[action]
             try:
                 if inspect.iscoroutinefunction(func):
                     await func(payload)
@@ -243,14 +296,15 @@ class CarService:
                 await self.connection_manager.error(str(e))
 
             await self.broadcast_calibration()
-        elif action in actions_map:
-            func = actions_map[action]
+        elif action in self._actions:
+            func = self._actions[action]
             if inspect.iscoroutinefunction(func):
                 await func(payload)
             else:
                 func(payload)
 
-            await self.broadcast()
+            if action not in DRIVE_ACTIONS:
+                self.state_publisher.mark_dirty(urgent=action in URGENT_ACTIONS)
 
         else:
             error_msg = f"Unknown action: {action}"
@@ -296,40 +350,78 @@ class CarService:
         except Exception as e:
             await self.connection_manager.error(f"Failed to reset MCU: {e}")
 
+    def _on_drive_applied(self) -> None:
+        """
+        Called from the drive control thread after each applied command.
+        """
+        self.telemetry.record_drive(
+            self.px.state,
+            self.drive.stats.last_latency_ms,
+            self.px.bus.last_ms(BusPriority.MOTOR),
+            self.px.bus.last_ms(BusPriority.STEERING),
+        )
+        if self._loop is not None and not self._loop.is_closed():
+            self._loop.call_soon_threadsafe(self.state_publisher.mark_dirty)
+
+    def _on_drive_error(self, error: Exception) -> None:
+        if self._loop is not None and not self._loop.is_closed():
+            asyncio.run_coroutine_threadsafe(
+                self.connection_manager.error(str(error)), self._loop
+            )
+
+    def _submit_drive(self, **changes) -> int:
+        """
+        Hands the requested drive state to the control thread without waiting
+        for the hardware.
+        """
+        self._loop = asyncio.get_running_loop()
+        return self.drive.submit(**changes)
+
+    def submit_command(self, command: ControlCommand) -> int:
+        """
+        Hands a binary protocol command to the drive control thread, returning
+        its generation for `acknowledge_command`.
+        """
+        self._loop = asyncio.get_running_loop()
+        if command.opcode == ControlOpcode.STOP:
+            return self.drive.halt()
+        return self.drive.submit(**command.changes())
+
+    async def acknowledge_command(
+        self, command: ControlCommand, generation: Optional[int] = None
+    ) -> bytes:
+        """
+        Waits until the command with `generation` has been applied and returns
+        its acknowledgement frame.
+        """
+        await self.drive.settle(generation)
+        return encode_ack(command, self.px.state, self.drive.stats.last_latency_ms)
+
     async def handle_stop(self, _: Any = None) -> None:
-        await asyncio.to_thread(self.px.stop)
+        self._loop = asyncio.get_running_loop()
+        await self.drive.settle(self.drive.halt())
+        self.state_publisher.mark_dirty(urgent=True)
 
     async def handle_set_servo_dir_angle(self, payload: float) -> None:
-        angle = payload or 0
-        if self.px.state["steering_servo_angle"] != angle:
-            await asyncio.to_thread(self.px.set_dir_servo_angle, angle)
+        self._submit_drive(steering=payload or 0)
 
     async def handle_set_cam_tilt_angle(self, payload: float) -> None:
-        if self.px.state["cam_tilt_angle"] != payload:
-            await asyncio.to_thread(self.px.set_cam_tilt_angle, payload)
+        self._submit_drive(tilt=payload)
 
     async def handle_set_cam_pan_angle(self, payload: float) -> None:
-        angle = payload
-        if self.px.state["cam_pan_angle"] != angle:
-            await asyncio.to_thread(self.px.set_cam_pan_angle, angle)
+        self._submit_drive(pan=payload)
 
     async def handle_avoid_obstacles(self, _=None) -> None:
         self.avoid_obstacles_mode = not self.avoid_obstacles_mode
 
         if self.avoid_obstacles_mode:
+            if self.follow_target_mode:
+                await self.handle_follow_target()
             await self.handle_stop()
+            await self._acquire_distance_service(self.avoid.params.loop_period_s)
 
-            self.auto_measure_distance_mode = self.distance_service.running
-            self._prev_distance_interval = self.distance_service.interval
-
-            self.distance_service.interval = max(0.05, self._avoid_params.loop_period_s)
-            await self.distance_service.start_all()
-
-            self._avoid_state = AvoidState.CRUISSE if False else AvoidState.CRUISE
-            self._prefer_right = True
-            self._state_since = time.monotonic()
-            self._ema_distance = None
-            self._last_distance_ts = None
+            self.avoid.reset(time.monotonic())
+            self._distance_cursor = 0
             self._last_cmd = {"dir": 0, "speed": 0, "steer": 0.0}
 
             self._avoid_task = asyncio.create_task(self._avoid_loop())
@@ -337,12 +429,48 @@ class CarService:
             await self._stop_avoid_loop()
 
             await self.handle_stop()
+            await self._release_distance_service()
+
+    async def handle_follow_target(self, _=None) -> None:
+        """
+        Toggles the follow target mode, which drives toward the objects
+        detected by the main app, using the detection feed.
+        """
+        self.follow_target_mode = not self.follow_target_mode
+
+        if self.follow_target_mode:
+            if self.avoid_obstacles_mode:
+                await self.handle_avoid_obstacles()
+            await self.handle_stop()
+            await self._acquire_distance_service(self.follow.params.loop_period_s)
+
+            self.follow.reset()
+            self._last_cmd = {"dir": 0, "speed": 0, "steer": 0.0}
+
+            self._follow_task = asyncio.create_task(self._follow_loop())
+        else:
+            await self._stop_follow_loop()
+
+            await self.handle_stop()
+            await self._release_distance_service()
+
+    async def _acquire_distance_service(self, loop_period_s: float) -> None:
+        """
+        Starts measuring distance as often as an autonomous mode loop needs,
+        remembering the previous mode to restore it afterwards.
+        """
+        self.auto_measure_distance_mode = self.distance_service.running
+        self._prev_distance_interval = self.distance_service.interval
 
-            await self.distance_service.stop_all()
-            if self._prev_distance_interval is not None:
-                self.distance_service.interval = self._prev_distance_interval
-            if self.auto_measure_distance_mode:
-                await self.distance_service.start_all()
+        self.distance_service.interval = max(0.05, loop_period_s)
+        await self.distance_service.start_all()
+
+    async def _release_distance_service(self) -> None:
+        await self.distance_service.stop_all()
+        if self._prev_distance_interval is not None:
+            self.distance_service.interval = self._prev_distance_interval
+        if self.auto_measure_distance_mode:
+            await self.distance_service.start_all()
 
     async def _stop_avoid_loop(self) -> None:
         if self._avoid_task:
@@ -354,59 +482,32 @@ class CarService:
             finally:
                 self._avoid_task = None
 
-    def _smooth_distance(self, d: Union[float, None]) -> Union[float, None]:
-        now = time.monotonic()
+    async def _stop_follow_loop(self) -> None:
+        if self._follow_task:
+            self._follow_task.cancel()
+            try:
+                await self._follow_task
+            except asyncio.CancelledError:
+                pass
+            finally:
+                self._follow_task = None
 
-        invalid = (
-            d is None
-            or not isinstance(d, (int, float))
-            or not math.isfinite(d)
-            or d < 0
+    def _consume_distance_samples(self) -> Union[float, None]:
+        """
+        Feeds every distance sample taken since the previous call into the
+        avoid obstacles controller.
+        """
+        samples = self.distance_service.ring.read_since(self._distance_cursor)
+        if not len(samples):
+            return self.avoid.ema_distance
+        self._distance_cursor = samples.last_seq or self._distance_cursor
+        return self.avoid.feed(samples)
+
+    def _on_avoid_transition(self, new_state: AvoidState) -> None:
+        self.telemetry.record_avoid_state(
+            new_state, self.avoid.ema_distance, self.avoid.prefer_right
         )
-        if invalid:
-            if self._last_distance_ts is None:
-                self._last_distance_ts = now
-            return self._ema_distance
-
-        d_val: float = float(cast(float, d))
-
-        d_val = min(d_val, self._avoid_params.max_range_cm)
-
-        self._last_distance_ts = now
-
-        if self._ema_distance is None:
-            self._ema_distance = d_val
-        else:
-            a: float = float(self._avoid_params.ema_alpha)
-            ema = self._ema_distance
-            self._ema_distance = a * d_val + (1.0 - a) * ema
-        return self._ema_distance
-
-    def _is_stale(self) -> bool:
-        if self._last_distance_ts is None:
-            return True
-        return (
-            time.monotonic() - self._last_distance_ts
-        ) > self._avoid_params.stale_timeout_s
-
-    def _ramp(
-        self, current: float, target: float, dt: float, accel: float, decel: float
-    ) -> float:
-        delta = target - current
-        if delta > 0:
-            max_step = accel * dt
-            delta = min(delta, max_step)
-        else:
-            max_step = decel * dt
-            delta = max(delta, -max_step)
-        return current + delta
-
-    def _transition(self, new_state: AvoidState) -> None:
-        self._avoid_state = new_state
-        self._state_since = time.monotonic()
-
-    def _state_time(self) -> float:
-        return time.monotonic() - self._state_since
+        self.state_publisher.mark_dirty(urgent=True)
 
     async def _apply_drive(
         self, direction: MotorServiceDirection, speed: int, steer: float
@@ -434,8 +535,9 @@ class CarService:
                 self._last_cmd["dir"] = direction
                 self._last_cmd["speed"] = speed
 
+        await self.drive.settle()
+
     async def _avoid_loop(self) -> None:
-        p = self._avoid_params
         last_time = time.monotonic()
         try:
             while (
@@ -447,136 +549,82 @@ class CarService:
                 dt = loop_start - last_time
                 last_time = loop_start
 
-                raw_d = self.distance_service.distance
-                d = self._smooth_distance(raw_d)
-
-                target_dir = 0
-                target_speed = 0
-                target_steer = 0.0
-
-                stale = self._is_stale()
-                if stale:
-                    (
-                        self._transition(AvoidState.WAIT)
-                        if self._avoid_state != AvoidState.WAIT
-                        else None
-                    )
-                    target_dir, target_speed, target_steer = 0, 0, 0.0
-                else:
-                    dval = d if d is not None else 0.0
-
-                    if self._avoid_state == AvoidState.CRUISE:
-                        target_steer = 0.0
-                        if dval < p.stop:
-                            self._transition(AvoidState.REVERSE)
-                        elif dval < p.danger:
-                            self._transition(AvoidState.TURN)
-                        else:
-                            if dval <= p.caution:
-                                target_speed = p.turn_speed
-                            elif dval >= p.safe:
-                                target_speed = p.forward_speed
-                            else:
-                                frac = (dval - p.caution) / (p.safe - p.caution)
-                                target_speed = int(
-                                    p.turn_speed
-                                    + frac * (p.forward_speed - p.turn_speed)
-                                )
-                            target_dir = 1
-
-                    elif self._avoid_state == AvoidState.TURN:
-                        target_dir = 1
-                        target_speed = p.turn_speed
-                        target_steer = (
-                            p.turn_angle if self._prefer_right else -p.turn_angle
-                        )
-
-                        if dval < p.stop:
-                            self._transition(AvoidState.REVERSE)
-                        elif dval >= p.safe and self._state_time() >= p.hold_cruise_s:
-                            self._transition(AvoidState.CRUISE)
-
-                    elif self._avoid_state == AvoidState.REVERSE:
-                        target_dir = -1
-                        target_speed = p.reverse_speed
-                        target_steer = (
-                            -p.reverse_angle if self._prefer_right else p.reverse_angle
-                        )
-
-                        if self._state_time() >= p.reverse_time_s:
-                            self._transition(AvoidState.WAIT)
-                            self._prefer_right = not self._prefer_right
-
-                    elif self._avoid_state == AvoidState.WAIT:
-                        target_dir = 0
-                        target_speed = 0
-                        target_steer = 0.0
-                        if self._state_time() >= p.wait_time_s:
-                            self._transition(AvoidState.TURN)
-                    else:
-                        self._transition(AvoidState.CRUISE)
-                    _log.debug("target_steer=%s, dval=%s", target_steer, dval)
-
-                current_speed = self.px.state["speed"]
-                current_dir = self.px.state["direction"]
-                desired_dir = target_dir
-                ramp_target_speed = target_speed
-
-                if desired_dir != current_dir and (current_speed > 0):
-                    ramp_target_speed = 0
-
-                ramped = self._ramp(
-                    current=current_speed,
-                    target=ramp_target_speed,
-                    dt=dt if dt > 0 else p.loop_period_s,
-                    accel=p.accel_rate,
-                    decel=p.decel_rate,
+                self._consume_distance_samples()
+                command = self.avoid.step(
+                    now=loop_start,
+                    dt=dt,
+                    current_speed=self.px.state["speed"],
+                    current_direction=self.px.state["direction"],
                 )
-
-                if ramped == 0 and current_speed != 0 and desired_dir != current_dir:
+                if command.stop_first:
                     await self.handle_stop()
 
-                out_speed = int(round(ramped))
-                out_dir = current_dir
-                if out_speed == 0:
-                    out_dir = 0
-                elif current_speed == 0 and desired_dir != 0:
-                    out_dir = desired_dir
-
-                _log.debug("out_speed=%s, out_dir=%s", out_speed, out_dir)
-                await self._apply_drive(out_dir, out_speed, target_steer)
-
-                now = time.monotonic()
-                if now - self._last_broadcast > 0.2:
-                    self._last_broadcast = now
-                    await self.broadcast()
+                _log.debug("out_speed=%s, out_dir=%s", command.speed, command.direction)
+                await self._apply_drive(
+                    command.direction, command.speed, command.steering
+                )
 
                 elapsed = time.monotonic() - loop_start
-                sleep_time = max(0.0, p.loop_period_s - elapsed)
+                sleep_time = max(0.0, self.avoid.params.loop_period_s - elapsed)
                 await asyncio.sleep(sleep_time)
         except asyncio.CancelledError:
             await self.handle_stop()
-            await self.broadcast()
         except ServoNotFoundError:
             await self.connection_manager.error("Servo is not found!")
             await self.handle_stop()
-            await self.broadcast()
         except Exception:
             _log.error("Avoid loop crashed", exc_info=True)
             await self.handle_stop()
             await self.connection_manager.error("Avoid obstacles loop crashed")
-            await self.broadcast()
+
+    async def _follow_loop(self) -> None:
+        last_time = time.monotonic()
+        try:
+            while self.follow_target_mode:
+                loop_start = time.monotonic()
+                dt = loop_start - last_time
+                last_time = loop_start
+
+                self.follow.update(
+                    self.detection_feed.read_new(self.follow.last_seq), loop_start
+                )
+                distance = (
+                    median_distance(self.distance_service.ring.window(0.3, loop_start))
+                    if self.distance_service.running
+                    else None
+                )
+                prev_state = self.follow.state
+                command = self.follow.step(
+                    now=loop_start,
+                    dt=dt,
+                    current_speed=self.px.state["speed"],
+                    distance=distance,
+                    camera_pan=self.px.state["cam_pan_angle"],
+                )
+                if self.follow.state != prev_state:
+                    self.state_publisher.mark_dirty(urgent=True)
+
+                await self._apply_drive(
+                    command.direction, command.speed, command.steering
+                )
+
+                elapsed = time.monotonic() - loop_start
+                sleep_time = max(0.0, self.follow.params.loop_period_s - elapsed)
+                await asyncio.sleep(sleep_time)
+        except asyncio.CancelledError:
+            await self.handle_stop()
+        except ServoNotFoundError:
+            await self.connection_manager.error("Servo is not found!")
+            await self.handle_stop()
+        except Exception:
+            _log.error("Follow loop crashed", exc_info=True)
+            await self.handle_stop()
+            await self.connection_manager.error("Follow target loop crashed")
 
     async def servos_test(self, _=None) -> None:
-        servos = [
-            (self.px.set_dir_servo_angle, [-30, 30, 0]),
-            (self.px.set_cam_pan_angle, [-30, 30, 0]),
-            (self.px.set_cam_tilt_angle, [-30, 30, 0]),
-        ]
-        for fn, args in servos:
-            for arg in args:
-                await asyncio.to_thread(fn, arg)
-                await self.broadcast()
+        for servo in ("steering", "pan", "tilt"):
+            for angle in (-30, 30, 0):
+                await self.drive.settle(self._submit_drive(**{servo: angle}))
                 await asyncio.sleep(0.5)
 
     async def handle_max_speed(self, payload: int) -> None:
@@ -585,41 +633,42 @@ class CarService:
             await self.move(self.px.state["direction"], self.max_speed)
 
     async def handle_update(self, payload: Dict[str, Any]) -> None:
+        """
+        Hands all changed fields of the payload to the drive control thread as a
+        single command.
+        """
+        fields = {
+            "servoAngle": "steering",
+            "camTilt": "tilt",
+            "camPan": "pan",
+            "speed": "speed",
+            "direction": "direction",
+        }
         current_state = self.current_state
-        move_payload_changed = False
-        handlers: Dict[str, Callable[[Any], Awaitable[None]]] = {
-            "servoAngle": self.handle_set_servo_dir_angle,
-            "camTilt": self.handle_set_cam_tilt_angle,
-            "camPan": self.handle_set_cam_pan_angle,
+        changes = {
+            fields[key]: value
+            for key, value in payload.items()
+            if key in fields and value is not None and current_state.get(key) != value
         }
-
-        for key, value in payload.items():
-            if value is not None and current_state.get(key) != value:
-                handler = handlers.get(key)
-                if handler:
-                    await handler(value)
-                if key == "speed" or key == "direction" and not move_payload_changed:
-                    move_payload_changed = True
-
-        if move_payload_changed:
-            await self.handle_move(
-                {"speed": payload.get("speed"), "direction": payload.get("direction")}
-            )
+        if "speed" in changes or "direction" in changes:
+            changes.setdefault("speed", payload.get("speed") or 0)
+            changes.setdefault("direction", payload.get("direction") or 0)
+        if changes:
+            self._submit_drive(**changes)
 
     async def handle_move(self, payload: Dict[str, Any]) -> None:
         """
         Handles move actions to control the car's direction and speed.
 
+        Only the latest move is applied if several arrive within one control
+        tick.
+
         Args:
             payload (dict): Payload containing direction and speed data.
         """
         direction = payload.get("direction", 0)
         speed = payload.get("speed", 0)
-        if self.px.state["direction"] != direction or speed != self.px.state["speed"]:
-            if speed == 0 or direction == 0:
-                await self.handle_stop()
-            else:
-                await self.move(direction, speed)
+        self._submit_drive(speed=speed, direction=direction)
 
     async def move(self, direction: MotorServiceDirection, speed: int) -> None:
         """
@@ -629,10 +678,10 @@ class CarService:
             direction: The direction to move the car (1 for forward, -1 for backward).
             speed: The speed at which to move the car.
         """
-        if direction == 1:
-            await asyncio.to_thread(self.px.forward, speed)
-        elif direction == -1:
-            await asyncio.to_thread(self.px.backward, speed)
+        if direction in (1, -1):
+            await self.drive.settle(
+                self._submit_drive(speed=speed, direction=direction)
+            )
 
     async def start_auto_measure_distance(self, _: Any = None) -> None:
         self.auto_measure_distance_mode = True
@@ -663,24 +712,25 @@ class CarService:
             await self.handle_set_servo_dir_angle(0)
             if self.px.state["speed"] != POWER or self.px.state["direction"] != 1:
                 await self.move(1, POWER)
-            await self.broadcast()
+            self.state_publisher.mark_dirty()
         elif distance >= DangerDistance:
             await self.handle_set_servo_dir_angle(30)
             if self.px.state["speed"] != POWER or self.px.state["direction"] != 1:
                 await self.move(1, POWER)
             else:
                 await asyncio.sleep(0.1)
-            await self.broadcast()
+            self.state_publisher.mark_dirty()
         else:
             await self.handle_set_servo_dir_angle(-30)
             if self.px.state["speed"] != POWER or self.px.state["direction"] != -1:
                 await self.move(-1, POWER)
-            await self.broadcast()
+            self.state_publisher.mark_dirty()
             await asyncio.sleep(0.5)
 
     async def cleanup(self) -> None:
         async_handlers = [
             self._stop_avoid_loop,
+            self._stop_follow_loop,
             self.handle_stop,
             self.distance_service.stop_all,
         ]
@@ -690,6 +740,9 @@ class CarService:
             except Exception:
                 pass
 
+        self.state_publisher.close()
+        await asyncio.to_thread(self.drive.close)
+
         try:
             await asyncio.to_thread(self.px.cleanup)
 
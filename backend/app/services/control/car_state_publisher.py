@@ -0,0 +1,126 @@
+import asyncio
+import time
+from typing import TYPE_CHECKING, Any, Callable, Dict, Mapping, Optional
+
+from app.core.px_logger import Logger
+
+if TYPE_CHECKING:
+    from app.services.connection_service import ConnectionService
+
+_log = Logger(name=__name__)
+
+
+class CarStatePublisher:
+    """
+    Broadcasts the car state to all clients at a limited rate.
+
+    Callers mark the state dirty instead of broadcasting it. The dirty state
+    is flushed at most `rate_hz` times per second, and each flush sends only
+    the fields that changed since the previous one as an `update` message.
+    Urgent changes, such as a stop, are flushed immediately.
+
+    Must be used from the event loop.
+    """
+
+    DEFAULT_RATE_HZ = 10
+
+    def __init__(
+        self,
+        connection_manager: "ConnectionService",
+        get_state: Callable[[], Mapping[str, Any]],
+        rate_hz: Optional[float] = None,
+    ) -> None:
+        self.connection_manager = connection_manager
+        self._get_state = get_state
+        self._period = 1.0 / (rate_hz or self.DEFAULT_RATE_HZ)
+        self._last_sent: Dict[str, Any] = {}
+        self._last_flush = 0.0
+        self._dirty = False
+        self._urgent = False
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._flush_task: Optional[asyncio.Task] = None
+
+    @property
+    def rate_hz(self) -> float:
+        return 1.0 / self._period
+
+    @rate_hz.setter
+    def rate_hz(self, value: Optional[float]) -> None:
+        self._period = 1.0 / (value or self.DEFAULT_RATE_HZ)
+
+    def mark_dirty(self, urgent: bool = False) -> None:
+        """
+        Schedules a flush of the changed fields, right away if `urgent` and
+        otherwise no sooner than one period after the previous flush.
+        """
+        self._dirty = True
+        self._urgent = self._urgent or urgent
+        if self._flush_task is not None:
+            return
+        if self._timer is not None:
+            if not urgent:
+                return
+            self._timer.cancel()
+
+        delay = (
+            0.0 if self._urgent else self._last_flush + self._period - time.monotonic()
+        )
+        self._timer = asyncio.get_running_loop().call_later(
+            max(0.0, delay), self._start_flush
+        )
+
+    async def publish_changes(self) -> None:
+        """
+        Broadcasts the fields that changed since the previous broadcast.
+        """
+        self._dirty = False
+        self._urgent = False
+        self._last_flush = time.monotonic()
+        state = self._get_state()
+        changes = {
+            key: value
+            for key, value in state.items()
+            if key not in self._last_sent or self._last_sent[key] != value
+        }
+        if not changes:
+            return
+        self._last_sent.update(changes)
+        await self.connection_manager.broadcast_json(
+            {"type": "update", "payload": changes}
+        )
+
+    async def publish_full(self) -> None:
+        """
+        Broadcasts the whole state, e.g. for a newly connected client.
+        """
+        self._dirty = False
+        self._urgent = False
+        self._last_flush = time.monotonic()
+        state = dict(self._get_state())
+        self._last_sent = dict(state)
+        await self.connection_manager.broadcast_json(
+            {"type": "update", "payload": state}
+        )
+
+    def close(self) -> None:
+        self._dirty = False
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if self._flush_task is not None:
+            self._flush_task.cancel()
+            self._flush_task = None
+
+    def _start_flush(self) -> None:
+        self._timer = None
+        self._flush_task = asyncio.create_task(self._flush())
+
+    async def _flush(self) -> None:
+        try:
+            await self.publish_changes()
+        except Exception as e:
+            _log.error("Failed to broadcast the car state: %s", e)
+        finally:
+            self._flush_task = None
+            if self._dirty:
+                self.mark_dirty(self._urgent)
@@ -0,0 +1,159 @@
+"""
+Binary protocol for the car control WebSocket.
+
+A client opts in by offering the `BINARY_SUBPROTOCOL` WebSocket subprotocol.
+Drive commands are then sent as fixed-size little-endian binary frames, and
+the server answers each of them with an acknowledgement once the command has
+been applied to the hardware. JSON text frames remain accepted on the same
+connection for everything else.
+
+Command frame (`COMMAND_FORMAT`, 28 bytes):
+
+| Field     | Type | Description                                  |
+|-----------|------|----------------------------------------------|
+| opcode    | u8   | `ControlOpcode.DRIVE` or `ControlOpcode.STOP` |
+| fields    | u8   | `ControlField` mask of the fields to apply    |
+| seq       | u32  | Client sequence number                        |
+| client_ts | f64  | Client timestamp, echoed back unchanged       |
+| speed     | i8   | Speed from 0 to 100                           |
+| direction | i8   | 1 forward, -1 backward, 0 stopped             |
+| steering  | f32  | Steering servo angle                          |
+| pan       | f32  | Camera pan angle                              |
+| tilt      | f32  | Camera tilt angle                             |
+
+Acknowledgement frame (`ACK_FORMAT`, 32 bytes): opcode `ControlOpcode.ACK`, a
+reserved byte, the command's `seq` and `client_ts`, followed by the applied
+speed, direction, steering, pan and tilt, and the server-side command latency
+in milliseconds (NaN if unknown).
+"""
+
+import math
+import struct
+from dataclasses import dataclass
+from enum import IntEnum, IntFlag
+from typing import Any, Dict, Optional
+
+from app.exceptions.robot import ControlProtocolError
+from app.types.car import PicarState
+
+BINARY_SUBPROTOCOL = "px-binary.v1"
+
+COMMAND_FORMAT = struct.Struct("<BBIdbbfff")
+ACK_FORMAT = struct.Struct("<BBIdbbffff")
+
+
+class ControlOpcode(IntEnum):
+    DRIVE = 0x01
+    STOP = 0x02
+    ACK = 0x81
+
+
+class ControlField(IntFlag):
+    MOTORS = 0x01
+    STEERING = 0x02
+    PAN = 0x04
+    TILT = 0x08
+
+
+_ALL_FIELDS = (
+    ControlField.MOTORS | ControlField.STEERING | ControlField.PAN | ControlField.TILT
+)
+
+
+@dataclass(frozen=True)
+class ControlCommand:
+    opcode: ControlOpcode
+    fields: ControlField
+    seq: int
+    client_ts: float
+    speed: int = 0
+    direction: int = 0
+    steering: float = 0.0
+    pan: float = 0.0
+    tilt: float = 0.0
+
+    def changes(self) -> Dict[str, Any]:
+        """
+        Returns the drive fields selected by the `fields` mask.
+        """
+        changes: Dict[str, Any] = {}
+        if ControlField.MOTORS in self.fields:
+            changes["speed"] = self.speed
+            changes["direction"] = self.direction
+        if ControlField.STEERING in self.fields:
+            changes["steering"] = self.steering
+        if ControlField.PAN in self.fields:
+            changes["pan"] = self.pan
+        if ControlField.TILT in self.fields:
+            changes["tilt"] = self.tilt
+        return changes
+
+
+def decode_command(data: bytes) -> ControlCommand:
+    """
+    Decodes a binary command frame.
+
+    Raises:
+        ControlProtocolError: If the frame is malformed.
+    """
+    if len(data) != COMMAND_FORMAT.size:
+        raise ControlProtocolError(
+            f"Expected a {COMMAND_FORMAT.size}-byte control frame, got {len(data)} bytes"
+        )
+    opcode, fields, seq, client_ts, speed, direction, steering, pan, tilt = (
+        COMMAND_FORMAT.unpack(data)
+    )
+    if opcode not in (ControlOpcode.DRIVE, ControlOpcode.STOP):
+        raise ControlProtocolError(f"Unknown control opcode: {opcode:#04x}")
+    if direction not in (-1, 0, 1):
+        raise ControlProtocolError(f"Invalid direction: {direction}")
+    if not 0 <= speed <= 100:
+        raise ControlProtocolError(f"Invalid speed: {speed}")
+    if not all(math.isfinite(angle) for angle in (steering, pan, tilt)):
+        raise ControlProtocolError("Servo angles must be finite")
+
+    return ControlCommand(
+        opcode=ControlOpcode(opcode),
+        fields=ControlField(fields) & _ALL_FIELDS,
+        seq=seq,
+        client_ts=client_ts,
+        speed=speed,
+        direction=direction,
+        steering=steering,
+        pan=pan,
+        tilt=tilt,
+    )
+
+
+def encode_command(command: ControlCommand) -> bytes:
+    return COMMAND_FORMAT.pack(
+        command.opcode,
+        command.fields,
+        command.seq,
+        command.client_ts,
+        command.speed,
+        command.direction,
+        command.steering,
+        command.pan,
+        command.tilt,
+    )
+
+
+def encode_ack(
+    command: ControlCommand, state: PicarState, latency_ms: Optional[float]
+) -> bytes:
+    """
+    Encodes the acknowledgement of `command` with the applied hardware state.
+    """
+    return ACK_FORMAT.pack(
+        ControlOpcode.ACK,
+        0,
+        command.seq,
+        command.client_ts,
+        int(state["speed"]),
+        state["direction"],
+        state["steering_servo_angle"],
+        state["cam_pan_angle"],
+        state["cam_tilt_angle"],
+        math.nan if latency_ms is None else latency_ms,
+    )
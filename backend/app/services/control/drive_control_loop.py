@@ -0,0 +1,262 @@
+import asyncio
+import threading
+import time
+from dataclasses import dataclass, field, replace
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional, Tuple
+
+from app.core.px_logger import Logger
+from robot_hat.services.motor_service import MotorServiceDirection
+
+if TYPE_CHECKING:
+    from app.adapters.picarx_adapter import PicarxAdapter
+
+_log = Logger(name=__name__)
+
+DRIVE_FIELDS = ("speed", "direction", "steering", "pan", "tilt")
+
+
+@dataclass(frozen=True)
+class DriveTarget:
+    """
+    The latest desired drive state.
+
+    `changed` maps each field to the generation of the last request that set it,
+    so the control thread can tell which fields were requested since it last
+    applied them. `halt` is the generation of the last explicit stop, which is
+    written to the motors even if they are believed to be stopped.
+    """
+
+    speed: int = 0
+    direction: MotorServiceDirection = 0
+    steering: float = 0.0
+    pan: float = 0.0
+    tilt: float = 0.0
+    generation: int = 0
+    changed: Dict[str, int] = field(default_factory=dict)
+    requested_at: float = 0.0
+    halt: int = 0
+
+
+@dataclass
+class DriveLoopStats:
+    """
+    Latency from a request to its application to the hardware, in milliseconds.
+    """
+
+    last_latency_ms: Optional[float] = None
+    max_latency_ms: float = 0.0
+    applied: int = 0
+    coalesced: int = 0
+
+
+class DriveControlLoop:
+    """
+    Fixed-rate control thread that owns the drive and camera servos and motors.
+
+    Requests replace an immutable `DriveTarget` in a single slot and are never
+    queued: the slot is written only from the event loop and read by the
+    control thread, so no lock is needed. At most `rate_hz` times per second
+    the control thread takes the latest target and applies only the fields
+    that were requested since the previous tick and differ from the hardware
+    state. A flood of joystick updates therefore collapses into one hardware
+    update per tick, always the newest.
+    """
+
+    DEFAULT_RATE_HZ = 50
+
+    def __init__(
+        self,
+        px: "PicarxAdapter",
+        rate_hz: float = DEFAULT_RATE_HZ,
+        on_applied: Optional[Callable[[], None]] = None,
+        on_error: Optional[Callable[[Exception], None]] = None,
+    ) -> None:
+        self.px = px
+        self.period = 1.0 / rate_hz
+        self.on_applied = on_applied
+        self.on_error = on_error
+        self.stats = DriveLoopStats()
+        self._target = DriveTarget()
+        self._applied_generations: Dict[str, int] = {}
+        self._applied_generation = 0
+        self._applied_halt = 0
+        self._wake = threading.Event()
+        self._stopping = False
+        self._thread: Optional[threading.Thread] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._waiters: List[Tuple[int, asyncio.Future]] = []
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        """
+        Starts the control thread. Must be called from the event loop.
+        """
+        if self.running:
+            return
+        self._loop = asyncio.get_running_loop()
+        self._stopping = False
+        self._thread = threading.Thread(
+            target=self._run, name="drive-control", daemon=True
+        )
+        self._thread.start()
+
+    def submit(self, **changes) -> int:
+        """
+        Replaces the requested fields of the drive target, returning the
+        request's generation.
+
+        Accepts any of `speed`, `direction`, `steering`, `pan` and `tilt`.
+        """
+        unknown = set(changes) - set(DRIVE_FIELDS)
+        if unknown:
+            raise ValueError(f"Unknown drive fields: {', '.join(sorted(unknown))}")
+        return self._submit(changes, halt=False)
+
+    def halt(self) -> int:
+        """
+        Requests the motors to stop, returning the request's generation.
+        """
+        return self._submit({"speed": 0, "direction": 0}, halt=True)
+
+    def _submit(self, changes: Dict, halt: bool) -> int:
+        self.start()
+        target = self._target
+        generation = target.generation + 1
+        self._target = replace(
+            target,
+            **changes,
+            generation=generation,
+            changed={**target.changed, **{key: generation for key in changes}},
+            requested_at=time.monotonic(),
+            halt=generation if halt else target.halt,
+        )
+        self._wake.set()
+        return generation
+
+    async def settle(self, generation: Optional[int] = None) -> None:
+        """
+        Waits until the request with `generation`, or the latest request, has
+        been applied.
+        """
+        target_generation = (
+            generation if generation is not None else self._target.generation
+        )
+        if target_generation <= self._applied_generation or not self.running:
+            return
+        future = asyncio.get_running_loop().create_future()
+        self._waiters.append((target_generation, future))
+        await future
+
+    def close(self) -> None:
+        """
+        Stops the control thread after the pending target is applied.
+        """
+        self._stopping = True
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join(timeout=2)
+            self._thread = None
+
+    def _run(self) -> None:
+        next_tick = time.monotonic()
+        while True:
+            self._wake.wait()
+            delay = next_tick - time.monotonic()
+            if delay > 0 and not self._stopping:
+                time.sleep(delay)
+            self._wake.clear()
+
+            target = self._target
+            tick_start = time.monotonic()
+            if target.generation != self._applied_generation:
+                self._apply(target)
+            next_tick = tick_start + self.period
+
+            if self._stopping:
+                break
+
+    def _apply(self, target: DriveTarget) -> None:
+        pending = {
+            key
+            for key, generation in target.changed.items()
+            if generation > self._applied_generations.get(key, 0)
+        }
+        state = self.px.state
+
+        operations: List[Tuple[str, Callable[[], None], bool]] = [
+            (
+                "steering",
+                lambda: self.px.set_dir_servo_angle(target.steering),
+                state["steering_servo_angle"] != target.steering,
+            ),
+            (
+                "pan",
+                lambda: self.px.set_cam_pan_angle(target.pan),
+                state["cam_pan_angle"] != target.pan,
+            ),
+            (
+                "tilt",
+                lambda: self.px.set_cam_tilt_angle(target.tilt),
+                state["cam_tilt_angle"] != target.tilt,
+            ),
+        ]
+        for key, operation, differs in operations:
+            if key in pending and differs:
+                self._run_operation(operation)
+
+        if "speed" in pending or "direction" in pending:
+            self._run_operation(lambda: self._apply_motors(target))
+
+        self._applied_generations = dict(target.changed)
+        self._applied_halt = target.halt
+        self._record(target)
+
+    def _apply_motors(self, target: DriveTarget) -> None:
+        state = self.px.state
+        if target.speed == 0 or target.direction == 0:
+            if target.halt > self._applied_halt or state["speed"] != 0:
+                self.px.stop()
+            return
+
+        if state["direction"] == target.direction and state["speed"] == target.speed:
+            return
+        if target.direction == 1:
+            self.px.forward(target.speed)
+        else:
+            self.px.backward(target.speed)
+
+    def _run_operation(self, operation: Callable[[], None]) -> None:
+        try:
+            operation()
+        except Exception as e:
+            _log.error("Drive control error: %s", e)
+            if self.on_error is not None:
+                self.on_error(e)
+
+    def _record(self, target: DriveTarget) -> None:
+        stats = self.stats
+        latency_ms = (time.monotonic() - target.requested_at) * 1000
+        stats.last_latency_ms = latency_ms
+        stats.max_latency_ms = max(stats.max_latency_ms, latency_ms)
+        stats.coalesced += max(0, target.generation - self._applied_generation - 1)
+        stats.applied += 1
+        self._applied_generation = target.generation
+
+        if self._loop is not None and not self._loop.is_closed():
+            self._loop.call_soon_threadsafe(self._resolve_waiters, target.generation)
+        if self.on_applied is not None:
+            self.on_applied()
+
+    def _resolve_waiters(self, generation: int) -> None:
+        remaining: List[Tuple[int, asyncio.Future]] = []
+        for waiter_generation, future in self._waiters:
+            if future.done():
+                continue
+            if waiter_generation <= generation:
+                future.set_result(None)
+            else:
+                remaining.append((waiter_generation, future))
+        self._waiters = remaining
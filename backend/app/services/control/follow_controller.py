@@ -0,0 +1,181 @@
+from dataclasses import dataclass
+from typing import List, Optional
+
+from app.core.px_logger import Logger
+from app.managers.detection_feed import DetectionFrame, FeedDetection
+from app.schemas.robot.follow import FollowParams, FollowState
+from app.services.control.avoid_controller import AvoidController
+from robot_hat.services.motor_service import MotorServiceDirection
+
+_log = Logger(name=__name__)
+
+
+@dataclass(frozen=True)
+class FollowCommand:
+    """
+    The drive output of one follow target step.
+    """
+
+    direction: MotorServiceDirection
+    speed: int
+    steering: float
+
+
+def iou(a: FeedDetection, b: FeedDetection) -> float:
+    """
+    Returns the intersection over union of two detection boxes.
+    """
+    ax1, ay1, ax2, ay2 = a.bbox
+    bx1, by1, bx2, by2 = b.bbox
+    w = min(ax2, bx2) - max(ax1, bx1)
+    h = min(ay2, by2) - max(ay1, by1)
+    if w <= 0 or h <= 0:
+        return 0.0
+    inter = w * h
+    union = a.width * a.height + b.width * b.height - inter
+    return inter / union if union > 0 else 0.0
+
+
+class FollowController:
+    """
+    State machine of the follow target mode.
+
+    The controller steers toward a detected target and drives forward until
+    the target fills `target_height` of the frame. It keeps following the same
+    object across frames by its tracker id or, if the model does not track, by
+    box overlap, and falls back to the largest (nearest) matching object.
+
+    Like `AvoidController`, it has no I/O: the caller passes the latest
+    detection frame, the ultrasonic distance and the current time.
+    """
+
+    def __init__(self, params: FollowParams) -> None:
+        self.params = params
+        self.state = FollowState.SEARCH
+        self.target: Optional[FeedDetection] = None
+        self.target_seen_at: Optional[float] = None
+        self.frame: Optional[DetectionFrame] = None
+        self.last_seq = 0
+
+    def reset(self) -> None:
+        self.state = FollowState.SEARCH
+        self.target = None
+        self.target_seen_at = None
+        self.frame = None
+        self.last_seq = 0
+
+    def candidates(self, frame: DetectionFrame) -> List[FeedDetection]:
+        labels = set(self.params.target_labels)
+        return [
+            detection
+            for detection in frame.detections
+            if detection.confidence >= self.params.min_confidence
+            and (not labels or detection.label in labels)
+        ]
+
+    def select_target(self, frame: DetectionFrame) -> Optional[FeedDetection]:
+        """
+        Returns the detection in the frame that continues the current target,
+        or the largest candidate if the current target is not in the frame.
+        """
+        candidates = self.candidates(frame)
+        if not candidates:
+            return None
+        previous = self.target
+        if previous is not None:
+            if previous.track_id >= 0:
+                for detection in candidates:
+                    if detection.track_id == previous.track_id:
+                        return detection
+            best = max(candidates, key=lambda d: iou(previous, d))
+            if iou(previous, best) >= self.params.min_iou:
+                return best
+        return max(candidates, key=lambda d: d.width * d.height)
+
+    def update(self, frame: Optional[DetectionFrame], now: float) -> None:
+        """
+        Feeds a new detection frame, if any.
+        """
+        if frame is None or frame.seq == self.last_seq:
+            return
+        self.last_seq = frame.seq
+        self.frame = frame
+        target = self.select_target(frame)
+        if target is not None:
+            self.target = target
+            self.target_seen_at = now
+
+    def bearing(self, target: FeedDetection, frame: DetectionFrame) -> float:
+        """
+        Returns the horizontal angle of the target from the camera axis, in
+        degrees; positive angles are to the right.
+        """
+        if frame.frame_width <= 0:
+            return 0.0
+        offset = target.center[0] / frame.frame_width - 0.5
+        return offset * self.params.camera_fov_deg
+
+    def step(
+        self,
+        now: float,
+        dt: float,
+        current_speed: float,
+        distance: Optional[float] = None,
+        camera_pan: float = 0.0,
+    ) -> FollowCommand:
+        """
+        Advances the state machine and returns the drive command.
+
+        `distance` is the ultrasonic distance in centimeters, if measured, and
+        `camera_pan` the pan angle of the camera, which adds to the bearing of
+        the target.
+        """
+        p = self.params
+        frame = self.frame
+        target = self.target
+        target_speed = 0
+        steering = 0.0
+
+        if (
+            frame is None
+            or frame.age(now) > p.stale_timeout_s
+            or target is None
+            or self.target_seen_at is None
+            or now - self.target_seen_at > p.lost_timeout_s
+        ):
+            self.target = None
+            state = FollowState.SEARCH
+        else:
+            bearing = self.bearing(target, frame) + camera_pan
+            steering = max(
+                -p.max_steering, min(p.max_steering, p.steering_gain * bearing)
+            )
+            height = target.height / frame.frame_height if frame.frame_height else 0
+            error = (p.target_height - height) / p.target_height
+            if error <= 0 or (distance is not None and 0 <= distance < p.stop_distance):
+                state = FollowState.HOLD
+            else:
+                state = FollowState.FOLLOW
+                target_speed = int(
+                    p.min_speed + min(1.0, error) * (p.forward_speed - p.min_speed)
+                )
+
+        if state != self.state:
+            _log.debug("Follow state %s -> %s", self.state.name, state.name)
+            self.state = state
+
+        speed = AvoidController.ramp(
+            current=current_speed,
+            target=target_speed,
+            dt=dt if dt > 0 else p.loop_period_s,
+            accel=p.accel_rate,
+            decel=p.decel_rate,
+        )
+        if target_speed == 0 and state != FollowState.FOLLOW:
+            speed = 0
+        out_speed = int(round(speed))
+        return FollowCommand(
+            direction=1 if out_speed > 0 else 0,
+            speed=out_speed,
+            steering=steering,
+        )
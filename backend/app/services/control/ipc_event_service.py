@@ -0,0 +1,97 @@
+import asyncio
+import json
+from typing import Any, AsyncGenerator, Optional, Set
+
+from app.core.async_emitter import AsyncEventEmitter
+from app.core.px_logger import Logger
+
+_log = Logger(name=__name__)
+
+
+class IPCEventService(AsyncEventEmitter):
+    """
+    Event channel of the control app to the main app.
+
+    Events published with `publish` are written to every open event stream
+    (see `stream`) as newline-delimited JSON. A stream that falls behind by
+    more than `queue_size` events loses the oldest ones, so a slow reader
+    never blocks the control loop.
+
+    Events pushed by the main app are emitted to the listeners registered with
+    `on`, with the payload as the only argument.
+    """
+
+    def __init__(self, queue_size: int = 256, heartbeat_s: float = 10.0) -> None:
+        super().__init__()
+        self.queue_size = queue_size
+        self.heartbeat_s = heartbeat_s
+        self._queues: Set["asyncio.Queue[Optional[bytes]]"] = set()
+        self._closed = False
+
+    @staticmethod
+    def encode(event_type: str, payload: Any = None) -> bytes:
+        return (
+            json.dumps(
+                {"type": event_type, "payload": payload}, separators=(",", ":")
+            ).encode()
+            + b"\n"
+        )
+
+    @property
+    def subscribers(self) -> int:
+        return len(self._queues)
+
+    def publish(self, event_type: str, payload: Any = None) -> None:
+        """
+        Queues the event for every open stream. Must be called from the event
+        loop of the app.
+        """
+        if not self._queues:
+            return
+        line = self.encode(event_type, payload)
+        for queue in self._queues:
+            if queue.full():
+                queue.get_nowait()
+            queue.put_nowait(line)
+
+    async def dispatch(self, event_type: str, payload: Any = None) -> None:
+        """
+        Emits an event pushed by the main app to the local listeners.
+        """
+        _log.debug("Received IPC event '%s'", event_type)
+        await self.emit(event_type, payload)
+
+    async def stream(self) -> AsyncGenerator[bytes, None]:
+        """
+        Yields published events until the service is closed. An empty line is
+        yielded as a heartbeat when no event was published for `heartbeat_s`
+        seconds, so the reader can tell an idle stream from a dead one.
+        """
+        queue: "asyncio.Queue[Optional[bytes]]" = asyncio.Queue(self.queue_size)
+        if self._closed:
+            return
+        self._queues.add(queue)
+        _log.info("IPC event stream opened (%d open)", len(self._queues))
+        try:
+            while True:
+                try:
+                    line = await asyncio.wait_for(queue.get(), self.heartbeat_s)
+                except asyncio.TimeoutError:
+                    yield b"\n"
+                    continue
+                if line is None:
+                    return
+                yield line
+        finally:
+            self._queues.discard(queue)
+            _log.info("IPC event stream closed (%d open)", len(self._queues))
+
+    def close(self) -> None:
+        """
+        Ends all open streams.
+        """
+        self._closed = True
+        for queue in self._queues:
+            if queue.full():
+                queue.get_nowait()
+            queue.put_nowait(None)
@@ -0,0 +1,303 @@
+import asyncio
+import os
+import re
+import shutil
+import time
+from typing import TYPE_CHECKING, Any, AsyncGenerator, List, Mapping, Optional
+
+from app.core.px_logger import Logger
+from app.exceptions.robot import TelemetrySessionNotFound
+from app.managers.telemetry_log import (
+    HEADER_SIZE,
+    RECORD_SIZE,
+    UNKNOWN_COUNT,
+    TelemetryKind,
+    TelemetryLogWriter,
+    decode_header,
+    encode_header,
+    read_segment,
+    segment_paths,
+)
+from app.schemas.robot.telemetry import TelemetrySession
+
+if TYPE_CHECKING:
+    from app.managers.distance_ring import DistanceRing
+    from app.schemas.battery import BatteryStatusResponse
+    from app.schemas.robot.avoid_obstacles import AvoidState
+
+_log = Logger(name=__name__)
+
+_SESSION_ID_RE = re.compile(r"^\w[\w.-]*$")
+
+
+def _value(value: Optional[float]) -> float:
+    return float("nan") if value is None else float(value)
+
+
+class TelemetryService:
+    """
+    Records robot telemetry into sessions of memory-mapped log files (see
+    `TelemetryLogWriter`) and serves the recorded sessions.
+
+    The `record_*` methods are cheap no-ops while nothing is recorded, so they
+    are called unconditionally from the control loops.
+    """
+
+    def __init__(
+        self,
+        root_dir: str,
+        segment_records: int = TelemetryLogWriter.DEFAULT_SEGMENT_RECORDS,
+        max_segments: int = TelemetryLogWriter.DEFAULT_MAX_SEGMENTS,
+    ) -> None:
+        self.root_dir = root_dir
+        self.segment_records = segment_records
+        self.max_segments = max_segments
+        self._writer: Optional[TelemetryLogWriter] = None
+        self._session_id: Optional[str] = None
+        self._distance_cursor = 0
+
+    @property
+    def recording(self) -> bool:
+        return self._writer is not None
+
+    @property
+    def session_id(self) -> Optional[str]:
+        return self._session_id
+
+    def start(self) -> TelemetrySession:
+        """
+        Starts a new session, stopping the current one.
+        """
+        self.stop()
+        session_id = time.strftime("%Y%m%d-%H%M%S")
+        suffix = 1
+        while os.path.exists(os.path.join(self.root_dir, session_id)):
+            suffix += 1
+            session_id = f"{time.strftime('%Y%m%d-%H%M%S')}-{suffix}"
+
+        self._distance_cursor = 0
+        self._writer = TelemetryLogWriter(
+            os.path.join(self.root_dir, session_id),
+            segment_records=self.segment_records,
+            max_segments=self.max_segments,
+        )
+        self._session_id = session_id
+        _log.info("Started telemetry session %s", session_id)
+        return self.get_session(session_id)
+
+    def stop(self) -> Optional[TelemetrySession]:
+        """
+        Stops the current session and returns it, if any.
+        """
+        writer, session_id = self._writer, self._session_id
+        if writer is None or session_id is None:
+            return None
+        self._writer = None
+        self._session_id = None
+        writer.close()
+        _log.info(
+            "Stopped telemetry session %s (%d records)", session_id, writer.records
+        )
+        return self.get_session(session_id)
+
+    def record(
+        self,
+        kind: TelemetryKind,
+        *values: float,
+        ts: Optional[float] = None,
+        source: int = 0,
+    ) -> None:
+        writer = self._writer
+        if writer is None:
+            return
+        try:
+            writer.append(kind, *values, ts=ts, source=source)
+        except ValueError:
+            # the session was stopped by another thread
+            pass
+
+    def record_distance_samples(self, ring: "DistanceRing") -> None:
+        """
+        Records every distance sample written to `ring` since the previous call.
+        """
+        if self._writer is None:
+            return
+        samples = ring.read_since(self._distance_cursor)
+        if not len(samples):
+            return
+        self._distance_cursor = samples.last_seq or self._distance_cursor
+        for seq, ts, distance, status in zip(*samples):
+            self.record(TelemetryKind.DISTANCE, distance, status, seq, ts=float(ts))
+
+    def record_speed(
+        self,
+        speed_kmh: Optional[float],
+        distance: float,
+        interval: float,
+        relative_speed: int,
+    ) -> None:
+        self.record(
+            TelemetryKind.SPEED,
+            _value(speed_kmh),
+            distance,
+            interval,
+            relative_speed,
+        )
+
+    def record_avoid_state(
+        self, state: "AvoidState", distance: Optional[float], prefer_right: bool
+    ) -> None:
+        self.record(
+            TelemetryKind.AVOID_STATE, state.value, _value(distance), prefer_right
+        )
+
+    def record_drive(
+        self,
+        state: Mapping[str, Any],
+        latency_ms: Optional[float],
+        motor_i2c_ms: Optional[float],
+        servo_i2c_ms: Optional[float],
+    ) -> None:
+        """
+        Records the applied drive state of the hardware; the speed is negative
+        when driving backward.
+        """
+        self.record(
+            TelemetryKind.DRIVE,
+            state["speed"] * (state["direction"] or 0),
+            state["steering_servo_angle"],
+            state["cam_pan_angle"],
+            state["cam_tilt_angle"],
+            _value(latency_ms),
+            _value(motor_i2c_ms),
+            _value(servo_i2c_ms),
+        )
+
+    def record_battery(self, source: int, status: "BatteryStatusResponse") -> None:
+        """
+        Records a battery reading; `source` is the index of the battery among
+        the enabled batteries.
+        """
+        self.record(
+            TelemetryKind.BATTERY,
+            _value(status.voltage),
+            _value(status.current),
+            _value(status.percentage),
+            source=source,
+        )
+
+    def session_dir(self, session_id: str) -> str:
+        """
+        Returns the directory of a session.
+
+        Raises:
+            TelemetrySessionNotFound: If there is no such session.
+        """
+        directory = os.path.join(self.root_dir, session_id)
+        if not _SESSION_ID_RE.match(session_id) or not os.path.isdir(directory):
+            raise TelemetrySessionNotFound(session_id)
+        return directory
+
+    def get_session(self, session_id: str) -> TelemetrySession:
+        started_at: Optional[float] = None
+        records = 0
+        paths = segment_paths(self.session_dir(session_id))
+        for path in paths:
+            try:
+                with open(path, "rb") as file:
+                    created_at, _, count = decode_header(file.read(HEADER_SIZE))
+            except (FileNotFoundError, ValueError):
+                continue
+            started_at = created_at if started_at is None else started_at
+            records += count
+        return TelemetrySession(
+            id=session_id,
+            started_at=started_at,
+            records=records,
+            segments=len(paths),
+            size=HEADER_SIZE + records * RECORD_SIZE,
+            recording=session_id == self._session_id,
+        )
+
+    def list_sessions(self) -> List[TelemetrySession]:
+        """
+        Returns the recorded sessions, newest first.
+        """
+        try:
+            names = sorted(os.listdir(self.root_dir), reverse=True)
+        except FileNotFoundError:
+            return []
+        return [
+            self.get_session(name)
+            for name in names
+            if _SESSION_ID_RE.match(name)
+            and os.path.isdir(os.path.join(self.root_dir, name))
+        ]
+
+    def delete_session(self, session_id: str) -> None:
+        """
+        Raises:
+            TelemetrySessionNotFound: If there is no such session.
+            ValueError: If the session is being recorded.
+        """
+        directory = self.session_dir(session_id)
+        if session_id == self._session_id:
+            raise ValueError("Can't delete the session that is being recorded")
+        shutil.rmtree(directory)
+
+    def stream_session(
+        self, session_id: str, follow: bool = False, poll_interval: float = 0.2
+    ) -> AsyncGenerator[bytes, None]:
+        """
+        Returns the chunks of a session as a single log file, readable with
+        `load_session`.
+
+        With `follow`, keeps yielding new records until the session stops
+        recording.
+
+        Raises:
+            TelemetrySessionNotFound: If there is no such session.
+        """
+        directory = self.session_dir(session_id)
+        paths = segment_paths(directory)
+        if not paths:
+            raise TelemetrySessionNotFound(session_id)
+        with open(paths[0], "rb") as file:
+            created_at, created_monotonic, _ = decode_header(file.read(HEADER_SIZE))
+
+        return self._stream_records(
+            session_id, directory, follow, poll_interval, created_at, created_monotonic
+        )
+
+    async def _stream_records(
+        self,
+        session_id: str,
+        directory: str,
+        follow: bool,
+        poll_interval: float,
+        created_at: float,
+        created_monotonic: float,
+    ) -> AsyncGenerator[bytes, None]:
+        yield encode_header(created_at, created_monotonic, UNKNOWN_COUNT)
+        current: Optional[str] = None
+        offset = 0
+        while True:
+            live = follow and self._session_id == session_id
+            for path in segment_paths(directory):
+                if current is not None and path < current:
+                    continue
+                if path != current:
+                    current, offset = path, 0
+                try:
+                    records = await asyncio.to_thread(read_segment, path, offset)
+                except FileNotFoundError:
+                    continue
+                if len(records):
+                    offset += len(records)
+                    yield records.tobytes()
+            if not live:
+                return
+            await asyncio.sleep(poll_interval)
+
+    def close(self) -> None:
+        self.stop()
@@ -5,6 +5,7 @@ from app.core.logger import Logger
 from app.schemas.file_filter import (
     FileDetail,
     FileFilterModel,
+    FilePageResponseModel,
     FileResponseModel,
     FilterInfo,
     OrderingModel,
@@ -101,6 +102,22 @@ class DetectionFileService(FileManagerService):
 
         return loadable_files
 
+    def _extra_files(self, subdir: Optional[str] = None) -> List[FileDetail]:
+        return self._loadable_model_files() if subdir is None else []
+
+    def _filter_info(self) -> FilterInfo:
+        return FilterInfo(
+            type=self.file_types,
+            file_suffixes=[
+                ValueLabelOption(value=item, label=item) for item in MODEL_FILE_SUFFIXES
+            ],
+        )
+
+    def get_files_page(self, *args, **kwargs) -> FilePageResponseModel:
+        result = super().get_files_page(*args, **kwargs)
+        result.filter_info = self._filter_info()
+        return result
+
     def get_files_tree(
         self,
         filter_model: Optional[FileFilterModel] = None,
@@ -138,11 +155,6 @@ class DetectionFileService(FileManagerService):
         )
         self.cache_manager.maybe_save()
 
-        result.filter_info = FilterInfo(
-            type=result.filter_info.type,
-            file_suffixes=[
-                ValueLabelOption(value=item, label=item) for item in MODEL_FILE_SUFFIXES
-            ],
-        )
+        result.filter_info = self._filter_info()
 
         return result
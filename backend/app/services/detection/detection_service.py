@@ -21,6 +21,7 @@ from app.types.detection import (
     DetectionQueueData,
     DetectionReadyMessage,
     DetectionResultData,
+    DetectionWorkerCommand,
 )
 from app.util.file_util import resolve_absolute_path
 from app.util.queue_helpers import clear_queue
@@ -39,6 +40,15 @@ class DetectionService:
     A service class for managing object detection processes. This service handles
     starting, stopping, and updating settings for object detection using multiprocessing
     and asynchronous tasks.
+
+    Detection runs in a long-lived worker process (see `detection_worker_func`),
+    which imports the detection libraries once and then loads and releases models
+    on request, so that enabling detection or switching models only waits for the
+    model itself to load. `detection_process` refers to the worker while it has a
+    model loaded, and is None otherwise.
+
+    When `feed_path` is given, the detection process also publishes every result to
+    that detection feed file, from which the robot app reads it.
     """
 
     def __init__(
@@ -47,8 +57,10 @@ class DetectionService:
         file_manager: "FileManagerService",
         connection_manager: "ConnectionService",
         profile_service: "DetectionProfileService",
+        feed_path: Optional[str] = None,
     ) -> None:
         self.lock = asyncio.Lock()
+        self.feed_path = feed_path
         self.settings_service = settings_service
         self.connection_manager = connection_manager
         self.file_manager = file_manager
@@ -70,15 +82,19 @@ class DetectionService:
             self.detection_settings = legacy_settings
         self.task_event = asyncio.Event()
         self.stop_event = mp.Event()
+        self.idle_event = mp.Event()
         self.frame_queue: mp.Queue[DetectionFrameData] = mp.Queue(maxsize=1)
         self.detection_queue: mp.Queue[DetectionQueueData] = mp.Queue(maxsize=1)
-        self.control_queue: mp.Queue[DetectionControlMessage] = mp.Queue(maxsize=1)
+        self.control_queue: mp.Queue[
+            Union[DetectionControlMessage, DetectionWorkerCommand]
+        ] = mp.Queue(maxsize=1)
         self.out_queue: mp.Queue[
             Union[
                 DetectionReadyMessage, DetectionLoadErrorMessage, DetectionErrorMessage
             ]
         ] = mp.Queue(maxsize=1)
-        self.detection_process = None
+        self.worker: Optional[mp.Process] = None
+        self.detection_process: Optional[mp.Process] = None
         self.detection_result: Optional[
             Union[DetectionQueueData, DetectionResultData]
         ] = None
@@ -190,21 +206,71 @@ class DetectionService:
 
         return self.detection_settings
 
+    def start_worker(self) -> None:
+        """
+        Starts the detection worker process unless it is already running.
+
+        The worker begins importing the detection libraries right away, and
+        processes the first `load_model` command once it has finished.
+        """
+        from app.managers.detection.detection_process import detection_worker_func
+
+        if self.worker is not None and self.worker.is_alive():
+            return
+        if self.worker is not None:
+            self.worker.close()
+        self.idle_event.clear()
+        self.worker = mp.Process(
+            target=detection_worker_func,
+            args=(
+                self.stop_event,
+                self.idle_event,
+                self.frame_queue,
+                self.detection_queue,
+                self.control_queue,
+                self.out_queue,
+                self.feed_path,
+            ),
+            name="px_detection_worker",
+        )
+        self.worker.start()
+        logger.info("Detection worker has been started")
+
+    async def stop_worker(self) -> None:
+        """
+        Asks the idle detection worker to exit, terminating it if it does not.
+        """
+        worker = self.worker
+        self.worker = None
+        if worker is None:
+            return
+        if worker.is_alive():
+            command: DetectionWorkerCommand = {"command": "shutdown"}
+            try:
+                self.control_queue.put_nowait(command)
+            except queue.Full:
+                pass
+            await asyncio.to_thread(worker.join, 10)
+        if worker.is_alive():
+            logger.warning("Force terminating detection worker since it's still alive.")
+            worker.terminate()
+            await asyncio.to_thread(worker.join, 5)
+        worker.close()
+        logger.info("Detection worker has been stopped")
+
     async def start_detection_process(self) -> None:
         """
-        Starts the detection process as a multiprocessing subprocess.
+        Loads the model in the detection worker and starts detection.
 
         Behavior:
-            - Ensures the model is loaded and initializes required resources.
-            - Configures the detection subprocess and provides the necessary queues.
+            - Starts the detection worker if it is not running yet.
+            - Sends the worker the model to load and waits until it is loaded.
             - Broadcasts updates to connected clients regarding the operational status.
 
         Raises:
             DetectionModelLoadError: If the detection model fails to load.
             Exception: For unhandled errors during initialization.
         """
-        from app.managers.detection.detection_process import detection_process_func
-
         try:
             async with self.lock:
                 if self.detection_settings.model is None:
@@ -214,23 +280,20 @@ class DetectionService:
                     or not self.detection_process.is_alive()
                 ):
                     self.loading = True
-
-                    self.detection_process = mp.Process(
-                        target=detection_process_func,
-                        args=(
-                            resolve_absolute_path(
-                                self.detection_settings.model,
-                                self.file_manager.root_directory,
-                            ),
-                            self.stop_event,
-                            self.frame_queue,
-                            self.detection_queue,
-                            self.control_queue,
-                            self.out_queue,
+                    self.start_worker()
+                    load_command: DetectionWorkerCommand = {
+                        "command": "load_model",
+                        "model": resolve_absolute_path(
+                            self.detection_settings.model,
+                            self.file_manager.root_directory,
                         ),
+                    }
+                    self.idle_event.clear()
+                    await asyncio.to_thread(
+                        self.clear_and_put, self.control_queue, load_command
                     )
-                    self.detection_process.start()
-                    logger.info("Detection process has been started")
+                    self.detection_process = self.worker
+                    logger.info("Detection worker is loading the model")
                 else:
                     logger.info("Skipping starting of detection process: already alive")
 
@@ -250,6 +313,7 @@ class DetectionService:
                 logger.info("Received %s", msg)
                 err_msg = msg.get("error")
                 if err_msg is not None:
+                    self.detection_process = None
                     raise DetectionModelLoadError(
                         err_msg
                         if isinstance(err_msg, str)
@@ -290,11 +354,11 @@ class DetectionService:
 
     async def stop_detection_process(self, clear_queues=True) -> None:
         """
-        Stops the currently running detection process.
+        Stops detection and unloads the model, keeping the worker for the next start.
 
         Behavior:
-            - Signals the process to stop using the `stop_event`.
-            - Waits for the process to terminate, forcibly closing it if required.
+            - Signals the worker to stop detecting using the `stop_event`.
+            - Waits for the worker to release the model, terminating it if it does not.
             - Cleans up shared resources like queues and resets state.
         """
         async with self.lock:
@@ -306,15 +370,20 @@ class DetectionService:
                 self.stop_event.set()
 
                 logger.info("Detection process setted stop_event")
-                await asyncio.to_thread(self.detection_process.join, 10)
-                logger.info("Detection process has been joined")
-                if self.detection_process.is_alive():
-                    logger.warning(
-                        "Force terminating detection process since it's still alive."
-                    )
-                    self.detection_process.terminate()
-                    await asyncio.to_thread(self.detection_process.join, 5)
+                idle = self.detection_process.is_alive() and await asyncio.to_thread(
+                    self.idle_event.wait, 10
+                )
+                if idle:
+                    logger.info("Detection worker has released the model")
+                else:
+                    if self.detection_process.is_alive():
+                        logger.warning(
+                            "Force terminating detection worker since it's still busy."
+                        )
+                        self.detection_process.terminate()
+                        await asyncio.to_thread(self.detection_process.join, 5)
                     self.detection_process.close()
+                    self.worker = None
             if clear_queues:
                 await asyncio.to_thread(self._cleanup_queues)
             logger.info("Clearing stop event")
@@ -665,16 +734,19 @@ class DetectionService:
         self.shutting_down = True
         await self.cancel_detection_watcher()
         await self.stop_detection_process(clear_queues=False)
+        await self.stop_worker()
 
         self._close_queues()
 
         for prop in [
             "stop_event",
+            "idle_event",
             "frame_queue",
             "control_queue",
             "detection_queue",
             "out_queue",
             "detection_process",
+            "worker",
         ]:
             if hasattr(self, prop):
                 logger.info(f"Removing {prop.replace('_', ' ')}")
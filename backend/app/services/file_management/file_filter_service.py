@@ -1,57 +1,43 @@
 from __future__ import annotations
 
-from typing import Callable, List, Optional
+import threading
+from collections import OrderedDict
+from typing import Callable, List, Optional, Tuple
 
+from app.core.file_filtering.file_index import FileIndex
 from app.core.file_filtering.predicate_builder_factory import PredicateBuilderFactory
 from app.core.file_filtering.predicate_builders.suffix_predicate_builder import (
     SuffixPredicateBuilder,
 )
 from app.core.logger import Logger
 from app.schemas.file_filter import FileDetail, FileFilterModel, SearchModel
-from rapidfuzz import fuzz
 
 _log = Logger(name=__name__)
 
 
+ResultKey = Tuple[int, Optional[str], Optional[str], Optional[str], float]
+
+
 class FileFilterService:
+    max_cached_indexes = 4
+    max_cached_results = 64
+
     def __init__(self) -> None:
         self.factory = PredicateBuilderFactory()
 
         self.special_predicate_builders = {
             "file_suffixes": SuffixPredicateBuilder(),
         }
-
-    def _build_search_predicate(
-        self,
-        search: Optional[SearchModel] = None,
-        min_search_score=70,
-    ) -> Optional[Callable[[FileDetail], bool]]:
-        if search and search.value:
-            search_field = search.field or "name"
-            search_val = search.value.lower()
-
-            def fuzzy_predicate(f: FileDetail) -> bool:
-                value = getattr(f, search_field, "").lower()
-                score = fuzz.WRatio(search_val, value)
-                return score >= min_search_score
-
-            return fuzzy_predicate
-        return None
+        self._lock = threading.Lock()
+        self._indexes: OrderedDict[int, FileIndex] = OrderedDict()
+        self._results: OrderedDict[ResultKey, Tuple[List[int], int]] = OrderedDict()
 
     def _build_filter_predicates(
         self,
         filter_model: Optional[FileFilterModel] = None,
-        search: Optional[SearchModel] = None,
-        min_search_score=70,
     ) -> List[Callable[[FileDetail], bool]]:
         predicates: List[Callable[[FileDetail], bool]] = []
 
-        search_pred = self._build_search_predicate(
-            search=search, min_search_score=min_search_score
-        )
-        if search_pred:
-            predicates.append(search_pred)
-
         if not filter_model:
             return predicates
 
@@ -75,6 +61,51 @@ class FileFilterService:
 
         return predicates
 
+    def _get_index(self, files: List[FileDetail]) -> FileIndex:
+        signature = FileIndex.compute_signature(files)
+        with self._lock:
+            index = self._indexes.get(signature)
+            if index is not None:
+                self._indexes.move_to_end(signature)
+                index.rebind(files)
+                return index
+
+            index = FileIndex(files, signature=signature)
+            self._indexes[signature] = index
+            while len(self._indexes) > self.max_cached_indexes:
+                self._indexes.popitem(last=False)
+            return index
+
+    def _match_indexes(
+        self,
+        index: FileIndex,
+        files: List[FileDetail],
+        filter_model: Optional[FileFilterModel],
+        search: Optional[SearchModel],
+        min_search_score: float,
+    ) -> Tuple[List[int], int]:
+        """
+        Returns the indexes of the files matching the filters and the search,
+        followed by their parent directories, and the number of direct matches.
+
+        The cheap filter predicates run first, and only the remaining files are
+        scored against the search query, in a single batch.
+        """
+        predicates = self._build_filter_predicates(filter_model=filter_model)
+        candidates = [
+            i for i, f in enumerate(files) if all(pred(f) for pred in predicates)
+        ]
+
+        if search and search.value and candidates:
+            candidates = index.search(
+                search.value,
+                search.field or "name",
+                candidates,
+                min_search_score,
+            )
+
+        return index.with_parent_dirs(candidates), len(candidates)
+
     def filter_files(
         self,
         files: List[FileDetail],
@@ -88,38 +119,38 @@ class FileFilterService:
 
         In addition to returning files that match the predicates, include any parent
         directories (from the full input files list) of any matched file.
+
+        Results are cached per listing, filter and search, so re-running the same
+        query over an unchanged directory skips the matching entirely.
         """
-        predicates = self._build_filter_predicates(
-            filter_model=filter_model, search=search, min_search_score=min_search_score
+        index = self._get_index(files)
+        key: ResultKey = (
+            index.signature,
+            filter_model.model_dump_json(exclude_none=True) if filter_model else None,
+            search.value if search and search.value else None,
+            (search.field or "name") if search and search.value else None,
+            min_search_score,
         )
 
+        with self._lock:
+            cached = self._results.get(key)
+            if cached is not None:
+                self._results.move_to_end(key)
+
+        if cached is None:
+            cached = self._match_indexes(
+                index, files, filter_model, search, min_search_score
+            )
+            with self._lock:
+                self._results[key] = cached
+                while len(self._results) > self.max_cached_results:
+                    self._results.popitem(last=False)
+
+        indexes, matched_count = cached
+        result = [files[i] for i in indexes]
+
         if filtered_file_transformer:
-            matched = [
-                filtered_file_transformer(f)
-                for f in files
-                if all(pred(f) for pred in predicates)
+            result[:matched_count] = [
+                filtered_file_transformer(f) for f in result[:matched_count]
             ]
-        else:
-            matched = [f for f in files if all(pred(f) for pred in predicates)]
-
-        dir_map = {f.path: f for f in files if f.is_dir}
-
-        def get_parent_paths(path: str) -> List[str]:
-            parents = []
-            parts = path.split("/")
-            for i in range(1, len(parts)):
-                parent_path = "/".join(parts[:i])
-                parents.append(parent_path)
-            return parents
-
-        additional_dirs = {}
-        for file_detail in matched:
-            if not file_detail.is_dir:
-                for parent in get_parent_paths(file_detail.path):
-                    if parent in dir_map:
-                        additional_dirs[parent] = dir_map[parent]
-
-        final_set = {f.path: f for f in matched}
-        final_set.update(additional_dirs)
-
-        return list(final_set.values())
+        return result
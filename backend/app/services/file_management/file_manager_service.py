@@ -1,10 +1,11 @@
 from __future__ import annotations
 
 import os
+import shutil
 from dataclasses import dataclass
 from os import PathLike
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple, Union
+from typing import Dict, Iterator, List, Optional, Tuple, Union
 
 from app.core.logger import Logger
 from app.exceptions.file_exceptions import InvalidFileName
@@ -13,6 +14,7 @@ from app.managers.file_management.file_manager import FileManager
 from app.schemas.file_filter import (
     FileDetail,
     FileFilterModel,
+    FilePageResponseModel,
     FileResponseModel,
     OrderingModel,
     SearchModel,
@@ -28,7 +30,6 @@ from app.util.file_util import (
     resolve_absolute_path,
 )
 from fastapi import UploadFile
-from pydub import AudioSegment
 
 _log = Logger(name=__name__)
 
@@ -39,6 +40,9 @@ class FileCachedMetadata:
     duration: Optional[float]
     removable: Optional[bool] = True
     order: Optional[int] = None
+    title: Optional[str] = None
+    artist: Optional[str] = None
+    album: Optional[str] = None
 
 
 class FileManagerService:
@@ -67,7 +71,7 @@ class FileManagerService:
     ) -> None:
         self.root_directory: str = root_directory
         self._cache_dir: str = cache_dir
-        self._cache_file: str = os.path.join(self._cache_dir, "metadata.json")
+        self._cache_file: str = os.path.join(self._cache_dir, "metadata.db")
         self._preview_dir: str = os.path.join(self._cache_dir, "preview")
         self.filter_service = filter_service
         self.file_manager = file_manager
@@ -78,7 +82,12 @@ class FileManagerService:
                 duration=data.get("duration"),
                 removable=data.get("removable"),
                 order=data.get("order"),
+                title=data.get("title"),
+                artist=data.get("artist"),
+                album=data.get("album"),
             ),
+            legacy_cache_file=os.path.join(self._cache_dir, "metadata.json"),
+            key_exists=self._cache_key_exists,
         )
 
     @classmethod
@@ -95,6 +104,12 @@ class FileManagerService:
             (".zip", ".tar", ".tar.gz", ".tgz", ".7z", ".rar")
         )
 
+    def _cache_key_exists(self, relative_name: str) -> bool:
+        """
+        Whether the cached file still exists; entries for missing files are evicted.
+        """
+        return os.path.exists(os.path.join(self.root_directory, relative_name))
+
     def rename_file(self, relative_name: str, new_name: str) -> None:
         _log.info("Renaming filename %s to %s", relative_name, new_name)
         files_cache = self.cache_manager.get_cache()
@@ -110,18 +125,15 @@ class FileManagerService:
 
         if file_cached_detail:
             file_cached_detail.modified_time = os.path.getmtime(new_full_name)
+            file_cached_detail.size = os.path.getsize(new_full_name)
             files_cache[new_name] = file_cached_detail
             del files_cache[relative_name]
-            self.cache_manager.save_cache()
+            self.cache_manager.maybe_save()
 
     def remove_file(self, relative_name: str) -> bool:
         full_name = resolve_absolute_path(relative_name, self.root_directory)
-        files_cache = self.cache_manager.get_cache()
-        file_cached_detail = files_cache.get(relative_name)
-
-        if file_cached_detail:
-            del files_cache[relative_name]
-            self.cache_manager.save_cache()
+        if self.cache_manager.evict([relative_name]):
+            self.cache_manager.maybe_save()
 
         return self.file_manager.remove_file(full_name)
 
@@ -132,17 +144,18 @@ class FileManagerService:
             resolve_absolute_path(file, self.root_directory) for file in filenames
         ]
 
-        dirs = [item for item in filenames if os.path.isdir(item)]
-        dirs_relative = [file_to_relative(d, self.root_directory) for d in dirs]
+        relative_names = [file_to_relative(f, self.root_directory) for f in filenames]
 
         responses, success_responses = self.file_manager.batch_remove_files(filenames)
         files_cache = self.cache_manager.get_cache()
 
-        for key in list(files_cache):
-            if any(key == d or key.startswith(d + os.sep) for d in dirs_relative):
-                del files_cache[key]
-                self.cache_manager.mark_dirty()
-
+        self.cache_manager.evict(
+            [
+                key
+                for key in files_cache
+                if any(key == d or key.startswith(d + os.sep) for d in relative_names)
+            ]
+        )
         self.cache_manager.maybe_save()
 
         return responses, success_responses
@@ -158,19 +171,20 @@ class FileManagerService:
         filenames = [
             resolve_absolute_path(file, self.root_directory) for file in filenames
         ]
-        dirs = [item for item in filenames if os.path.isdir(item)]
-        dirs_relative = [file_to_relative(d, self.root_directory) for d in dirs]
+        relative_names = [file_to_relative(f, self.root_directory) for f in filenames]
         files_cache = self.cache_manager.get_cache()
 
         responses, success_responses = self.file_manager.batch_move_files(
             filenames, target_dir=target_dir
         )
 
-        for key in list(files_cache):
-            if any(key == d or key.startswith(d + os.sep) for d in dirs_relative):
-                del files_cache[key]
-                self.cache_manager.mark_dirty()
-
+        self.cache_manager.evict(
+            [
+                key
+                for key in files_cache
+                if any(key == d or key.startswith(d + os.sep) for d in relative_names)
+            ]
+        )
         self.cache_manager.maybe_save()
 
         return responses, success_responses
@@ -200,6 +214,84 @@ class FileManagerService:
 
         return result
 
+    def get_files_page(
+        self,
+        filter_model: Optional[FileFilterModel] = None,
+        search: Optional[SearchModel] = None,
+        ordering: Optional[OrderingModel] = None,
+        subdir: Optional[str] = None,
+        offset: int = 0,
+        limit: Optional[int] = None,
+        lazy: bool = False,
+    ) -> FilePageResponseModel:
+        """
+        Return one page of the filtered and ordered files, either from the whole
+        tree or, in lazy mode, from the direct children of `subdir`.
+
+        Metadata such as durations is looked up for the returned page only.
+        """
+        result = self.file_manager.get_files_page(
+            root_dir=self.root_directory,
+            subdir=subdir,
+            filter_model=filter_model,
+            search=search,
+            ordering=ordering,
+            offset=offset,
+            limit=limit,
+            lazy=lazy,
+            filtered_file_transformer=self._transform_file,
+            extra_files=self._extra_files(subdir),
+        )
+        self.cache_manager.maybe_save()
+
+        return result
+
+    def stream_files(
+        self,
+        filter_model: Optional[FileFilterModel] = None,
+        search: Optional[SearchModel] = None,
+        ordering: Optional[OrderingModel] = None,
+        subdir: Optional[str] = None,
+        lazy: bool = False,
+    ) -> Tuple[int, Iterator[str]]:
+        """
+        Return the number of matching files and a generator yielding them as
+        newline-delimited JSON, so large directories can be sent incrementally.
+        """
+        transform_first = self.file_manager.needs_transform_before_sort(ordering)
+        files = self.file_manager.query_files(
+            self.root_directory,
+            subdir=subdir,
+            filter_model=filter_model,
+            search=search,
+            ordering=ordering,
+            lazy=lazy,
+            extra_files=self._extra_files(subdir),
+            filtered_file_transformer=self._transform_file if transform_first else None,
+        )
+
+        def generate() -> Iterator[str]:
+            try:
+                yield from self.file_manager.iter_files(
+                    files, None if transform_first else self._transform_file
+                )
+            finally:
+                self.cache_manager.maybe_save()
+
+        return len(files), generate()
+
+    def _transform_file(self, file_model: FileDetail) -> FileDetail:
+        """
+        Adds the cached metadata to a file of a page or stream.
+        """
+        return self._add_duration(file_model)
+
+    def _extra_files(self, subdir: Optional[str] = None) -> List[FileDetail]:
+        """
+        Additional virtual entries listed alongside the files on disk.
+        """
+        return []
+
     def save_uploaded_file(
         self, file: UploadFile, directory: Optional[str] = None
     ) -> str:
@@ -228,10 +320,18 @@ class FileManagerService:
         file_path = resolve_absolute_path(filename, directory)
 
         with atomic_write(file_path, mode="wb") as buffer:
-            buffer.write(file.file.read())
+            shutil.copyfileobj(file.file, buffer, 1024 * 1024)
+        self.on_file_added(file_path)
         return file_path
 
+    def on_file_added(self, file_path: str) -> None:
+        """
+        Called after a file was uploaded to `file_path`.
+        """
+
     def _audio_duration(self, filename: str) -> float:
+        from pydub import AudioSegment
+
         audio: AudioSegment = AudioSegment.from_file(filename)
         return len(audio) / 1000.0
 
@@ -252,7 +352,7 @@ class FileManagerService:
         relative_name: str = file_model.path
         file_cache: Optional[CacheEntry[FileCachedMetadata]] = cache.get(relative_name)
 
-        if file_cache is None or file_cache.modified_time != mod_time:
+        if file_cache is None or not file_cache.is_fresh(mod_time, file_model.size):
             duration: Optional[float] = None
             preview: Optional[str] = None
             try:
@@ -268,9 +368,9 @@ class FileManagerService:
 
             cache[relative_name] = CacheEntry(
                 modified_time=mod_time,
+                size=file_model.size,
                 details=FileCachedMetadata(preview=preview, duration=duration),
             )
-            self.cache_manager.mark_dirty()
             return duration
         else:
             return file_cache.details.duration
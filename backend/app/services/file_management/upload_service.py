@@ -0,0 +1,288 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import threading
+import time
+import uuid
+from dataclasses import dataclass, field
+from typing import IO, Any, Dict, Optional
+
+from app.core.logger import Logger
+from app.exceptions.file_exceptions import (
+    InvalidFileName,
+    UploadIntegrityError,
+    UploadOffsetMismatch,
+    UploadSessionNotFound,
+)
+from app.util.atomic_write import atomic_write
+from app.util.file_util import resolve_absolute_path
+
+_log = Logger(name=__name__)
+
+
+@dataclass
+class UploadSession:
+    upload_id: str
+    target_path: str
+    part_path: str
+    size: int
+    checksum: Optional[str] = None
+    hasher: Optional[Any] = field(default=None, repr=False)
+    hashed_bytes: int = 0
+    unsynced_bytes: int = 0
+    file: Optional[IO[bytes]] = field(default=None, repr=False)
+    lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    @property
+    def offset(self) -> int:
+        try:
+            return os.path.getsize(self.part_path)
+        except FileNotFoundError:
+            return 0
+
+    @property
+    def filename(self) -> str:
+        return os.path.basename(self.target_path)
+
+
+class UploadService:
+    """
+    Resumable chunked uploads.
+
+    Chunks are appended directly to a hidden `.part` file next to the
+    destination, so finalizing an upload is a rename rather than another copy.
+    The received offset is the size of the part file, which lets clients resume
+    after a dropped connection, or after a server restart, since session
+    metadata is persisted in `sessions_dir`.
+    """
+
+    FSYNC_INTERVAL_BYTES = 8 * 1024 * 1024
+    STALE_SESSION_SECONDS = 24 * 60 * 60
+
+    def __init__(self, sessions_dir: str) -> None:
+        self.sessions_dir = sessions_dir
+        self._sessions: Dict[str, UploadSession] = {}
+        self._lock = threading.Lock()
+
+    def _session_file(self, upload_id: str) -> str:
+        return os.path.join(self.sessions_dir, f"{upload_id}.json")
+
+    def create(
+        self,
+        directory: str,
+        filename: str,
+        size: int,
+        checksum: Optional[str] = None,
+    ) -> UploadSession:
+        """
+        Starts a new upload of `filename` into `directory`.
+
+        Raises:
+            InvalidFileName: If the filename is invalid.
+        """
+        if not filename or os.path.basename(filename) in ("", ".", ".."):
+            raise InvalidFileName("Invalid filename.")
+
+        self.purge_stale()
+
+        target_path = resolve_absolute_path(filename, directory)
+        upload_id = uuid.uuid4().hex
+        part_path = os.path.join(
+            os.path.dirname(target_path),
+            f".{os.path.basename(target_path)}.{upload_id}.part",
+        )
+        os.makedirs(os.path.dirname(part_path), exist_ok=True)
+        open(part_path, "wb").close()
+
+        session = UploadSession(
+            upload_id=upload_id,
+            target_path=target_path,
+            part_path=part_path,
+            size=size,
+            checksum=checksum.lower() if checksum else None,
+            hasher=hashlib.sha256() if checksum else None,
+        )
+
+        with atomic_write(self._session_file(upload_id), mode="w") as f:
+            json.dump(
+                {
+                    "target_path": target_path,
+                    "part_path": part_path,
+                    "size": size,
+                    "checksum": session.checksum,
+                },
+                f,
+            )
+
+        with self._lock:
+            self._sessions[upload_id] = session
+
+        _log.info("Started upload %s of '%s' (%d bytes)", upload_id, target_path, size)
+        return session
+
+    def get(self, upload_id: str) -> UploadSession:
+        """
+        Returns the upload session, restoring it from disk if needed.
+
+        Raises:
+            UploadSessionNotFound: If there is no such upload.
+        """
+        with self._lock:
+            session = self._sessions.get(upload_id)
+            if session is not None:
+                return session
+
+            session_file = self._session_file(upload_id)
+            if not upload_id.isalnum() or not os.path.exists(session_file):
+                raise UploadSessionNotFound(f"Upload {upload_id} not found")
+
+            with open(session_file, "r", encoding="utf-8") as f:
+                data = json.load(f)
+
+            session = UploadSession(
+                upload_id=upload_id,
+                target_path=data["target_path"],
+                part_path=data["part_path"],
+                size=data["size"],
+                checksum=data.get("checksum"),
+            )
+            if not os.path.exists(session.part_path):
+                raise UploadSessionNotFound(f"Upload {upload_id} not found")
+
+            self._sessions[upload_id] = session
+            return session
+
+    def write(self, upload_id: str, offset: int, data: bytes) -> int:
+        """
+        Appends `data` at `offset` and returns the new offset.
+
+        The part file is fsynced every `FSYNC_INTERVAL_BYTES` instead of after
+        each chunk.
+
+        Raises:
+            UploadOffsetMismatch: If `offset` is not the current offset.
+            UploadIntegrityError: If the data would exceed the declared size.
+        """
+        session = self.get(upload_id)
+        with session.lock:
+            current = session.offset
+            if offset != current:
+                raise UploadOffsetMismatch(
+                    f"Expected offset {current}, got {offset}", offset=current
+                )
+            if current + len(data) > session.size:
+                raise UploadIntegrityError(
+                    f"Chunk exceeds the declared size of {session.size} bytes"
+                )
+
+            if session.file is None:
+                session.file = open(session.part_path, "ab")
+
+            session.file.write(data)
+            session.file.flush()
+            session.unsynced_bytes += len(data)
+
+            if session.hasher is not None and session.hashed_bytes == current:
+                session.hasher.update(data)
+                session.hashed_bytes += len(data)
+
+            if session.unsynced_bytes >= self.FSYNC_INTERVAL_BYTES:
+                os.fsync(session.file.fileno())
+                session.unsynced_bytes = 0
+
+            return current + len(data)
+
+    def _file_checksum(self, session: UploadSession) -> str:
+        if session.hasher is not None and session.hashed_bytes == session.size:
+            return session.hasher.hexdigest()
+
+        hasher = hashlib.sha256()
+        with open(session.part_path, "rb") as f:
+            for chunk in iter(lambda: f.read(1024 * 1024), b""):
+                hasher.update(chunk)
+        return hasher.hexdigest()
+
+    def finalize(self, upload_id: str) -> str:
+        """
+        Verifies the received file and moves it into place.
+
+        Returns:
+            The path of the saved file.
+
+        Raises:
+            UploadIntegrityError: If the size or the checksum does not match.
+        """
+        session = self.get(upload_id)
+        with session.lock:
+            self._close(session, sync=True)
+
+            received = session.offset
+            if received != session.size:
+                raise UploadIntegrityError(
+                    f"Received {received} of {session.size} bytes"
+                )
+
+            if session.checksum and self._file_checksum(session) != session.checksum:
+                raise UploadIntegrityError("Checksum mismatch")
+
+            os.replace(session.part_path, session.target_path)
+            self._forget(session)
+
+        _log.info("Finished upload %s: '%s'", upload_id, session.target_path)
+        return session.target_path
+
+    def abort(self, upload_id: str) -> None:
+        session = self.get(upload_id)
+        with session.lock:
+            self._close(session)
+            try:
+                os.remove(session.part_path)
+            except FileNotFoundError:
+                pass
+            self._forget(session)
+        _log.info("Aborted upload %s", upload_id)
+
+    def purge_stale(self) -> None:
+        """
+        Aborts uploads that have not received data for `STALE_SESSION_SECONDS`.
+        """
+        if not os.path.isdir(self.sessions_dir):
+            return
+        now = time.time()
+        for name in os.listdir(self.sessions_dir):
+            upload_id, ext = os.path.splitext(name)
+            if ext != ".json":
+                continue
+            try:
+                session = self.get(upload_id)
+                last_activity = max(
+                    os.path.getmtime(self._session_file(upload_id)),
+                    os.path.getmtime(session.part_path),
+                )
+            except (UploadSessionNotFound, OSError, ValueError, KeyError):
+                self._remove_session_file(upload_id)
+                continue
+            if now - last_activity > self.STALE_SESSION_SECONDS:
+                _log.info("Removing stale upload %s", upload_id)
+                self.abort(upload_id)
+
+    def _close(self, session: UploadSession, sync: bool = False) -> None:
+        if session.file is not None:
+            if sync and session.unsynced_bytes:
+                os.fsync(session.file.fileno())
+            session.file.close()
+            session.file = None
+            session.unsynced_bytes = 0
+
+    def _forget(self, session: UploadSession) -> None:
+        with self._lock:
+            self._sessions.pop(session.upload_id, None)
+        self._remove_session_file(session.upload_id)
+
+    def _remove_session_file(self, upload_id: str) -> None:
+        try:
+            os.remove(self._session_file(upload_id))
+        except FileNotFoundError:
+            pass
@@ -1,41 +1,210 @@
-from typing import Any, Dict
+import asyncio
+import json
+import os
+from typing import Any, Dict, Optional
 
 import httpx
+from app.core.async_emitter import AsyncEventEmitter, Listener
 from app.core.logger import Logger
 
 logger = Logger(__name__)
 
 
-class RobotCommunicationService:
-    def __init__(self, base_url: str) -> None:
+class RobotCommunicationService(AsyncEventEmitter):
+    """
+    Persistent connection of the main app to the robot (control) app.
+
+    All requests share one `httpx.AsyncClient` whose pool keeps connections
+    alive between calls, so a message costs a request on an open connection
+    rather than a new connection. When `socket_path` exists, the client talks
+    to the robot app over that Unix domain socket instead of TCP; the
+    transport is chosen again whenever the socket appears or disappears, e.g.
+    after the robot app restarts.
+
+    Besides request/response calls, the service exchanges events with the
+    robot app: `publish` pushes an event to it, and listeners registered with
+    `subscribe` receive the events it streams, with the payload as the only
+    argument. The event stream is opened by the first subscription and
+    reopened with a backoff whenever it breaks.
+    """
+
+    EVENTS_PATH = "/px/api/ipc/events"
+
+    def __init__(
+        self,
+        base_url: str,
+        socket_path: Optional[str] = None,
+        max_connections: int = 4,
+        keepalive_expiry: float = 60.0,
+        timeout: float = 5.0,
+        stream_timeout: float = 30.0,
+        reconnect_delay: float = 0.5,
+        max_reconnect_delay: float = 10.0,
+    ) -> None:
+        super().__init__()
         self.base_url = base_url.rstrip("/")
+        self.socket_path = socket_path
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_connections,
+            keepalive_expiry=keepalive_expiry,
+        )
+        self.timeout = timeout
+        self.stream_timeout = stream_timeout
+        self.reconnect_delay = reconnect_delay
+        self.max_reconnect_delay = max_reconnect_delay
+        self._client: Optional[httpx.AsyncClient] = None
+        self._client_uds: Optional[str] = None
+        self._listener_task: Optional[asyncio.Task] = None
+        self._closed = False
+
+    @property
+    def uds(self) -> Optional[str]:
+        """
+        The Unix domain socket to connect through, or None to use TCP.
+        """
+        if self.socket_path and os.path.exists(self.socket_path):
+            return self.socket_path
+        return None
+
+    async def get_client(self) -> httpx.AsyncClient:
+        """
+        Returns the shared client, creating it, or replacing it if the robot
+        app socket appeared or disappeared since it was created.
+        """
+        uds = self.uds
+        if self._client is not None and self._client_uds != uds:
+            logger.info(
+                "Robot app transport changed to %s", f"socket {uds}" if uds else "TCP"
+            )
+            client, self._client = self._client, None
+            await client.aclose()
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                base_url=self.base_url,
+                transport=httpx.AsyncHTTPTransport(uds=uds, limits=self.limits),
+                timeout=self.timeout,
+            )
+            self._client_uds = uds
+        return self._client
+
+    async def request(self, method: str, path: str, **kwargs: Any) -> httpx.Response:
+        """
+        Sends a request to the robot app over a pooled connection.
+        """
+        client = await self.get_client()
+        return await client.request(method, path, **kwargs)
 
     async def shutdown_robot_services(self) -> None:
         """Notify the robot app to shutdown its services."""
-        robot_shutdown_url = f"{self.base_url}/px/api/system/shutdown"
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.get(robot_shutdown_url)
-                if response.status_code != 200:
-                    logger.error(
-                        "Robot shutdown call failed. Status: %s, Response: %s",
-                        response.status_code,
-                        response.text,
-                    )
+            response = await self.request("GET", "/px/api/system/shutdown")
+            if response.status_code != 200:
+                logger.error(
+                    "Robot shutdown call failed. Status: %s, Response: %s",
+                    response.status_code,
+                    response.text,
+                )
         except Exception as e:
             logger.error("Error calling robot shutdown endpoint: %s", e)
 
     async def refresh_robot_settings(self, new_settings: Dict[str, Any]) -> None:
         """Refresh settings in the robot app."""
-        robot_refresh_url = f"{self.base_url}/px/api/settings/update"
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.post(robot_refresh_url, json=new_settings)
-                if response.status_code != 200:
-                    logger.error(
-                        "Failed to refresh robot settings. Status code: %s, Response: %s",
-                        response.status_code,
-                        response.text,
-                    )
+            response = await self.request(
+                "POST", "/px/api/settings/update", json=new_settings
+            )
+            if response.status_code != 200:
+                logger.error(
+                    "Failed to refresh robot settings. Status code: %s, Response: %s",
+                    response.status_code,
+                    response.text,
+                )
         except Exception as exc:
             logger.error("Error calling robot app refresh endpoint: %s", exc)
+
+    async def publish(self, event_type: str, payload: Any = None) -> bool:
+        """
+        Pushes an event to the robot app. Returns whether it was delivered.
+        """
+        try:
+            response = await self.request(
+                "POST", self.EVENTS_PATH, json={"type": event_type, "payload": payload}
+            )
+        except httpx.HTTPError as e:
+            logger.debug("Failed to publish '%s' to the robot app: %s", event_type, e)
+            return False
+        return response.status_code == 204
+
+    def subscribe(self, event_name: str, listener: Listener) -> None:
+        """
+        Registers a listener for an event of the robot app and opens the event
+        stream if needed.
+        """
+        self.on(event_name, listener)
+        self.start_listener()
+
+    def start_listener(self) -> None:
+        """
+        Opens the event stream of the robot app, unless it is already open.
+        Does nothing outside of a running event loop.
+        """
+        if self._closed or (
+            self._listener_task is not None and not self._listener_task.done()
+        ):
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        self._listener_task = loop.create_task(self._listen())
+
+    async def _listen(self) -> None:
+        delay = self.reconnect_delay
+        # The robot app sends heartbeats, so a silent stream is a dead one.
+        timeout = httpx.Timeout(self.timeout, read=self.stream_timeout)
+        while not self._closed:
+            try:
+                client = await self.get_client()
+                async with client.stream(
+                    "GET", self.EVENTS_PATH, timeout=timeout
+                ) as response:
+                    response.raise_for_status()
+                    logger.info("Subscribed to the robot app events")
+                    delay = self.reconnect_delay
+                    async for line in response.aiter_lines():
+                        if line:
+                            await self._dispatch(line)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.debug("Robot app event stream unavailable: %s", e)
+            if self._closed:
+                break
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, self.max_reconnect_delay)
+
+    async def _dispatch(self, line: str) -> None:
+        try:
+            event = json.loads(line)
+            event_type = event["type"]
+        except (ValueError, KeyError, TypeError):
+            logger.warning("Skipping malformed robot app event: %r", line)
+            return
+        await self.emit(event_type, event.get("payload"))
+
+    async def aclose(self) -> None:
+        """
+        Closes the event stream and the pooled connections.
+        """
+        self._closed = True
+        task, self._listener_task = self._listener_task, None
+        if task is not None:
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        client, self._client = self._client, None
+        if client is not None:
+            await client.aclose()
@@ -0,0 +1,159 @@
+from abc import ABC, abstractmethod
+from importlib import import_module
+from typing import Any, List, Optional
+
+import numpy as np
+from app.core.logger import Logger
+from app.exceptions.audio import AudioCodecUnavailable
+from app.schemas.audio import AudioStreamCodec, AudioStreamFormat
+
+_log = Logger(name=__name__)
+
+MULAW_BIAS = 0x21
+MULAW_CLIP = 8159
+
+OPUS_FRAME_DURATIONS_MS = (10, 20, 40, 60)
+OPUS_SAMPLE_RATES = (8000, 12000, 16000, 24000, 48000)
+
+
+def mulaw_encode(samples: np.ndarray) -> np.ndarray:
+    """
+    Encodes 16-bit PCM samples to G.711 µ-law.
+    """
+    x = samples.astype(np.int32) >> 2
+    negative = x < 0
+    magnitude = np.minimum(np.where(negative, -x, x), MULAW_CLIP) + MULAW_BIAS
+    exponent = np.floor(np.log2(magnitude)).astype(np.int32) - 5
+    mantissa = (magnitude >> (exponent + 1)) & 0x0F
+    code = np.where(exponent > 7, 0x7F, (exponent << 4) | mantissa)
+    return (code ^ np.where(negative, 0x7F, 0xFF)).astype(np.uint8)
+
+
+def mulaw_decode(data: np.ndarray) -> np.ndarray:
+    """
+    Decodes G.711 µ-law bytes to 16-bit PCM samples.
+    """
+    u = ~data.astype(np.int32) & 0xFF
+    exponent = (u >> 4) & 0x07
+    mantissa = u & 0x0F
+    magnitude = (((mantissa << 3) + 0x84) << exponent) - 0x84
+    return np.where(u & 0x80, -magnitude, magnitude).astype(np.int16)
+
+
+class AudioEncoder(ABC):
+    """
+    Splits a stream of 16-bit PCM blocks into frames of `frame_size` samples
+    and encodes each frame.
+    """
+
+    def __init__(self, sample_rate: int, channels: int, frame_size: int) -> None:
+        self.sample_rate = sample_rate
+        self.channels = channels
+        self.frame_size = frame_size
+        self._frame_bytes = frame_size * channels * 2
+        self._pending = bytearray()
+
+    @property
+    @abstractmethod
+    def codec(self) -> AudioStreamCodec:
+        pass
+
+    @property
+    def bitrate(self) -> Optional[int]:
+        return None
+
+    @property
+    def stream_format(self) -> AudioStreamFormat:
+        return AudioStreamFormat(
+            codec=self.codec,
+            sample_rate=self.sample_rate,
+            channels=self.channels,
+            frame_size=self.frame_size,
+            bitrate=self.bitrate,
+        )
+
+    @abstractmethod
+    def encode_frame(self, pcm: bytes) -> bytes:
+        pass
+
+    def encode(self, pcm: bytes) -> List[bytes]:
+        """
+        Appends PCM data and returns the encoded frames that became complete.
+        """
+        self._pending.extend(pcm)
+        frames: List[bytes] = []
+        while len(self._pending) >= self._frame_bytes:
+            frame = bytes(self._pending[: self._frame_bytes])
+            del self._pending[: self._frame_bytes]
+            frames.append(self.encode_frame(frame))
+        return frames
+
+
+class MuLawEncoder(AudioEncoder):
+    @property
+    def codec(self) -> AudioStreamCodec:
+        return AudioStreamCodec.mulaw
+
+    def encode_frame(self, pcm: bytes) -> bytes:
+        return mulaw_encode(np.frombuffer(pcm, dtype="<i2")).tobytes()
+
+
+class OpusEncoder(AudioEncoder):
+    """
+    Opus encoder backed by the optional `opuslib` package.
+    """
+
+    def __init__(
+        self, sample_rate: int, channels: int, frame_size: int, bitrate: int
+    ) -> None:
+        super().__init__(sample_rate, channels, frame_size)
+        if sample_rate not in OPUS_SAMPLE_RATES:
+            raise AudioCodecUnavailable(
+                f"Opus does not support the sample rate {sample_rate}"
+            )
+        try:
+            opuslib: Any = import_module("opuslib")
+        except (ImportError, OSError) as e:
+            raise AudioCodecUnavailable(f"Opus is not available: {e}")
+
+        self._encoder = opuslib.Encoder(
+            sample_rate, channels, opuslib.APPLICATION_RESTRICTED_LOWDELAY
+        )
+        self._encoder.bitrate = bitrate
+        self._bitrate = bitrate
+
+    @property
+    def codec(self) -> AudioStreamCodec:
+        return AudioStreamCodec.opus
+
+    @property
+    def bitrate(self) -> Optional[int]:
+        return self._bitrate
+
+    def encode_frame(self, pcm: bytes) -> bytes:
+        return self._encoder.encode(pcm, self.frame_size)
+
+
+def create_audio_encoder(
+    codec: AudioStreamCodec,
+    sample_rate: int,
+    channels: int,
+    frame_ms: int,
+    bitrate: int,
+) -> AudioEncoder:
+    """
+    Creates an encoder for `codec`.
+
+    Raises:
+        AudioCodecUnavailable: If the codec or its parameters are not supported.
+    """
+    frame_size = sample_rate * frame_ms // 1000
+    if codec == AudioStreamCodec.opus:
+        if frame_ms not in OPUS_FRAME_DURATIONS_MS:
+            raise AudioCodecUnavailable(
+                f"Opus frame duration must be one of {OPUS_FRAME_DURATIONS_MS} ms"
+            )
+        return OpusEncoder(sample_rate, channels, frame_size, bitrate)
+    if codec == AudioStreamCodec.mulaw:
+        return MuLawEncoder(sample_rate, channels, frame_size)
+    raise AudioCodecUnavailable(f"No encoder for {codec.value}")
@@ -1,10 +1,110 @@
-from pydub import AudioSegment
+import json
+import os
+import subprocess
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional
+
+from app.core.logger import Logger
+
+_log = Logger(name=__name__)
+
+
+@dataclass
+class AudioTags:
+    duration: Optional[float] = None
+    title: Optional[str] = None
+    artist: Optional[str] = None
+    album: Optional[str] = None
+    has_cover: bool = False
 
 
 class AudioMetadataService:
     """Reads metadata from audio files."""
 
+    COVER_MAX_SIDE = 256
+
     def get_duration(self, filename: str) -> float:
         """Return the duration of an audio file in seconds."""
+        from pydub import AudioSegment
+
         audio = AudioSegment.from_file(filename)
         return len(audio) / 1000.0
+
+    def read_tags(self, filename: str) -> AudioTags:
+        """
+        Return the duration, the title, artist and album tags, and whether the
+        file embeds cover art, using a single ffprobe call that does not decode
+        the audio.
+
+        Falls back to decoding the file for the duration if ffprobe fails.
+        """
+        cmd = [
+            "ffprobe",
+            "-v",
+            "error",
+            "-show_entries",
+            "format=duration:format_tags=title,artist,album:stream=codec_type",
+            "-of",
+            "json",
+            filename,
+        ]
+        try:
+            result = subprocess.run(
+                cmd,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                text=True,
+                check=True,
+            )
+            info = json.loads(result.stdout)
+        except Exception as err:
+            _log.warning("Failed to probe '%s': %s", filename, err)
+            return AudioTags(duration=self.get_duration(filename))
+
+        fmt = info.get("format") or {}
+        tags = {key.lower(): value for key, value in (fmt.get("tags") or {}).items()}
+        duration = fmt.get("duration")
+        return AudioTags(
+            duration=float(duration) if duration else None,
+            title=tags.get("title") or None,
+            artist=tags.get("artist") or None,
+            album=tags.get("album") or None,
+            has_cover=any(
+                stream.get("codec_type") == "video"
+                for stream in info.get("streams") or []
+            ),
+        )
+
+    def extract_cover(self, filename: str, output_path: str) -> Optional[str]:
+        """
+        Save the embedded cover art of an audio file as a JPEG thumbnail.
+        """
+        try:
+            Path(output_path).parent.mkdir(parents=True, exist_ok=True)
+        except Exception as err:
+            _log.error("Error creating cover cache directory: %s", err)
+            return None
+
+        cmd = [
+            "ffmpeg",
+            "-y",
+            "-i",
+            filename,
+            "-an",
+            "-frames:v",
+            "1",
+            "-vf",
+            f"scale='min({self.COVER_MAX_SIDE},iw)':-2",
+            "-q:v",
+            "3",
+            output_path,
+        ]
+        try:
+            subprocess.run(
+                cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, check=True
+            )
+            return output_path if os.path.exists(output_path) else None
+        except Exception as err:
+            _log.error("Failed to extract cover art from '%s': %s", filename, err)
+            return None
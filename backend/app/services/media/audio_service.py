@@ -1,4 +1,4 @@
-from typing import Union
+from typing import Callable, Optional, Union
 
 from app.services.media.audio_metadata_service import AudioMetadataService
 from app.services.media.volume_controller import VolumeController
@@ -40,3 +40,26 @@ class AudioService:
         """
         normalized_volume = int(max(0, min(100, volume_percentage)))
         self._volume_controller.set_volume(normalized_volume)
+
+    def set_volume_listener(self, listener: Optional[Callable[[int], None]]) -> bool:
+        """
+        Register a callback for volume changes made outside the application.
+
+        The callback is invoked from a background thread. Returns whether the
+        volume controller reports such changes.
+        """
+        set_change_listener = getattr(
+            self._volume_controller, "set_change_listener", None
+        )
+        if set_change_listener is None:
+            return False
+        set_change_listener(listener)
+        return True
+
+    def close(self) -> None:
+        """
+        Release the resources held by the volume controller.
+        """
+        close = getattr(self._volume_controller, "close", None)
+        if close is not None:
+            close()
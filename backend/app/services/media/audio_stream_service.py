@@ -1,42 +1,74 @@
 import asyncio
 import threading
-from queue import Empty, Full, Queue
-from typing import AsyncGenerator, Optional
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, AsyncGenerator, Dict, Optional, Tuple
 
-import sounddevice as sd
 from app.core.logger import Logger
+from app.exceptions.audio import AudioCodecUnavailable
+from app.schemas.audio import AudioStreamCodec
+from app.services.media.audio_codecs import AudioEncoder, create_audio_encoder
+from app.util.ring_broadcaster import RingBroadcaster, RingSubscription
 from fastapi import WebSocket, WebSocketDisconnect
 
+if TYPE_CHECKING:
+    import sounddevice as sd
+
 _log = Logger(name=__name__)
 
+EncodedStreamKey = Tuple[AudioStreamCodec, int, int]
+
+
+@dataclass
+class EncodedAudioStream:
+    """
+    Encoded audio shared by all clients that requested the same format.
+    """
+
+    encoder: AudioEncoder
+    broadcaster: RingBroadcaster[bytes]
+    task: Optional[asyncio.Task] = None
+    subscribers: int = 0
+
 
 class AudioStreamService:
     """
     Service to capture audio in real time using the microphone.
+
+    Captured blocks are published once to a ring buffer, from which every
+    connected client reads with its own cursor. Clients may request an encoded
+    stream (µ-law or Opus), which is encoded once per format and shared by all
+    clients that requested it.
     """
 
+    BUFFER_BLOCKS = 64
+    DEFAULT_FRAME_MS = 20
+    DEFAULT_BITRATE = 32000
+
     def __init__(self) -> None:
-        self.sample_rate = 44100
+        self.sample_rate = 48000
         self.channels = 1
         self.block_size = 1024
         self.running = False
         self.audio_thread: Optional[threading.Thread] = None
-        self.audio_queue = Queue(maxsize=100)
-        self.audio_stream: Optional[sd.InputStream] = None
+        self.broadcaster: RingBroadcaster[bytes] = RingBroadcaster(self.BUFFER_BLOCKS)
+        self.audio_stream: Optional["sd.InputStream"] = None
         self.active_clients = 0
+        self._encoded_streams: Dict[EncodedStreamKey, EncodedAudioStream] = {}
 
     def _capture_worker(self) -> None:
         """
-        Background worker to capture audio in real time and push it to the queue.
-        Uses `_enqueue_audio_chunk` to ensure robust queue handling.
+        Background worker to capture audio in real time and publish it to the
+        subscribers.
         """
         try:
+            import sounddevice as sd
+
             self.audio_stream = sd.InputStream(
                 samplerate=self.sample_rate,
                 channels=self.channels,
                 blocksize=self.block_size,
                 dtype="int16",
-                callback=lambda indata, frames, time, status: self._enqueue_audio_chunk(
+                callback=lambda indata, frames, time, status: self._publish_audio_chunk(
                     indata
                 ),
             )
@@ -55,19 +87,12 @@ class AudioStreamService:
             self.audio_stream = None
             _log.info("Audio capture stopped.")
 
-    def _enqueue_audio_chunk(self, chunk) -> None:
+    def _publish_audio_chunk(self, chunk) -> None:
         """
-        Safely enqueue an audio chunk, discarding the oldest data if the queue is full.
+        Publish an audio chunk to every subscriber. Subscribers that fall behind
+        skip the oldest chunks.
         """
-        try:
-            self.audio_queue.put_nowait(chunk.copy())
-        except Full:
-            _log.warning("Audio queue is full; dropping oldest chunk.")
-            try:
-                self.audio_queue.get_nowait()
-                self.audio_queue.put_nowait(chunk.copy())
-            except Empty:
-                _log.error("Unexpected: Audio queue was empty during cleanup.")
+        self.broadcaster.publish(chunk.tobytes())
 
     def start_audio_capture(self) -> None:
         """
@@ -77,6 +102,8 @@ class AudioStreamService:
             _log.info("Audio capture is already running.")
             return
         self.running = True
+        if self.broadcaster.closed:
+            self.broadcaster = RingBroadcaster(self.BUFFER_BLOCKS)
         self.audio_thread = threading.Thread(target=self._capture_worker, daemon=True)
         self.audio_thread.start()
 
@@ -88,37 +115,128 @@ class AudioStreamService:
             _log.info("Audio capture is not running.")
             return
         self.running = False
+        self.broadcaster.close()
         if self.audio_thread and self.audio_thread.is_alive():
             self.audio_thread.join()
 
     async def generate_audio_chunks(self) -> AsyncGenerator[bytes, None]:
         """
-        Async generator to yield audio chunks from the queue in real time.
+        Async generator to yield audio chunks in real time.
         """
         if not self.running:
             await asyncio.to_thread(self.start_audio_capture)
 
-        while self.running:
-            try:
-                chunk = await asyncio.to_thread(self.audio_queue.get, timeout=1)
-                yield chunk.tobytes()
-            except Empty:
-                _log.warning("Audio queue is empty; waiting for audio.")
-                continue
+        async for chunk in self.broadcaster.subscribe():
+            yield chunk
+
+    async def _encode_worker(
+        self,
+        key: EncodedStreamKey,
+        stream: EncodedAudioStream,
+        source: RingSubscription[bytes],
+    ) -> None:
+        try:
+            async for chunk in source:
+                for frame in stream.encoder.encode(chunk):
+                    stream.broadcaster.publish(frame)
+        except asyncio.CancelledError:
+            pass
+        except Exception:
+            _log.error("Failed to encode audio stream", exc_info=True)
+        finally:
+            stream.broadcaster.close()
+            if self._encoded_streams.get(key) is stream:
+                del self._encoded_streams[key]
+
+    def acquire_encoded_stream(
+        self, codec: AudioStreamCodec, frame_ms: int, bitrate: int
+    ) -> EncodedAudioStream:
+        """
+        Returns the encoded stream for the format, starting its encoder if this
+        is the first subscriber. Audio capture must be running.
+
+        Raises:
+            AudioCodecUnavailable: If the codec or its parameters are not supported.
+        """
+        key: EncodedStreamKey = (codec, frame_ms, bitrate)
+        stream = self._encoded_streams.get(key)
+        if stream is None or stream.broadcaster.closed:
+            encoder = create_audio_encoder(
+                codec, self.sample_rate, self.channels, frame_ms, bitrate
+            )
+            stream = EncodedAudioStream(
+                encoder=encoder,
+                broadcaster=RingBroadcaster(self.BUFFER_BLOCKS),
+            )
+            stream.task = asyncio.create_task(
+                self._encode_worker(key, stream, self.broadcaster.subscribe())
+            )
+            self._encoded_streams[key] = stream
+            _log.info("Started %s audio encoder", codec.value)
+        stream.subscribers += 1
+        return stream
+
+    def release_encoded_stream(self, stream: EncodedAudioStream) -> None:
+        """
+        Unsubscribes from the encoded stream, stopping its encoder if there are
+        no subscribers left.
+        """
+        stream.subscribers -= 1
+        if stream.subscribers <= 0 and stream.task is not None:
+            stream.task.cancel()
+            _log.info("Stopped %s audio encoder", stream.encoder.codec.value)
+
+    def _acquire_with_fallback(
+        self, codec: AudioStreamCodec, frame_ms: int, bitrate: int
+    ) -> EncodedAudioStream:
+        try:
+            return self.acquire_encoded_stream(codec, frame_ms, bitrate)
+        except AudioCodecUnavailable as e:
+            if codec == AudioStreamCodec.mulaw:
+                raise
+            _log.warning("%s, falling back to µ-law", e)
+            return self.acquire_encoded_stream(
+                AudioStreamCodec.mulaw, frame_ms, bitrate
+            )
 
-    async def audio_stream_to_ws(self, websocket: WebSocket) -> None:
+    async def audio_stream_to_ws(
+        self,
+        websocket: WebSocket,
+        codec: AudioStreamCodec = AudioStreamCodec.pcm,
+        frame_ms: int = DEFAULT_FRAME_MS,
+        bitrate: int = DEFAULT_BITRATE,
+    ) -> None:
         """
         Handles an incoming WebSocket connection for audio streaming.
 
         This method is called for each new WebSocket connection.
+
+        For the `pcm` codec, every message contains raw 16-bit samples. For
+        encoded codecs, the first message is a JSON text message of type
+        `format` describing the stream, followed by one encoded frame per binary
+        message. If Opus is unavailable, µ-law is used instead.
         """
         _log.info(f"WebSocket connection established: {websocket.client}")
         self.active_clients += 1
+        stream: Optional[EncodedAudioStream] = None
 
         try:
             await websocket.accept()
-            async for audio_chunk in self.generate_audio_chunks():
-                await websocket.send_bytes(audio_chunk)
+            if codec == AudioStreamCodec.pcm:
+                async for audio_chunk in self.generate_audio_chunks():
+                    await websocket.send_bytes(audio_chunk)
+            else:
+                if not self.running:
+                    await asyncio.to_thread(self.start_audio_capture)
+                stream = self._acquire_with_fallback(codec, frame_ms, bitrate)
+                await websocket.send_json(
+                    {
+                        "type": "format",
+                        "payload": stream.encoder.stream_format.model_dump(mode="json"),
+                    }
+                )
+                async for frame in stream.broadcaster.subscribe():
+                    await websocket.send_bytes(frame)
         except WebSocketDisconnect:
             _log.info(f"WebSocket Disconnected {websocket.client}")
         except asyncio.CancelledError:
@@ -126,6 +244,8 @@ class AudioStreamService:
         except Exception:
             _log.log_exception("An error occurred in video stream")
         finally:
+            if stream is not None:
+                self.release_encoded_stream(stream)
             self.active_clients -= 1
             if self.active_clients == 0:
                 _log.info(
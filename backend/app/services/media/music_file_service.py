@@ -20,20 +20,45 @@ from app.services.file_management.file_manager_service import (
     FileCachedMetadata,
     FileManagerService,
 )
+from app.services.media.audio_metadata_service import AudioMetadataService
+from app.services.media.music_library import MusicLibrary
 from app.services.media.music_service import MusicService
-from app.util.file_util import abbreviate_path
+from app.util.file_util import (
+    abbreviate_path,
+    file_to_relative,
+    resolve_absolute_path,
+)
 from app.util.list_util import take_while
 
 _log = Logger(__name__)
 
 
 class MusicFileService(FileManagerService):
+    """
+    Manages the music directory and keeps an index of its tracks.
+
+    The directory is scanned once, when the tracks are first listed. Durations,
+    tags and cover art are persisted in the metadata cache, so later scans only
+    probe new or modified files. Afterwards, uploads, renames, moves and removals
+    made through this service update the index incrementally, and
+    `list_sorted_tracks` is served from memory. Files changed on disk by other
+    means are picked up by `refresh_library`.
+    """
+
     def __init__(
-        self, music_service: MusicService, default_music_dir: str, *args, **kwargs
+        self,
+        music_service: MusicService,
+        default_music_dir: str,
+        *args,
+        metadata_service: Optional[AudioMetadataService] = None,
+        **kwargs,
     ) -> None:
         super().__init__(*args, **kwargs)
         self.music_service = music_service
         self.default_music_dir = default_music_dir
+        self.metadata_service = metadata_service or AudioMetadataService()
+        self.library = MusicLibrary()
+        self._cover_dir = os.path.join(self._preview_dir, "covers")
         default_files: List[str] = []
         for file in os.listdir(self.default_music_dir):
             file_path = os.path.join(self.default_music_dir, file)
@@ -85,27 +110,95 @@ class MusicFileService(FileManagerService):
             else:
                 filtered_filenames.append(relative_name)
 
-        return super().batch_remove_files(filenames=filtered_filenames)
+        result = super().batch_remove_files(filenames=filtered_filenames)
+        self._update_library(
+            removed=[
+                name
+                for name in filtered_filenames
+                if not os.path.exists(os.path.join(self.root_directory, name))
+            ]
+        )
+        return result
+
+    def batch_move_files(
+        self, filenames: List[str], target_dir: str
+    ) -> Tuple[List[BatchFileResult], List[Dict[str, str]]]:
+        result = super().batch_move_files(filenames, target_dir)
+        target_abs = resolve_absolute_path(target_dir, self.root_directory)
+        if not os.path.isdir(target_abs):
+            target_abs = os.path.dirname(target_abs)
+
+        removed: List[str] = []
+        added: List[str] = []
+        for name in filenames:
+            full_name = resolve_absolute_path(name, self.root_directory)
+            if os.path.exists(full_name):
+                continue
+            removed.append(file_to_relative(full_name, self.root_directory))
+            added.append(os.path.join(target_abs, os.path.basename(full_name)))
+        self._update_library(removed=removed, added=added)
+        return result
+
+    def rename_file(self, relative_name: str, new_name: str) -> None:
+        super().rename_file(relative_name, new_name)
+        self._update_library(
+            removed=[relative_name],
+            added=[resolve_absolute_path(new_name, self.root_directory)],
+        )
+
+    def on_file_added(self, file_path: str) -> None:
+        self._update_library(added=[file_path])
 
     def list_sorted_tracks(self) -> List[FileDetail]:
-        files_cache = self.cache_manager.get_cache()
+        """
+        Returns the audio tracks sorted by their custom order, scanning the
+        music directory only if the library has not been loaded yet.
+        """
+        if not self.library.loaded:
+            self.refresh_library()
+        return self.library.sorted_tracks()
+
+    def refresh_library(self) -> None:
+        """
+        Rebuilds the library from a full scan of the music directory.
+        """
         all_files = self.file_manager.list_files_recursively(self.root_directory)
-        max_len = len(all_files)
-        audio_files: List[FileDetail] = [
+        self.library.replace(
             self.add_metadata(item) for item in all_files if item.type == "audio"
-        ]
-        ordering: Dict[str, int] = {}
-        for key, entry in files_cache.items():
-            if isinstance(entry.details.order, int):
-                ordering[key] = entry.details.order
-
+        )
         self.cache_manager.maybe_save()
+        _log.info("Indexed %d music tracks", len(self.library))
 
-        sorted_tracks: List[FileDetail] = sorted(
-            audio_files, key=lambda file: ordering.get(file.path, max_len), reverse=True
-        )
+    def _update_library(
+        self, removed: Optional[List[str]] = None, added: Optional[List[str]] = None
+    ) -> None:
+        """
+        Removes the given relative paths from the library and indexes the audio
+        files at, or under, the given absolute paths, then passes the updated
+        playlist to the music player.
+        """
+        if not self.library.loaded:
+            return
 
-        return sorted_tracks
+        for relative_name in removed or []:
+            self.library.remove(relative_name)
+
+        for full_path in added or []:
+            if os.path.isdir(full_path):
+                subdir = file_to_relative(full_path, self.root_directory)
+                files = self.file_manager.list_files_recursively(
+                    self.root_directory, subdir
+                )
+            elif os.path.exists(full_path):
+                files = [self.file_manager.file_detail(full_path, self.root_directory)]
+            else:
+                continue
+            for item in files:
+                if item.type == "audio":
+                    self.library.upsert(self.add_metadata(item))
+
+        self.cache_manager.maybe_save()
+        self.music_service.update_tracks(self.library.sorted_tracks())
 
     def save_custom_music_order(self, filenames: List[str]) -> List[FileDetail]:
         files_cache = self.cache_manager.get_cache()
@@ -124,31 +217,37 @@ class MusicFileService(FileManagerService):
                         is_default_file = True
 
                 modified_time = os.path.getmtime(full_name)
-                duration = self._audio_duration(full_name)
+                tags = self.metadata_service.read_tags(full_name)
 
                 files_cache[key] = CacheEntry(
                     modified_time=modified_time,
+                    size=os.path.getsize(full_name),
                     details=FileCachedMetadata(
                         preview=None,
-                        duration=duration,
+                        duration=tags.duration,
                         order=i,
                         removable=not is_default_file,
+                        title=tags.title,
+                        artist=tags.artist,
+                        album=tags.album,
                     ),
                 )
-                self.cache_manager.mark_dirty()
 
             else:
                 entry = files_cache[key]
                 if entry.details.order != i:
                     entry.details.order = i
-                    self.cache_manager.mark_dirty()
+                    self.cache_manager.mark_dirty(key)
 
         for key, entry in files_cache.items():
             if not key in order_set and isinstance(entry.details.order, int):
-                del entry.details.order
-                self.cache_manager.mark_dirty()
+                entry.details.order = None
+                self.cache_manager.mark_dirty(key)
 
-        sorted_tracks = self.list_sorted_tracks()
+        self.cache_manager.maybe_save()
+        self.list_sorted_tracks()
+        self.library.set_order(filenames)
+        sorted_tracks = self.library.sorted_tracks()
         self.music_service.update_tracks(sorted_tracks)
         return sorted_tracks
 
@@ -169,8 +268,7 @@ class MusicFileService(FileManagerService):
 
         status = super().remove_file(relative_name)
         if status:
-            sorted_tracks = self.list_sorted_tracks()
-            self.music_service.update_tracks(sorted_tracks)
+            self._update_library(removed=[relative_name])
 
         return status
 
@@ -194,6 +292,11 @@ class MusicFileService(FileManagerService):
 
         return any(file in active_track_dirs for file in abs_filenames)
 
+    def _cache_key_exists(self, relative_name: str) -> bool:
+        return super()._cache_key_exists(relative_name) or os.path.exists(
+            os.path.join(self.default_music_dir, relative_name)
+        )
+
     def _is_default_file(self, relative_name: str) -> bool:
         file_abs = os.path.join(self.root_directory, relative_name)
         file_abs_default = os.path.join(self.default_music_dir, relative_name)
@@ -203,15 +306,92 @@ class MusicFileService(FileManagerService):
         else:
             return False
 
+    def _transform_file(self, file_model: FileDetail) -> FileDetail:
+        return self.add_metadata(file_model)
+
     def add_metadata(self, file_model: FileDetail) -> FileDetail:
+        """
+        Adds the duration, tags, cover art and custom order of an audio file,
+        probing the file only if its cache entry is missing or stale.
+        """
+        if not self.is_audio(file_model):
+            return self._add_duration(file_model)
 
-        file_model = self._add_duration(file_model)
         files_cache = self.cache_manager.get_cache()
+        full_name = os.path.join(self.root_directory, file_model.path)
         file_cache = files_cache.get(file_model.path)
-        if file_cache and isinstance(file_cache.details.order, int):
-            file_model.order = file_cache.details.order
+        modified_time = (
+            file_model.modified
+            if file_model.modified is not None
+            else os.path.getmtime(full_name)
+        )
+
+        if file_cache is None or not file_cache.is_fresh(
+            modified_time, file_model.size
+        ):
+            file_cache = CacheEntry(
+                modified_time=modified_time,
+                size=file_model.size,
+                details=self._probe(
+                    full_name,
+                    file_model.path,
+                    modified_time,
+                    file_cache.details if file_cache else None,
+                ),
+            )
+            files_cache[file_model.path] = file_cache
+
+        details = file_cache.details
+        file_model.duration = details.duration
+        file_model.title = details.title
+        file_model.artist = details.artist
+        file_model.album = details.album
+        file_model.has_cover = details.preview is not None
+        if isinstance(details.order, int):
+            file_model.order = details.order
         return file_model
 
+    def _probe(
+        self,
+        full_name: str,
+        relative_name: str,
+        modified_time: float,
+        previous: Optional[FileCachedMetadata],
+    ) -> FileCachedMetadata:
+        tags = None
+        try:
+            tags = self.metadata_service.read_tags(full_name)
+        except Exception as e:
+            _log.error("Error reading metadata for %s: %s", full_name, e)
+
+        cover = None
+        if tags is not None and tags.has_cover:
+            cover = self.metadata_service.extract_cover(
+                full_name, self._cover_path(relative_name, modified_time)
+            )
+
+        return FileCachedMetadata(
+            preview=cover,
+            duration=tags.duration if tags else None,
+            removable=previous.removable if previous else True,
+            order=previous.order if previous else None,
+            title=tags.title if tags else None,
+            artist=tags.artist if tags else None,
+            album=tags.album if tags else None,
+        )
+
+    def _cover_path(self, relative_name: str, modified_time: float) -> str:
+        basename = str(Path(relative_name).with_suffix(""))
+        return os.path.join(self._cover_dir, f"{basename}_{int(modified_time)}.jpg")
+
+    def get_cover(self, relative_name: str) -> Optional[str]:
+        """
+        Returns the path to the cover art thumbnail of a track, if it has one.
+        """
+        entry = self.cache_manager.get_cache().get(relative_name)
+        cover = entry.details.preview if entry else None
+        return cover if cover and os.path.exists(cover) else None
+
     def get_files_tree(
         self,
         filter_model: Optional[FileFilterModel] = None,
@@ -0,0 +1,85 @@
+import threading
+from typing import Dict, Iterable, List, Optional
+
+from app.schemas.file_filter import FileDetail
+
+
+class MusicLibrary:
+    """
+    In-memory index of the audio tracks in the music directory.
+
+    Tracks are keyed by their path relative to the music directory and kept in
+    the order they were added. The sorted playlist is computed once and reused
+    until the index changes, so listing tracks does not touch the filesystem.
+    """
+
+    def __init__(self) -> None:
+        self._tracks: Dict[str, FileDetail] = {}
+        self._sorted: Optional[List[FileDetail]] = None
+        self._lock = threading.RLock()
+        self.loaded = False
+
+    def __len__(self) -> int:
+        return len(self._tracks)
+
+    def __contains__(self, path: object) -> bool:
+        return path in self._tracks
+
+    def get(self, path: str) -> Optional[FileDetail]:
+        return self._tracks.get(path)
+
+    def replace(self, tracks: Iterable[FileDetail]) -> None:
+        """Replaces the whole index, e.g. after a full scan."""
+        with self._lock:
+            self._tracks = {track.path: track for track in tracks}
+            self._sorted = None
+            self.loaded = True
+
+    def upsert(self, track: FileDetail) -> None:
+        """Adds a track or replaces the indexed track with the same path."""
+        with self._lock:
+            self._tracks[track.path] = track
+            self._sorted = None
+
+    def remove(self, path: str) -> List[str]:
+        """
+        Removes a track, or every track under a directory, returning the removed
+        paths.
+        """
+        prefix = path.rstrip("/") + "/"
+        with self._lock:
+            removed = [
+                key for key in self._tracks if key == path or key.startswith(prefix)
+            ]
+            for key in removed:
+                del self._tracks[key]
+            if removed:
+                self._sorted = None
+            return removed
+
+    def set_order(self, paths: List[str]) -> None:
+        """
+        Assigns the custom order by position in `paths` and clears it for the
+        tracks that are not listed.
+        """
+        positions = {path: i for i, path in enumerate(paths)}
+        with self._lock:
+            for key, track in self._tracks.items():
+                track.order = positions.get(key)
+            self._sorted = None
+
+    def sorted_tracks(self) -> List[FileDetail]:
+        """
+        Returns the tracks without a custom order first, in the order they were
+        added, followed by the ordered tracks from the highest order down.
+        """
+        with self._lock:
+            if self._sorted is None:
+                self._sorted = sorted(
+                    self._tracks.values(),
+                    key=lambda track: (
+                        track.order if isinstance(track.order, int) else float("inf")
+                    ),
+                    reverse=True,
+                )
+            return list(self._sorted)
@@ -2,13 +2,15 @@
 
 from __future__ import annotations
 
+import concurrent.futures
+import os
 import threading
+import time
+from collections import deque
 from collections.abc import Callable, Generator
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Any, Protocol
 
-import miniaudio
-
 from app.core.logger import Logger
 from app.exceptions.music import MusicInitError, MusicPlayerError
 
@@ -31,9 +33,16 @@ class PlaybackDevice(Protocol):
 
 @dataclass(frozen=True)
 class PlaybackEvent:
-    """A completed stream, optionally carrying a decoder failure."""
+    """
+    A completed stream, optionally carrying a decoder failure.
+
+    `advanced` is set when the stream ended and the queued next file continued
+    playback without a gap.
+    """
 
     error: Exception | None = None
+    advanced: bool = False
+    created_at: float = field(default_factory=time.monotonic)
 
 
 class MusicPlayback(Protocol):
@@ -44,6 +53,10 @@ class MusicPlayback(Protocol):
 
     def play(self, file_path: str, position: float = 0.0) -> None: ...
 
+    def seek(self, position: float) -> None: ...
+
+    def queue_next(self, file_path: str | None) -> None: ...
+
     def pause(self) -> None: ...
 
     def resume(self) -> None: ...
@@ -52,11 +65,105 @@ class MusicPlayback(Protocol):
 
     def take_event(self) -> PlaybackEvent | None: ...
 
+    def set_event_listener(self, listener: Callable[[], None] | None) -> None: ...
+
     def close(self) -> None: ...
 
 
+class DecoderStream(Generator[bytes, int, None]):
+    """
+    Signed 16-bit PCM stream over one Miniaudio decoder.
+
+    Unlike :func:`miniaudio.stream_file`, the decoder can be repositioned with
+    :meth:`seek` without being recreated.
+    """
+
+    MAX_FRAMES = 16384
+
+    def __init__(
+        self,
+        file_path: str,
+        *,
+        channels: int,
+        sample_rate: int,
+        seek_frame: int = 0,
+    ) -> None:
+        import miniaudio
+
+        self._ffi = miniaudio.ffi
+        self._lib = miniaudio.lib
+        self._channels = channels
+        self._decoder = self._ffi.new("ma_decoder *")
+        config = self._lib.ma_decoder_config_init(
+            miniaudio.SampleFormat.SIGNED16.value, channels, sample_rate
+        )
+        result = self._lib.ma_decoder_init_file(
+            os.fsencode(file_path), self._ffi.addressof(config), self._decoder
+        )
+        if result != self._lib.MA_SUCCESS:
+            raise miniaudio.DecodeError("failed to init decoder", result)
+        self._closed = False
+        self._buffer = self._ffi.new("int16_t[]", self.MAX_FRAMES * channels)
+        self._frames_read = self._ffi.new("ma_uint64 *")
+        if seek_frame > 0 and not self.seek(seek_frame):
+            self.close()
+            raise miniaudio.DecodeError("failed to seek to frame")
+
+    def seek(self, frame: int) -> bool:
+        """Reposition the decoder, returning whether the format allowed it."""
+        if self._closed:
+            return False
+        result = self._lib.ma_decoder_seek_to_pcm_frame(self._decoder, frame)
+        return result == self._lib.MA_SUCCESS
+
+    def send(self, value: int | None) -> bytes:
+        if self._closed:
+            raise StopIteration
+        frames = min(value or 1024, self.MAX_FRAMES)
+        result = self._lib.ma_decoder_read_pcm_frames(
+            self._decoder, self._buffer, frames, self._frames_read
+        )
+        if result not in (self._lib.MA_SUCCESS, self._lib.MA_AT_END):
+            import miniaudio
+
+            raise miniaudio.DecodeError("error in ma_decoder_read_pcm_frames")
+        frames_read = self._frames_read[0]
+        if frames_read <= 0:
+            raise StopIteration
+        return self._ffi.buffer(self._buffer, frames_read * self._channels * 2)[:]
+
+    def throw(self, typ: Any, val: Any = None, tb: Any = None) -> bytes:
+        self.close()
+        raise typ if val is None else val
+
+    def close(self) -> None:
+        if not self._closed:
+            self._closed = True
+            self._lib.ma_decoder_uninit(self._decoder)
+
+    def __del__(self) -> None:
+        self.close()
+
+
+@dataclass
+class PreparedSource:
+    """A decoder stream opened ahead of time with its first samples decoded."""
+
+    file_path: str
+    stream: PlaybackStream
+    prebuffer: bytes = b""
+    ended: bool = False
+
+
 class MiniaudioMusicPlayback:
-    """Stream local music through one lazily-created Miniaudio output device."""
+    """
+    Stream local music through one lazily-created Miniaudio output device.
+
+    The file queued with :meth:`queue_next` is opened and pre-decoded in the
+    background and spliced into the device stream right after the last sample
+    of the current file, optionally with a crossfade, so consecutive tracks
+    play without a gap or a decoder cold start.
+    """
 
     def __init__(
         self,
@@ -64,6 +171,7 @@ class MiniaudioMusicPlayback:
         sample_rate: int = 44_100,
         channels: int = 2,
         buffer_size_msec: int = 200,
+        crossfade_msec: int = 0,
         device_factory: DeviceFactory | None = None,
         stream_factory: StreamFactory | None = None,
     ) -> None:
@@ -73,6 +181,8 @@ class MiniaudioMusicPlayback:
             raise ValueError("channels must be 1 or 2")
         if buffer_size_msec <= 0:
             raise ValueError("buffer_size_msec must be greater than zero")
+        if crossfade_msec < 0:
+            raise ValueError("crossfade_msec cannot be negative")
 
         self._sample_rate = sample_rate
         self._channels = channels
@@ -85,7 +195,20 @@ class MiniaudioMusicPlayback:
         self._can_resume = False
         self._closed = False
         self._generation = 0
-        self._event: PlaybackEvent | None = None
+        self._frame_bytes = channels * 2
+        self._crossfade_frames = sample_rate * crossfade_msec // 1000
+        self._prebuffer_frames = min(
+            sample_rate * buffer_size_msec // 1000, DecoderStream.MAX_FRAMES
+        )
+        self._file_path: str | None = None
+        self._pending_seek: int | None = None
+        self._next: tuple[int, concurrent.futures.Future[PreparedSource]] | None = None
+        self._prefetch = concurrent.futures.ThreadPoolExecutor(
+            max_workers=1,
+            thread_name_prefix="music-prefetch",
+        )
+        self._events: deque[PlaybackEvent] = deque()
+        self._event_listener: Callable[[], None] | None = None
         self._lock = threading.RLock()
         self._event_lock = threading.Lock()
 
@@ -109,12 +232,13 @@ class MiniaudioMusicPlayback:
 
             try:
                 source_stream = self._stream_factory(file_path, seek_frame)
-                playback_stream = self._with_completion_event(
-                    source_stream,
+                self._source_stream = source_stream
+                self._file_path = file_path
+                playback_stream = self._gapless_stream(
+                    PreparedSource(file_path, source_stream),
                     generation,
                 )
                 next(playback_stream)
-                self._source_stream = source_stream
                 self._playback_stream = playback_stream
                 device.start(playback_stream)
             except Exception as error:
@@ -137,6 +261,44 @@ class MiniaudioMusicPlayback:
                 position,
             )
 
+    def seek(self, position: float) -> None:
+        """
+        Move the playing stream to `position` without restarting the output.
+
+        The current decoder is repositioned when its format allows it;
+        otherwise the file is reopened at the new position. Without an active
+        stream, this is equivalent to :meth:`play`.
+        """
+        if position < 0:
+            raise MusicPlayerError("Playback position cannot be negative")
+
+        with self._lock:
+            if (
+                self._playback_stream is None
+                or self._can_resume
+                or self._file_path is None
+            ):
+                if self._file_path is None:
+                    raise MusicPlayerError("No music stream to seek")
+                self.play(self._file_path, position)
+                return
+            with self._event_lock:
+                self._pending_seek = round(position * self._sample_rate)
+
+    def queue_next(self, file_path: str | None) -> None:
+        """
+        Open and pre-decode the file that should follow the current stream,
+        or cancel the queued file if `file_path` is None.
+        """
+        with self._lock:
+            self._ensure_open()
+            self._discard_next()
+            if file_path is None:
+                return
+            future = self._prefetch.submit(self._prepare_source, file_path)
+            with self._event_lock:
+                self._next = (self._generation, future)
+
     def pause(self) -> None:
         """Pause the current stream while retaining its decoder position."""
         with self._lock:
@@ -174,12 +336,19 @@ class MiniaudioMusicPlayback:
         with self._lock:
             self._stop_locked()
 
+    def set_event_listener(self, listener: Callable[[], None] | None) -> None:
+        """
+        Register a callback invoked after each new event.
+
+        The callback runs on the audio thread, so it should only schedule work,
+        e.g. with :meth:`asyncio.AbstractEventLoop.call_soon_threadsafe`.
+        """
+        self._event_listener = listener
+
     def take_event(self) -> PlaybackEvent | None:
-        """Return and clear the latest natural-completion or decoder event."""
+        """Return and remove the oldest completion, advance, or decoder event."""
         with self._event_lock:
-            event = self._event
-            self._event = None
-            return event
+            return self._events.popleft() if self._events else None
 
     def close(self) -> None:
         """Stop playback and release the Miniaudio output device."""
@@ -196,6 +365,8 @@ class MiniaudioMusicPlayback:
             device = self._device
             self._device = None
             self._closed = True
+            self._discard_next()
+            self._prefetch.shutdown(wait=False, cancel_futures=True)
             if device is not None:
                 try:
                     device.close()
@@ -209,6 +380,8 @@ class MiniaudioMusicPlayback:
                 ) from stop_error
 
     def _create_device(self) -> PlaybackDevice:
+        import miniaudio
+
         return miniaudio.PlaybackDevice(
             output_format=miniaudio.SampleFormat.SIGNED16,
             nchannels=self._channels,
@@ -222,14 +395,90 @@ class MiniaudioMusicPlayback:
         file_path: str,
         seek_frame: int,
     ) -> PlaybackStream:
-        return miniaudio.stream_file(
+        return DecoderStream(
             file_path,
-            output_format=miniaudio.SampleFormat.SIGNED16,
-            nchannels=self._channels,
+            channels=self._channels,
             sample_rate=self._sample_rate,
             seek_frame=seek_frame,
         )
 
+    def _prepare_source(self, file_path: str) -> PreparedSource:
+        stream = self._stream_factory(file_path, 0)
+        source = PreparedSource(file_path, stream)
+        try:
+            source.prebuffer = bytes(stream.send(self._prebuffer_frames))
+        except StopIteration:
+            source.ended = True
+        return source
+
+    def _discard_next(self) -> None:
+        with self._event_lock:
+            queued = self._next
+            self._next = None
+        if queued is not None:
+            _, future = queued
+            if not future.cancel():
+                future.add_done_callback(self._close_prepared)
+
+    @staticmethod
+    def _close_prepared(future: concurrent.futures.Future[PreparedSource]) -> None:
+        if future.cancelled() or future.exception() is not None:
+            return
+        try:
+            future.result().stream.close()
+        except Exception:
+            _log.warning("Unable to close a prefetched music stream", exc_info=True)
+
+    def _take_next(self, generation: int) -> PreparedSource | None:
+        with self._event_lock:
+            queued = self._next
+            if queued is None or queued[0] != generation:
+                return None
+            self._next = None
+        try:
+            return queued[1].result()
+        except Exception:
+            _log.warning("Unable to prefetch the next music file", exc_info=True)
+            return None
+
+    def _take_seek(self) -> int | None:
+        with self._event_lock:
+            seek_frame = self._pending_seek
+            self._pending_seek = None
+            return seek_frame
+
+    def _apply_seek(self, source: PreparedSource, seek_frame: int) -> None:
+        source.prebuffer = b""
+        source.ended = False
+        seek = getattr(source.stream, "seek", None)
+        if seek is not None and seek(seek_frame):
+            return
+        stream = self._stream_factory(source.file_path, seek_frame)
+        try:
+            source.stream.close()
+        finally:
+            source.stream = stream
+            self._source_stream = stream
+
+    def _crossfade(self, tail: bytes, head: bytes) -> bytes:
+        """Mix the end of one stream into the beginning of the next."""
+        import numpy as np
+
+        frames = len(tail) // self._frame_bytes
+        if frames == 0:
+            return head
+        size = frames * self._frame_bytes
+        head = head.ljust(size, b"\0")
+        fade_in = np.linspace(0.0, 1.0, frames, dtype=np.float32)[:, None]
+        tail_samples = np.frombuffer(tail[:size], dtype="<i2").reshape(frames, -1)
+        head_samples = np.frombuffer(head[:size], dtype="<i2").reshape(frames, -1)
+        mixed = tail_samples * (1.0 - fade_in) + head_samples * fade_in
+        return (
+            np.clip(mixed, -32768, 32767).astype("<i2").tobytes()
+            + tail[size:]
+            + head[size:]
+        )
+
     def _ensure_device(self) -> PlaybackDevice:
         if self._device is None:
             try:
@@ -247,6 +496,7 @@ class MiniaudioMusicPlayback:
     def _stop_locked(self) -> None:
         self._generation += 1
         self._clear_event()
+        self._discard_next()
         stop_error: Exception | None = None
         if self._device is not None:
             try:
@@ -279,28 +529,105 @@ class MiniaudioMusicPlayback:
             except Exception:
                 _log.warning("Unable to close the music decoder stream", exc_info=True)
 
-    def _with_completion_event(
+    def _gapless_stream(
         self,
-        source_stream: PlaybackStream,
+        source: PreparedSource,
         generation: int,
     ) -> PlaybackStream:
+        """
+        Feed the device from `source`, continuing with the queued next source
+        as soon as the current one ends.
+
+        A short read means the decoder reached the end of the file, so the
+        remaining frames of the same request are filled from the next source.
+        With a crossfade, that many frames are kept decoded ahead and mixed
+        with the beginning of the next source.
+        """
+        hold = self._crossfade_frames * self._frame_bytes
+        buffer = bytearray(source.prebuffer)
         requested_frames = yield b""
         try:
             while True:
-                samples = source_stream.send(requested_frames)
+                seek_frame = self._take_seek()
+                if seek_frame is not None:
+                    buffer.clear()
+                    self._apply_seek(source, seek_frame)
+
+                wanted = (requested_frames or 1024) * self._frame_bytes
+                ended = source.ended
+                while not ended and len(buffer) < wanted + hold:
+                    missing = wanted + hold - len(buffer)
+                    frames = min(
+                        -(-missing // self._frame_bytes), DecoderStream.MAX_FRAMES
+                    )
+                    try:
+                        samples = bytes(source.stream.send(frames))
+                    except StopIteration:
+                        source.ended = ended = True
+                        break
+                    buffer.extend(samples)
+                    if len(samples) < frames * self._frame_bytes:
+                        ended = True
+
+                if ended:
+                    next_source = self._take_next(generation)
+                    if next_source is not None:
+                        buffer = self._splice(buffer, source, next_source, hold)
+                        source = next_source
+                        self._source_stream = source.stream
+                        self._file_path = source.file_path
+                        self._set_event(generation, PlaybackEvent(advanced=True))
+                    elif not buffer and source.ended:
+                        self._set_event(generation, PlaybackEvent())
+                        return
+
+                samples = bytes(buffer[:wanted])
+                del buffer[:wanted]
                 requested_frames = yield samples
-        except StopIteration:
-            self._set_event(generation, PlaybackEvent())
         except GeneratorExit:
             raise
         except Exception as error:
             self._set_event(generation, PlaybackEvent(error=error))
+        finally:
+            if source.stream is not self._source_stream:
+                source.stream.close()
+
+    def _splice(
+        self,
+        buffer: bytearray,
+        source: PreparedSource,
+        next_source: PreparedSource,
+        hold: int,
+    ) -> bytearray:
+        try:
+            source.stream.close()
+        except Exception:
+            _log.warning("Unable to close the finished music stream", exc_info=True)
+
+        head = next_source.prebuffer
+        next_source.prebuffer = b""
+        tail_size = min(hold, len(buffer))
+        tail_size -= tail_size % self._frame_bytes
+        if tail_size == 0:
+            return bytearray(buffer + head)
+        return bytearray(
+            buffer[:-tail_size] + self._crossfade(bytes(buffer[-tail_size:]), head)
+        )
 
     def _set_event(self, generation: int, event: PlaybackEvent) -> None:
         with self._event_lock:
-            if generation == self._generation:
-                self._event = event
+            if generation != self._generation:
+                return
+            self._events.append(event)
+
+        listener = self._event_listener
+        if listener is not None:
+            try:
+                listener()
+            except Exception:
+                _log.warning("Music playback event listener failed", exc_info=True)
 
     def _clear_event(self) -> None:
         with self._event_lock:
-            self._event = None
+            self._events.clear()
+            self._pending_seek = None
@@ -25,7 +25,16 @@ _log = Logger(__name__)
 
 
 class MusicService:
-    """Manage a playlist and delegate audio output to an interruptible player."""
+    """
+    Manage a playlist and delegate audio output to an interruptible player.
+
+    Player state is published only when it changes: playback events from the
+    audio thread wake the publisher, bursts of changes are coalesced into one
+    broadcast, and clients extrapolate the position from the last published
+    `position` and `rate` instead of receiving periodic position updates.
+    """
+
+    BROADCAST_COALESCE_DELAY = 0.05
 
     def __init__(
         self,
@@ -51,8 +60,12 @@ class MusicService:
         self.last_update_time = time.monotonic()
         self.stop_event = asyncio.Event()
         self.play_task: asyncio.Task[None] | None = None
+        self._state_changed = asyncio.Event()
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._published_signature: tuple[Any, ...] | None = None
         self._playback = playback if playback is not None else MiniaudioMusicPlayback()
         self._state_lock = threading.RLock()
+        self._queued_track: str | None = None
 
     def get_current_position(self) -> float:
         """Return the current playback position in seconds."""
@@ -105,6 +118,7 @@ class MusicService:
         except Exception:
             _log.error("Music player task failed during cleanup", exc_info=True)
         finally:
+            self._playback.set_event_listener(None)
             self.play_task = None
             self.stop_event.clear()
 
@@ -114,14 +128,50 @@ class MusicService:
         with self._state_lock:
             return {
                 "track": self.track,
-                "position": round(self.get_current_position()),
+                "position": round(self.get_current_position(), 3),
                 "is_playing": self.is_playing,
                 "duration": self.duration,
                 "mode": self.mode,
+                "rate": 1.0 if self.is_playing else 0.0,
             }
 
+    def _state_signature(self) -> tuple[Any, ...]:
+        """
+        Return the part of the state clients cannot derive by themselves.
+
+        While playing, the position advances at a known rate, so the moment the
+        track would have started is stable unless the position jumps.
+        """
+        with self._state_lock:
+            position = self.get_current_position()
+            anchor = self.last_update_time - position if self.is_playing else position
+            return (
+                self.track,
+                self.is_playing,
+                self.duration,
+                self.mode,
+                round(anchor, 1),
+            )
+
+    def notify_state_changed(self) -> None:
+        """
+        Wake the state publisher. Safe to call from any thread.
+        """
+        loop = self._loop
+        if loop is None or loop.is_closed():
+            return
+        try:
+            running_loop = asyncio.get_running_loop()
+        except RuntimeError:
+            running_loop = None
+        if running_loop is loop:
+            self._state_changed.set()
+        else:
+            loop.call_soon_threadsafe(self._state_changed.set)
+
     async def broadcast_state(self) -> None:
         """Broadcast the current player state to all connected clients."""
+        self._published_signature = self._state_signature()
         await self.connection_manager.broadcast_json(
             {"type": "player", "payload": self.current_state}
         )
@@ -147,13 +197,19 @@ class MusicService:
                     self._start_playing_current_track()
             elif self.track is not None:
                 self.duration = self.get_track_duration(self.track)
+                if self.is_playing:
+                    self._queue_next_track()
 
             self.last_update_time = time.monotonic()
+        self.notify_state_changed()
 
     def start_broadcast_task(self) -> None:
-        """Start periodic player-state broadcasts once."""
+        """Start the player-state publisher once."""
         if self.play_task is not None and not self.play_task.done():
             return
+        self._loop = asyncio.get_running_loop()
+        self._playback.set_event_listener(self.notify_state_changed)
+        self._state_changed.set()
         self.play_task = asyncio.create_task(self.broadcast_loop())
 
     def toggle_playing(self) -> None:
@@ -173,6 +229,7 @@ class MusicService:
             else:
                 file_path = self.music_track_to_absolute(self.track)
                 self._playback.play(file_path, self.position)
+                self._queue_next_track()
 
             self.last_update_time = time.monotonic()
             self.is_playing = True
@@ -194,9 +251,8 @@ class MusicService:
             self.position = next_position
 
             if self.is_playing and self.track is not None:
-                file_path = self.music_track_to_absolute(self.track)
                 self.is_playing = False
-                self._playback.play(file_path, self.position)
+                self._playback.seek(self.position)
                 self.is_playing = True
             elif self._playback.can_resume:
                 self._playback.stop()
@@ -207,6 +263,8 @@ class MusicService:
         """Set the playlist completion policy."""
         with self._state_lock:
             self.mode = mode
+            if self.is_playing:
+                self._queue_next_track()
 
     def play_track(self, track: str) -> None:
         """Select and immediately play a track from its beginning."""
@@ -263,6 +321,36 @@ class MusicService:
         self.position = 0.0
         self.last_update_time = time.monotonic()
         self.is_playing = True
+        self._queue_next_track()
+
+    def _next_track_for_mode(self) -> str | None:
+        """Return the track that should follow the current one in this mode."""
+        if self.track is None or self.mode == MusicPlayerMode.SINGLE:
+            return None
+        if self.mode == MusicPlayerMode.LOOP_ONE:
+            return self.track
+        if not self.playlist or self.track not in self.playlist:
+            return None
+
+        next_index = self.playlist.index(self.track) + 1
+        if next_index == len(self.playlist):
+            if self.mode == MusicPlayerMode.QUEUE:
+                return None
+            next_index = 0
+        return self.playlist[next_index]
+
+    def _queue_next_track(self) -> None:
+        """Let the player prefetch the next track for a gapless transition."""
+        next_track = self._next_track_for_mode()
+        file_path: str | None = None
+        if next_track is not None:
+            try:
+                file_path = self.music_track_to_absolute(next_track)
+            except FileNotFoundError:
+                next_track = None
+
+        self._queued_track = next_track
+        self._playback.queue_next(file_path)
 
     def _select_track(self, index: int) -> None:
         self.track = self.playlist[index]
@@ -272,6 +360,10 @@ class MusicService:
 
     def _process_playback_event(self, event: PlaybackEvent) -> None:
         with self._state_lock:
+            if event.advanced:
+                self._advance_to_queued_track(event)
+                return
+
             if not self.is_playing:
                 return
 
@@ -309,14 +401,35 @@ class MusicService:
             self._select_track((current_index + 1) % len(self.playlist))
             self._start_playing_current_track()
 
+    def _advance_to_queued_track(self, event: PlaybackEvent) -> None:
+        """Reflect a gapless transition that already happened in the player."""
+        if self._queued_track is None:
+            return
+        self.track = self._queued_track
+        self.duration = self.get_track_duration(self.track)
+        now = time.monotonic()
+        played_until = now if self.is_playing else self.last_update_time
+        self.position = max(0.0, played_until - event.created_at)
+        self.last_update_time = now
+        self._queue_next_track()
+
     async def broadcast_loop(self) -> None:
-        """Broadcast state and apply playlist policy after stream completion."""
+        """
+        Apply playlist policy after playback events and broadcast the state
+        when it changes.
+        """
         while not self.stop_event.is_set():
+            await self._state_changed.wait()
+            await asyncio.sleep(self.BROADCAST_COALESCE_DELAY)
+            self._state_changed.clear()
+
             event = self._playback.take_event()
-            if event is not None:
+            while event is not None:
                 self._process_playback_event(event)
-            await self.broadcast_state()
-            await asyncio.sleep(0.5)
+                event = self._playback.take_event()
+
+            if self._state_signature() != self._published_signature:
+                await self.broadcast_state()
 
     async def cleanup(self) -> None:
         """Stop music and the broadcaster while keeping the device reusable."""
@@ -0,0 +1,194 @@
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Optional, Tuple
+
+from app.core.logger import Logger
+from app.schemas.file_management import ThumbnailSize
+from app.util.atomic_write import atomic_write
+from app.util.lru_disk_cache import LRUDiskCache
+
+if TYPE_CHECKING:
+    import numpy as np
+
+_log = Logger(name=__name__)
+
+_JPEG_SOF_MARKERS = frozenset(range(0xC0, 0xD0)) - {0xC4, 0xC8, 0xCC}
+_JPEG_STANDALONE_MARKERS = frozenset(range(0xD0, 0xDA)) | {0x01}
+
+
+def read_jpeg_size(file_path: str) -> Optional[Tuple[int, int]]:
+    """
+    Returns the width and height of a JPEG image from its frame header without
+    decoding it, or None if the file is not a JPEG or the header is not found.
+    """
+    try:
+        with open(file_path, "rb") as f:
+            if f.read(2) != b"\xff\xd8":
+                return None
+            while True:
+                byte = f.read(1)
+                if not byte:
+                    return None
+                if byte != b"\xff":
+                    continue
+                marker = f.read(1)
+                while marker == b"\xff":
+                    marker = f.read(1)
+                if not marker:
+                    return None
+                code = marker[0]
+                if code in _JPEG_STANDALONE_MARKERS:
+                    continue
+                length_bytes = f.read(2)
+                if len(length_bytes) < 2:
+                    return None
+                length = int.from_bytes(length_bytes, "big")
+                if code in _JPEG_SOF_MARKERS:
+                    header = f.read(5)
+                    if len(header) < 5:
+                        return None
+                    height = int.from_bytes(header[1:3], "big")
+                    width = int.from_bytes(header[3:5], "big")
+                    return (width, height) if width and height else None
+                f.seek(length - 2, os.SEEK_CUR)
+    except OSError:
+        return None
+
+
+class ThumbnailService:
+    """
+    Generates downscaled JPEG thumbnails of photos and video posters and keeps
+    them in a disk cache bounded by a size budget.
+
+    Thumbnails are addressed by a fingerprint of the source content, its size and
+    modification time, so renamed files reuse their thumbnails and modified files
+    get new ones. The least recently served thumbnails are evicted first.
+    """
+
+    JPEG_QUALITY = 82
+    FINGERPRINT_CHUNK_SIZE = 64 * 1024
+    MAX_CACHED_FINGERPRINTS = 4096
+
+    def __init__(self, cache_dir: str, max_cache_bytes: int) -> None:
+        self.cache_dir = cache_dir
+        self.disk_cache = LRUDiskCache(cache_dir, max_cache_bytes, name="thumbnail")
+        self._lock = threading.Lock()
+        self._fingerprints: OrderedDict[Tuple[str, int, int], str] = OrderedDict()
+
+    def fingerprint(self, file_path: str) -> str:
+        """
+        Returns a content fingerprint of the file: a hash of its size, mtime and
+        the first and last chunks of its content.
+        """
+        stat = os.stat(file_path)
+        stat_key = (os.path.realpath(file_path), stat.st_mtime_ns, stat.st_size)
+        with self._lock:
+            cached = self._fingerprints.get(stat_key)
+            if cached:
+                self._fingerprints.move_to_end(stat_key)
+                return cached
+
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(f"{stat.st_size}:{stat.st_mtime_ns}".encode())
+        with open(file_path, "rb") as f:
+            digest.update(f.read(self.FINGERPRINT_CHUNK_SIZE))
+            if stat.st_size > self.FINGERPRINT_CHUNK_SIZE * 2:
+                f.seek(-self.FINGERPRINT_CHUNK_SIZE, os.SEEK_END)
+                digest.update(f.read(self.FINGERPRINT_CHUNK_SIZE))
+
+        key = digest.hexdigest()
+        with self._lock:
+            self._fingerprints[stat_key] = key
+            while len(self._fingerprints) > self.MAX_CACHED_FINGERPRINTS:
+                self._fingerprints.popitem(last=False)
+        return key
+
+    def thumbnail_path(self, file_path: str, size: ThumbnailSize) -> str:
+        key = self.fingerprint(file_path)
+        return os.path.join(self.cache_dir, key[:2], f"{key}_{size.value}.jpg")
+
+    @classmethod
+    def decode_reduced(cls, file_path: str, max_side: int) -> Optional["np.ndarray"]:
+        """
+        Decodes an image at the smallest scale (1/8, 1/4, 1/2 or full) whose
+        longest side still covers `max_side`.
+
+        For JPEG files, the scale is chosen from the frame header and OpenCV
+        performs the reduction in the DCT domain, so a 12 MP photo is never
+        fully decoded for a grid thumbnail. Other formats cannot be decoded at
+        a reduced scale, so they are decoded once at full size.
+        """
+        import cv2
+
+        jpeg_size = read_jpeg_size(file_path)
+        if jpeg_size is None:
+            return cv2.imread(file_path, cv2.IMREAD_COLOR)
+
+        reduced_decode_flags = {
+            1: cv2.IMREAD_COLOR,
+            2: cv2.IMREAD_REDUCED_COLOR_2,
+            4: cv2.IMREAD_REDUCED_COLOR_4,
+            8: cv2.IMREAD_REDUCED_COLOR_8,
+        }
+        full_side = max(jpeg_size)
+        factor = next(
+            (f for f in (8, 4, 2) if full_side // f >= max_side),
+            1,
+        )
+        return cv2.imread(file_path, reduced_decode_flags[factor])
+
+    @staticmethod
+    def fit(img: "np.ndarray", max_side: int) -> "np.ndarray":
+        import cv2
+
+        height, width = img.shape[:2]
+        longest = max(height, width)
+        if longest <= max_side:
+            return img
+        scale = max_side / longest
+        return cv2.resize(
+            img,
+            (max(1, round(width * scale)), max(1, round(height * scale))),
+            interpolation=cv2.INTER_AREA,
+        )
+
+    def get_thumbnail(self, file_path: str, size: ThumbnailSize) -> Optional[str]:
+        """
+        Returns the path to a cached thumbnail of the image `file_path`,
+        generating it if needed.
+
+        Returns None if the image could not be decoded.
+        """
+        output_path = self.thumbnail_path(file_path, size)
+
+        if os.path.exists(output_path):
+            self.disk_cache.touch(output_path)
+            return output_path
+
+        img = self.decode_reduced(file_path, size.max_side)
+        if img is None:
+            _log.warning("Failed to decode image for thumbnail: '%s'", file_path)
+            return None
+
+        import cv2
+
+        ok, buffer = cv2.imencode(
+            ".jpg",
+            self.fit(img, size.max_side),
+            [cv2.IMWRITE_JPEG_QUALITY, self.JPEG_QUALITY],
+        )
+        if not ok:
+            _log.error("Failed to encode thumbnail for '%s'", file_path)
+            return None
+
+        data = buffer.tobytes()
+        with atomic_write(output_path, mode="wb") as f:
+            f.write(data)
+
+        _log.debug(
+            "Generated %s thumbnail for '%s': '%s'", size.value, file_path, output_path
+        )
+        self.disk_cache.account(len(data))
+        return output_path
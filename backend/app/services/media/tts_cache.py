@@ -0,0 +1,52 @@
+import os
+from typing import Optional
+
+from app.util.atomic_write import atomic_write
+from app.util.lru_disk_cache import LRUDiskCache
+
+
+class TTSAudioCache:
+    """
+    Disk cache of synthesized speech, bounded by a size budget.
+
+    Implements the `gspeech` audio cache interface. Keys are content hashes of
+    the segment text and language computed by the synthesizer, so each entry is
+    stored as a file named after its key. Entries do not expire, which keeps
+    cached phrases available offline; the least recently played entries are
+    evicted when the cache exceeds `max_cache_bytes`.
+    """
+
+    def __init__(self, cache_dir: str, max_cache_bytes: int) -> None:
+        self.cache_dir = cache_dir
+        self.disk_cache = LRUDiskCache(cache_dir, max_cache_bytes, name="speech")
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, key[:2], f"{key}.mp3")
+
+    def get(self, key: str) -> Optional[bytes]:
+        path = self._path(key)
+        try:
+            with open(path, "rb") as f:
+                data = f.read()
+        except FileNotFoundError:
+            return None
+        self.disk_cache.touch(path)
+        return data
+
+    def set(self, key: str, audio_data: bytes) -> None:
+        path = self._path(key)
+        try:
+            previous_size = os.path.getsize(path)
+        except OSError:
+            previous_size = 0
+
+        with atomic_write(path, mode="wb") as f:
+            f.write(audio_data)
+
+        self.disk_cache.account(len(audio_data) - previous_size)
+
+    def clear(self) -> None:
+        self.disk_cache.clear()
+
+    def close(self) -> None:
+        """Files are opened per operation, so there is nothing to release."""
@@ -1,13 +1,20 @@
 """Application service for interruptible text-to-speech playback."""
 
+from collections.abc import Iterable
+
 from app.core.logger import Logger
 from app.exceptions.tts import TextToSpeechRequestError, TextToSpeechUnavailable
 from gspeech import (
+    AudioCache,
+    GoogleTranslateTTSClient,
     GSpeechError,
     LanguageOption,
+    PlayerClosedError,
+    Speech,
     SpeechHandle,
     SpeechPlayer,
     SpeechPolicy,
+    Synthesizer,
     available_languages,
 )
 
@@ -17,8 +24,24 @@ _log = Logger(__name__)
 class TTSService:
     """Submit, interrupt, and stop Google Translate text-to-speech playback."""
 
-    def __init__(self, player: SpeechPlayer | None = None) -> None:
-        self._player = player if player is not None else SpeechPlayer()
+    def __init__(
+        self,
+        player: SpeechPlayer | None = None,
+        synthesizer: Synthesizer | None = None,
+        cache: AudioCache | None = None,
+    ) -> None:
+        """
+        Create the service.
+
+        Without an explicit `player`, speech is synthesized by `synthesizer`
+        or, by default, by a Google Translate client storing audio in `cache`.
+        """
+        if player is None and synthesizer is None:
+            synthesizer = GoogleTranslateTTSClient(cache=cache)
+        self._synthesizer = synthesizer
+        self._player = (
+            player if player is not None else SpeechPlayer(synthesizer=synthesizer)
+        )
 
     @staticmethod
     def available_languages() -> tuple[LanguageOption, ...]:
@@ -56,6 +79,36 @@ class TTSService:
         )
         return handle
 
+    def prewarm(self, phrases: Iterable[tuple[str, str]]) -> int:
+        """
+        Synthesize `(text, lang)` phrases ahead of time so that the cache can
+        serve them without a network round trip.
+
+        Returns the number of phrases that were synthesized or already cached.
+        """
+        if self._synthesizer is None:
+            return 0
+
+        warmed = 0
+        for text, lang in phrases:
+            try:
+                for segment in Speech(text, lang):
+                    self._synthesizer.synthesize(segment.text, segment.lang)
+            except PlayerClosedError:
+                break
+            except (ValueError, GSpeechError) as error:
+                _log.warning(
+                    "Failed to pre-synthesize speech: lang=%s chars=%d error=%s",
+                    lang,
+                    len(text),
+                    error,
+                )
+                continue
+            warmed += 1
+
+        _log.info("Text-to-speech cache warmed: phrases=%d", warmed)
+        return warmed
+
     def text_to_speech(self, text: str, lang: str = "en") -> SpeechHandle:
         """Backward-compatible alias for :meth:`speak`."""
         return self.speak(text, lang)
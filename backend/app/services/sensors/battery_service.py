@@ -1,9 +1,11 @@
 import asyncio
 import time
+from functools import partial
 from typing import TYPE_CHECKING, Any, Dict, List, Optional, Sequence, Tuple
 
 from app.core.px_logger import Logger
 from app.managers.file_management.json_data_manager import JsonDataManager
+from app.managers.i2c_bus_scheduler import BusPriority, I2CBusScheduler
 from app.schemas.battery import BatteryStatusResponse
 from app.schemas.connection import ConnectionEvent
 from app.schemas.robot.battery import (
@@ -24,6 +26,7 @@ from robot_hat import (
 
 if TYPE_CHECKING:
     from app.services.connection_service import ConnectionService
+    from app.services.control.telemetry_service import TelemetryService
     from robot_hat.i2c.smbus_manager import SMBusManager
 
 _log = Logger(__name__)
@@ -35,12 +38,16 @@ class BatteryService:
         connection_manager: "ConnectionService",
         config_manager: "JsonDataManager",
         smbus_manager: "SMBusManager",
+        bus_scheduler: I2CBusScheduler,
+        telemetry_service: "TelemetryService",
         app_loop: asyncio.AbstractEventLoop,
     ) -> None:
         self.config_manager = config_manager
         self.connection_manager = connection_manager
         self.config = HardwareConfig(**config_manager.load_data())
         self._smbus_manager = smbus_manager
+        self._bus = bus_scheduler
+        self._telemetry = telemetry_service
         self._stop_event = asyncio.Event()
         self._task: Optional[asyncio.Task] = None
         self._lock = asyncio.Lock()
@@ -173,8 +180,10 @@ class BatteryService:
             if cached and time.monotonic() - cached[0] <= battery.cache_seconds:
                 return cached[1]
             try:
-                voltage, current = await asyncio.to_thread(
-                    self._read_adapter_metrics, adapter
+                voltage, current = await self._bus.run(
+                    BusPriority.TELEMETRY,
+                    partial(self._read_adapter_metrics, adapter),
+                    key=f"battery:{battery.name}",
                 )
             except Exception as error:
                 _log.error("Error reading battery '%s': %s", battery.name, error)
@@ -194,6 +203,15 @@ class BatteryService:
             error=None,
         )
         self._metrics_cache[battery.name] = (time.monotonic(), status)
+        source = next(
+            (
+                i
+                for i, item in enumerate(self.enabled_batteries)
+                if item.name == battery.name
+            ),
+            0,
+        )
+        self._telemetry.record_battery(source, status)
         return status
 
     async def read_all_metrics(
@@ -5,11 +5,10 @@ from typing import TYPE_CHECKING, Any, Dict, Optional
 
 from app.core.px_logger import Logger
 from app.managers.distance_manager import distance_process
+from app.managers.distance_ring import DistanceRing, median_distance
 from app.schemas.robot.config import HardwareConfig
 
 if TYPE_CHECKING:
-    from multiprocessing.sharedctypes import Synchronized
-
     from app.core.async_emitter import AsyncEventEmitter, Listener
     from app.managers.async_task_manager import AsyncTaskManager
     from app.managers.file_management.json_data_manager import JsonDataManager
@@ -28,7 +27,7 @@ class DistanceService:
 
         self.config_manager = config_manager
         self.robot_config = HardwareConfig(**config_manager.load_data())
-        self._distance: Synchronized[float] = mp.Value("f", 0)
+        self._ring = DistanceRing()
         self._process = None
         self.stop_event = mp.Event()
         self.interval = interval
@@ -62,8 +61,19 @@ class DistanceService:
     def unsubscribe(self, listener: "Listener") -> None:
         self._emitter.off("distance", listener)
 
+    @property
+    def ring(self) -> DistanceRing:
+        """
+        The timestamped samples written by the distance process.
+        """
+        return self._ring
+
     async def distance_watcher(self) -> None:
-        initial_value = self._distance.value
+        """
+        Emits the median of the samples read since the previous emission, or
+        the latest failed reading if none of them is valid.
+        """
+        cursor = 0
         try:
             while (
                 hasattr(self, "stop_event")
@@ -72,13 +82,15 @@ class DistanceService:
                 and not self._task_manager.stop_event.is_set()
                 and not self.stop_event.is_set()
             ):
-                if not self.loading:
-                    await self._emitter.emit("distance", self.distance)
-                    await asyncio.sleep(self.interval)
-                elif initial_value == self._distance.value:
-                    await asyncio.sleep(self.interval)
-                else:
+                samples = self._ring.read_since(cursor)
+                if len(samples):
+                    cursor = samples.last_seq or cursor
                     self.loading = False
+                    value = median_distance(samples)
+                    if value is None:
+                        value = float(samples.distance[-1])
+                    await self._emitter.emit("distance", round(value, 2))
+                await asyncio.sleep(self.interval)
 
         except (
             BrokenPipeError,
@@ -108,7 +120,8 @@ class DistanceService:
 
     @property
     def distance(self) -> float:
-        return round(self._distance.value, 2)
+        latest = self._ring.latest()
+        return round(float(latest.distance[-1]), 2) if latest else 0.0
 
     @property
     def running(self) -> Optional[bool]:
@@ -118,13 +131,14 @@ class DistanceService:
     def _start_process(self) -> None:
         if self.robot_config.ultrasonic:
             with self._lock:
+                self._ring.reset()
                 self._process = mp.Process(
                     target=distance_process,
                     args=(
                         self.robot_config.ultrasonic.trig_pin,
                         self.robot_config.ultrasonic.echo_pin,
                         self.stop_event,
-                        self._distance,
+                        self._ring,
                         self.interval,
                         self.robot_config.ultrasonic.timeout,
                     ),
@@ -166,4 +180,4 @@ class DistanceService:
             with self._lock:
                 self.__dict__.pop("stop_event", None)
                 self.__dict__.pop("_process", None)
-                self.__dict__.pop("_distance", None)
+                self.__dict__.pop("_ring", None)
@@ -0,0 +1,206 @@
+"""
+Fits the noise of the speed estimator to a recorded telemetry session, or
+benchmarks the speed filter, and prints the result as JSON.
+
+Usage:
+    python -m app.services.sensors.speed_calibration --session ~/.cache/picar-x-racer/telemetry/<session>
+    python -m app.services.sensors.speed_calibration --benchmark --samples 2000
+"""
+
+import argparse
+import json
+import math
+import sys
+import time
+from dataclasses import asdict
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from app.managers.distance_ring import DistanceStatus
+from app.managers.telemetry_log import load_session
+from app.services.sensors.speed_estimator import SpeedEstimator
+from app.services.sensors.speed_filter import (
+    SpeedFilter,
+    SpeedNoise,
+    SpeedSamples,
+    fit_noise,
+    run_filter,
+    smooth,
+)
+
+
+def session_samples(path: str, max_speed_cm_s: float) -> SpeedSamples:
+    """
+    Builds the speed filter inputs from a recorded telemetry session: one row
+    per distance sample, with the drive command applied at that time.
+
+    Raises:
+        ValueError: If the session has no distance samples.
+    """
+    session = load_session(path)
+    distance = np.sort(session["distance"], order="ts")
+    drive = np.sort(session["drive"], order="ts")
+    if not len(distance):
+        raise ValueError("The session has no distance samples")
+
+    ts = distance["ts"]
+    values = distance["distance"].astype(np.float64)
+    values[distance["status"] != DistanceStatus.OK] = math.nan
+
+    speed = np.zeros(len(ts))
+    applied = np.searchsorted(drive["ts"], ts, side="right") - 1
+    has_drive = applied >= 0
+    speed[has_drive] = drive["speed"][applied[has_drive]]
+
+    return SpeedSamples.create(
+        interval=np.diff(ts, prepend=ts[0]),
+        distance=values,
+        throttle=np.abs(speed),
+        command_cm_s=speed / 100.0 * max_speed_cm_s,
+    )
+
+
+def synthetic_samples(
+    n: int,
+    noise: SpeedNoise = SpeedNoise(),
+    interval: float = 0.05,
+    start_distance: float = 400.0,
+    seed: int = 0,
+) -> Tuple[SpeedSamples, np.ndarray]:
+    """
+    Generates samples that follow the speed filter model with the given
+    noise, and returns them with the true speed at each sample.
+    """
+    rng = np.random.default_rng(seed)
+    speed = np.cumsum(rng.normal(0, noise.sigma_speed_cm_s * math.sqrt(interval), n))
+    drift = rng.normal(0, noise.sigma_position_cm * interval, n)
+    distance = start_distance - np.cumsum(speed * interval) + drift.cumsum()
+    return (
+        SpeedSamples.create(
+            interval=np.full(n, interval),
+            distance=distance + rng.normal(0, noise.sigma_position_cm, n),
+            command_cm_s=speed + rng.normal(0, noise.sigma_command_cm_s, n),
+        ),
+        speed,
+    )
+
+
+def calibrate(path: str, with_smoothing: bool = False) -> Dict[str, Any]:
+    """
+    Fits the noise to a session and reports it with the speed estimates.
+    """
+    estimator = SpeedEstimator()
+    samples = session_samples(path, estimator.max_speed_cm_s)
+    fit = fit_noise(samples, base=estimator.noise)
+    before = run_filter(samples, [estimator.noise]).nll[0]
+    report: Dict[str, Any] = {
+        "samples": len(samples),
+        "candidates": fit.candidates,
+        "nll_default": round(float(before), 3),
+        "nll_fitted": round(fit.nll, 3),
+        "noise": asdict(fit.noise),
+    }
+    if with_smoothing:
+        state, _ = smooth(run_filter(samples, [fit.noise]))
+        report["smoothed_speed_cm_s"] = [
+            None if math.isnan(v) else round(v, 2) for v in state[0, :, 1].tolist()
+        ]
+    return report
+
+
+def _per_call_us(fn, repeat: int) -> float:
+    started = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - started) / repeat * 1e6
+
+
+def benchmark(n: int = 2000, seed: int = 0) -> Dict[str, Any]:
+    """
+    Measures the cost of the online step, of batch filtering and smoothing
+    per sample, and of fitting the noise.
+    """
+    samples, _ = synthetic_samples(n, seed=seed)
+    estimator = SpeedEstimator()
+    rows = iter(samples.distance.tolist() * 2)
+    online_us = _per_call_us(
+        lambda: estimator.process_distance(
+            next(rows), 0.05, relative_speed=30, direction=1
+        ),
+        n,
+    )
+
+    speed_filter = SpeedFilter()
+    speed_filter.initialize(samples.distance[0])
+    step_us = _per_call_us(
+        lambda: speed_filter.step(0.05, 200.0, 30.0, 40.0),
+        n,
+    )
+
+    started = time.perf_counter()
+    result = run_filter(samples)
+    batch_s = time.perf_counter() - started
+
+    grid = [
+        SpeedNoise(sigma_position_cm=p, sigma_speed_cm_s=s)
+        for p in np.geomspace(0.5, 10, 9)
+        for s in np.geomspace(1, 100, 9)
+    ]
+    started = time.perf_counter()
+    run_filter(samples, grid)
+    grid_s = time.perf_counter() - started
+
+    started = time.perf_counter()
+    smooth(result)
+    smooth_s = time.perf_counter() - started
+
+    started = time.perf_counter()
+    fit = fit_noise(samples)
+    fit_s = time.perf_counter() - started
+
+    return {
+        "samples": n,
+        "online_step_us": round(online_us, 2),
+        "filter_step_us": round(step_us, 2),
+        "batch_filter_us_per_sample": round(batch_s / n * 1e6, 2),
+        "grid_candidates": len(grid),
+        "grid_filter_us_per_sample_candidate": round(grid_s / n / len(grid) * 1e6, 3),
+        "smoother_us_per_sample": round(smooth_s / n * 1e6, 2),
+        "fit_s": round(fit_s, 3),
+        "fit_candidates": fit.candidates,
+        "fitted_noise": {
+            "sigma_position_cm": round(fit.noise.sigma_position_cm, 3),
+            "sigma_speed_cm_s": round(fit.noise.sigma_speed_cm_s, 3),
+        },
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m app.services.sensors.speed_calibration", description=__doc__
+    )
+    parser.add_argument("--session", help="Telemetry session directory or file.")
+    parser.add_argument(
+        "--smooth",
+        action="store_true",
+        help="Also print the smoothed speed of each sample of the session.",
+    )
+    parser.add_argument("--benchmark", action="store_true")
+    parser.add_argument("--samples", type=int, default=2000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    if args.session:
+        report = calibrate(args.session, with_smoothing=args.smooth)
+    elif args.benchmark:
+        report = benchmark(args.samples, seed=args.seed)
+    else:
+        parser.error("Either --session or --benchmark is required")
+    json.dump(report, sys.stdout, indent=2)
+    sys.stdout.write("\n")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
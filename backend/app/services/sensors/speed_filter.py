@@ -0,0 +1,477 @@
+import math
+from dataclasses import dataclass, fields, replace
+from enum import IntEnum
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+INITIAL_SPEED_VARIANCE = 500.0
+"""Variance of the speed before the first speed measurement (very uncertain)."""
+
+_LOG_2PI = math.log(2 * math.pi)
+
+
+class SpeedChannel(IntEnum):
+    """
+    Measurements fused by `SpeedFilter`.
+    """
+
+    DISTANCE = 0
+    """Ultrasonic distance to the obstacle ahead, in cm."""
+    COMMAND = 1
+    """Commanded motor speed, in cm/s, negative when driving backward."""
+    ENCODER = 2
+    """Wheel encoder speed, in cm/s, negative when driving backward."""
+
+
+CHANNEL_H = np.array(
+    [
+        [1.0, 0.0],
+        [0.0, 1.0],
+        [0.0, 1.0],
+    ]
+)
+"""The row of the observation matrix of each `SpeedChannel`."""
+
+
+@dataclass(frozen=True)
+class SpeedNoise:
+    """
+    Noise of the speed model, as standard deviations.
+
+    The process noise of the distance and of the speed grows with the time
+    step, as `sigma_position_cm * dt` and `sigma_speed_cm_s * sqrt(dt)`. The
+    distance readings have a noise of `sigma_position_cm`, inflated by
+    `throttle_noise_gain` per percent of throttle, since the running motors
+    shake the sensor.
+    """
+
+    sigma_position_cm: float = 2.0
+    sigma_speed_cm_s: float = 10.0
+    sigma_command_cm_s: float = 10.0
+    sigma_encoder_cm_s: float = 3.0
+    sigma_accel_cm_s2: float = 50.0
+    throttle_noise_gain: float = 0.03
+
+
+def _stack(noises: Sequence[SpeedNoise]) -> Dict[str, np.ndarray]:
+    return {
+        field.name: np.array([getattr(noise, field.name) for noise in noises])
+        for field in fields(SpeedNoise)
+    }
+
+
+@dataclass(frozen=True)
+class SpeedSamples:
+    """
+    Recorded inputs of the speed filter, one row per distance reading.
+
+    `interval` is the time since the previous row (s), and `throttle` the
+    absolute commanded speed (%). Inputs that were not measured at a row,
+    including invalid distance readings, are NaN.
+    """
+
+    interval: np.ndarray
+    distance: np.ndarray
+    throttle: np.ndarray
+    command_cm_s: np.ndarray
+    encoder_cm_s: np.ndarray
+    accel_cm_s2: np.ndarray
+
+    @classmethod
+    def create(
+        cls,
+        interval: Sequence[float],
+        distance: Sequence[float],
+        throttle: Optional[Sequence[float]] = None,
+        command_cm_s: Optional[Sequence[float]] = None,
+        encoder_cm_s: Optional[Sequence[float]] = None,
+        accel_cm_s2: Optional[Sequence[float]] = None,
+    ) -> "SpeedSamples":
+        """
+        Creates samples from sequences of the same length; inputs that are
+        not given are treated as not measured.
+        """
+        n = len(distance)
+
+        def column(values: Optional[Sequence[float]], default: float) -> np.ndarray:
+            if values is None:
+                return np.full(n, default)
+            array = np.asarray(values, dtype=np.float64)
+            if array.shape != (n,):
+                raise ValueError("All sample columns must have the same length")
+            return array
+
+        return cls(
+            interval=column(interval, 0.0),
+            distance=column(distance, math.nan),
+            throttle=column(throttle, 0.0),
+            command_cm_s=column(command_cm_s, math.nan),
+            encoder_cm_s=column(encoder_cm_s, math.nan),
+            accel_cm_s2=column(accel_cm_s2, math.nan),
+        )
+
+    def __len__(self) -> int:
+        return len(self.distance)
+
+
+class SpeedFilter:
+    """
+    Kalman filter of the distance to the obstacle ahead and the speed at
+    which the car closes on it.
+
+    State vector:
+        x = [distance_cm,
+             speed_cm_s]
+
+    Motion model (constant speed, or the measured acceleration `a`):
+        distance_k = distance_{k-1} - speed_{k-1} * dt - a * dt^2 / 2 + w_d
+        speed_k    = speed_{k-1}                    + a * dt         + w_v
+
+    The speed is positive when driving toward the obstacle. Each measurement
+    is a scalar update with a row of `CHANNEL_H`, so another sensor only needs
+    another channel.
+
+    The filter runs one model per noise candidate at once, keeping each state
+    and covariance entry as an array over the candidates; `nll` accumulates
+    the negative log likelihood of the measurements under each candidate. With
+    a single candidate the same arithmetic runs on floats, since NumPy calls
+    on one-element arrays cost more than the whole update.
+    """
+
+    def __init__(self, noises: Sequence[SpeedNoise] = (SpeedNoise(),)) -> None:
+        if not noises:
+            raise ValueError("At least one noise candidate is required")
+        self.noises = list(noises)
+        self.size = len(self.noises)
+        self._scalar = self.size == 1
+        self._log = math.log if self._scalar else np.log
+        noise = {
+            name: float(values[0]) if self._scalar else values
+            for name, values in _stack(self.noises).items()
+        }
+        self._q_position = noise["sigma_position_cm"] ** 2
+        self._q_speed = noise["sigma_speed_cm_s"] ** 2
+        self._q_accel = noise["sigma_accel_cm_s2"] ** 2
+        self._r_distance = noise["sigma_position_cm"] ** 2
+        self._throttle_gain = noise["throttle_noise_gain"]
+        self._r_channel = {
+            SpeedChannel.COMMAND: noise["sigma_command_cm_s"] ** 2,
+            SpeedChannel.ENCODER: noise["sigma_encoder_cm_s"] ** 2,
+        }
+        self._h = CHANNEL_H.tolist()
+        self.reset()
+
+    def _fill(self, value: float) -> Any:
+        return value if self._scalar else np.full(self.size, value)
+
+    def reset(self) -> None:
+        self.x0 = self.x1 = self._fill(math.nan)
+        self.p00 = self.p01 = self.p11 = self._fill(math.nan)
+        self.nll = self._fill(0.0)
+        self.initialized = False
+
+    @property
+    def x(self) -> np.ndarray:
+        """
+        The state of each candidate, shaped (K, 2).
+        """
+        return np.column_stack(np.broadcast_arrays(self.x0, self.x1))
+
+    @property
+    def P(self) -> np.ndarray:
+        """
+        The upper triangle of the covariance of each candidate, shaped (K, 3).
+        """
+        return np.column_stack(np.broadcast_arrays(self.p00, self.p01, self.p11))
+
+    def distance_variance(self, throttle: float) -> Any:
+        factor = 1.0 + self._throttle_gain * max(0.0, min(throttle, 100.0))
+        return self._r_distance * factor * factor
+
+    def initialize(
+        self, distance: float, throttle: float = 0.0, speed: float = 0.0
+    ) -> None:
+        """
+        Starts the filter at a distance reading and an initial speed guess.
+        """
+        self.x0 = self._fill(distance)
+        self.x1 = self._fill(speed)
+        self.p00 = self._fill(0.0) + self.distance_variance(throttle)
+        self.p01 = self._fill(0.0)
+        self.p11 = self._fill(INITIAL_SPEED_VARIANCE)
+        self.initialized = True
+
+    def predict(self, dt: float, accel: Optional[float] = None) -> None:
+        """
+        Advances the state by `dt` seconds, with the measured acceleration
+        toward the obstacle in cm/s², if any.
+        """
+        p00, p01, p11 = self.p00, self.p01, self.p11
+        dt2 = dt * dt
+
+        n00 = p00 - 2 * dt * p01 + dt2 * p11 + self._q_position * dt2
+        n01 = p01 - dt * p11
+        n11 = p11 + self._q_speed * dt
+        self.x0 = self.x0 - dt * self.x1
+
+        if accel is not None and not math.isnan(accel):
+            g0, g1 = -0.5 * dt2, dt
+            self.x0 = self.x0 + g0 * accel
+            self.x1 = self.x1 + g1 * accel
+            n00 = n00 + self._q_accel * g0 * g0
+            n01 = n01 + self._q_accel * g0 * g1
+            n11 = n11 + self._q_accel * g1 * g1
+
+        self.p00, self.p01, self.p11 = n00, n01, n11
+
+    def update(
+        self,
+        channel: SpeedChannel,
+        z: float,
+        variance: Any = None,
+    ) -> None:
+        """
+        Corrects the state with a measurement of a channel, with the
+        channel's configured variance unless `variance` is given.
+        """
+        if variance is None:
+            variance = self._r_channel[channel]
+        h0, h1 = self._h[channel]
+        p00, p01, p11 = self.p00, self.p01, self.p11
+
+        ph0 = p00 * h0 + p01 * h1
+        ph1 = p01 * h0 + p11 * h1
+        s = h0 * ph0 + h1 * ph1 + variance
+        y = z - (h0 * self.x0 + h1 * self.x1)
+        k0 = ph0 / s
+        k1 = ph1 / s
+
+        self.x0 = self.x0 + k0 * y
+        self.x1 = self.x1 + k1 * y
+        self.p00 = p00 - k0 * ph0
+        self.p01 = p01 - k0 * ph1
+        self.p11 = p11 - k1 * ph1
+        self.nll = self.nll + 0.5 * (_LOG_2PI + self._log(s) + y * y / s)
+
+    def step(
+        self,
+        dt: float,
+        distance: float,
+        throttle: float = 0.0,
+        command_cm_s: float = math.nan,
+        encoder_cm_s: float = math.nan,
+        accel_cm_s2: float = math.nan,
+    ) -> bool:
+        """
+        Advances the filter by one sample; NaN inputs were not measured.
+        Returns whether the state was updated.
+        """
+        if not self.initialized:
+            if math.isnan(distance):
+                return False
+            speed = encoder_cm_s if not math.isnan(encoder_cm_s) else command_cm_s
+            self.initialize(distance, throttle, 0.0 if math.isnan(speed) else speed)
+            return True
+
+        self.predict(dt, accel_cm_s2)
+        self.correct(distance, throttle, command_cm_s, encoder_cm_s)
+        return True
+
+    def correct(
+        self,
+        distance: float,
+        throttle: float = 0.0,
+        command_cm_s: float = math.nan,
+        encoder_cm_s: float = math.nan,
+    ) -> None:
+        """
+        Applies the measured inputs of a sample; NaN inputs are skipped.
+        """
+        if not math.isnan(distance):
+            self.update(
+                SpeedChannel.DISTANCE, distance, self.distance_variance(throttle)
+            )
+        if not math.isnan(command_cm_s):
+            self.update(SpeedChannel.COMMAND, command_cm_s)
+        if not math.isnan(encoder_cm_s):
+            self.update(SpeedChannel.ENCODER, encoder_cm_s)
+
+
+@dataclass(frozen=True)
+class FilterResult:
+    """
+    The history of a batch run of `SpeedFilter`, with the leading axis over
+    the noise candidates and the second over the samples. Rows before the
+    first valid distance are NaN.
+    """
+
+    noises: List[SpeedNoise]
+    interval: np.ndarray
+    state: np.ndarray
+    covariance: np.ndarray
+    predicted_state: np.ndarray
+    predicted_covariance: np.ndarray
+    nll: np.ndarray
+
+    @property
+    def speed(self) -> np.ndarray:
+        return self.state[..., 1]
+
+
+def run_filter(
+    samples: SpeedSamples, noises: Sequence[SpeedNoise] = (SpeedNoise(),)
+) -> FilterResult:
+    """
+    Filters recorded samples under each noise candidate at once.
+    """
+    speed_filter = SpeedFilter(noises)
+    size, n = len(speed_filter.noises), len(samples)
+    state = np.full((size, n, 2), math.nan)
+    covariance = np.full((size, n, 3), math.nan)
+    predicted_state = np.full((size, n, 2), math.nan)
+    predicted_covariance = np.full((size, n, 3), math.nan)
+
+    rows = zip(
+        samples.interval.tolist(),
+        samples.distance.tolist(),
+        samples.throttle.tolist(),
+        samples.command_cm_s.tolist(),
+        samples.encoder_cm_s.tolist(),
+        samples.accel_cm_s2.tolist(),
+    )
+    for i, (dt, distance, throttle, command, encoder, accel) in enumerate(rows):
+        initialized = speed_filter.initialized
+        if initialized:
+            speed_filter.predict(dt, accel)
+        elif not speed_filter.step(dt, distance, throttle, command, encoder, accel):
+            continue
+        predicted_state[:, i, 0] = speed_filter.x0
+        predicted_state[:, i, 1] = speed_filter.x1
+        predicted_covariance[:, i, 0] = speed_filter.p00
+        predicted_covariance[:, i, 1] = speed_filter.p01
+        predicted_covariance[:, i, 2] = speed_filter.p11
+        if initialized:
+            speed_filter.correct(distance, throttle, command, encoder)
+        state[:, i, 0] = speed_filter.x0
+        state[:, i, 1] = speed_filter.x1
+        covariance[:, i, 0] = speed_filter.p00
+        covariance[:, i, 1] = speed_filter.p01
+        covariance[:, i, 2] = speed_filter.p11
+
+    return FilterResult(
+        noises=speed_filter.noises,
+        interval=samples.interval,
+        state=state,
+        covariance=covariance,
+        predicted_state=predicted_state,
+        predicted_covariance=predicted_covariance,
+        nll=np.broadcast_to(speed_filter.nll, (speed_filter.size,)).copy(),
+    )
+
+
+def smooth(result: FilterResult) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Runs the Rauch-Tung-Striebel smoother over a batch run and returns the
+    smoothed states and covariances, shaped like those of the run.
+    """
+    state = result.state.copy()
+    covariance = result.covariance.copy()
+    started = np.flatnonzero(~np.isnan(result.state[0, :, 0]))
+    if len(started) < 2:
+        return state, covariance
+
+    for i in range(len(result.interval) - 2, started[0] - 1, -1):
+        dt = result.interval[i + 1]
+        f00, f01, f11 = result.covariance[:, i].T
+        p00, p01, p11 = result.predicted_covariance[:, i + 1].T
+        det = p00 * p11 - p01 * p01
+        # P_f F^T, with F = [[1, -dt], [0, 1]]
+        a00, a01 = f00 - dt * f01, f01
+        a10, a11 = f01 - dt * f11, f11
+        # C = P_f F^T P_p^-1
+        c00 = (a00 * p11 - a01 * p01) / det
+        c01 = (a01 * p00 - a00 * p01) / det
+        c10 = (a10 * p11 - a11 * p01) / det
+        c11 = (a11 * p00 - a10 * p01) / det
+
+        d0 = state[:, i + 1, 0] - result.predicted_state[:, i + 1, 0]
+        d1 = state[:, i + 1, 1] - result.predicted_state[:, i + 1, 1]
+        state[:, i, 0] += c00 * d0 + c01 * d1
+        state[:, i, 1] += c10 * d0 + c11 * d1
+
+        e00 = covariance[:, i + 1, 0] - p00
+        e01 = covariance[:, i + 1, 1] - p01
+        e11 = covariance[:, i + 1, 2] - p11
+        # C (P_s - P_p) C^T
+        covariance[:, i, 0] += c00 * (c00 * e00 + c01 * e01) + c01 * (
+            c00 * e01 + c01 * e11
+        )
+        covariance[:, i, 1] += c00 * (c10 * e00 + c11 * e01) + c01 * (
+            c10 * e01 + c11 * e11
+        )
+        covariance[:, i, 2] += c10 * (c10 * e00 + c11 * e01) + c11 * (
+            c10 * e01 + c11 * e11
+        )
+    return state, covariance
+
+
+@dataclass(frozen=True)
+class NoiseFit:
+    """
+    The most likely noise for a recording, and its negative log likelihood.
+    """
+
+    noise: SpeedNoise
+    nll: float
+    candidates: int
+
+
+def fit_noise(
+    samples: SpeedSamples,
+    base: SpeedNoise = SpeedNoise(),
+    position_range: Tuple[float, float] = (0.2, 20.0),
+    speed_range: Tuple[float, float] = (0.5, 200.0),
+    grid_size: int = 9,
+    rounds: int = 3,
+) -> NoiseFit:
+    """
+    Fits `sigma_position_cm` and `sigma_speed_cm_s` to a recording by
+    maximum likelihood, keeping the other noise of `base`.
+
+    Each round filters the recording once for a log-spaced grid of
+    candidates and narrows the grid around the best one.
+    """
+    if grid_size < 2 or rounds < 1:
+        raise ValueError("Fitting needs a grid of at least 2 and one round")
+    log_position = np.log(position_range)
+    log_speed = np.log(speed_range)
+    best: Optional[Tuple[float, SpeedNoise]] = None
+    evaluated = 0
+
+    for _ in range(rounds):
+        positions = np.exp(np.linspace(*log_position, grid_size))
+        speeds = np.exp(np.linspace(*log_speed, grid_size))
+        noises = [
+            replace(base, sigma_position_cm=float(p), sigma_speed_cm_s=float(s))
+            for p in positions
+            for s in speeds
+        ]
+        nll = run_filter(samples, noises).nll
+        evaluated += len(noises)
+        index = int(np.nanargmin(nll))
+        if best is None or nll[index] < best[0]:
+            best = (float(nll[index]), noises[index])
+
+        assert best is not None
+        step_position = (log_position[1] - log_position[0]) / (grid_size - 1)
+        step_speed = (log_speed[1] - log_speed[0]) / (grid_size - 1)
+        center_position = math.log(best[1].sigma_position_cm)
+        center_speed = math.log(best[1].sigma_speed_cm_s)
+        log_position = np.array(
+            [center_position - step_position, center_position + step_position]
+        )
+        log_speed = np.array([center_speed - step_speed, center_speed + step_speed])
+
+    assert best is not None
+    return NoiseFit(noise=best[1], nll=best[0], candidates=evaluated)
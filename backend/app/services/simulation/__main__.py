@@ -0,0 +1,58 @@
+"""
+Benchmarks the avoid obstacles controller in simulation, or replays a
+recorded telemetry session through it, and prints the report as JSON.
+
+Usage:
+    python -m app.services.simulation --scenario pillars --duration 60
+    python -m app.services.simulation --replay ~/.cache/picar-x-racer/telemetry/<session>
+"""
+
+import argparse
+import json
+import sys
+from typing import List, Optional
+
+from app.schemas.robot.avoid_obstacles import AvoidParams
+from app.schemas.robot.config import HardwareConfig
+from app.services.simulation.harness import (
+    SCENARIOS,
+    SimulationConfig,
+    replay_session,
+    run_simulation,
+)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m app.services.simulation", description=__doc__
+    )
+    parser.add_argument("--scenario", choices=sorted(SCENARIOS), default="wall")
+    parser.add_argument("--duration", type=float, default=20.0, help="Seconds.")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--config",
+        help="Robot config JSON file to take the avoid obstacles parameters from.",
+    )
+    parser.add_argument("--replay", help="Telemetry session directory or file.")
+    args = parser.parse_args(argv)
+
+    params = AvoidParams()
+    if args.config:
+        with open(args.config, "r") as file:
+            params = HardwareConfig(**json.load(file)).avoid_obstacles_params
+
+    if args.replay:
+        report = replay_session(args.replay, params=params).to_dict()
+    else:
+        report = run_simulation(
+            args.scenario,
+            params=params,
+            config=SimulationConfig(duration_s=args.duration, seed=args.seed),
+        ).to_dict()
+    json.dump(report, sys.stdout, indent=2)
+    sys.stdout.write("\n")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,143 @@
+import math
+import random
+from dataclasses import dataclass
+from typing import Callable, List
+
+from app.services.simulation.world import SimCar, SimWorld
+from app.types.car import PicarState
+from robot_hat.services.motor_service import MotorServiceDirection
+
+Schedule = Callable[[float, Callable[[], None]], None]
+
+SPEED_OF_SOUND_CM_S = 34300
+
+
+@dataclass
+class SimulatedServo:
+    min_angle: float = -30.0
+    max_angle: float = 30.0
+    current_angle: float = 0.0
+
+
+class SimulatedPicarx:
+    """
+    Stands in for `PicarxAdapter` on top of a simulated car.
+
+    The reported state changes as soon as a command is issued, like the cached
+    state of the real motor and servo services, but the car only receives the
+    command after a simulated I2C transaction time, which `schedule` runs in
+    simulated time.
+    """
+
+    def __init__(
+        self,
+        car: SimCar,
+        schedule: Schedule,
+        rng: random.Random,
+        i2c_latency_s: float = 0.002,
+        i2c_jitter_s: float = 0.001,
+    ) -> None:
+        self.car = car
+        self.schedule = schedule
+        self.rng = rng
+        self.i2c_latency_s = i2c_latency_s
+        self.i2c_jitter_s = i2c_jitter_s
+        self.steering_servo = SimulatedServo()
+        self.cam_pan_servo = SimulatedServo(min_angle=-90, max_angle=90)
+        self.cam_tilt_servo = SimulatedServo(min_angle=-35, max_angle=65)
+        self.transaction_times: List[float] = []
+        self._speed = 0
+        self._direction: MotorServiceDirection = 0
+
+    @property
+    def state(self) -> PicarState:
+        return {
+            "speed": self._speed,
+            "direction": self._direction,
+            "steering_servo_angle": self.steering_servo.current_angle,
+            "cam_pan_angle": self.cam_pan_servo.current_angle,
+            "cam_tilt_angle": self.cam_tilt_servo.current_angle,
+        }
+
+    def set_dir_servo_angle(self, value: float) -> None:
+        value = max(
+            self.steering_servo.min_angle, min(self.steering_servo.max_angle, value)
+        )
+        self.steering_servo.current_angle = value
+        self._transaction(lambda: setattr(self.car, "steering", value))
+
+    def set_cam_pan_angle(self, value: float) -> None:
+        self.cam_pan_servo.current_angle = value
+        self._transaction(lambda: None)
+
+    def set_cam_tilt_angle(self, value: float) -> None:
+        self.cam_tilt_servo.current_angle = value
+        self._transaction(lambda: None)
+
+    def move(self, speed: int, direction: MotorServiceDirection) -> None:
+        self._speed, self._direction = speed, direction
+
+        def apply() -> None:
+            self.car.speed, self.car.direction = speed, direction
+
+        self._transaction(apply)
+
+    def forward(self, speed: int) -> None:
+        self.move(speed, 1)
+
+    def backward(self, speed: int) -> None:
+        self.move(speed, -1)
+
+    def stop(self) -> None:
+        self.move(0, 0)
+
+    def cleanup(self) -> None:
+        pass
+
+    def _transaction(self, apply: Callable[[], None]) -> None:
+        duration = self.i2c_latency_s + self.rng.uniform(0, self.i2c_jitter_s)
+        self.transaction_times.append(duration)
+        self.schedule(duration, apply)
+
+
+class SimulatedUltrasonic:
+    """
+    Ultrasonic sensor mounted at the front of a simulated car.
+
+    `read` follows the real sensor: the distance in centimeters, or -1 if no
+    echo returned within `timeout` seconds. Readings have gaussian noise with
+    `noise_cm` standard deviation, and `dropout_rate` of them time out.
+    """
+
+    def __init__(
+        self,
+        world: SimWorld,
+        car: SimCar,
+        rng: random.Random,
+        noise_cm: float = 1.0,
+        dropout_rate: float = 0.02,
+        timeout: float = 0.017,
+        beam_angle_deg: float = 15.0,
+    ) -> None:
+        self.world = world
+        self.car = car
+        self.rng = rng
+        self.noise_cm = noise_cm
+        self.dropout_rate = dropout_rate
+        self.max_range_cm = timeout * SPEED_OF_SOUND_CM_S / 2
+        self.beam_angle = math.radians(beam_angle_deg)
+
+    def true_distance(self) -> float:
+        """
+        Returns the noise-free distance, or `math.inf` if out of range.
+        """
+        x, y, heading = self.car.sensor_pose
+        return self.world.raycast(
+            x, y, heading, self.max_range_cm, beam_angle=self.beam_angle, rays=5
+        )
+
+    def read(self) -> float:
+        distance = self.true_distance()
+        if math.isinf(distance) or self.rng.random() < self.dropout_rate:
+            return -1
+        return round(max(0.0, distance + self.rng.gauss(0, self.noise_cm)), 2)
@@ -0,0 +1,439 @@
+import heapq
+import itertools
+import math
+import random
+import time
+from dataclasses import asdict, dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from app.managers.distance_ring import DistanceRing, DistanceSamples, DistanceStatus
+from app.managers.telemetry_log import load_session
+from app.schemas.robot.avoid_obstacles import AvoidParams, AvoidState
+from app.services.control.avoid_controller import AvoidCommand, AvoidController
+from app.services.sensors.speed_estimator import SpeedEstimator
+from app.services.simulation.hardware import SimulatedPicarx, SimulatedUltrasonic
+from app.services.simulation.world import (
+    CarModel,
+    Obstacle,
+    Pillar,
+    SimCar,
+    SimWorld,
+    room,
+)
+
+
+@dataclass(frozen=True)
+class Scenario:
+    """
+    Obstacles and the start pose (x, y in centimeters, heading in radians).
+    """
+
+    name: str
+    obstacles: Tuple[Obstacle, ...]
+    start: Tuple[float, float, float]
+
+
+SCENARIOS: Dict[str, Scenario] = {
+    scenario.name: scenario
+    for scenario in (
+        Scenario("wall", tuple(room(300, 200)), start=(50, 100, 0.0)),
+        Scenario("corridor", tuple(room(280, 100)), start=(40, 50, 0.0)),
+        Scenario(
+            "pillars",
+            (
+                *room(500, 300),
+                Pillar(250, 150, 20),
+                Pillar(380, 90, 15),
+                Pillar(150, 230, 15),
+            ),
+            start=(50, 150, 0.0),
+        ),
+    )
+}
+
+
+@dataclass
+class SimulationConfig:
+    """
+    Timing and noise of a simulation run. Times are in seconds.
+
+    `loop_jitter_s` is the mean of the exponentially distributed delay added
+    to each control loop period, modelling event loop scheduling.
+    """
+
+    duration_s: float = 20.0
+    physics_step_s: float = 0.002
+    sensor_interval_s: float = 0.05
+    sensor_noise_cm: float = 1.0
+    sensor_dropout_rate: float = 0.02
+    i2c_latency_s: float = 0.002
+    i2c_jitter_s: float = 0.001
+    loop_jitter_s: float = 0.003
+    seed: int = 0
+
+
+@dataclass(frozen=True)
+class Summary:
+    count: int = 0
+    mean: Optional[float] = None
+    p95: Optional[float] = None
+    max: Optional[float] = None
+
+    @classmethod
+    def of(cls, values: Sequence[float], scale: float = 1.0) -> "Summary":
+        if not len(values):
+            return cls()
+        array = np.asarray(values, dtype=np.float64) * scale
+        return cls(
+            count=len(array),
+            mean=round(float(array.mean()), 3),
+            p95=round(float(np.percentile(array, 95)), 3),
+            max=round(float(array.max()), 3),
+        )
+
+
+@dataclass
+class BenchmarkReport:
+    """
+    Results of a simulation run.
+
+    `reaction_latency_ms` measures the time from an obstacle entering the
+    `danger` distance in front of the cruising car to the controller leaving
+    the cruise state. `stopping_distance_cm` measures how far the car kept
+    moving forward after the controller switched to reversing.
+    `step_time_us` is the real time spent in the controller per step.
+    """
+
+    scenario: str
+    seed: int
+    simulated_s: float
+    wall_clock_s: float
+    realtime_factor: float
+    loop_period_ms: Summary
+    loop_jitter_ms: Summary
+    step_time_us: Summary
+    i2c_latency_ms: Summary
+    reaction_latency_ms: Summary
+    stopping_distance_cm: Summary
+    speed_error_kmh: Summary
+    min_clearance_cm: float
+    collisions: int
+    distance_travelled_cm: float
+    transitions: Dict[str, int] = field(default_factory=dict)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+class Simulation:
+    """
+    Runs the avoid obstacles controller against a simulated car, sensor and
+    I2C bus in simulated time, as fast as the host allows.
+
+    The distance sensor writes into a `DistanceRing` like the distance
+    process, and the control loop consumes it and applies commands like
+    `CarService`. Runs with the same configuration and seed are identical.
+    """
+
+    def __init__(
+        self,
+        scenario: Scenario,
+        params: Optional[AvoidParams] = None,
+        config: Optional[SimulationConfig] = None,
+        car_model: Optional[CarModel] = None,
+    ) -> None:
+        self.scenario = scenario
+        self.config = config or SimulationConfig()
+        self.params = params or AvoidParams()
+        seed = self.config.seed
+        self.world = SimWorld(list(scenario.obstacles))
+        x, y, heading = scenario.start
+        self.car = SimCar(car_model or CarModel(), x=x, y=y, heading=heading)
+        self.now = 0.0
+        self._events: List[Tuple[float, int, Callable[[], None]]] = []
+        self._seq = itertools.count()
+        self._loop_rng = random.Random(f"{seed}:loop")
+        self.px = SimulatedPicarx(
+            self.car,
+            self.schedule,
+            random.Random(f"{seed}:i2c"),
+            i2c_latency_s=self.config.i2c_latency_s,
+            i2c_jitter_s=self.config.i2c_jitter_s,
+        )
+        self.sensor = SimulatedUltrasonic(
+            self.world,
+            self.car,
+            random.Random(f"{seed}:sensor"),
+            noise_cm=self.config.sensor_noise_cm,
+            dropout_rate=self.config.sensor_dropout_rate,
+        )
+        self.ring = DistanceRing()
+        self.controller = AvoidController(
+            self.params, on_transition=self._on_transition
+        )
+        self.speed_estimator = SpeedEstimator()
+
+        self._cursor = 0
+        self._last_tick: Optional[float] = None
+        self._last_steer = 0.0
+        self._last_sensor: Optional[float] = None
+        self._threat_since: Optional[float] = None
+        self._stopping_from: Optional[float] = None
+        self._periods: List[float] = []
+        self._step_times: List[float] = []
+        self._reactions: List[float] = []
+        self._stopping_distances: List[float] = []
+        self._speed_errors: List[float] = []
+        self._transitions: Dict[str, int] = {}
+        self._min_clearance = math.inf
+
+    def schedule(self, delay: float, fn: Callable[[], None]) -> None:
+        heapq.heappush(self._events, (self.now + delay, next(self._seq), fn))
+
+    def run(self) -> BenchmarkReport:
+        started = time.perf_counter()
+        duration = self.config.duration_s
+        self.controller.reset(self.now)
+        self.schedule(0.0, self._sample_distance)
+        self.schedule(0.0, self._tick)
+
+        while self._events and self._events[0][0] <= duration:
+            at, _, fn = heapq.heappop(self._events)
+            self._advance_to(at)
+            fn()
+        self._advance_to(duration)
+
+        wall_clock = time.perf_counter() - started
+        nominal = self.params.loop_period_s
+        return BenchmarkReport(
+            scenario=self.scenario.name,
+            seed=self.config.seed,
+            simulated_s=duration,
+            wall_clock_s=round(wall_clock, 3),
+            realtime_factor=round(duration / wall_clock, 1) if wall_clock else 0.0,
+            loop_period_ms=Summary.of(self._periods, 1000),
+            loop_jitter_ms=Summary.of(
+                [abs(period - nominal) for period in self._periods], 1000
+            ),
+            step_time_us=Summary.of(self._step_times, 1e6),
+            i2c_latency_ms=Summary.of(self.px.transaction_times, 1000),
+            reaction_latency_ms=Summary.of(self._reactions, 1000),
+            stopping_distance_cm=Summary.of(self._stopping_distances),
+            speed_error_kmh=Summary.of(self._speed_errors),
+            min_clearance_cm=round(self._min_clearance, 2),
+            collisions=self.car.collisions,
+            distance_travelled_cm=round(self.car.odometer, 1),
+            transitions=dict(self._transitions),
+        )
+
+    def _advance_to(self, until: float) -> None:
+        step = self.config.physics_step_s
+        while self.now < until:
+            dt = min(step, until - self.now)
+            self.car.advance(dt, self.world)
+            self.now += dt
+            self._observe()
+
+    def _observe(self) -> None:
+        car = self.car
+        self._min_clearance = min(
+            self._min_clearance,
+            self.world.clearance(car.x, car.y) - car.model.radius_cm,
+        )
+        if (
+            self._threat_since is None
+            and self.controller.state == AvoidState.CRUISE
+            and car.velocity > 0
+            and self.sensor.true_distance() < self.params.danger
+        ):
+            self._threat_since = self.now
+        if self._stopping_from is not None and car.velocity <= 0:
+            self._stopping_distances.append(car.odometer - self._stopping_from)
+            self._stopping_from = None
+
+    def _on_transition(self, state: AvoidState) -> None:
+        self._transitions[state.name] = self._transitions.get(state.name, 0) + 1
+        if self._threat_since is not None and state != AvoidState.CRUISE:
+            self._reactions.append(self.now - self._threat_since)
+            self._threat_since = None
+        if state == AvoidState.REVERSE and self.car.velocity > 0:
+            self._stopping_from = self.car.odometer
+
+    def _sample_distance(self) -> None:
+        reading = self.sensor.read()
+        status = DistanceStatus.from_reading(reading)
+        self.ring.append(reading, status, ts=self.now)
+        if status == DistanceStatus.OK:
+            if self._last_sensor is not None:
+                speed = self.speed_estimator.process_distance(
+                    reading,
+                    self.now - self._last_sensor,
+                    relative_speed=self.px.state["speed"],
+                    direction=self.px.state["direction"],
+                )
+                if speed is not None and self.car.steering == 0:
+                    self._speed_errors.append(
+                        abs(speed - abs(self.car.velocity) * 0.036)
+                    )
+            self._last_sensor = self.now
+        self.schedule(self.config.sensor_interval_s, self._sample_distance)
+
+    def _tick(self) -> None:
+        now = self.now
+        dt = now - self._last_tick if self._last_tick is not None else 0.0
+        if self._last_tick is not None:
+            self._periods.append(dt)
+        self._last_tick = now
+
+        samples = self.ring.read_since(self._cursor)
+        self._cursor = samples.last_seq or self._cursor
+        started = time.perf_counter()
+        self.controller.feed(samples)
+        command = self.controller.step(
+            now=now,
+            dt=dt,
+            current_speed=self.px.state["speed"],
+            current_direction=self.px.state["direction"],
+        )
+        self._step_times.append(time.perf_counter() - started)
+        self._apply(command)
+
+        jitter = self.config.loop_jitter_s
+        delay = self.params.loop_period_s + (
+            self._loop_rng.expovariate(1 / jitter) if jitter > 0 else 0.0
+        )
+        self.schedule(delay, self._tick)
+
+    def _apply(self, command: AvoidCommand) -> None:
+        """
+        Applies a command the way `CarService` does.
+        """
+        if command.stop_first:
+            self.px.stop()
+        servo = self.px.steering_servo
+        steer = max(servo.min_angle, min(servo.max_angle, command.steering))
+        speed = max(0, min(command.speed, 100))
+        if steer != self._last_steer:
+            self.px.set_dir_servo_angle(steer)
+            self._last_steer = steer
+        state = self.px.state
+        if command.direction != state["direction"] or speed != state["speed"]:
+            if command.direction == 0 or speed == 0:
+                self.px.stop()
+            else:
+                self.px.move(speed, command.direction)
+
+
+def run_simulation(
+    scenario: str = "wall",
+    params: Optional[AvoidParams] = None,
+    config: Optional[SimulationConfig] = None,
+) -> BenchmarkReport:
+    """
+    Runs a named scenario (see `SCENARIOS`) and returns its report.
+
+    Raises:
+        ValueError: If there is no such scenario.
+    """
+    if scenario not in SCENARIOS:
+        raise ValueError(
+            f"Unknown scenario '{scenario}', expected one of {', '.join(SCENARIOS)}"
+        )
+    return Simulation(SCENARIOS[scenario], params=params, config=config).run()
+
+
+@dataclass
+class ReplayReport:
+    """
+    Results of replaying recorded distance samples through the controller.
+
+    `first_divergence_s` is the time from the first sample to the first
+    replayed state transition that differs from the recorded sequence, or None
+    if the sequences match.
+    """
+
+    duration_s: float
+    distance_samples: int
+    recorded_transitions: List[str]
+    replayed_transitions: List[str]
+    first_divergence_s: Optional[float]
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+def replay_session(path: str, params: Optional[AvoidParams] = None) -> ReplayReport:
+    """
+    Feeds the distance samples of a recorded telemetry session (see
+    `TelemetryService`) through the avoid obstacles controller at its loop
+    rate, using the recorded drive state as the car state, and compares the
+    resulting state transitions with the recorded ones.
+
+    Raises:
+        ValueError: If the session has no distance samples.
+    """
+    params = params or AvoidParams()
+    session = load_session(path)
+    distance = np.sort(session["distance"], order="ts")
+    drive = np.sort(session["drive"], order="ts")
+    recorded = np.sort(session["avoid_state"], order="ts")
+    if not len(distance):
+        raise ValueError("The session has no distance samples")
+
+    replayed: List[Tuple[float, AvoidState]] = []
+    now = float(distance["ts"][0])
+    controller = AvoidController(
+        params, on_transition=lambda state: replayed.append((now, state))
+    )
+    controller.reset(now)
+
+    end = float(distance["ts"][-1])
+    fed = 0
+    while now <= end:
+        until = int(np.searchsorted(distance["ts"], now, side="right"))
+        if until > fed:
+            chunk = distance[fed:until]
+            controller.feed(
+                DistanceSamples(
+                    seq=chunk["seq"].astype(np.int64),
+                    ts=chunk["ts"],
+                    distance=chunk["distance"].astype(np.float64),
+                    status=chunk["status"].astype(np.int8),
+                )
+            )
+            fed = until
+        applied = int(np.searchsorted(drive["ts"], now, side="right"))
+        speed = float(drive["speed"][applied - 1]) if applied else 0.0
+        controller.step(
+            now=now,
+            dt=params.loop_period_s,
+            current_speed=abs(speed),
+            current_direction=int(np.sign(speed)),  # type: ignore[arg-type]
+        )
+        now += params.loop_period_s
+
+    start = float(distance["ts"][0])
+    recorded_names = [AvoidState(int(value)).name for value in recorded["state"]]
+    replayed_names = [state.name for _, state in replayed]
+    divergence: Optional[float] = None
+    for i in range(max(len(recorded_names), len(replayed_names))):
+        if (
+            i >= len(recorded_names)
+            or i >= len(replayed_names)
+            or recorded_names[i] != replayed_names[i]
+        ):
+            if i < len(replayed):
+                divergence = replayed[i][0] - start
+            else:
+                divergence = float(recorded["ts"][i]) - start
+            break
+
+    return ReplayReport(
+        duration_s=round(end - start, 3),
+        distance_samples=len(distance),
+        recorded_transitions=recorded_names,
+        replayed_transitions=replayed_names,
+        first_divergence_s=None if divergence is None else round(divergence, 3),
+    )
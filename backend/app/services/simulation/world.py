@@ -0,0 +1,215 @@
+import math
+from dataclasses import dataclass, field
+from typing import List, Optional, Sequence, Tuple, Union
+
+from app.util.speed import max_speed_loaded_kmh
+
+
+@dataclass(frozen=True)
+class Wall:
+    """
+    A straight obstacle from (x1, y1) to (x2, y2), in centimeters.
+    """
+
+    x1: float
+    y1: float
+    x2: float
+    y2: float
+
+    def ray_distance(self, x: float, y: float, dx: float, dy: float) -> Optional[float]:
+        ex, ey = self.x2 - self.x1, self.y2 - self.y1
+        denominator = dx * ey - dy * ex
+        if abs(denominator) < 1e-12:
+            return None
+        wx, wy = self.x1 - x, self.y1 - y
+        t = (wx * ey - wy * ex) / denominator
+        u = (wx * dy - wy * dx) / denominator
+        return t if t >= 0 and 0 <= u <= 1 else None
+
+    def clearance(self, x: float, y: float) -> float:
+        ex, ey = self.x2 - self.x1, self.y2 - self.y1
+        length_sq = ex * ex + ey * ey
+        u = (
+            0.0
+            if length_sq == 0
+            else max(
+                0.0, min(1.0, ((x - self.x1) * ex + (y - self.y1) * ey) / length_sq)
+            )
+        )
+        return math.hypot(self.x1 + u * ex - x, self.y1 + u * ey - y)
+
+
+@dataclass(frozen=True)
+class Pillar:
+    """
+    A round obstacle centered at (x, y), in centimeters.
+    """
+
+    x: float
+    y: float
+    radius: float
+
+    def ray_distance(self, x: float, y: float, dx: float, dy: float) -> Optional[float]:
+        ox, oy = x - self.x, y - self.y
+        b = ox * dx + oy * dy
+        c = ox * ox + oy * oy - self.radius * self.radius
+        discriminant = b * b - c
+        if discriminant < 0:
+            return None
+        root = math.sqrt(discriminant)
+        for t in (-b - root, -b + root):
+            if t >= 0:
+                return t
+        return None
+
+    def clearance(self, x: float, y: float) -> float:
+        return max(0.0, math.hypot(x - self.x, y - self.y) - self.radius)
+
+
+Obstacle = Union[Wall, Pillar]
+
+
+@dataclass
+class SimWorld:
+    """
+    A flat floor with obstacles.
+    """
+
+    obstacles: List[Obstacle] = field(default_factory=list)
+
+    def raycast(
+        self,
+        x: float,
+        y: float,
+        heading: float,
+        max_range: float,
+        beam_angle: float = 0.0,
+        rays: int = 1,
+    ) -> float:
+        """
+        Returns the distance to the nearest obstacle within a beam of
+        `beam_angle` radians centered on `heading`, or `math.inf` if there is
+        none within `max_range`.
+        """
+        nearest = math.inf
+        for i in range(rays):
+            offset = 0.0 if rays == 1 else beam_angle * (i / (rays - 1) - 0.5)
+            dx, dy = math.cos(heading + offset), math.sin(heading + offset)
+            for obstacle in self.obstacles:
+                distance = obstacle.ray_distance(x, y, dx, dy)
+                if distance is not None and distance < nearest:
+                    nearest = distance
+        return nearest if nearest <= max_range else math.inf
+
+    def clearance(self, x: float, y: float) -> float:
+        """
+        Returns the distance from a point to the nearest obstacle.
+        """
+        return min(
+            (obstacle.clearance(x, y) for obstacle in self.obstacles),
+            default=math.inf,
+        )
+
+
+def _default_max_speed_cm_s() -> float:
+    return (
+        max_speed_loaded_kmh(
+            mass_kg=0.9,
+            wheel_diameter_mm=65,
+            stall_torque_kgcm=0.8,
+            rpm_no_load_ref=170,
+            voltage=6.0,
+            ref_voltage=3.6,
+        )
+        / 3.6
+        * 100
+    )
+
+
+@dataclass(frozen=True)
+class CarModel:
+    """
+    Physical parameters of the simulated car.
+
+    The motors respond to a new speed as a first-order lag with the time
+    constant `motor_time_constant_s`; 100% speed corresponds to
+    `max_speed_cm_s`.
+    """
+
+    wheelbase_cm: float = 9.5
+    radius_cm: float = 10.0
+    sensor_offset_cm: float = 12.0
+    max_speed_cm_s: float = field(default_factory=_default_max_speed_cm_s)
+    motor_time_constant_s: float = 0.15
+
+
+@dataclass
+class SimCar:
+    """
+    Kinematic bicycle model of the car. Angles are in radians, except the
+    steering angle, which is in degrees like the steering servo; positive
+    angles turn right.
+    """
+
+    model: CarModel
+    x: float = 0.0
+    y: float = 0.0
+    heading: float = 0.0
+    velocity: float = 0.0
+    speed: int = 0
+    direction: int = 0
+    steering: float = 0.0
+    odometer: float = 0.0
+    blocked: bool = False
+    collisions: int = 0
+
+    @property
+    def sensor_pose(self) -> Tuple[float, float, float]:
+        offset = self.model.sensor_offset_cm
+        return (
+            self.x + offset * math.cos(self.heading),
+            self.y + offset * math.sin(self.heading),
+            self.heading,
+        )
+
+    def advance(self, dt: float, world: SimWorld) -> None:
+        """
+        Moves the car by `dt` seconds. A car that would hit an obstacle stops
+        in place, which counts as a collision.
+        """
+        target = self.direction * self.speed / 100 * self.model.max_speed_cm_s
+        tau = self.model.motor_time_constant_s
+        blend = 1.0 - math.exp(-dt / tau) if tau > 0 else 1.0
+        self.velocity += (target - self.velocity) * blend
+
+        heading = self.heading - (
+            self.velocity
+            / self.model.wheelbase_cm
+            * math.tan(math.radians(self.steering))
+            * dt
+        )
+        x = self.x + self.velocity * math.cos(heading) * dt
+        y = self.y + self.velocity * math.sin(heading) * dt
+        if world.clearance(x, y) < self.model.radius_cm:
+            self.collisions += 0 if self.blocked else 1
+            self.blocked = True
+            self.velocity = 0.0
+            return
+        self.blocked = False
+        self.odometer += abs(self.velocity) * dt
+        self.x, self.y, self.heading = x, y, heading
+
+
+def room(width: float, height: float) -> List[Obstacle]:
+    """
+    Returns the walls of a rectangular room with a corner at the origin.
+    """
+    corners: Sequence[Tuple[float, float]] = (
+        (0, 0),
+        (width, 0),
+        (width, height),
+        (0, height),
+    )
+    return [
+        Wall(*corners[i], *corners[(i + 1) % len(corners)]) for i in range(len(corners))
+    ]
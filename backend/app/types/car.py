@@ -20,9 +20,11 @@ class CarServiceState(PicarBaseState):
     camTilt: float
     maxSpeed: Union[int, None]
     avoidObstacles: bool
+    followTarget: bool
     distance: float
     autoMeasureDistanceMode: Union[bool, None]
     ledBlinking: bool
+    commandLatency: Union[float, None]
 
 
 class CarServiceBroadcastPayload(TypedDict):
@@ -4,6 +4,7 @@ import numpy as np
 from typing_extensions import NotRequired
 
 DetectionProcessCommand = Literal["set_detect_mode"]
+DetectionWorkerCommandName = Literal["load_model", "shutdown"]
 SegmentationDetail = Literal["fast", "balanced", "detailed"]
 
 
@@ -42,6 +43,16 @@ class DetectionControlMessage(TypedDict):
     command: DetectionProcessCommand
 
 
+class DetectionWorkerCommand(TypedDict):
+    """
+    Represents a command to the idle detection worker: load a model and start
+    detection with it, or exit.
+    """
+
+    command: DetectionWorkerCommandName
+    model: NotRequired[str]
+
+
 class DetectionKeypoint(TypedDict):
     """
     Represents a keypoint in an object detection result.
@@ -0,0 +1,104 @@
+import os
+import shutil
+import threading
+from typing import List, Optional, Tuple
+
+from app.core.logger import Logger
+
+_log = Logger(name=__name__)
+
+
+class LRUDiskCache:
+    """
+    Keeps the files of a cache directory within a size budget.
+
+    Files are ranked by their modification time, so the owner of the cache
+    touches a file whenever it serves it. When the budget is exceeded, the least
+    recently used files are removed until the cache fits in
+    `EVICTION_TARGET_RATIO` of the budget.
+    """
+
+    EVICTION_TARGET_RATIO = 0.9
+
+    def __init__(self, cache_dir: str, max_cache_bytes: int, name: str) -> None:
+        """
+        Args:
+            cache_dir: The directory of the cache files.
+            max_cache_bytes: The size budget of the cache.
+            name: The name of the cache used in log messages, e.g. "thumbnail".
+        """
+        self.cache_dir = cache_dir
+        self.max_cache_bytes = max_cache_bytes
+        self.name = name
+        self._lock = threading.Lock()
+        self._cache_bytes: Optional[int] = None
+
+    @staticmethod
+    def touch(path: str) -> None:
+        """
+        Marks the file as recently used.
+        """
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+
+    def account(self, added_bytes: int) -> None:
+        """
+        Records that the cache grew by `added_bytes` and evicts files if it no
+        longer fits in the budget.
+        """
+        with self._lock:
+            if self._cache_bytes is None:
+                self._cache_bytes = sum(size for _, size, _ in self._list_cached())
+            else:
+                self._cache_bytes += added_bytes
+
+            if self._cache_bytes > self.max_cache_bytes:
+                self._cache_bytes = self._evict()
+
+    def clear(self) -> None:
+        with self._lock:
+            shutil.rmtree(self.cache_dir, ignore_errors=True)
+            self._cache_bytes = 0
+
+    def _list_cached(self) -> List[Tuple[float, int, str]]:
+        entries: List[Tuple[float, int, str]] = []
+        for dirpath, _, filenames in os.walk(self.cache_dir):
+            for name in filenames:
+                path = os.path.join(dirpath, name)
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, path))
+        return entries
+
+    def _evict(self) -> int:
+        """
+        Removes the least recently used files until the cache fits in the
+        eviction target, returning the remaining cache size.
+        """
+        entries = sorted(self._list_cached())
+        total = sum(size for _, size, _ in entries)
+        target = self.max_cache_bytes * self.EVICTION_TARGET_RATIO
+        removed = 0
+        for _, size, path in entries:
+            if total <= target:
+                break
+            try:
+                os.remove(path)
+                total -= size
+                removed += 1
+            except OSError as e:
+                _log.warning(
+                    "Failed to evict %s cache file '%s': %s", self.name, path, e
+                )
+
+        _log.info(
+            "Evicted %d %s cache files, cache size is %d bytes",
+            removed,
+            self.name,
+            total,
+        )
+        return total
@@ -0,0 +1,146 @@
+import asyncio
+import threading
+from typing import Generic, List, Optional, Set, TypeVar
+
+from app.core.logger import Logger
+
+_log = Logger(name=__name__)
+
+T = TypeVar("T")
+
+
+class RingBroadcaster(Generic[T]):
+    """
+    Single-producer, multi-subscriber ring buffer.
+
+    The producer may publish from any thread (e.g. an audio driver callback).
+    Each item is stored once, and every subscriber reads it from its own cursor,
+    so subscribers do not compete for items. Subscribers waiting for data are
+    woken up on their event loop via `call_soon_threadsafe`.
+
+    A subscriber that falls behind by more than `capacity` items skips ahead
+    to the oldest item still in the buffer instead of blocking the producer.
+    """
+
+    def __init__(self, capacity: int) -> None:
+        if capacity < 1:
+            raise ValueError("Capacity must be positive")
+        self.capacity = capacity
+        self._buffer: List[Optional[T]] = [None] * capacity
+        self._head = 0
+        self._closed = False
+        self._lock = threading.Lock()
+        self._waiting: Set["RingSubscription[T]"] = set()
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    def publish(self, item: T) -> None:
+        """
+        Appends an item, overwriting the oldest one if the buffer is full.
+        """
+        with self._lock:
+            if self._closed:
+                return
+            self._buffer[self._head % self.capacity] = item
+            self._head += 1
+            waiting = self._waiting
+            self._waiting = set()
+
+        for subscription in waiting:
+            subscription._wakeup()
+
+    def subscribe(self) -> "RingSubscription[T]":
+        """
+        Returns a subscription that receives items published from now on.
+
+        Must be called from the event loop the subscription will be read on.
+        """
+        with self._lock:
+            return RingSubscription(self, asyncio.get_running_loop(), self._head)
+
+    def close(self) -> None:
+        """
+        Stops the broadcaster. Subscribers receive the remaining items and then
+        stop iterating.
+        """
+        with self._lock:
+            self._closed = True
+            waiting = self._waiting
+            self._waiting = set()
+
+        for subscription in waiting:
+            subscription._wakeup()
+
+
+class RingSubscription(Generic[T]):
+    """
+    A reader of `RingBroadcaster` with its own cursor.
+    """
+
+    def __init__(
+        self,
+        broadcaster: RingBroadcaster[T],
+        loop: asyncio.AbstractEventLoop,
+        cursor: int,
+    ) -> None:
+        self._broadcaster = broadcaster
+        self._loop = loop
+        self._cursor = cursor
+        self._event = asyncio.Event()
+        self.skipped = 0
+
+    def _wakeup(self) -> None:
+        try:
+            self._loop.call_soon_threadsafe(self._event.set)
+        except RuntimeError:
+            # The subscriber's loop is already closed.
+            pass
+
+    def _next_nowait(self) -> Optional[T]:
+        """
+        Returns the next item, or None if there is none yet. Must be called
+        with the broadcaster lock held.
+        """
+        broadcaster = self._broadcaster
+        if self._cursor >= broadcaster._head:
+            return None
+
+        lag = broadcaster._head - self._cursor
+        if lag > broadcaster.capacity:
+            skipped = lag - broadcaster.capacity
+            self.skipped += skipped
+            self._cursor += skipped
+
+        item = broadcaster._buffer[self._cursor % broadcaster.capacity]
+        self._cursor += 1
+        return item
+
+    async def get(self) -> Optional[T]:
+        """
+        Waits for the next item. Returns None once the broadcaster is closed
+        and there are no items left.
+        """
+        broadcaster = self._broadcaster
+        while True:
+            with broadcaster._lock:
+                item = self._next_nowait()
+                if item is not None:
+                    return item
+                if broadcaster._closed:
+                    return None
+                self._event.clear()
+                broadcaster._waiting.add(self)
+            await self._event.wait()
+
+    def __aiter__(self) -> "RingSubscription[T]":
+        return self
+
+    async def __anext__(self) -> T:
+        item = await self.get()
+        if item is None:
+            if self.skipped:
+                _log.debug("Subscriber skipped %d items", self.skipped)
+            raise StopAsyncIteration
+        return item
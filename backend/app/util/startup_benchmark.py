@@ -0,0 +1,225 @@
+"""
+Measures how long the server entry points take to import, using
+`python -X importtime` in fresh interpreters, and checks them against their
+import budget. Exits with status 1 if a budget is exceeded.
+
+Usage:
+    python -m app.util.startup_benchmark
+    python -m app.util.startup_benchmark --runs 5 --top 15
+"""
+
+import argparse
+import json
+import os
+import re
+import statistics
+import subprocess
+import sys
+from dataclasses import dataclass
+from typing import Any, Dict, FrozenSet, List, Optional, Sequence, Tuple
+
+BACKEND_DIR = os.path.dirname(
+    os.path.dirname(os.path.dirname(os.path.realpath(__file__)))
+)
+
+BASELINE_MODULE = "fastapi"
+"""
+The import time of the budgets is relative to the import time of FastAPI in
+the same environment, so that one budget holds on both a desktop and a
+Raspberry Pi.
+"""
+
+_IMPORTTIME_LINE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)\s*$")
+
+
+@dataclass(frozen=True)
+class ImportRecord:
+    """
+    One line of the `-X importtime` output. Times are in microseconds.
+    """
+
+    module: str
+    self_us: int
+    cumulative_us: int
+    depth: int
+
+
+@dataclass(frozen=True)
+class ImportMeasurement:
+    module: str
+    cumulative_us: int
+    """The median import time of the module over the runs."""
+    records: Tuple[ImportRecord, ...]
+    """The modules imported by the median run."""
+
+    @property
+    def loaded(self) -> FrozenSet[str]:
+        return frozenset(record.module for record in self.records)
+
+    def heaviest(self, n: int) -> List[ImportRecord]:
+        """
+        Returns the `n` modules with the longest own import time.
+        """
+        return sorted(self.records, key=lambda r: r.self_us, reverse=True)[:n]
+
+
+@dataclass(frozen=True)
+class ImportBudget:
+    module: str
+    max_ratio: float
+    """The maximum import time as a multiple of the baseline import time."""
+    forbidden: Tuple[str, ...]
+    """Modules that must be imported on first use rather than at startup."""
+
+    def violations(
+        self, measurement: ImportMeasurement, baseline_us: Optional[int] = None
+    ) -> List[str]:
+        """
+        Returns a description of each way the measurement exceeds the budget.
+        The time is not checked if `baseline_us` is None.
+        """
+        result = [
+            f"{self.module} imports {name} at startup"
+            for name in self.forbidden
+            if name in measurement.loaded
+        ]
+        if baseline_us:
+            ratio = measurement.cumulative_us / baseline_us
+            if ratio > self.max_ratio:
+                result.append(
+                    f"{self.module} takes {ratio:.2f}x the {BASELINE_MODULE} import "
+                    f"time, the budget is {self.max_ratio:.2f}x"
+                )
+        return result
+
+
+_MEDIA_MODULES = ("sounddevice", "miniaudio", "pydub", "gspeech")
+
+IMPORT_BUDGETS: Tuple[ImportBudget, ...] = (
+    ImportBudget(
+        module="app.control_server",
+        max_ratio=2.8,
+        forbidden=("cv2", "httpx") + _MEDIA_MODULES,
+    ),
+    ImportBudget(
+        module="app.main_server",
+        max_ratio=2.9,
+        forbidden=("cv2", "numpy", "httpx") + _MEDIA_MODULES,
+    ),
+)
+
+
+def parse_importtime(output: str) -> List[ImportRecord]:
+    """
+    Parses the `-X importtime` output written to stderr; other lines are
+    skipped.
+    """
+    records: List[ImportRecord] = []
+    for line in output.splitlines():
+        match = _IMPORTTIME_LINE.match(line)
+        if match:
+            self_us, cumulative_us, indent, module = match.groups()
+            records.append(
+                ImportRecord(
+                    module=module,
+                    self_us=int(self_us),
+                    cumulative_us=int(cumulative_us),
+                    depth=(len(indent) - 1) // 2,
+                )
+            )
+    return records
+
+
+def import_once(module: str) -> List[ImportRecord]:
+    """
+    Imports the module in a fresh interpreter and returns its import records.
+
+    Raises:
+        RuntimeError: If the module could not be imported.
+    """
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=BACKEND_DIR,
+        capture_output=True,
+        text=True,
+    )
+    if proc.returncode != 0:
+        raise RuntimeError(f"Failed to import {module}:\n{proc.stderr[-2000:]}")
+    return parse_importtime(proc.stderr)
+
+
+def measure_import(module: str, runs: int = 3) -> ImportMeasurement:
+    """
+    Imports the module `runs` times and returns the median run.
+    """
+    measured: List[Tuple[int, List[ImportRecord]]] = []
+    for _ in range(max(1, runs)):
+        records = import_once(module)
+        total = next(r.cumulative_us for r in records if r.module == module)
+        measured.append((total, records))
+    measured.sort(key=lambda item: item[0])
+    _, records = measured[len(measured) // 2]
+    return ImportMeasurement(
+        module=module,
+        cumulative_us=int(statistics.median(t for t, _ in measured)),
+        records=tuple(records),
+    )
+
+
+def benchmark(
+    budgets: Sequence[ImportBudget] = IMPORT_BUDGETS, runs: int = 3, top: int = 10
+) -> Dict[str, Any]:
+    """
+    Measures the baseline and every budgeted module, and reports their import
+    times, heaviest modules and budget violations.
+    """
+    baseline = measure_import(BASELINE_MODULE, runs)
+    report: Dict[str, Any] = {
+        "baseline": {
+            "module": BASELINE_MODULE,
+            "import_ms": round(baseline.cumulative_us / 1000, 1),
+        },
+        "modules": [],
+        "violations": [],
+    }
+    for budget in budgets:
+        measurement = measure_import(budget.module, runs)
+        report["modules"].append(
+            {
+                "module": budget.module,
+                "import_ms": round(measurement.cumulative_us / 1000, 1),
+                "ratio": round(measurement.cumulative_us / baseline.cumulative_us, 2),
+                "max_ratio": budget.max_ratio,
+                "heaviest_ms": {
+                    record.module: round(record.self_us / 1000, 1)
+                    for record in measurement.heaviest(top)
+                },
+            }
+        )
+        report["violations"].extend(
+            budget.violations(measurement, baseline.cumulative_us)
+        )
+    return report
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m app.util.startup_benchmark", description=__doc__
+    )
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument(
+        "--top",
+        type=int,
+        default=10,
+        help="How many of the slowest modules to list for each entry point.",
+    )
+    args = parser.parse_args(argv)
+
+    report = benchmark(runs=args.runs, top=args.top)
+    json.dump(report, sys.stdout, indent=2)
+    sys.stdout.write("\n")
+    return 1 if report["violations"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
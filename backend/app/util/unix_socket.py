@@ -0,0 +1,39 @@
+import os
+import socket
+from typing import Optional
+
+
+def unix_sockets_supported() -> bool:
+    return hasattr(socket, "AF_UNIX")
+
+
+def bind_unix_socket(path: str, backlog: int = 128) -> socket.socket:
+    """
+    Returns a listening Unix domain socket bound to `path`.
+
+    A stale socket file left by a previous process is replaced. The socket is
+    only accessible to the current user.
+    """
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    remove_unix_socket(path)
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.bind(path)
+        os.chmod(path, 0o600)
+        sock.listen(backlog)
+    except BaseException:
+        sock.close()
+        raise
+    sock.set_inheritable(True)
+    return sock
+
+
+def remove_unix_socket(path: Optional[str]) -> None:
+    if not path:
+        return
+    try:
+        os.unlink(path)
+    except FileNotFoundError:
+        pass
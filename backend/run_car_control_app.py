@@ -1,17 +1,56 @@
-from typing import Union
+from typing import List, Optional, Union
 
 import uvicorn
 
 
-def start_control_app(port: Union[str, int], log_level: str) -> None:
-    uvicorn_config = {
-        "app": "app.control_server:app",
-        "host": "0.0.0.0",
-        "port": port if isinstance(port, int) else int(port),
-        "log_level": log_level.lower(),
-    }
+class ControlAppServer(uvicorn.Server):
+    """
+    Ends the IPC event streams as soon as the server starts shutting down,
+    since uvicorn would otherwise wait for them like for unfinished requests.
+    """
 
-    uvicorn.run(**uvicorn_config)
+    async def shutdown(self, sockets: Optional[List] = None) -> None:
+        from app.api.robot_deps import get_ipc_event_service
+
+        get_ipc_event_service().close()
+        await super().shutdown(sockets=sockets)
+
+
+def start_control_app(
+    port: Union[str, int], log_level: str, socket_path: Optional[str] = None
+) -> None:
+    """
+    Runs the control app on the TCP `port` and, unless disabled, on the Unix
+    domain socket the main app connects to (`PX_CONTROL_APP_SOCKET` by
+    default).
+    """
+    from app.config.config import settings
+    from app.util.unix_socket import (
+        bind_unix_socket,
+        remove_unix_socket,
+        unix_sockets_supported,
+    )
+
+    config = uvicorn.Config(
+        app="app.control_server:app",
+        host="0.0.0.0",
+        port=port if isinstance(port, int) else int(port),
+        log_level=log_level.lower(),
+    )
+    if socket_path is None:
+        socket_path = settings.PX_CONTROL_APP_SOCKET
+    if not unix_sockets_supported():
+        socket_path = None
+
+    sockets = [config.bind_socket()]
+    if socket_path:
+        sockets.append(bind_unix_socket(socket_path))
+    try:
+        ControlAppServer(config).run(sockets=sockets)
+    finally:
+        for sock in sockets:
+            sock.close()
+        remove_unix_socket(socket_path)
 
 
 def main() -> None:
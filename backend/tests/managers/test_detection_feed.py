@@ -0,0 +1,107 @@
+import os
+import tempfile
+import unittest
+
+from app.managers.detection_feed import DetectionFeedReader, DetectionFeedWriter
+
+
+def result(*detections: dict, timestamp: float = 100.0) -> dict:
+    return {
+        "detection_result": list(detections),
+        "timestamp": timestamp,
+        "fps": None,
+        "loading": False,
+    }
+
+
+PERSON = {"bbox": [10, 20, 110, 220], "label": "person", "confidence": 0.9}
+
+
+class TestDetectionFeed(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.path = os.path.join(self.tmp.name, "feed", "detections.feed")
+
+    def make_writer(self, **kwargs) -> DetectionFeedWriter:
+        writer = DetectionFeedWriter(self.path, **kwargs)
+        self.addCleanup(writer.close)
+        return writer
+
+    def make_reader(self) -> DetectionFeedReader:
+        reader = DetectionFeedReader(self.path, recheck_s=0)
+        self.addCleanup(reader.close)
+        return reader
+
+    def test_reader_sees_the_latest_result(self) -> None:
+        writer = self.make_writer()
+        reader = self.make_reader()
+
+        writer.publish(result(PERSON), frame_width=640, frame_height=480)
+        seq = writer.publish(
+            result({**PERSON, "track_id": 7}, timestamp=101.0), 640, 480
+        )
+        frame = reader.read()
+
+        assert frame is not None
+        self.assertEqual(frame.seq, seq)
+        self.assertEqual(frame.timestamp, 101.0)
+        self.assertEqual((frame.frame_width, frame.frame_height), (640, 480))
+        self.assertEqual(len(frame.detections), 1)
+        detection = frame.detections[0]
+        self.assertEqual(detection.bbox, (10, 20, 110, 220))
+        self.assertEqual(detection.label, "person")
+        self.assertAlmostEqual(detection.confidence, 0.9, places=5)
+        self.assertEqual(detection.track_id, 7)
+        self.assertEqual(detection.center, (60, 120))
+
+    def test_missing_feed_reads_nothing(self) -> None:
+        reader = self.make_reader()
+
+        self.assertIsNone(reader.read())
+        self.assertEqual(reader.seq, 0)
+
+        self.make_writer().publish(result(PERSON))
+
+        self.assertEqual(reader.seq, 0)
+        self.assertIsNotNone(reader.read())
+
+    def test_read_new_returns_each_result_once(self) -> None:
+        writer = self.make_writer()
+        reader = self.make_reader()
+        seq = writer.publish(result(PERSON))
+
+        frame = reader.read_new(0)
+
+        assert frame is not None
+        self.assertEqual(frame.seq, seq)
+        self.assertIsNone(reader.read_new(frame.seq))
+
+    def test_restarted_writer_continues_the_sequence(self) -> None:
+        writer = self.make_writer()
+        reader = self.make_reader()
+        writer.publish(result(PERSON))
+        last_seq = writer.publish(result())
+        writer.close()
+
+        restarted = self.make_writer()
+        seq = restarted.publish(result(PERSON))
+        frame = reader.read_new(last_seq)
+
+        self.assertEqual(seq, last_seq + 1)
+        assert frame is not None
+        self.assertEqual(frame.seq, seq)
+
+    def test_extra_detections_are_dropped(self) -> None:
+        writer = self.make_writer(max_detections=2)
+        reader = self.make_reader()
+
+        writer.publish(result(PERSON, PERSON, PERSON))
+        frame = reader.read()
+
+        assert frame is not None
+        self.assertEqual(len(frame.detections), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,6 +1,15 @@
+import queue
+import threading
 import unittest
+from typing import List
+from unittest.mock import patch
 
-from app.managers.detection.detection_process import model_labels
+from app.managers.detection.detection_process import (
+    detection_worker_func,
+    model_labels,
+)
+
+MODULE = "app.managers.detection.detection_process"
 
 
 class TestDetectionProcessMetadata(unittest.TestCase):
@@ -15,5 +24,87 @@ class TestDetectionProcessMetadata(unittest.TestCase):
         self.assertEqual(model_labels(model), ["person", "car"])
 
 
+class TestDetectionWorker(unittest.TestCase):
+    def setUp(self) -> None:
+        self.stop_event = threading.Event()
+        self.idle_event = threading.Event()
+        self.control_queue: queue.Queue = queue.Queue(maxsize=1)
+        self.out_queue: queue.Queue = queue.Queue()
+        self.loaded: List[str] = []
+        self.detecting = threading.Event()
+        self.preload_calls = 0
+
+        def fake_preload():
+            self.preload_calls += 1
+            return None
+
+        patcher = patch(f"{MODULE}.preload_detection_libraries", fake_preload)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def fake_detection(self, model: str, stop_event, *_args) -> None:
+        self.loaded.append(model)
+        self.detecting.set()
+        stop_event.wait(5)
+        self.detecting.clear()
+
+    def start_worker(self) -> threading.Thread:
+        thread = threading.Thread(
+            target=detection_worker_func,
+            args=(
+                self.stop_event,
+                self.idle_event,
+                queue.Queue(),
+                queue.Queue(),
+                self.control_queue,
+                self.out_queue,
+            ),
+            daemon=True,
+        )
+        thread.start()
+        self.assertTrue(self.idle_event.wait(5))
+        return thread
+
+    def load(self, model: str) -> None:
+        self.idle_event.clear()
+        self.control_queue.put({"command": "load_model", "model": model})
+
+    def shutdown(self, thread: threading.Thread) -> None:
+        self.control_queue.put({"command": "shutdown"})
+        thread.join(5)
+        self.assertFalse(thread.is_alive())
+
+    def test_loads_models_until_shutdown(self) -> None:
+        with patch(f"{MODULE}.detection_process_func", self.fake_detection):
+            thread = self.start_worker()
+            for model in ("a.pt", "b.pt"):
+                self.load(model)
+                self.assertTrue(self.detecting.wait(5))
+                self.assertFalse(self.idle_event.is_set())
+                self.stop_event.set()
+                self.assertTrue(self.idle_event.wait(5))
+                self.stop_event.clear()
+                self.control_queue.put({"command": "set_detect_mode"})
+            self.shutdown(thread)
+
+        self.assertEqual(self.loaded, ["a.pt", "b.pt"])
+        self.assertEqual(self.preload_calls, 1)
+
+    def test_reports_models_that_fail_to_load_and_stays_idle(self) -> None:
+        def failing_detection(model: str, *_args) -> None:
+            raise ModuleNotFoundError("No module named 'ultralytics'")
+
+        with patch(f"{MODULE}.detection_process_func", failing_detection):
+            thread = self.start_worker()
+            self.load("a.pt")
+            message = self.out_queue.get(timeout=5)
+
+            self.assertFalse(message["success"])
+            self.assertIn("a.pt", message["error"])
+            self.assertTrue(self.idle_event.wait(5))
+            self.assertTrue(thread.is_alive())
+            self.shutdown(thread)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -1,11 +1,12 @@
 import os
 import unittest
 import warnings
-from multiprocessing.sharedctypes import Synchronized
 from multiprocessing.synchronize import Event
 from typing import TYPE_CHECKING, cast
 from unittest.mock import patch
 
+from app.managers.distance_ring import DistanceRing
+
 if TYPE_CHECKING:
     from robot_hat import Pin
 
@@ -25,16 +26,6 @@ class DummyEvent:
         return self._calls > self._calls_before_set
 
 
-class DummySynchronized:
-    """
-    A dummy “shared value” container. In production this might be a
-    multiprocessing.Value or other synchronized object.
-    """
-
-    def __init__(self, value: float = 0.0):
-        self.value = value
-
-
 class FakeUltrasonicValid:
     """
     Fake ultrasonic sensor that returns a valid float value.
@@ -76,7 +67,7 @@ class TestDistanceProcess(unittest.TestCase):
         self.trig_pin = "D2"
         self.echo_pin = "D3"
         self.stop_event = DummyEvent(calls_before_set=1)
-        self.shared_value = DummySynchronized(0.0)
+        self.ring = DistanceRing(capacity=8)
         self.patched_env = {
             **dict(os.environ),
             "ROBOT_HAT_MOCK_SMBUS": "1",
@@ -87,7 +78,7 @@ class TestDistanceProcess(unittest.TestCase):
     @patch("app.managers.distance_manager.Ultrasonic", new=FakeUltrasonicValid)
     def test_valid_read(self):
         """
-        Test that with a valid sensor reading the synchronized value updates.
+        Test that with a valid sensor reading a sample is written to the ring.
         """
 
         with patch.dict(os.environ, self.patched_env):
@@ -99,12 +90,14 @@ class TestDistanceProcess(unittest.TestCase):
                     trig_pin=self.trig_pin,
                     echo_pin=self.echo_pin,
                     stop_event=cast(Event, self.stop_event),
-                    value=cast(Synchronized, self.shared_value),
+                    ring=self.ring,
                     interval=0.001,
                     timeout=0.017,
                 )
+                latest = self.ring.latest()
+                assert latest is not None
                 self.assertEqual(
-                    self.shared_value.value, FakeUltrasonicValid.mock_read_result
+                    latest.distance[-1], FakeUltrasonicValid.mock_read_result
                 )
                 mock_logger_info.assert_called_once()
 
@@ -124,20 +117,20 @@ class TestDistanceProcess(unittest.TestCase):
                     trig_pin=self.trig_pin,
                     echo_pin=self.echo_pin,
                     stop_event=cast(Event, self.stop_event),
-                    value=cast(Synchronized, self.shared_value),
+                    ring=self.ring,
                     interval=0.001,
                     timeout=0.017,
                 )
 
             mock_logger_error.assert_called_once()
-            self.assertEqual(self.shared_value.value, 0.0)
+            self.assertEqual(self.ring.head, 0)
 
     @patch("app.managers.distance_manager.sleep", lambda interval: None)
     @patch("app.managers.distance_manager.Ultrasonic", new=FakeUltrasonicValid)
     def test_stop_event_prevents_loop(self):
         """
         Test that if the stop_event is already set, the sensor loop is never executed
-        and the shared value remains unchanged.
+        and no sample is written.
         """
         from app.core.logger import Logger
 
@@ -154,12 +147,12 @@ class TestDistanceProcess(unittest.TestCase):
                     trig_pin=self.trig_pin,
                     echo_pin=self.echo_pin,
                     stop_event=cast(Event, always_set_event),
-                    value=cast(Synchronized, self.shared_value),
+                    ring=self.ring,
                     interval=0.001,
                     timeout=0.017,
                 )
                 mock_logger_info.assert_called_once()
-                self.assertEqual(self.shared_value.value, 0.0)
+                self.assertEqual(self.ring.head, 0)
 
 
 if __name__ == "__main__":
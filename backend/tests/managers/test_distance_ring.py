@@ -0,0 +1,111 @@
+import multiprocessing as mp
+import unittest
+
+import numpy as np
+
+from app.managers.distance_ring import (
+    DistanceRing,
+    DistanceSamples,
+    DistanceStatus,
+    estimate_velocity,
+    median_distance,
+    reject_outliers,
+)
+
+
+def write_samples(ring: DistanceRing, count: int) -> None:
+    for i in range(count):
+        ring.append(float(i), ts=float(i))
+
+
+def samples(distances, ts=None, status=None) -> DistanceSamples:
+    count = len(distances)
+    return DistanceSamples(
+        seq=np.arange(1, count + 1),
+        ts=np.asarray(ts if ts is not None else range(count), dtype=np.float64),
+        distance=np.asarray(distances, dtype=np.float64),
+        status=np.asarray(status if status is not None else [0] * count),
+    )
+
+
+class TestDistanceRing(unittest.TestCase):
+    def test_reader_sees_every_sample_once(self):
+        ring = DistanceRing(capacity=8)
+        ring.append(10.0, ts=1.0)
+        ring.append(-1, DistanceStatus.from_reading(-1), ts=2.0)
+
+        first = ring.read_since(0)
+        ring.append(12.0, ts=3.0)
+        second = ring.read_since(first.last_seq or 0)
+
+        self.assertEqual(first.distance.tolist(), [10.0, -1.0])
+        self.assertEqual(first.status.tolist(), [0, DistanceStatus.TIMEOUT])
+        self.assertEqual(second.seq.tolist(), [3])
+        self.assertEqual(len(ring.read_since(3)), 0)
+
+    def test_reader_behind_by_more_than_capacity_skips_overwritten(self):
+        ring = DistanceRing(capacity=4)
+        write_samples(ring, 10)
+
+        result = ring.read_since(2)
+
+        self.assertEqual(result.seq.tolist(), [7, 8, 9, 10])
+        self.assertEqual(result.distance.tolist(), [6.0, 7.0, 8.0, 9.0])
+
+    def test_reader_ahead_of_a_reset_ring_reads_from_the_start(self):
+        ring = DistanceRing(capacity=8)
+        write_samples(ring, 5)
+        cursor = ring.read_since(0).last_seq or 0
+
+        ring.reset()
+        write_samples(ring, 2)
+
+        self.assertEqual(ring.read_since(cursor).seq.tolist(), [1, 2])
+
+    def test_window_and_latest(self):
+        ring = DistanceRing(capacity=8)
+        write_samples(ring, 5)
+
+        self.assertEqual(ring.window(1.5, now=4.0).distance.tolist(), [3.0, 4.0])
+        latest = ring.latest()
+        assert latest is not None
+        self.assertEqual(latest.distance.tolist(), [4.0])
+
+        ring.reset()
+        self.assertIsNone(ring.latest())
+
+    def test_samples_are_shared_with_a_child_process(self):
+        ring = DistanceRing(capacity=16)
+        process = mp.get_context("spawn").Process(target=write_samples, args=(ring, 3))
+        process.start()
+        process.join(10)
+
+        self.assertEqual(ring.read_since(0).distance.tolist(), [0.0, 1.0, 2.0])
+
+
+class TestDistanceStatistics(unittest.TestCase):
+    def test_rejects_outliers(self):
+        mask = reject_outliers(np.array([50.0, 51.0, 49.0, 50.5, 300.0]))
+
+        self.assertEqual(mask.tolist(), [True, True, True, True, False])
+
+    def test_median_ignores_failed_readings_and_outliers(self):
+        result = median_distance(
+            samples([40.0, -1.0, 42.0, 41.0, 400.0], status=[0, 1, 0, 0, 0])
+        )
+
+        self.assertEqual(result, 41.0)
+        self.assertIsNone(median_distance(samples([-1.0], status=[1])))
+
+    def test_estimates_approach_velocity(self):
+        velocity = estimate_velocity(
+            samples([100.0, 90.0, 80.0, 70.0], ts=[0.0, 0.5, 1.0, 1.5])
+        )
+
+        assert velocity is not None
+        self.assertAlmostEqual(velocity, -20.0)
+        self.assertIsNone(estimate_velocity(samples([100.0])))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,129 @@
+import json
+import os
+import sqlite3
+import tempfile
+import unittest
+from dataclasses import dataclass
+from typing import Optional
+
+from app.managers.file_management.file_cache import CacheEntry, CacheManager
+
+
+@dataclass
+class Details:
+    duration: Optional[float]
+    order: Optional[int] = None
+
+
+def details_factory(data) -> Details:
+    return Details(duration=data.get("duration"), order=data.get("order"))
+
+
+class TestCacheManager(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.cache_file = os.path.join(self.temp_dir.name, "cache", "metadata.db")
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def make_manager(self, **kwargs) -> CacheManager[Details]:
+        manager = CacheManager(self.cache_file, details_factory, **kwargs)
+        self.addCleanup(manager.close)
+        return manager
+
+    def rows(self):
+        with sqlite3.connect(self.cache_file) as conn:
+            return {
+                row[0]: row[1:]
+                for row in conn.execute(
+                    "SELECT path, modified_time, size, details FROM entries"
+                )
+            }
+
+    def test_entries_persist_between_instances(self):
+        manager = self.make_manager()
+        cache = manager.get_cache()
+        cache["a.mp3"] = CacheEntry(
+            modified_time=1.0, size=10, details=Details(duration=2.5)
+        )
+        manager.maybe_save()
+
+        reloaded = self.make_manager().get_cache()
+
+        self.assertEqual(reloaded["a.mp3"].modified_time, 1.0)
+        self.assertEqual(reloaded["a.mp3"].size, 10)
+        self.assertEqual(reloaded["a.mp3"].details, Details(duration=2.5))
+
+    def test_only_changed_entries_are_written(self):
+        manager = self.make_manager()
+        cache = manager.get_cache()
+        for i in range(3):
+            cache[f"{i}.mp3"] = CacheEntry(modified_time=i, details=Details(None))
+        manager.maybe_save()
+
+        with sqlite3.connect(self.cache_file) as conn:
+            conn.execute("UPDATE entries SET modified_time = 99 WHERE path = '0.mp3'")
+
+        cache["1.mp3"].details.order = 5
+        manager.mark_dirty("1.mp3")
+        del cache["2.mp3"]
+        self.assertTrue(manager.dirty)
+        manager.maybe_save()
+        self.assertFalse(manager.dirty)
+
+        rows = self.rows()
+        self.assertEqual(rows["0.mp3"][0], 99)
+        self.assertEqual(json.loads(rows["1.mp3"][2])["order"], 5)
+        self.assertNotIn("2.mp3", rows)
+
+    def test_rename_moves_row(self):
+        manager = self.make_manager()
+        cache = manager.get_cache()
+        cache["old.mp3"] = CacheEntry(modified_time=1.0, details=Details(3.0))
+        manager.maybe_save()
+
+        cache["new.mp3"] = cache["old.mp3"]
+        del cache["old.mp3"]
+        manager.maybe_save()
+
+        self.assertEqual(list(self.rows()), ["new.mp3"])
+
+    def test_imports_legacy_json_cache(self):
+        legacy_file = os.path.join(self.temp_dir.name, "metadata.json")
+        with open(legacy_file, "w") as f:
+            json.dump(
+                {"a.mp3": {"modified_time": 2.0, "details": {"duration": 4.0}}}, f
+            )
+
+        cache = self.make_manager(legacy_cache_file=legacy_file).get_cache()
+
+        self.assertEqual(cache["a.mp3"].details.duration, 4.0)
+        self.assertIn("a.mp3", self.rows())
+        self.assertFalse(os.path.exists(legacy_file))
+
+    def test_evicts_missing_files_on_load(self):
+        manager = self.make_manager()
+        cache = manager.get_cache()
+        cache["kept.mp3"] = CacheEntry(modified_time=1.0, details=Details(None))
+        cache["gone.mp3"] = CacheEntry(modified_time=1.0, details=Details(None))
+        manager.maybe_save()
+
+        reloaded = self.make_manager(key_exists=lambda key: key == "kept.mp3")
+
+        self.assertEqual(list(reloaded.get_cache()), ["kept.mp3"])
+        self.assertEqual(list(self.rows()), ["kept.mp3"])
+
+    def test_is_fresh_compares_mtime_and_size(self):
+        entry = CacheEntry(modified_time=1.0, size=10, details=Details(None))
+
+        self.assertTrue(entry.is_fresh(1.0, 10))
+        self.assertFalse(entry.is_fresh(1.0, 11))
+        self.assertFalse(entry.is_fresh(2.0, 10))
+        self.assertTrue(
+            CacheEntry(modified_time=1.0, details=Details(None)).is_fresh(1.0, 11)
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,140 @@
+import os
+import tempfile
+import unittest
+
+from app.managers.file_management.file_manager import FileManager
+from app.schemas.file_filter import (
+    FileDetail,
+    FileFilterModel,
+    FilterFieldStringArray,
+    FilterMatchMode,
+    OrderingModel,
+    SortDirection,
+)
+from app.services.file_management.file_filter_service import FileFilterService
+
+
+class TestFileManagerPagination(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.root = self.temp_dir.name
+        os.makedirs(os.path.join(self.root, "albums", "live"))
+        for name in [
+            "a.mp3",
+            "b.mp3",
+            "c.txt",
+            "albums/d.mp3",
+            "albums/live/e.mp3",
+        ]:
+            with open(os.path.join(self.root, name), "w") as f:
+                f.write(name)
+        self.manager = FileManager(FileFilterService())
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def name_ordering(self) -> OrderingModel:
+        return OrderingModel(field="name", direction=SortDirection.asc)
+
+    def test_paginate_returns_next_offset(self):
+        files = self.manager.query_files(self.root, ordering=self.name_ordering())
+
+        page, next_offset = self.manager.paginate(files, offset=0, limit=3)
+        last_page, last_next_offset = self.manager.paginate(files, offset=6, limit=3)
+
+        self.assertEqual(len(files), 7)
+        self.assertEqual(len(page), 3)
+        self.assertEqual(next_offset, 3)
+        self.assertEqual(len(last_page), 1)
+        self.assertIsNone(last_next_offset)
+
+    def test_lazy_mode_lists_one_level_with_dirs_first(self):
+        audio_filter = FileFilterModel(
+            type=FilterFieldStringArray(value=["audio"], match_mode=FilterMatchMode.IN)
+        )
+
+        result = self.manager.get_files_page(
+            self.root,
+            filter_model=audio_filter,
+            ordering=self.name_ordering(),
+            lazy=True,
+        )
+
+        self.assertEqual([f.path for f in result.data], ["albums", "a.mp3", "b.mp3"])
+        self.assertEqual(result.data[0].children_count, 2)
+        self.assertEqual(result.total, 3)
+
+        nested = self.manager.get_files_page(
+            self.root, subdir="albums", ordering=self.name_ordering(), lazy=True
+        )
+        self.assertEqual([f.path for f in nested.data], ["albums/live", "albums/d.mp3"])
+
+    def test_lazy_mode_can_return_absolute_paths(self):
+        result = self.manager.get_files_page(
+            self.root,
+            ordering=self.name_ordering(),
+            limit=2,
+            lazy=True,
+            relative_path=False,
+        )
+
+        self.assertEqual(
+            [f.path for f in result.data],
+            [os.path.join(self.root, "albums"), os.path.join(self.root, "a.mp3")],
+        )
+        self.assertEqual(result.next_offset, 2)
+
+    def test_rejects_subdirs_outside_root(self):
+        for subdir in ("..", "../../etc", "albums/../..", "/etc"):
+            for lazy in (True, False):
+                with self.subTest(subdir=subdir, lazy=lazy):
+                    with self.assertRaises(FileNotFoundError):
+                        self.manager.query_files(self.root, subdir=subdir, lazy=lazy)
+
+    def test_transformer_applies_to_page_only(self):
+        transformed = []
+
+        def transformer(f: FileDetail) -> FileDetail:
+            transformed.append(f.path)
+            return f
+
+        result = self.manager.get_files_page(
+            self.root,
+            ordering=self.name_ordering(),
+            offset=1,
+            limit=2,
+            filtered_file_transformer=transformer,
+        )
+
+        self.assertEqual(transformed, [f.path for f in result.data])
+        self.assertEqual(result.next_offset, 3)
+
+    def test_iter_files_yields_ndjson(self):
+        files = self.manager.query_files(self.root, subdir="albums", lazy=True)
+
+        lines = list(self.manager.iter_files(files))
+
+        self.assertEqual(len(lines), 2)
+        self.assertTrue(all(line.endswith("\n") for line in lines))
+        self.assertEqual(
+            {FileDetail.model_validate_json(line).path for line in lines},
+            {"albums/live", "albums/d.mp3"},
+        )
+
+    def test_group_files_places_dirs_first(self):
+        files = self.manager.query_files(self.root, ordering=self.name_ordering())
+
+        tree = self.manager.group_files(files)
+
+        self.assertEqual(
+            [node.path for node in tree], ["albums", "a.mp3", "b.mp3", "c.txt"]
+        )
+        albums = tree[0]
+        self.assertEqual(
+            [node.path for node in albums.children or []],
+            ["albums/live", "albums/d.mp3"],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
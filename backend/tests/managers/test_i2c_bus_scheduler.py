@@ -0,0 +1,96 @@
+import threading
+import unittest
+
+from app.managers.i2c_bus_scheduler import BusPriority, I2CBusScheduler
+
+
+class TestI2CBusScheduler(unittest.TestCase):
+    def setUp(self):
+        self.scheduler = I2CBusScheduler()
+        self.addCleanup(self.scheduler.close)
+        self.calls = []
+        self.gate = threading.Event()
+        self.busy = threading.Event()
+
+    def _block_worker(self):
+        def hold():
+            self.busy.set()
+            self.gate.wait(timeout=2)
+
+        blocker = self.scheduler.submit(BusPriority.TELEMETRY, hold)
+        self.busy.wait(timeout=1)
+        return blocker
+
+    def _record(self, name):
+        return lambda: self.calls.append(name) or name
+
+    def test_runs_higher_priority_lanes_first(self):
+        blocker = self._block_worker()
+        futures = [
+            self.scheduler.submit(BusPriority.TELEMETRY, self._record("battery")),
+            self.scheduler.submit(BusPriority.CAMERA, self._record("pan")),
+            self.scheduler.submit(BusPriority.MOTOR, self._record("forward")),
+            self.scheduler.submit(BusPriority.STEERING, self._record("steering")),
+        ]
+        self.gate.set()
+
+        blocker.result(timeout=1)
+        for future in futures:
+            future.result(timeout=1)
+
+        self.assertEqual(self.calls, ["forward", "steering", "pan", "battery"])
+
+    def test_merges_queued_writes_with_the_same_key(self):
+        blocker = self._block_worker()
+        first = self.scheduler.submit(
+            BusPriority.STEERING, self._record(10), key="steering"
+        )
+        second = self.scheduler.submit(
+            BusPriority.STEERING, self._record(20), key="steering"
+        )
+        self.gate.set()
+
+        blocker.result(timeout=1)
+        self.assertEqual(first.result(timeout=1), 20)
+        self.assertEqual(second.result(timeout=1), 20)
+        self.assertEqual(self.calls, [20])
+        self.assertEqual(self.scheduler.stats()["steering"]["merged"], 1)
+
+    def test_emergency_stop_supersedes_queued_motor_writes(self):
+        blocker = self._block_worker()
+        forward = self.scheduler.submit(
+            BusPriority.MOTOR, self._record("forward"), key="motors"
+        )
+        stop = self.scheduler.submit(BusPriority.EMERGENCY, self._record("stop"))
+        self.gate.set()
+
+        blocker.result(timeout=1)
+        self.assertEqual(stop.result(timeout=1), "stop")
+        self.assertIsNone(forward.result(timeout=1))
+        self.assertEqual(self.calls, ["stop"])
+        self.assertEqual(self.scheduler.stats()["motor"]["superseded"], 1)
+
+    def test_propagates_errors_and_records_timings(self):
+        def fail():
+            raise OSError(121, "Remote I/O error")
+
+        with self.assertRaises(OSError):
+            self.scheduler.call(BusPriority.CAMERA, fail)
+        self.scheduler.call(BusPriority.CAMERA, self._record("tilt"))
+
+        stats = self.scheduler.stats()["camera"]
+        self.assertEqual(stats["transactions"], 2)
+        self.assertEqual(stats["errors"], 1)
+        self.assertGreaterEqual(stats["max_ms"], 0)
+
+    def test_nested_calls_run_inline_on_the_worker(self):
+        result = self.scheduler.call(
+            BusPriority.MOTOR,
+            lambda: self.scheduler.call(BusPriority.EMERGENCY, self._record("stop")),
+        )
+
+        self.assertEqual(result, "stop")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,91 @@
+import math
+import os
+import tempfile
+import threading
+import unittest
+
+from app.managers.telemetry_log import (
+    HEADER_SIZE,
+    RECORD_SIZE,
+    TelemetryKind,
+    TelemetryLogWriter,
+    load_session,
+    read_records,
+    read_segment,
+    segment_paths,
+)
+
+
+class TestTelemetryLog(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.directory = os.path.join(self.tmp.name, "session")
+
+    def test_records_are_readable_while_the_segment_is_written(self) -> None:
+        writer = TelemetryLogWriter(self.directory, segment_records=16)
+        self.addCleanup(writer.close)
+        writer.append(TelemetryKind.DISTANCE, 42.5, 0, 1, ts=10.0)
+        writer.append(TelemetryKind.BATTERY, 7.4, 0.8, 61.0, ts=10.5, source=1)
+
+        (path,) = segment_paths(self.directory)
+        records = read_segment(path)
+
+        self.assertEqual(os.path.getsize(path), HEADER_SIZE + 16 * RECORD_SIZE)
+        self.assertEqual(len(records), 2)
+        self.assertEqual(records["ts"].tolist(), [10.0, 10.5])
+        self.assertEqual(records["source"].tolist(), [0, 1])
+        self.assertAlmostEqual(float(records["values"][1][0]), 7.4, places=5)
+        self.assertTrue(math.isnan(records["values"][0][3]))
+
+    def test_rotates_and_deletes_old_segments(self) -> None:
+        writer = TelemetryLogWriter(self.directory, segment_records=4, max_segments=2)
+        for i in range(10):
+            writer.append(TelemetryKind.DISTANCE, float(i), ts=float(i))
+        writer.close()
+
+        paths = segment_paths(self.directory)
+
+        self.assertEqual(
+            [os.path.basename(path) for path in paths],
+            ["segment-00001.ptl", "segment-00002.ptl"],
+        )
+        self.assertEqual(os.path.getsize(paths[-1]), HEADER_SIZE + 2 * RECORD_SIZE)
+        self.assertEqual(
+            read_records(self.directory)["ts"].tolist(), [4.0 + i for i in range(6)]
+        )
+
+    def test_concurrent_appends_are_not_lost(self) -> None:
+        writer = TelemetryLogWriter(self.directory, segment_records=64)
+
+        def write() -> None:
+            for _ in range(500):
+                writer.append(TelemetryKind.DRIVE, 1.0)
+
+        threads = [threading.Thread(target=write) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        writer.close()
+
+        self.assertEqual(len(read_records(self.directory)), 2000)
+
+    def test_load_session_splits_records_by_kind(self) -> None:
+        writer = TelemetryLogWriter(self.directory)
+        writer.append(TelemetryKind.DISTANCE, 30.0, 0, 1, ts=1.0)
+        writer.append(TelemetryKind.DRIVE, -40, 12.5, 0, 0, 3.2, 0.4, 0.6, ts=1.1)
+        writer.append(TelemetryKind.DISTANCE, 28.0, 0, 2, ts=1.2)
+        writer.close()
+
+        session = load_session(self.directory)
+
+        self.assertEqual(session["distance"]["distance"].tolist(), [30.0, 28.0])
+        self.assertEqual(session["distance"]["seq"].tolist(), [1.0, 2.0])
+        self.assertEqual(session["drive"]["speed"].tolist(), [-40.0])
+        self.assertAlmostEqual(float(session["drive"]["latency_ms"][0]), 3.2, places=5)
+        self.assertEqual(len(session["battery"]), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,67 @@
+import unittest
+
+import numpy as np
+
+from app.managers.distance_ring import DistanceSamples
+from app.schemas.robot.avoid_obstacles import AvoidParams, AvoidState
+from app.services.control.avoid_controller import AvoidController
+
+
+def samples(*readings: tuple) -> DistanceSamples:
+    return DistanceSamples(
+        seq=np.arange(1, len(readings) + 1, dtype=np.int64),
+        ts=np.array([ts for ts, _ in readings], dtype=np.float64),
+        distance=np.array([d for _, d in readings], dtype=np.float64),
+        status=np.zeros(len(readings), dtype=np.int8),
+    )
+
+
+class TestAvoidController(unittest.TestCase):
+    def setUp(self) -> None:
+        self.transitions: list[AvoidState] = []
+        self.controller = AvoidController(
+            AvoidParams(ema_alpha=1.0), on_transition=self.transitions.append
+        )
+        self.controller.reset(0.0)
+
+    def test_waits_while_the_sensor_is_stale(self) -> None:
+        command = self.controller.step(
+            now=1.0, dt=0.03, current_speed=0, current_direction=0
+        )
+
+        self.assertEqual(self.transitions, [AvoidState.WAIT])
+        self.assertEqual((command.direction, command.speed), (0, 0))
+
+    def test_cruise_ramps_up_towards_the_forward_speed(self) -> None:
+        self.controller.feed(samples((1.0, 200.0)))
+
+        command = self.controller.step(
+            now=1.0, dt=0.1, current_speed=0, current_direction=0
+        )
+
+        self.assertEqual(self.transitions, [])
+        self.assertEqual((command.direction, command.speed), (1, 10))
+
+    def test_close_obstacle_reverses_after_stopping(self) -> None:
+        self.controller.feed(samples((1.0, 10.0)))
+
+        self.controller.step(now=1.0, dt=0.03, current_speed=40, current_direction=1)
+        command = self.controller.step(
+            now=1.03, dt=0.1, current_speed=40, current_direction=1
+        )
+
+        self.assertEqual(self.transitions, [AvoidState.REVERSE])
+        self.assertTrue(command.stop_first)
+        self.assertEqual(command.speed, 0)
+
+    def test_feed_ignores_outliers(self) -> None:
+        self.controller.feed(
+            samples((1.0, 50.0), (1.1, 51.0), (1.2, 300.0), (1.3, 50.0))
+        )
+
+        self.assertEqual(self.controller.ema_distance, 50.0)
+        self.assertEqual(self.controller.last_distance_ts, 1.3)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,63 @@
+import asyncio
+import unittest
+from typing import Any, Dict
+from unittest.mock import AsyncMock, MagicMock
+
+from app.services.control.car_state_publisher import CarStatePublisher
+
+
+class TestCarStatePublisher(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.state: Dict[str, Any] = {"speed": 0, "direction": 0, "servoAngle": 0}
+        self.broadcast_json = AsyncMock()
+        self.publisher = CarStatePublisher(
+            connection_manager=MagicMock(broadcast_json=self.broadcast_json),
+            get_state=lambda: self.state,
+            rate_hz=20,
+        )
+        self.addCleanup(self.publisher.close)
+
+    @property
+    def payloads(self):
+        return [call.args[0]["payload"] for call in self.broadcast_json.call_args_list]
+
+    async def test_full_state_then_only_changed_fields(self):
+        await self.publisher.publish_full()
+        self.state["speed"] = 40
+
+        await self.publisher.publish_changes()
+        await self.publisher.publish_changes()
+
+        self.assertEqual(
+            self.payloads,
+            [{"speed": 0, "direction": 0, "servoAngle": 0}, {"speed": 40}],
+        )
+
+    async def test_bursts_are_flushed_at_most_once_per_period(self):
+        await self.publisher.publish_full()
+        for speed in range(1, 30):
+            self.state["speed"] = speed
+            self.publisher.mark_dirty()
+            await asyncio.sleep(0)
+
+        await asyncio.sleep(0.02)
+        self.assertEqual(self.payloads[1:], [])
+
+        await asyncio.sleep(0.06)
+        self.assertEqual(self.payloads[1:], [{"speed": 29}])
+
+    async def test_urgent_changes_bypass_the_rate_limit(self):
+        await self.publisher.publish_full()
+        self.state["servoAngle"] = 10
+        self.publisher.mark_dirty()
+        self.state["speed"] = 0
+        self.state["direction"] = -1
+
+        self.publisher.mark_dirty(urgent=True)
+        await asyncio.sleep(0.01)
+
+        self.assertEqual(self.payloads[1:], [{"direction": -1, "servoAngle": 10}])
+
+
+if __name__ == "__main__":
+    unittest.main()
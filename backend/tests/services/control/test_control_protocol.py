@@ -0,0 +1,82 @@
+import math
+import unittest
+
+from app.exceptions.robot import ControlProtocolError
+from app.services.control.control_protocol import (
+    ACK_FORMAT,
+    COMMAND_FORMAT,
+    ControlCommand,
+    ControlField,
+    ControlOpcode,
+    decode_command,
+    encode_ack,
+    encode_command,
+)
+
+
+class TestControlProtocol(unittest.TestCase):
+    def test_round_trips_drive_command(self):
+        command = ControlCommand(
+            opcode=ControlOpcode.DRIVE,
+            fields=ControlField.MOTORS | ControlField.STEERING,
+            seq=42,
+            client_ts=1234.5,
+            speed=60,
+            direction=-1,
+            steering=-12.5,
+            pan=3.0,
+        )
+
+        frame = encode_command(command)
+
+        self.assertEqual(len(frame), COMMAND_FORMAT.size)
+        self.assertEqual(decode_command(frame), command)
+
+    def test_changes_include_only_masked_fields(self):
+        command = ControlCommand(
+            opcode=ControlOpcode.DRIVE,
+            fields=ControlField.STEERING | ControlField.TILT,
+            seq=1,
+            client_ts=0.0,
+            speed=50,
+            direction=1,
+            steering=10.0,
+            tilt=-5.0,
+        )
+
+        self.assertEqual(command.changes(), {"steering": 10.0, "tilt": -5.0})
+
+    def test_rejects_malformed_frames(self):
+        valid = ControlCommand(ControlOpcode.DRIVE, ControlField.MOTORS, 1, 0.0)
+        frames = {
+            "truncated": encode_command(valid)[:-1],
+            "opcode": COMMAND_FORMAT.pack(0x7F, 0, 1, 0.0, 0, 0, 0, 0, 0),
+            "direction": COMMAND_FORMAT.pack(1, 1, 1, 0.0, 10, 2, 0, 0, 0),
+            "speed": COMMAND_FORMAT.pack(1, 1, 1, 0.0, 101, 1, 0, 0, 0),
+            "angle": COMMAND_FORMAT.pack(1, 2, 1, 0.0, 0, 0, math.inf, 0, 0),
+        }
+        for name, frame in frames.items():
+            with self.subTest(name), self.assertRaises(ControlProtocolError):
+                decode_command(frame)
+
+    def test_ack_echoes_sequence_and_client_timestamp(self):
+        command = ControlCommand(ControlOpcode.STOP, ControlField(0), 7, 99.25)
+        state = {
+            "speed": 0,
+            "direction": 0,
+            "steering_servo_angle": 5.0,
+            "cam_pan_angle": -10.0,
+            "cam_tilt_angle": 15.0,
+        }
+
+        ack = ACK_FORMAT.unpack(encode_ack(command, state, 12.5))  # type: ignore[arg-type]
+
+        self.assertEqual(
+            ack, (ControlOpcode.ACK, 0, 7, 99.25, 0, 0, 5.0, -10.0, 15.0, 12.5)
+        )
+        latency = ACK_FORMAT.unpack(encode_ack(command, state, None))[-1]  # type: ignore[arg-type]
+        self.assertTrue(math.isnan(latency))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,107 @@
+import asyncio
+import threading
+import unittest
+
+from app.services.control.drive_control_loop import DriveControlLoop
+
+
+class FakePicarx:
+    def __init__(self) -> None:
+        self.calls: list[tuple] = []
+        self.release = threading.Event()
+        self.release.set()
+        self._state = {
+            "speed": 0,
+            "direction": 0,
+            "steering_servo_angle": 0,
+            "cam_pan_angle": 0,
+            "cam_tilt_angle": 0,
+        }
+
+    @property
+    def state(self) -> dict:
+        return dict(self._state)
+
+    def set_dir_servo_angle(self, value: float) -> None:
+        self.release.wait(timeout=1)
+        self.calls.append(("steering", value))
+        self._state["steering_servo_angle"] = value
+
+    def set_cam_pan_angle(self, value: float) -> None:
+        self.calls.append(("pan", value))
+        self._state["cam_pan_angle"] = value
+
+    def set_cam_tilt_angle(self, value: float) -> None:
+        self.calls.append(("tilt", value))
+        self._state["cam_tilt_angle"] = value
+
+    def forward(self, speed: int) -> None:
+        self.calls.append(("forward", speed))
+        self._state.update(speed=speed, direction=1)
+
+    def backward(self, speed: int) -> None:
+        self.calls.append(("backward", speed))
+        self._state.update(speed=speed, direction=-1)
+
+    def stop(self) -> None:
+        self.calls.append(("stop",))
+        self._state.update(speed=0, direction=0)
+
+
+class TestDriveControlLoop(unittest.IsolatedAsyncioTestCase):
+    def setUp(self) -> None:
+        self.px = FakePicarx()
+        self.errors: list[Exception] = []
+        self.loop = DriveControlLoop(
+            self.px, rate_hz=100, on_error=self.errors.append  # type: ignore[arg-type]
+        )
+
+    async def asyncTearDown(self) -> None:
+        await asyncio.to_thread(self.loop.close)
+
+    async def test_flood_of_requests_applies_only_the_latest(self) -> None:
+        self.px.release.clear()
+        self.loop.submit(steering=1)
+        for angle in range(2, 60):
+            self.loop.submit(steering=angle)
+        self.px.release.set()
+
+        await asyncio.wait_for(self.loop.settle(), timeout=2)
+
+        steering_calls = [call for call in self.px.calls if call[0] == "steering"]
+        self.assertLessEqual(len(steering_calls), 2)
+        self.assertEqual(steering_calls[-1], ("steering", 59))
+        self.assertGreater(self.loop.stats.coalesced, 0)
+        self.assertIsNotNone(self.loop.stats.last_latency_ms)
+
+    async def test_only_changed_fields_are_applied(self) -> None:
+        await self.loop.settle(self.loop.submit(speed=40, direction=1, pan=10))
+        self.px.calls.clear()
+
+        await self.loop.settle(self.loop.submit(tilt=5))
+        await self.loop.settle(self.loop.submit(speed=40, direction=1))
+
+        self.assertEqual(self.px.calls, [("tilt", 5)])
+
+    async def test_halt_always_stops_motors(self) -> None:
+        await self.loop.settle(self.loop.submit(speed=0, direction=0))
+        self.assertEqual(self.px.calls, [])
+
+        await self.loop.settle(self.loop.halt())
+
+        self.assertEqual(self.px.calls, [("stop",)])
+
+    async def test_hardware_errors_are_reported(self) -> None:
+        def fail(_: float) -> None:
+            raise OSError("bus error")
+
+        self.px.set_cam_pan_angle = fail  # type: ignore[method-assign]
+
+        await self.loop.settle(self.loop.submit(pan=10, tilt=3))
+
+        self.assertEqual([str(e) for e in self.errors], ["bus error"])
+        self.assertIn(("tilt", 3), self.px.calls)
+
+
+if __name__ == "__main__":
+    unittest.main()
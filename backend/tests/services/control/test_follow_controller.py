@@ -0,0 +1,114 @@
+import unittest
+
+from app.managers.detection_feed import DetectionFrame, FeedDetection
+from app.schemas.robot.follow import FollowParams, FollowState
+from app.services.control.follow_controller import FollowController
+
+
+def person(x1: float, y1: float, x2: float, y2: float, **kwargs) -> FeedDetection:
+    return FeedDetection(
+        bbox=(x1, y1, x2, y2),
+        label=kwargs.get("label", "person"),
+        confidence=kwargs.get("confidence", 0.9),
+        track_id=kwargs.get("track_id", -1),
+    )
+
+
+def frame(seq: int, *detections: FeedDetection, at: float = 0.0) -> DetectionFrame:
+    return DetectionFrame(
+        seq=seq,
+        timestamp=at,
+        published_at=at,
+        frame_width=640,
+        frame_height=480,
+        detections=list(detections),
+    )
+
+
+class TestFollowController(unittest.TestCase):
+    def setUp(self) -> None:
+        self.controller = FollowController(
+            FollowParams(accel_rate=10_000, decel_rate=10_000)
+        )
+
+    def test_steers_and_drives_toward_a_far_target(self) -> None:
+        self.controller.update(frame(1, person(480, 200, 560, 300)), 0.0)
+
+        command = self.controller.step(now=0.03, dt=0.03, current_speed=0)
+
+        self.assertEqual(self.controller.state, FollowState.FOLLOW)
+        self.assertGreater(command.steering, 0)
+        self.assertEqual(command.direction, 1)
+        self.assertGreater(command.speed, 0)
+
+    def test_camera_pan_adds_to_the_bearing(self) -> None:
+        self.controller.update(frame(1, person(280, 200, 360, 300)), 0.0)
+
+        command = self.controller.step(
+            now=0.03, dt=0.03, current_speed=0, camera_pan=-20
+        )
+
+        self.assertAlmostEqual(command.steering, -20)
+
+    def test_holds_when_the_target_is_close(self) -> None:
+        self.controller.update(frame(1, person(200, 0, 440, 480)), 0.0)
+
+        command = self.controller.step(now=0.03, dt=0.03, current_speed=40)
+
+        self.assertEqual(self.controller.state, FollowState.HOLD)
+        self.assertEqual(command.speed, 0)
+
+    def test_holds_when_an_obstacle_is_closer_than_the_stop_distance(self) -> None:
+        self.controller.update(frame(1, person(300, 200, 340, 260)), 0.0)
+
+        command = self.controller.step(now=0.03, dt=0.03, current_speed=40, distance=10)
+
+        self.assertEqual(self.controller.state, FollowState.HOLD)
+        self.assertEqual(command.speed, 0)
+
+    def test_stops_when_the_target_is_lost(self) -> None:
+        self.controller.update(frame(1, person(300, 200, 340, 260)), 0.0)
+        self.controller.step(now=0.03, dt=0.03, current_speed=0)
+        self.controller.update(frame(2, person(0, 0, 10, 10, label="cat"), at=0.5), 0.5)
+
+        command = self.controller.step(now=0.7, dt=0.03, current_speed=40)
+
+        self.assertEqual(self.controller.state, FollowState.SEARCH)
+        self.assertIsNone(self.controller.target)
+        self.assertEqual(command.speed, 0)
+
+    def test_stops_when_detection_stalls(self) -> None:
+        self.controller.update(frame(1, person(300, 200, 340, 260)), 0.0)
+
+        command = self.controller.step(now=1.5, dt=0.03, current_speed=40)
+
+        self.assertEqual(self.controller.state, FollowState.SEARCH)
+        self.assertEqual(command.speed, 0)
+
+    def test_keeps_following_the_same_object_by_overlap(self) -> None:
+        self.controller.update(frame(1, person(100, 200, 160, 300)), 0.0)
+        near = person(400, 100, 600, 400)
+        moved = person(110, 200, 170, 300)
+
+        self.controller.update(frame(2, near, moved, at=0.1), 0.1)
+
+        self.assertEqual(self.controller.target, moved)
+
+    def test_keeps_following_the_same_object_by_track_id(self) -> None:
+        self.controller.update(frame(1, person(100, 200, 160, 300, track_id=3)), 0.0)
+        other = person(105, 200, 165, 300, track_id=4)
+        tracked = person(400, 200, 460, 300, track_id=3)
+
+        self.controller.update(frame(2, other, tracked, at=0.1), 0.1)
+
+        self.assertEqual(self.controller.target, tracked)
+
+    def test_ignores_repeated_frames(self) -> None:
+        self.controller.update(frame(1, person(300, 200, 340, 260)), 0.0)
+        self.controller.update(frame(1, person(0, 0, 10, 10)), 0.5)
+
+        self.assertEqual(self.controller.target_seen_at, 0.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,60 @@
+import asyncio
+import json
+import unittest
+
+from app.services.control.ipc_event_service import IPCEventService
+
+
+class TestIPCEventService(unittest.IsolatedAsyncioTestCase):
+    async def test_streams_published_events_until_closed(self) -> None:
+        service = IPCEventService()
+        stream = service.stream()
+        first = asyncio.ensure_future(stream.__anext__())
+        await asyncio.sleep(0)
+
+        service.publish("distance", {"distance": 42.5})
+        line = await first
+        service.close()
+
+        self.assertEqual(
+            json.loads(line), {"type": "distance", "payload": {"distance": 42.5}}
+        )
+        with self.assertRaises(StopAsyncIteration):
+            await stream.__anext__()
+        self.assertEqual(service.subscribers, 0)
+
+    async def test_slow_stream_drops_oldest_events(self) -> None:
+        service = IPCEventService(queue_size=2)
+        stream = service.stream()
+        first = asyncio.ensure_future(stream.__anext__())
+        await asyncio.sleep(0)
+
+        for i in range(5):
+            service.publish("seq", i)
+
+        received = [json.loads(await first)["payload"]]
+        received.append(json.loads(await stream.__anext__())["payload"])
+        await stream.aclose()
+
+        self.assertEqual(received, [3, 4])
+
+    async def test_sends_heartbeats_when_idle(self) -> None:
+        service = IPCEventService(heartbeat_s=0.01)
+        stream = service.stream()
+
+        self.assertEqual(await stream.__anext__(), b"\n")
+        await stream.aclose()
+
+    async def test_dispatches_pushed_events_to_listeners(self) -> None:
+        service = IPCEventService()
+        received = []
+        service.on("detection", received.append)
+
+        await service.dispatch("detection", {"label": "person"})
+        await service.dispatch("unknown", None)
+
+        self.assertEqual(received, [{"label": "person"}])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,101 @@
+import asyncio
+import os
+import tempfile
+import unittest
+
+from app.exceptions.robot import TelemetrySessionNotFound
+from app.managers.distance_ring import DistanceRing, DistanceStatus
+from app.managers.telemetry_log import TelemetryKind, load_session
+from app.schemas.robot.avoid_obstacles import AvoidState
+from app.services.control.telemetry_service import TelemetryService
+
+
+class TestTelemetryService(unittest.IsolatedAsyncioTestCase):
+    def setUp(self) -> None:
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.service = TelemetryService(self.tmp.name, segment_records=8)
+        self.addCleanup(self.service.close)
+
+    def test_records_nothing_until_started(self) -> None:
+        self.service.record(TelemetryKind.DRIVE, 1.0)
+
+        self.assertEqual(self.service.list_sessions(), [])
+
+    def test_session_lifecycle(self) -> None:
+        started = self.service.start()
+        self.service.record_avoid_state(AvoidState.TURN, 35.0, True)
+        stopped = self.service.stop()
+
+        self.assertTrue(started.recording)
+        assert stopped is not None
+        self.assertFalse(stopped.recording)
+        self.assertEqual(stopped.records, 1)
+        self.assertEqual(
+            [session.id for session in self.service.list_sessions()], [started.id]
+        )
+
+        self.service.delete_session(started.id)
+
+        self.assertEqual(self.service.list_sessions(), [])
+
+    def test_rejects_unknown_and_unsafe_session_ids(self) -> None:
+        for session_id in ("missing", "..", "../etc"):
+            with self.subTest(session_id=session_id):
+                with self.assertRaises(TelemetrySessionNotFound):
+                    self.service.session_dir(session_id)
+
+    def test_records_every_new_distance_sample(self) -> None:
+        ring = DistanceRing(capacity=16)
+        self.service.start()
+        ring.append(40.0, ts=1.0)
+        ring.append(-1, DistanceStatus.TIMEOUT, ts=1.1)
+        self.service.record_distance_samples(ring)
+        ring.append(38.0, ts=1.2)
+        self.service.record_distance_samples(ring)
+        session = self.service.stop()
+        assert session is not None
+
+        distance = load_session(self.service.session_dir(session.id))["distance"]
+
+        self.assertEqual(distance["ts"].tolist(), [1.0, 1.1, 1.2])
+        self.assertEqual(distance["status"].tolist(), [0.0, 1.0, 0.0])
+
+    async def test_streamed_session_loads_like_the_recorded_one(self) -> None:
+        session = self.service.start()
+        for i in range(20):
+            self.service.record(TelemetryKind.DISTANCE, float(i), ts=float(i))
+        self.service.stop()
+
+        chunks = [chunk async for chunk in self.service.stream_session(session.id)]
+        path = os.path.join(self.tmp.name, "download.ptl")
+        with open(path, "wb") as file:
+            file.write(b"".join(chunks))
+
+        self.assertEqual(
+            load_session(path)["distance"]["ts"].tolist(),
+            [float(i) for i in range(20)],
+        )
+
+    async def test_follow_streams_until_recording_stops(self) -> None:
+        session = self.service.start()
+        self.service.record(TelemetryKind.DRIVE, 1.0)
+        received = []
+
+        async def consume() -> None:
+            async for chunk in self.service.stream_session(
+                session.id, follow=True, poll_interval=0.01
+            ):
+                received.append(chunk)
+
+        task = asyncio.create_task(consume())
+        await asyncio.sleep(0.05)
+        self.service.record(TelemetryKind.DRIVE, 2.0)
+        self.service.stop()
+        await asyncio.wait_for(task, timeout=2)
+
+        self.assertEqual(sum(len(chunk) for chunk in received[1:]), 2 * 40)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,90 @@
+import math
+import os
+import tempfile
+import unittest
+
+from app.managers.telemetry_log import TelemetryKind, TelemetryLogWriter
+from app.schemas.robot.avoid_obstacles import AvoidState
+from app.services.simulation.harness import (
+    SCENARIOS,
+    SimulationConfig,
+    replay_session,
+    run_simulation,
+)
+from app.services.simulation.world import Pillar, SimWorld, Wall
+
+_TIMING_FIELDS = ("wall_clock_s", "realtime_factor", "step_time_us")
+
+
+class TestSimWorld(unittest.TestCase):
+    def test_raycast_finds_the_nearest_obstacle(self) -> None:
+        world = SimWorld([Wall(100, -50, 100, 50), Pillar(60, 0, 10)])
+
+        self.assertAlmostEqual(world.raycast(0, 0, 0.0, max_range=300), 50.0)
+        self.assertAlmostEqual(world.raycast(0, 0, math.pi / 2, 300), math.inf)
+        self.assertAlmostEqual(world.clearance(60, 30), 20.0)
+
+
+class TestSimulation(unittest.TestCase):
+    def test_runs_are_deterministic(self) -> None:
+        config = SimulationConfig(duration_s=5, seed=3)
+
+        first = run_simulation("pillars", config=config).to_dict()
+        second = run_simulation("pillars", config=config).to_dict()
+
+        for key in _TIMING_FIELDS:
+            first.pop(key)
+            second.pop(key)
+        self.assertEqual(first, second)
+
+    def test_avoids_obstacles_in_every_scenario(self) -> None:
+        for name in SCENARIOS:
+            with self.subTest(scenario=name):
+                report = run_simulation(name, config=SimulationConfig(duration_s=15))
+
+                self.assertEqual(report.collisions, 0)
+                self.assertGreater(report.distance_travelled_cm, 100)
+                self.assertGreater(report.reaction_latency_ms.count, 0)
+                self.assertGreater(report.realtime_factor, 1)
+
+    def test_unknown_scenario(self) -> None:
+        with self.assertRaises(ValueError):
+            run_simulation("moon")
+
+
+class TestReplaySession(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+
+    def write_session(self, name: str, states: list[AvoidState]) -> str:
+        path = os.path.join(self.tmp.name, name)
+        writer = TelemetryLogWriter(path)
+        writer.append(TelemetryKind.DRIVE, 40, 0, 0, 0, ts=0.0)
+        for i in range(60):
+            distance = max(10.0, 120.0 - i * 3)
+            writer.append(TelemetryKind.DISTANCE, distance, 0, i + 1, ts=i * 0.05)
+        for i, state in enumerate(states):
+            writer.append(TelemetryKind.AVOID_STATE, state.value, ts=0.5 + i * 0.1)
+        writer.close()
+        return path
+
+    def test_matching_session_does_not_diverge(self) -> None:
+        replayed = replay_session(self.write_session("probe", []))
+        states = [AvoidState[name] for name in replayed.replayed_transitions]
+
+        report = replay_session(self.write_session("recorded", states))
+
+        self.assertTrue(states)
+        self.assertEqual(report.distance_samples, 60)
+        self.assertIsNone(report.first_divergence_s)
+
+    def test_reports_the_first_divergent_transition(self) -> None:
+        report = replay_session(self.write_session("recorded", [AvoidState.WAIT]))
+
+        self.assertIsNotNone(report.first_divergence_s)
+        self.assertEqual(report.recorded_transitions, ["WAIT"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,61 @@
+import unittest
+from unittest.mock import patch
+
+import numpy as np
+from app.exceptions.audio import AudioCodecUnavailable
+from app.schemas.audio import AudioStreamCodec
+from app.services.media.audio_codecs import (
+    create_audio_encoder,
+    mulaw_decode,
+    mulaw_encode,
+)
+
+
+class TestMuLaw(unittest.TestCase):
+    def test_encodes_reference_values(self):
+        samples = np.array([0, 32767, -32768, 1000, -1000], dtype=np.int16)
+
+        self.assertEqual(mulaw_encode(samples).tolist(), [0xFF, 0x80, 0x00, 0xCE, 0x4E])
+
+    def test_round_trip_error_is_bounded(self):
+        samples = np.arange(-32768, 32768, 7, dtype=np.int32).astype(np.int16)
+
+        decoded = mulaw_decode(mulaw_encode(samples)).astype(np.int32)
+        error = np.abs(decoded - samples.astype(np.int32))
+
+        self.assertTrue(np.all(error <= np.abs(samples.astype(np.int32)) // 16 + 8))
+
+
+class TestAudioEncoder(unittest.TestCase):
+    def test_regroups_blocks_into_frames(self):
+        encoder = create_audio_encoder(
+            AudioStreamCodec.mulaw,
+            sample_rate=48000,
+            channels=1,
+            frame_ms=20,
+            bitrate=32000,
+        )
+        block = np.zeros(1024, dtype=np.int16).tobytes()
+
+        first = encoder.encode(block)
+        second = encoder.encode(block)
+
+        self.assertEqual(first, [b"\xff" * 960])
+        self.assertEqual([len(frame) for frame in second], [960])
+        self.assertEqual(encoder.stream_format.frame_size, 960)
+
+    def test_opus_requires_opuslib(self):
+        with patch(
+            "app.services.media.audio_codecs.import_module",
+            side_effect=ImportError("No module named 'opuslib'"),
+        ):
+            with self.assertRaises(AudioCodecUnavailable):
+                create_audio_encoder(AudioStreamCodec.opus, 48000, 1, 20, 32000)
+
+    def test_opus_rejects_unsupported_frame_duration(self):
+        with self.assertRaises(AudioCodecUnavailable):
+            create_audio_encoder(AudioStreamCodec.opus, 48000, 1, 25, 32000)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -4,6 +4,7 @@ from types import SimpleNamespace
 from typing import Any, cast
 from unittest.mock import AsyncMock, MagicMock
 
+from app.managers.i2c_bus_scheduler import I2CBusScheduler
 from app.schemas.robot.battery import BatteryConfig
 from app.services.sensors.battery_service import BatteryService
 from robot_hat.data_types import BatteryMetrics
@@ -65,6 +66,9 @@ class TestBatteryService(unittest.IsolatedAsyncioTestCase):
         self.service._metrics_cache = {}
         self.service._adapter_errors = {}
         self.service._lock = asyncio.Lock()
+        self.service._bus = I2CBusScheduler()
+        self.addCleanup(self.service._bus.close)
+        self.service._telemetry = MagicMock()
         self.broadcast_json = AsyncMock()
         self.service.connection_manager = MagicMock(broadcast_json=self.broadcast_json)
 
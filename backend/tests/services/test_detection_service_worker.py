@@ -0,0 +1,122 @@
+import json
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+from typing import Any, List, Optional
+from unittest.mock import patch
+
+from app.schemas.detection import DetectionSettings
+from app.services.connection_service import ConnectionService
+from app.services.detection.detection_profile_service import DetectionProfileService
+from app.services.detection.detection_service import DetectionService
+from app.services.domain.settings_service import SettingsService
+from app.services.file_management.file_manager_service import FileManagerService
+
+PROCESS_MODULE = "app.managers.detection.detection_process"
+
+
+class DummySettingsService(SettingsService):
+    def __init__(self) -> None:
+        self.settings: dict[str, Any] = {"detection": {}}
+
+
+class DummyFileManager(FileManagerService):
+    def __init__(self) -> None:
+        self.root_directory = "/models"
+
+
+class ThreadProcess:
+    """
+    Runs the process target in a thread of the test process.
+    """
+
+    started: List["ThreadProcess"] = []
+
+    def __init__(self, target, args, name: Optional[str] = None) -> None:
+        self.thread = threading.Thread(target=target, args=args, daemon=True)
+        self.closed = False
+
+    def start(self) -> None:
+        ThreadProcess.started.append(self)
+        self.thread.start()
+
+    def is_alive(self) -> bool:
+        return self.thread.is_alive()
+
+    def join(self, timeout: Optional[float] = None) -> None:
+        self.thread.join(timeout)
+
+    def terminate(self) -> None:
+        pass
+
+    def close(self) -> None:
+        self.closed = True
+
+
+class TestDetectionServiceWorker(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self) -> None:
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        root = Path(tmp.name)
+        template = root / "default.json"
+        template.write_text(
+            json.dumps({"schema_version": 2, "selected_model": None, "profiles": {}})
+        )
+        self.service = DetectionService(
+            settings_service=DummySettingsService(),
+            file_manager=DummyFileManager(),
+            connection_manager=ConnectionService(),
+            profile_service=DetectionProfileService(
+                target_file=str(root / "profiles.json"),
+                template_file=str(template),
+                labels_file=None,
+            ),
+        )
+        self.loaded: List[str] = []
+
+        def fake_detection(
+            model, stop_event, _frames, _results, _control, out_queue, *_
+        ):
+            self.loaded.append(model)
+            out_queue.put({"success": True, "labels": ["person", "car"]})
+            stop_event.wait(5)
+
+        ThreadProcess.started = []
+        for target, fake in (
+            ("multiprocessing.Process", ThreadProcess),
+            (f"{PROCESS_MODULE}.detection_process_func", fake_detection),
+            (f"{PROCESS_MODULE}.preload_detection_libraries", lambda: None),
+        ):
+            patcher = patch(target, fake)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    async def test_reuses_the_worker_across_model_loads(self) -> None:
+        self.service.start_worker()
+        worker = self.service.worker
+
+        for model in ("yolo11n.pt", "yolo11s.pt"):
+            self.service.detection_settings = DetectionSettings(
+                model=model, active=True
+            )
+            await self.service.start_detection_process()
+            self.assertIs(self.service.detection_process, worker)
+            await self.service.stop_detection_process()
+            self.assertIsNone(self.service.detection_process)
+
+        self.assertEqual(self.loaded, ["/models/yolo11n.pt", "/models/yolo11s.pt"])
+        self.assertEqual(ThreadProcess.started, [worker])
+        self.assertEqual(
+            self.service.detection_settings.available_labels, ["person", "car"]
+        )
+
+        await self.service.cleanup()
+
+        assert worker is not None
+        self.assertFalse(worker.is_alive())
+        self.assertTrue(worker.closed)
+
+
+if __name__ == "__main__":
+    unittest.main()
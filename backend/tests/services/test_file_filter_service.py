@@ -0,0 +1,132 @@
+import unittest
+from typing import List
+from unittest.mock import patch
+
+from app.core.file_filtering.file_index import FileIndex
+from app.schemas.file_filter import (
+    FileDetail,
+    FileFilterModel,
+    FilterFieldStringArray,
+    FilterMatchMode,
+    SearchModel,
+)
+from app.services.file_management.file_filter_service import FileFilterService
+from rapidfuzz import fuzz
+
+
+def make_file(path: str, is_dir: bool = False, file_type: str = "audio") -> FileDetail:
+    return FileDetail(
+        name=path.rsplit("/", 1)[-1],
+        path=path,
+        size=0 if is_dir else 100,
+        is_dir=is_dir,
+        modified=1.0,
+        type="directory" if is_dir else file_type,
+    )
+
+
+class TestFileFilterService(unittest.TestCase):
+    def setUp(self):
+        self.service = FileFilterService()
+        self.files: List[FileDetail] = [
+            make_file("rock", is_dir=True),
+            make_file("rock/live", is_dir=True),
+            make_file("rock/live/highway_to_hell.mp3"),
+            make_file("rock/back_in_black.mp3"),
+            make_file("notes.txt", file_type="text"),
+            make_file("photo.jpg", file_type="image"),
+        ]
+
+    def paths(self, files: List[FileDetail]) -> List[str]:
+        return [f.path for f in files]
+
+    def test_search_includes_parent_directories(self):
+        result = self.service.filter_files(
+            self.files, search=SearchModel(value="highway", field="name")
+        )
+
+        self.assertEqual(
+            self.paths(result),
+            ["rock/live/highway_to_hell.mp3", "rock", "rock/live"],
+        )
+
+    def test_search_handles_absolute_paths(self):
+        files = [
+            make_file("/music", is_dir=True),
+            make_file("/music/highway_to_hell.mp3"),
+        ]
+
+        result = self.service.filter_files(
+            files, search=SearchModel(value="highway", field="name")
+        )
+
+        self.assertEqual(self.paths(result), ["/music/highway_to_hell.mp3", "/music"])
+
+    def test_search_matches_per_file_scoring(self):
+        query = "black"
+        expected = [
+            f.path
+            for f in self.files
+            if not f.is_dir and fuzz.WRatio(query, f.name.lower()) >= 70
+        ]
+
+        result = self.service.filter_files(
+            [f for f in self.files if not f.is_dir],
+            search=SearchModel(value=query, field="name"),
+        )
+
+        self.assertEqual(self.paths(result), expected)
+
+    def test_filters_and_search_combined(self):
+        filter_model = FileFilterModel(
+            type=FilterFieldStringArray(value=["text"], match_mode=FilterMatchMode.IN)
+        )
+
+        result = self.service.filter_files(
+            self.files,
+            filter_model=filter_model,
+            search=SearchModel(value="notes", field="name"),
+        )
+
+        self.assertEqual(self.paths(result), ["notes.txt"])
+
+    def test_transformer_is_applied_to_direct_matches_only(self):
+        transformed: List[str] = []
+
+        def transformer(f: FileDetail) -> FileDetail:
+            transformed.append(f.path)
+            return f
+
+        self.service.filter_files(
+            self.files,
+            search=SearchModel(value="highway", field="name"),
+            filtered_file_transformer=transformer,
+        )
+
+        self.assertEqual(transformed, ["rock/live/highway_to_hell.mp3"])
+
+    def test_results_are_cached_for_unchanged_listing(self):
+        search = SearchModel(value="black", field="name")
+        first = self.service.filter_files(self.files, search=search)
+
+        relisted = [f.model_copy() for f in self.files]
+        with patch.object(
+            FileIndex, "search", side_effect=AssertionError("not cached")
+        ):
+            second = self.service.filter_files(relisted, search=search)
+
+        self.assertEqual(self.paths(first), self.paths(second))
+        self.assertTrue(all(f in relisted for f in second))
+
+    def test_changed_listing_invalidates_cache(self):
+        search = SearchModel(value="black", field="name")
+        self.service.filter_files(self.files, search=search)
+
+        relisted = self.files + [make_file("black_dog.mp3")]
+        result = self.service.filter_files(relisted, search=search)
+
+        self.assertIn("black_dog.mp3", self.paths(result))
+
+
+if __name__ == "__main__":
+    unittest.main()
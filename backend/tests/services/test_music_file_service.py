@@ -0,0 +1,145 @@
+import os
+import tempfile
+import unittest
+from unittest.mock import MagicMock
+
+from app.managers.file_management.file_manager import FileManager
+from app.schemas.file_filter import FileDetail
+from app.services.file_management.file_filter_service import FileFilterService
+from app.services.media.audio_metadata_service import AudioTags
+from app.services.media.music_file_service import MusicFileService
+from app.services.media.music_library import MusicLibrary
+
+
+def track(path: str, order=None) -> FileDetail:
+    return FileDetail(
+        name=os.path.basename(path),
+        path=path,
+        size=1,
+        is_dir=False,
+        modified=1.0,
+        type="audio",
+        order=order,
+    )
+
+
+class TestMusicLibrary(unittest.TestCase):
+    def test_unordered_tracks_come_first_then_highest_order(self):
+        library = MusicLibrary()
+        library.replace([track("a.mp3", 0), track("b.mp3"), track("c.mp3", 1)])
+        library.upsert(track("d.mp3"))
+
+        self.assertEqual(
+            [t.path for t in library.sorted_tracks()],
+            ["b.mp3", "d.mp3", "c.mp3", "a.mp3"],
+        )
+
+    def test_remove_directory_removes_nested_tracks(self):
+        library = MusicLibrary()
+        library.replace([track("album/a.mp3"), track("album2/b.mp3")])
+
+        removed = library.remove("album")
+
+        self.assertEqual(removed, ["album/a.mp3"])
+        self.assertEqual([t.path for t in library.sorted_tracks()], ["album2/b.mp3"])
+
+    def test_set_order_resorts_tracks(self):
+        library = MusicLibrary()
+        library.replace([track("a.mp3"), track("b.mp3")])
+        library.sorted_tracks()
+
+        library.set_order(["b.mp3", "a.mp3"])
+
+        self.assertEqual([t.path for t in library.sorted_tracks()], ["a.mp3", "b.mp3"])
+
+
+class TestMusicFileService(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+        self.root = os.path.join(self.temp_dir.name, "music")
+        default_dir = os.path.join(self.temp_dir.name, "default")
+        os.makedirs(self.root)
+        os.makedirs(default_dir)
+        self._write("one.mp3")
+
+        self.metadata = MagicMock()
+        self.metadata.read_tags.return_value = AudioTags(
+            duration=12.5, title="Song", artist="Artist", album="Album"
+        )
+        self.music_service = MagicMock()
+        filter_service = FileFilterService()
+        self.service = MusicFileService(
+            music_service=self.music_service,
+            default_music_dir=default_dir,
+            root_directory=self.root,
+            cache_dir=os.path.join(self.temp_dir.name, "cache"),
+            file_manager=FileManager(filter_service),
+            filter_service=filter_service,
+            metadata_service=self.metadata,
+        )
+        self.addCleanup(self.service.cache_manager.close)
+
+    def _write(self, name: str) -> str:
+        path = os.path.join(self.root, name)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "wb") as f:
+            f.write(b"\xff\xfb" * 16)
+        return path
+
+    def test_tracks_include_tags_and_are_probed_once(self):
+        tracks = self.service.list_sorted_tracks()
+        self.service.list_sorted_tracks()
+
+        self.assertEqual([t.path for t in tracks], ["one.mp3"])
+        self.assertEqual(tracks[0].duration, 12.5)
+        self.assertEqual(tracks[0].title, "Song")
+        self.assertEqual(tracks[0].artist, "Artist")
+        self.assertEqual(tracks[0].album, "Album")
+        self.metadata.read_tags.assert_called_once()
+
+    def test_listing_does_not_scan_after_library_is_loaded(self):
+        self.service.list_sorted_tracks()
+        self._write("untracked.mp3")
+
+        paths = [t.path for t in self.service.list_sorted_tracks()]
+
+        self.assertEqual(paths, ["one.mp3"])
+
+    def test_upload_rename_and_remove_update_library(self):
+        self.service.list_sorted_tracks()
+
+        self.service.on_file_added(self._write("two.mp3"))
+        self.service.rename_file("two.mp3", "renamed.mp3")
+        self.service.remove_file("one.mp3")
+
+        self.assertEqual(
+            [t.path for t in self.service.list_sorted_tracks()], ["renamed.mp3"]
+        )
+        self.assertEqual(self.metadata.read_tags.call_count, 2)
+        updated = self.music_service.update_tracks.call_args.args[0]
+        self.assertEqual([t.path for t in updated], ["renamed.mp3"])
+
+    def test_metadata_is_persisted_across_instances(self):
+        self.service.list_sorted_tracks()
+        self.service.cache_manager.close()
+
+        restarted = MusicFileService(
+            music_service=self.music_service,
+            default_music_dir=self.service.default_music_dir,
+            root_directory=self.root,
+            cache_dir=os.path.join(self.temp_dir.name, "cache"),
+            file_manager=self.service.file_manager,
+            filter_service=self.service.filter_service,
+            metadata_service=self.metadata,
+        )
+        self.addCleanup(restarted.cache_manager.close)
+
+        tracks = restarted.list_sorted_tracks()
+
+        self.assertEqual(tracks[0].title, "Song")
+        self.metadata.read_tags.assert_called_once()
+
+
+if __name__ == "__main__":
+    unittest.main()
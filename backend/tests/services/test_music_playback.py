@@ -1,8 +1,13 @@
+import os
+import struct
+import tempfile
 import unittest
+import wave
 from collections.abc import Generator
 
 from app.exceptions.music import MusicInitError, MusicPlayerError
 from app.services.media.music_playback import (
+    DecoderStream,
     MiniaudioMusicPlayback,
     PlaybackDevice,
     PlaybackStream,
@@ -195,5 +200,117 @@ class TestMiniaudioMusicPlayback(unittest.TestCase):
         self.assertEqual(self.device.close_count, 1)
 
 
+def pcm(*samples: int) -> bytes:
+    return struct.pack(f"<{len(samples)}h", *samples)
+
+
+def make_pcm_stream(data: bytes, frame_bytes: int = 2) -> PlaybackStream:
+    def generate() -> Generator[bytes, int, None]:
+        offset = 0
+        requested_frames = yield b""
+        while offset < len(data):
+            size = requested_frames * frame_bytes
+            chunk = data[offset : offset + size]
+            offset += size
+            requested_frames = yield chunk
+
+    stream = generate()
+    next(stream)
+    return stream
+
+
+class TestGaplessPlayback(unittest.TestCase):
+    def setUp(self) -> None:
+        self.device = FakePlaybackDevice()
+        self.files = {
+            "/music/one.wav": pcm(1, 2, 3, 4, 5),
+            "/music/two.wav": pcm(10, 20, 30, 40),
+        }
+
+    def make_player(self, crossfade_msec: int = 0) -> MiniaudioMusicPlayback:
+        return MiniaudioMusicPlayback(
+            sample_rate=1000,
+            channels=1,
+            crossfade_msec=crossfade_msec,
+            device_factory=lambda: self.device,
+            stream_factory=lambda path, seek: make_pcm_stream(
+                self.files[path][seek * 2 :]
+            ),
+        )
+
+    def wait_for_prefetch(self, player: MiniaudioMusicPlayback) -> None:
+        queued = player._next
+        if queued is not None:
+            queued[1].result(timeout=1)
+
+    def test_next_file_is_spliced_into_the_same_request(self) -> None:
+        player = self.make_player()
+        player.play("/music/one.wav")
+        player.queue_next("/music/two.wav")
+        self.wait_for_prefetch(player)
+
+        first = self.device.request_frames(4)
+        second = self.device.request_frames(4)
+
+        self.assertEqual(first, pcm(1, 2, 3, 4))
+        self.assertEqual(second, pcm(5, 10, 20, 30))
+        self.assertEqual(len(self.device.started_streams), 1)
+        event = player.take_event()
+        self.assertTrue(event.advanced if event else False)
+
+    def test_crossfade_mixes_tail_with_next_head(self) -> None:
+        self.files["/music/one.wav"] = pcm(100, 100, 100, 100)
+        self.files["/music/two.wav"] = pcm(0, 0, 0, 0)
+        player = self.make_player(crossfade_msec=3)
+        player.play("/music/one.wav")
+        player.queue_next("/music/two.wav")
+        self.wait_for_prefetch(player)
+
+        output = self.device.request_frames(4) + self.device.request_frames(4)
+
+        samples = struct.unpack(f"<{len(output) // 2}h", output)
+        self.assertEqual(samples[:4], (100, 100, 50, 0))
+
+    def test_without_queued_file_stream_completes(self) -> None:
+        player = self.make_player()
+        player.play("/music/two.wav")
+
+        self.device.request_frames(4)
+        with self.assertRaises(StopIteration):
+            self.device.request_frames(4)
+
+        event = player.take_event()
+        self.assertFalse(event.advanced if event else True)
+
+    def test_seek_keeps_device_running(self) -> None:
+        player = self.make_player()
+        player.play("/music/one.wav")
+        self.device.request_frames(1)
+
+        player.seek(0.003)
+
+        self.assertEqual(self.device.request_frames(2), pcm(4, 5))
+        self.assertEqual(len(self.device.started_streams), 1)
+
+
+class TestDecoderStream(unittest.TestCase):
+    def test_seek_reuses_the_decoder(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            file_path = os.path.join(temp_dir, "tone.wav")
+            with wave.open(file_path, "wb") as f:
+                f.setnchannels(1)
+                f.setsampwidth(2)
+                f.setframerate(8000)
+                f.writeframes(pcm(*range(100)))
+
+            stream = DecoderStream(file_path, channels=1, sample_rate=8000)
+            try:
+                self.assertEqual(stream.send(3), pcm(0, 1, 2))
+                self.assertTrue(stream.seek(50))
+                self.assertEqual(stream.send(2), pcm(50, 51))
+            finally:
+                stream.close()
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -1,8 +1,10 @@
+import asyncio
 import tempfile
+import threading
 import unittest
 from collections import deque
 from pathlib import Path
-from typing import cast
+from typing import Callable, cast
 from unittest.mock import AsyncMock
 
 from app.schemas.file_filter import FileDetail
@@ -18,6 +20,8 @@ class FakeMusicPlayback:
         self.calls: list[tuple[object, ...]] = []
         self.events: deque[PlaybackEvent] = deque()
         self.play_error: Exception | None = None
+        self.queued: str | None = None
+        self.listener: Callable[[], None] | None = None
 
     def play(self, file_path: str, position: float = 0.0) -> None:
         self.calls.append(("play", file_path, position))
@@ -25,6 +29,12 @@ class FakeMusicPlayback:
             raise self.play_error
         self.can_resume = False
 
+    def seek(self, position: float) -> None:
+        self.calls.append(("seek", position))
+
+    def queue_next(self, file_path: str | None) -> None:
+        self.queued = file_path
+
     def pause(self) -> None:
         self.calls.append(("pause",))
         self.can_resume = True
@@ -41,6 +51,14 @@ class FakeMusicPlayback:
     def take_event(self) -> PlaybackEvent | None:
         return self.events.popleft() if self.events else None
 
+    def set_event_listener(self, listener: Callable[[], None] | None) -> None:
+        self.listener = listener
+
+    def emit(self, event: PlaybackEvent) -> None:
+        self.events.append(event)
+        if self.listener is not None:
+            self.listener()
+
     def close(self) -> None:
         self.calls.append(("close",))
 
@@ -58,7 +76,7 @@ def track(name: str, duration: float = 10.0) -> FileDetail:
     )
 
 
-class TestMusicService(unittest.IsolatedAsyncioTestCase):
+class MusicServiceTestCase(unittest.IsolatedAsyncioTestCase):
     def setUp(self) -> None:
         self.temp_dir = tempfile.TemporaryDirectory()
         self.addCleanup(self.temp_dir.cleanup)
@@ -77,6 +95,8 @@ class TestMusicService(unittest.IsolatedAsyncioTestCase):
             playback=self.playback,
         )
 
+
+class TestMusicService(MusicServiceTestCase):
     def test_toggle_starts_pauses_and_resumes_current_track(self) -> None:
         self.service.toggle_playing()
         self.service.toggle_playing()
@@ -102,15 +122,12 @@ class TestMusicService(unittest.IsolatedAsyncioTestCase):
         self.assertFalse(self.service.is_playing)
         self.assertEqual(self.service.position, 0.0)
 
-    def test_seek_restarts_active_decoder_at_requested_position(self) -> None:
+    def test_seek_moves_active_stream_to_requested_position(self) -> None:
         self.service.toggle_playing()
 
         self.service.update_position(4.5)
 
-        self.assertEqual(
-            self.playback.calls[-1],
-            ("play", str(self.music_dir / "one.mp3"), 4.5),
-        )
+        self.assertEqual(self.playback.calls[-1], ("seek", 4.5))
         self.assertEqual(self.service.position, 4.5)
 
     def test_seek_is_clamped_to_known_duration(self) -> None:
@@ -172,6 +189,27 @@ class TestMusicService(unittest.IsolatedAsyncioTestCase):
             ("play", str(self.music_dir / "one.mp3"), 0.0),
         )
 
+    def test_next_track_is_queued_according_to_mode(self) -> None:
+        self.service.play_track("two.mp3")
+        self.assertEqual(self.playback.queued, str(self.music_dir / "one.mp3"))
+
+        self.service.update_mode(MusicPlayerMode.QUEUE)
+        self.assertIsNone(self.playback.queued)
+
+        self.service.update_mode(MusicPlayerMode.LOOP_ONE)
+        self.assertEqual(self.playback.queued, str(self.music_dir / "two.mp3"))
+
+    def test_gapless_advance_follows_player_without_restarting(self) -> None:
+        self.service.play_track("one.mp3")
+        play_calls = len(self.playback.calls)
+
+        self.service._process_playback_event(PlaybackEvent(advanced=True))
+
+        self.assertEqual(self.service.track, "two.mp3")
+        self.assertTrue(self.service.is_playing)
+        self.assertEqual(len(self.playback.calls), play_calls)
+        self.assertEqual(self.playback.queued, str(self.music_dir / "one.mp3"))
+
     def test_decoder_failure_stops_instead_of_repeating_track(self) -> None:
         self.service.toggle_playing()
 
@@ -194,5 +232,63 @@ class TestMusicService(unittest.IsolatedAsyncioTestCase):
         self.assertEqual(self.playback.calls[-1], ("close",))
 
 
+class TestMusicStatePublisher(MusicServiceTestCase):
+    async def asyncSetUp(self) -> None:
+        self.service.BROADCAST_COALESCE_DELAY = 0
+        self.service.start_broadcast_task()
+        self.addAsyncCleanup(self.service.cleanup)
+        await self._settle()
+        self.connection_mock.broadcast_json.reset_mock()
+
+    async def _settle(self) -> None:
+        for _ in range(5):
+            await asyncio.sleep(0)
+
+    def _broadcast_payloads(self) -> list[dict]:
+        return [
+            call.args[0]["payload"]
+            for call in self.connection_mock.broadcast_json.call_args_list
+        ]
+
+    async def test_playback_event_from_audio_thread_is_published(self) -> None:
+        self.service.play_track("one.mp3")
+        thread = threading.Thread(
+            target=self.playback.emit, args=(PlaybackEvent(advanced=True),)
+        )
+        thread.start()
+        thread.join()
+
+        await self._settle()
+
+        payloads = self._broadcast_payloads()
+        self.assertEqual(len(payloads), 1)
+        self.assertEqual(payloads[0]["track"], "two.mp3")
+        self.assertEqual(payloads[0]["rate"], 1.0)
+
+    async def test_unchanged_state_is_not_rebroadcast(self) -> None:
+        self.service.play_track("one.mp3")
+        await self.service.broadcast_state()
+        self.connection_mock.broadcast_json.reset_mock()
+
+        self.service.notify_state_changed()
+        self.service.notify_state_changed()
+        await self._settle()
+
+        self.connection_mock.broadcast_json.assert_not_called()
+
+    async def test_burst_of_changes_is_coalesced(self) -> None:
+        self.service.BROADCAST_COALESCE_DELAY = 0.01
+        self.service.play_track("one.mp3")
+        self.service.notify_state_changed()
+        self.service.update_mode(MusicPlayerMode.QUEUE)
+        self.service.notify_state_changed()
+
+        await asyncio.sleep(0.05)
+
+        payloads = self._broadcast_payloads()
+        self.assertEqual(len(payloads), 1)
+        self.assertEqual(payloads[0]["mode"], MusicPlayerMode.QUEUE)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,114 @@
+import asyncio
+import os
+import tempfile
+import threading
+import time
+import unittest
+
+import uvicorn
+from app.api import robot_deps
+from app.api.control import ipc
+from app.services.control.ipc_event_service import IPCEventService
+from app.services.integration.robot_communication_service import (
+    RobotCommunicationService,
+)
+from app.util.unix_socket import bind_unix_socket, unix_sockets_supported
+from fastapi import FastAPI
+
+
+@unittest.skipUnless(unix_sockets_supported(), "Unix domain sockets not supported")
+class TestRobotCommunicationService(unittest.IsolatedAsyncioTestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.tmp = tempfile.TemporaryDirectory()
+        cls.socket_path = os.path.join(cls.tmp.name, "control.sock")
+        cls.events = IPCEventService(heartbeat_s=0.05)
+        cls.settings_updates = []
+
+        app = FastAPI()
+        app.include_router(ipc.router)
+        app.dependency_overrides[robot_deps.get_ipc_event_service] = lambda: cls.events
+
+        @app.post("/px/api/settings/update")
+        def update_settings(settings: dict):
+            cls.settings_updates.append(settings)
+            return settings
+
+        cls.sock = bind_unix_socket(cls.socket_path)
+        cls.server = uvicorn.Server(uvicorn.Config(app, log_level="error"))
+        cls.thread = threading.Thread(
+            target=cls.server.run, kwargs={"sockets": [cls.sock]}, daemon=True
+        )
+        cls.thread.start()
+        deadline = time.monotonic() + 5
+        while not cls.server.started and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        cls.events.close()
+        cls.server.should_exit = True
+        cls.thread.join(timeout=5)
+        cls.sock.close()
+        cls.tmp.cleanup()
+
+    async def asyncSetUp(self) -> None:
+        self.service = RobotCommunicationService(
+            base_url="http://127.0.0.1:1",
+            socket_path=self.socket_path,
+            reconnect_delay=0.01,
+        )
+
+    async def asyncTearDown(self) -> None:
+        await self.service.aclose()
+
+    async def test_requests_reuse_one_connection_over_the_socket(self) -> None:
+        for i in range(3):
+            await self.service.refresh_robot_settings({"i": i})
+
+        client = await self.service.get_client()
+        pool = getattr(client._transport, "_pool")
+
+        self.assertEqual(self.settings_updates[-3:], [{"i": 0}, {"i": 1}, {"i": 2}])
+        self.assertEqual(len(pool.connections), 1)
+
+    async def test_publish_reaches_robot_app_listeners(self) -> None:
+        received = []
+        self.events.on("detection", received.append)
+        self.addCleanup(self.events.off, "detection")
+
+        delivered = await self.service.publish("detection", {"label": "person"})
+
+        self.assertTrue(delivered)
+        self.assertEqual(received, [{"label": "person"}])
+
+    async def test_subscribers_receive_robot_app_events(self) -> None:
+        received: asyncio.Queue = asyncio.Queue()
+        self.service.subscribe("distance", received.put_nowait)
+
+        deadline = time.monotonic() + 5
+        while self.events.subscribers == 0 and time.monotonic() < deadline:
+            await asyncio.sleep(0.01)
+        self.server_publish("distance", {"distance": 12.5})
+
+        payload = await asyncio.wait_for(received.get(), 5)
+
+        self.assertEqual(payload, {"distance": 12.5})
+
+    async def test_falls_back_to_tcp_without_socket(self) -> None:
+        service = RobotCommunicationService(
+            base_url="http://127.0.0.1:1",
+            socket_path=os.path.join(self.tmp.name, "missing.sock"),
+        )
+        self.addAsyncCleanup(service.aclose)
+
+        self.assertIsNone(service.uds)
+        self.assertFalse(await service.publish("detection", None))
+
+    def server_publish(self, event_type: str, payload) -> None:
+        loop = self.server.servers[0].get_loop()
+        loop.call_soon_threadsafe(self.events.publish, event_type, payload)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,139 @@
+import math
+import os
+import tempfile
+import unittest
+
+import numpy as np
+
+from app.managers.telemetry_log import TelemetryKind, TelemetryLogWriter
+from app.services.sensors.speed_calibration import calibrate, synthetic_samples
+from app.services.sensors.speed_estimator import SpeedEstimator
+from app.services.sensors.speed_filter import (
+    SpeedFilter,
+    SpeedNoise,
+    SpeedSamples,
+    fit_noise,
+    run_filter,
+    smooth,
+)
+
+
+class TestSpeedFilter(unittest.TestCase):
+    def setUp(self) -> None:
+        self.noise = SpeedNoise(sigma_position_cm=1.5, sigma_speed_cm_s=8.0)
+        self.samples, self.true_speed = synthetic_samples(600, self.noise, seed=1)
+
+    def test_candidates_match_separate_runs(self) -> None:
+        noises = [SpeedNoise(), self.noise, SpeedNoise(sigma_speed_cm_s=40.0)]
+
+        together = run_filter(self.samples, noises)
+
+        for i, noise in enumerate(noises):
+            alone = run_filter(self.samples, [noise])
+            np.testing.assert_allclose(together.state[i], alone.state[0])
+            self.assertAlmostEqual(together.nll[i], alone.nll[0], places=6)
+
+    def test_online_steps_match_the_batch_run(self) -> None:
+        speed_filter = SpeedFilter([self.noise])
+        for i in range(len(self.samples)):
+            speed_filter.step(
+                self.samples.interval[i],
+                self.samples.distance[i],
+                command_cm_s=self.samples.command_cm_s[i],
+            )
+
+        result = run_filter(self.samples, [self.noise])
+
+        self.assertAlmostEqual(speed_filter.x1, result.speed[0, -1])
+
+    def test_smoothing_tracks_the_true_speed_better(self) -> None:
+        result = run_filter(self.samples, [self.noise])
+        state, _ = smooth(result)
+
+        filtered = np.abs(result.speed[0] - self.true_speed).mean()
+        smoothed = np.abs(state[0, :, 1] - self.true_speed).mean()
+
+        self.assertLess(smoothed, filtered)
+
+    def test_fit_recovers_the_noise(self) -> None:
+        fit = fit_noise(self.samples, base=self.noise)
+
+        self.assertAlmostEqual(fit.noise.sigma_position_cm, 1.5, delta=0.3)
+        self.assertAlmostEqual(fit.noise.sigma_speed_cm_s, 8.0, delta=2.0)
+
+    def test_missing_inputs_only_predict(self) -> None:
+        samples = SpeedSamples.create(
+            interval=[0.0, 0.1, 0.1, 0.1],
+            distance=[math.nan, 100.0, math.nan, 90.0],
+            command_cm_s=[math.nan, 50.0, 50.0, 50.0],
+        )
+
+        result = run_filter(samples)
+
+        self.assertTrue(np.isnan(result.state[0, 0]).all())
+        self.assertLess(result.state[0, 2, 0], result.state[0, 1, 0])
+        self.assertFalse(np.isnan(result.state[0, 3]).any())
+
+
+class TestSpeedEstimator(unittest.TestCase):
+    def setUp(self) -> None:
+        self.estimator = SpeedEstimator()
+
+    def approach(self, speed_cm_s: float, relative_speed: int, steps: int = 40):
+        distance = 300.0
+        result = None
+        for _ in range(steps):
+            result = self.estimator.process_distance(
+                distance, 0.05, relative_speed=relative_speed
+            )
+            distance -= speed_cm_s * 0.05
+        return result
+
+    def test_first_reading_has_no_speed(self) -> None:
+        self.assertIsNone(
+            self.estimator.process_distance(100.0, 0.05, relative_speed=0)
+        )
+
+    def test_estimates_the_approach_speed(self) -> None:
+        speed_cm_s = self.estimator.max_speed_cm_s * 0.5
+
+        result = self.approach(speed_cm_s, relative_speed=50)
+
+        assert result is not None
+        self.assertAlmostEqual(result, speed_cm_s * 0.036, delta=0.2)
+
+    def test_idle_car_reports_zero(self) -> None:
+        self.assertEqual(self.approach(1.0, relative_speed=0), 0.0)
+
+    def test_invalid_readings_are_skipped(self) -> None:
+        self.approach(0.0, relative_speed=0, steps=3)
+
+        self.assertIsNone(self.estimator.process_distance(-1, 0.05, relative_speed=0))
+        self.assertIsNotNone(
+            self.estimator.process_distance(300.0, 0.05, relative_speed=0)
+        )
+
+
+class TestSpeedCalibration(unittest.TestCase):
+    def test_calibrates_a_recorded_session(self) -> None:
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        directory = os.path.join(tmp.name, "session")
+        writer = TelemetryLogWriter(directory)
+        samples, _ = synthetic_samples(200, seed=2)
+        writer.append(TelemetryKind.DRIVE, 30, 0, 0, 0, 0, 0, 0, ts=0.0)
+        for i, distance in enumerate(samples.distance.tolist()):
+            status = 0 if i % 50 else 1
+            writer.append(TelemetryKind.DISTANCE, distance, status, i + 1, ts=i * 0.05)
+        writer.close()
+
+        report = calibrate(directory, with_smoothing=True)
+
+        self.assertEqual(report["samples"], 200)
+        self.assertLessEqual(report["nll_fitted"], report["nll_default"])
+        self.assertEqual(len(report["smoothed_speed_cm_s"]), 200)
+        self.assertIsNone(report["smoothed_speed_cm_s"][0])
+
+
+if __name__ == "__main__":
+    unittest.main()
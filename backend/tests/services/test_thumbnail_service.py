@@ -0,0 +1,111 @@
+import os
+import tempfile
+import time
+import unittest
+from unittest.mock import patch
+
+import cv2
+import numpy as np
+from app.schemas.file_management import ThumbnailSize
+from app.services.media.thumbnail_service import ThumbnailService, read_jpeg_size
+
+
+class TestThumbnailService(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.cache_dir = os.path.join(self.temp_dir.name, "thumbnails")
+        self.photo = os.path.join(self.temp_dir.name, "photo.jpg")
+        img = np.random.randint(0, 255, (1200, 1600, 3), dtype=np.uint8)
+        cv2.imwrite(self.photo, img)
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def make_service(self, max_cache_bytes: int = 10 * 1024 * 1024):
+        return ThumbnailService(self.cache_dir, max_cache_bytes=max_cache_bytes)
+
+    def test_generates_downscaled_thumbnail(self):
+        service = self.make_service()
+
+        path = service.get_thumbnail(self.photo, ThumbnailSize.thumbnail)
+
+        self.assertIsNotNone(path)
+        img = cv2.imread(path or "")
+        self.assertEqual(img.shape[:2], (192, 256))
+
+    def test_decodes_at_reduced_scale(self):
+        with patch("cv2.imread", wraps=cv2.imread) as imread:
+            ThumbnailService.decode_reduced(self.photo, 200)
+
+        imread.assert_called_once_with(self.photo, cv2.IMREAD_REDUCED_COLOR_8)
+
+        with patch("cv2.imread", wraps=cv2.imread) as imread:
+            img = ThumbnailService.decode_reduced(self.photo, 700)
+
+        imread.assert_called_once_with(self.photo, cv2.IMREAD_REDUCED_COLOR_2)
+        self.assertEqual(img.shape[:2] if img is not None else None, (600, 800))
+
+    def test_decodes_other_formats_once(self):
+        png = os.path.join(self.temp_dir.name, "photo.png")
+        cv2.imwrite(png, np.zeros((300, 400, 3), dtype=np.uint8))
+
+        with patch("cv2.imread", wraps=cv2.imread) as imread:
+            img = ThumbnailService.decode_reduced(png, 200)
+
+        imread.assert_called_once_with(png, cv2.IMREAD_COLOR)
+        self.assertEqual(img.shape[:2] if img is not None else None, (300, 400))
+
+    def test_reads_jpeg_size_from_header(self):
+        self.assertEqual(read_jpeg_size(self.photo), (1600, 1200))
+
+        not_jpeg = os.path.join(self.temp_dir.name, "photo.png")
+        cv2.imwrite(not_jpeg, np.zeros((4, 4, 3), dtype=np.uint8))
+        self.assertIsNone(read_jpeg_size(not_jpeg))
+
+    def test_bounds_cached_fingerprints(self):
+        service = self.make_service()
+        service.MAX_CACHED_FINGERPRINTS = 2
+
+        for mtime in range(1, 4):
+            os.utime(self.photo, (mtime, mtime))
+            service.fingerprint(self.photo)
+
+        self.assertEqual(
+            [mtime_ns for _, mtime_ns, _ in service._fingerprints],
+            [2 * 10**9, 3 * 10**9],
+        )
+
+    def test_reuses_cached_thumbnail(self):
+        service = self.make_service()
+        first = service.get_thumbnail(self.photo, ThumbnailSize.preview)
+
+        with patch.object(ThumbnailService, "decode_reduced") as decode:
+            second = service.get_thumbnail(self.photo, ThumbnailSize.preview)
+
+        decode.assert_not_called()
+        self.assertEqual(first, second)
+
+    def test_modified_source_gets_new_thumbnail(self):
+        service = self.make_service()
+        first = service.get_thumbnail(self.photo, ThumbnailSize.thumbnail)
+
+        stat = os.stat(self.photo)
+        os.utime(self.photo, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        second = service.get_thumbnail(self.photo, ThumbnailSize.thumbnail)
+
+        self.assertNotEqual(first, second)
+
+    def test_evicts_least_recently_used_over_budget(self):
+        service = self.make_service()
+        old = service.get_thumbnail(self.photo, ThumbnailSize.preview) or ""
+        os.utime(old, (time.time() - 100, time.time() - 100))
+        service.disk_cache.max_cache_bytes = os.path.getsize(old)
+
+        recent = service.get_thumbnail(self.photo, ThumbnailSize.thumbnail) or ""
+
+        self.assertFalse(os.path.exists(old))
+        self.assertTrue(os.path.exists(recent))
+
+
+if __name__ == "__main__":
+    unittest.main()
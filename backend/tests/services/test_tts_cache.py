@@ -0,0 +1,45 @@
+import os
+import tempfile
+import time
+import unittest
+
+from app.services.media.tts_cache import TTSAudioCache
+
+
+class TestTTSAudioCache(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.cache = TTSAudioCache(self.temp_dir.name, max_cache_bytes=1000)
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_returns_stored_audio(self):
+        self.cache.set("ab12", b"mp3 data")
+
+        self.assertEqual(self.cache.get("ab12"), b"mp3 data")
+        self.assertIsNone(self.cache.get("cd34"))
+
+    def test_evicts_least_recently_played_over_budget(self):
+        self.cache.set("aa01", b"a" * 400)
+        self.cache.set("bb02", b"b" * 400)
+        old = self.cache._path("aa01")
+        os.utime(old, (time.time() - 100, time.time() - 100))
+
+        self.assertIsNotNone(self.cache.get("bb02"))
+        self.cache.set("cc03", b"c" * 400)
+
+        self.assertIsNone(self.cache.get("aa01"))
+        self.assertIsNotNone(self.cache.get("bb02"))
+        self.assertIsNotNone(self.cache.get("cc03"))
+
+    def test_clear_removes_entries(self):
+        self.cache.set("ab12", b"mp3 data")
+
+        self.cache.clear()
+
+        self.assertIsNone(self.cache.get("ab12"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -4,7 +4,14 @@ from unittest.mock import Mock
 
 from app.exceptions.tts import TextToSpeechRequestError, TextToSpeechUnavailable
 from app.services.media.tts_service import TTSService
-from gspeech import GSpeechError, SpeechHandle, SpeechPlayer, SpeechPolicy
+from gspeech import (
+    GSpeechError,
+    SpeechHandle,
+    SpeechPlayer,
+    SpeechPolicy,
+    SynthesisError,
+    Synthesizer,
+)
 
 
 class TestTTSService(unittest.TestCase):
@@ -68,6 +75,28 @@ class TestTTSService(unittest.TestCase):
 
         self.player_mock.close.assert_called_once_with(timeout=2.0)
 
+    def test_prewarm_synthesizes_each_phrase(self) -> None:
+        synthesizer_mock = Mock(spec=Synthesizer)
+        synthesizer_mock.synthesize.side_effect = [
+            b"audio",
+            SynthesisError("offline"),
+        ]
+        service = TTSService(
+            cast(SpeechPlayer, self.player_mock),
+            synthesizer=cast(Synthesizer, synthesizer_mock),
+        )
+
+        warmed = service.prewarm(
+            [("Obstacle detected", "en"), ("Привіт", "uk"), ("Hello", "invalid")]
+        )
+
+        self.assertEqual(warmed, 1)
+        self.assertEqual(synthesizer_mock.synthesize.call_count, 2)
+        synthesizer_mock.synthesize.assert_any_call("Obstacle detected", "en")
+
+    def test_prewarm_without_synthesizer_is_a_no_op(self) -> None:
+        self.assertEqual(self.service.prewarm([("Hello", "en")]), 0)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,60 @@
+import os
+import tempfile
+import unittest
+from types import SimpleNamespace
+from typing import cast
+
+from app.api.endpoints.file_management import create_upload_in_aliased_dir
+from app.schemas.file_management import UploadSessionRequest
+from app.services.file_management.file_manager_service import FileManagerService
+from app.services.file_management.upload_service import UploadService
+from fastapi import HTTPException
+
+
+class TestCreateUploadEndpoint(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+        self.root = os.path.join(self.temp_dir.name, "data")
+        self.outside = os.path.join(self.temp_dir.name, "outside")
+        self.sessions_dir = os.path.join(self.temp_dir.name, "uploads")
+        os.makedirs(self.root)
+        self.manager = cast(
+            FileManagerService, SimpleNamespace(root_directory=self.root)
+        )
+        self.service = UploadService(self.sessions_dir)
+
+    def create(self, **kwargs):
+        return create_upload_in_aliased_dir(
+            UploadSessionRequest(size=10, **kwargs), self.manager, self.service
+        )
+
+    def test_creates_upload_in_root(self):
+        response = self.create(filename="model.zip", dir="models")
+
+        self.assertEqual(response["offset"], 0)
+        self.assertTrue(os.path.isdir(os.path.join(self.root, "models")))
+
+    def test_rejects_targets_outside_root(self):
+        for request in (
+            {"filename": "../outside/x"},
+            {"filename": os.path.join(self.outside, "x")},
+            {"filename": "x", "dir": "../outside"},
+            {"filename": "x", "dir": self.outside},
+            {"filename": "/tmp/x"},
+        ):
+            with self.subTest(**request):
+                with self.assertRaises(HTTPException) as ctx:
+                    self.create(**request)
+
+                self.assertEqual(ctx.exception.status_code, 400)
+
+        self.assertFalse(os.path.exists(self.outside))
+        self.assertEqual(os.listdir(self.root), [])
+        self.assertFalse(
+            os.path.exists(self.sessions_dir) and os.listdir(self.sessions_dir)
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,95 @@
+import hashlib
+import os
+import tempfile
+import unittest
+
+from app.exceptions.file_exceptions import (
+    UploadIntegrityError,
+    UploadOffsetMismatch,
+    UploadSessionNotFound,
+)
+from app.services.file_management.upload_service import UploadService
+
+
+class TestUploadService(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.root = os.path.join(self.temp_dir.name, "data")
+        self.sessions_dir = os.path.join(self.temp_dir.name, "uploads")
+        self.service = UploadService(self.sessions_dir)
+        self.content = os.urandom(300_000)
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_chunked_upload_is_moved_into_place(self):
+        session = self.service.create(self.root, "model.zip", len(self.content))
+
+        offset = self.service.write(session.upload_id, 0, self.content[:100_000])
+        offset = self.service.write(session.upload_id, offset, self.content[100_000:])
+        file_path = self.service.finalize(session.upload_id)
+
+        self.assertEqual(offset, len(self.content))
+        self.assertEqual(file_path, os.path.join(self.root, "model.zip"))
+        with open(file_path, "rb") as f:
+            self.assertEqual(f.read(), self.content)
+        self.assertEqual(os.listdir(self.root), ["model.zip"])
+        self.assertEqual(os.listdir(self.sessions_dir), [])
+
+    def test_offset_mismatch_reports_current_offset(self):
+        session = self.service.create(self.root, "model.zip", len(self.content))
+        self.service.write(session.upload_id, 0, self.content[:1000])
+
+        with self.assertRaises(UploadOffsetMismatch) as ctx:
+            self.service.write(session.upload_id, 0, self.content[:1000])
+
+        self.assertEqual(ctx.exception.offset, 1000)
+
+    def test_resumes_after_restart(self):
+        checksum = hashlib.sha256(self.content).hexdigest()
+        session = self.service.create(
+            self.root, "model.zip", len(self.content), checksum
+        )
+        self.service.write(session.upload_id, 0, self.content[:1000])
+        self.service._close(session)
+
+        restarted = UploadService(self.sessions_dir)
+        restored = restarted.get(session.upload_id)
+        restarted.write(session.upload_id, restored.offset, self.content[1000:])
+        file_path = restarted.finalize(session.upload_id)
+
+        self.assertEqual(restored.filename, "model.zip")
+        with open(file_path, "rb") as f:
+            self.assertEqual(f.read(), self.content)
+
+    def test_checksum_mismatch_keeps_part_file(self):
+        session = self.service.create(
+            self.root, "model.zip", len(self.content), "0" * 64
+        )
+        self.service.write(session.upload_id, 0, self.content)
+
+        with self.assertRaises(UploadIntegrityError):
+            self.service.finalize(session.upload_id)
+
+        self.assertFalse(os.path.exists(os.path.join(self.root, "model.zip")))
+        self.assertTrue(os.path.exists(session.part_path))
+
+    def test_rejects_data_beyond_declared_size(self):
+        session = self.service.create(self.root, "model.zip", 10)
+
+        with self.assertRaises(UploadIntegrityError):
+            self.service.write(session.upload_id, 0, b"x" * 11)
+
+    def test_abort_removes_part_file(self):
+        session = self.service.create(self.root, "model.zip", len(self.content))
+        self.service.write(session.upload_id, 0, self.content[:1000])
+
+        self.service.abort(session.upload_id)
+
+        self.assertEqual(os.listdir(self.root), [])
+        with self.assertRaises(UploadSessionNotFound):
+            self.service.get(session.upload_id)
+
+
+if __name__ == "__main__":
+    unittest.main()
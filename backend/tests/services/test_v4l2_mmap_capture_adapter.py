@@ -0,0 +1,243 @@
+import mmap
+import os
+import tempfile
+import unittest
+from collections import deque
+from typing import Deque, List, Tuple
+from unittest.mock import patch
+
+import cv2
+import numpy as np
+import v4l2
+from app.adapters.v4l2_mmap_capture_adapter import (
+    V4L2_BUF_FLAG_TIMESTAMP_MONOTONIC,
+    V4L2Frame,
+    V4l2MmapCaptureAdapter,
+    frame_to_bgr,
+    str_to_fourcc,
+)
+from app.exceptions.camera import CameraDeviceError
+from app.schemas.camera import CameraSettings
+from app.services.camera.v4l2_service import V4L2Service
+
+MODULE = "app.adapters.v4l2_mmap_capture_adapter"
+
+
+def yuyv_image(width: int, height: int) -> np.ndarray:
+    rng = np.random.default_rng(0)
+    return rng.integers(0, 256, (height, width, 2), dtype=np.uint8)
+
+
+def raw_frame(
+    data: np.ndarray,
+    pixel_format: str,
+    width: int,
+    height: int,
+    bytes_per_line: int,
+) -> V4L2Frame:
+    return V4L2Frame(
+        data=data.reshape(-1),
+        index=0,
+        sequence=0,
+        timestamp=0.0,
+        pixel_format=pixel_format,
+        width=width,
+        height=height,
+        bytes_per_line=bytes_per_line,
+    )
+
+
+class TestFrameToBgr(unittest.TestCase):
+    def test_converts_yuyv(self) -> None:
+        image = yuyv_image(8, 4)
+
+        bgr = frame_to_bgr(raw_frame(image, "YUYV", 8, 4, 16))
+
+        np.testing.assert_array_equal(bgr, cv2.cvtColor(image, cv2.COLOR_YUV2BGR_YUYV))
+
+    def test_skips_row_padding(self) -> None:
+        image = yuyv_image(8, 4)
+        padded = np.zeros((4, 24), dtype=np.uint8)
+        padded[:, :16] = image.reshape(4, 16)
+
+        bgr = frame_to_bgr(raw_frame(padded, "YUYV", 8, 4, 24))
+
+        np.testing.assert_array_equal(bgr, cv2.cvtColor(image, cv2.COLOR_YUV2BGR_YUYV))
+
+    def test_converts_nv12(self) -> None:
+        rng = np.random.default_rng(1)
+        image = rng.integers(0, 256, (6, 8), dtype=np.uint8)
+        padded = np.zeros((6, 12), dtype=np.uint8)
+        padded[:, :8] = image
+
+        bgr = frame_to_bgr(raw_frame(padded, "NV12", 8, 4, 12))
+
+        np.testing.assert_array_equal(bgr, cv2.cvtColor(image, cv2.COLOR_YUV2BGR_NV12))
+
+    def test_decodes_mjpg(self) -> None:
+        image = np.full((4, 8, 3), (10, 200, 30), dtype=np.uint8)
+        _, encoded = cv2.imencode(".jpg", image)
+
+        bgr = frame_to_bgr(raw_frame(encoded, "MJPG", 8, 4, 0))
+
+        self.assertEqual(bgr.shape, (4, 8, 3))
+        np.testing.assert_allclose(bgr, image, atol=8)
+
+    def test_rejects_truncated_and_unknown_frames(self) -> None:
+        with self.assertRaises(ValueError):
+            frame_to_bgr(raw_frame(yuyv_image(8, 2), "YUYV", 8, 4, 16))
+        with self.assertRaises(ValueError):
+            frame_to_bgr(raw_frame(yuyv_image(8, 4), "RGB3", 8, 4, 16))
+
+
+class FakeDriver:
+    """
+    Emulates the capture ioctls of a V4L2 driver whose buffers are pages of
+    a regular file, which the stream maps like driver memory.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        width: int = 8,
+        height: int = 4,
+        pixel_format: str = "YUYV",
+    ) -> None:
+        self.path = path
+        self.width = width
+        self.height = height
+        self.pixel_format = str_to_fourcc(pixel_format)
+        self.length = mmap.PAGESIZE
+        self.buffers = 0
+        self.queued: Deque[int] = deque()
+        self.frames: Deque[Tuple[int, float, np.ndarray]] = deque()
+        self.streaming = False
+        self.requests: List[int] = []
+
+    def push(self, sequence: int, timestamp: float, image: np.ndarray) -> None:
+        self.frames.append((sequence, timestamp, image))
+
+    def ioctl(self, fd: int, request: int, arg) -> None:
+        self.requests.append(request)
+        if request == v4l2.VIDIOC_QUERYCAP:
+            arg.capabilities = v4l2.V4L2_CAP_VIDEO_CAPTURE | v4l2.V4L2_CAP_STREAMING
+        elif request in (v4l2.VIDIOC_G_FMT, v4l2.VIDIOC_S_FMT):
+            if request == v4l2.VIDIOC_S_FMT:
+                self.pixel_format = arg.fmt.pix.pixelformat
+            arg.fmt.pix.width = self.width
+            arg.fmt.pix.height = self.height
+            arg.fmt.pix.pixelformat = self.pixel_format
+            arg.fmt.pix.bytesperline = self.width * 2
+        elif request == v4l2.VIDIOC_S_PARM:
+            arg.parm.capture.timeperframe.numerator = 1
+            arg.parm.capture.timeperframe.denominator = 30
+        elif request == v4l2.VIDIOC_REQBUFS:
+            self.buffers = arg.count
+            with open(self.path, "r+b") as file:
+                file.truncate(self.length * arg.count)
+        elif request == v4l2.VIDIOC_QUERYBUF:
+            arg.length = self.length
+            arg.m.offset = arg.index * self.length
+        elif request == v4l2.VIDIOC_QBUF:
+            self.queued.append(arg.index)
+        elif request == v4l2.VIDIOC_DQBUF:
+            if not self.frames or not self.queued:
+                raise BlockingIOError()
+            sequence, timestamp, image = self.frames.popleft()
+            index = self.queued.popleft()
+            data = image.tobytes()
+            with open(self.path, "r+b") as file:
+                file.seek(index * self.length)
+                file.write(data)
+            arg.index = index
+            arg.bytesused = len(data)
+            arg.sequence = sequence
+            arg.flags = V4L2_BUF_FLAG_TIMESTAMP_MONOTONIC
+            arg.timestamp.secs = int(timestamp)
+            arg.timestamp.usecs = round((timestamp - int(timestamp)) * 1e6)
+        elif request == v4l2.VIDIOC_STREAMON:
+            self.streaming = True
+        elif request == v4l2.VIDIOC_STREAMOFF:
+            self.streaming = False
+
+
+class TestV4l2MmapCaptureAdapter(unittest.TestCase):
+    def setUp(self) -> None:
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.device = os.path.join(tmp.name, "video0")
+        open(self.device, "wb").close()
+        self.driver = FakeDriver(self.device)
+        self.image = yuyv_image(8, 4)
+        ioctl_patch = patch(f"{MODULE}._ioctl", self.driver.ioctl)
+        ioctl_patch.start()
+        self.addCleanup(ioctl_patch.stop)
+
+    def open_adapter(self, **settings) -> V4l2MmapCaptureAdapter:
+        adapter = V4l2MmapCaptureAdapter(
+            self.device,
+            camera_settings=CameraSettings(**settings),
+            service=V4L2Service(),
+        )
+        self.addCleanup(adapter.release)
+        return adapter
+
+    def test_reads_bgr_frames_from_mapped_buffers(self) -> None:
+        self.driver.push(0, 10.0, self.image)
+        self.driver.push(1, 10.5, self.image)
+
+        adapter = self.open_adapter(pixel_format="YUYV", fps=30)
+        ok, frame = adapter.read()
+
+        self.assertTrue(ok)
+        np.testing.assert_array_equal(
+            frame, cv2.cvtColor(self.image, cv2.COLOR_YUV2BGR_YUYV)
+        )
+        self.assertEqual(adapter.frame_timestamp, 10.5)
+        self.assertEqual(adapter.settings.width, 8)
+        self.assertEqual(adapter.settings.pixel_format, "YUYV")
+        self.assertEqual(adapter.settings.fps, 30)
+        self.assertEqual(len(self.driver.queued), self.driver.buffers)
+
+    def test_raw_frame_is_a_view_over_the_buffer(self) -> None:
+        self.driver.push(0, 1.0, self.image)
+        self.driver.push(1, 1.1, self.image)
+        adapter = self.open_adapter()
+
+        with adapter.raw_frame() as frame:
+            self.assertFalse(frame.data.flags.owndata)
+            np.testing.assert_array_equal(frame.data, self.image.reshape(-1))
+            self.assertEqual(len(self.driver.queued), self.driver.buffers - 1)
+
+        self.assertEqual(len(self.driver.queued), self.driver.buffers)
+
+    def test_counts_sequence_gaps_as_dropped_frames(self) -> None:
+        for sequence in (0, 1, 4, 5, 9):
+            self.driver.push(sequence, float(sequence), self.image)
+        adapter = self.open_adapter()
+
+        for _ in range(4):
+            adapter.read()
+
+        self.assertEqual(adapter.dropped_frames, 5)
+
+    def test_read_fails_when_no_frame_arrives(self) -> None:
+        self.driver.push(0, 1.0, self.image)
+        adapter = self.open_adapter()
+
+        with patch(f"{MODULE}.select.select", return_value=([], [], [])):
+            with patch.object(adapter, "READ_TIMEOUT", 0.01):
+                ok, frame = adapter.read()
+
+        self.assertFalse(ok)
+        self.assertEqual(frame.size, 0)
+
+    def test_unsupported_pixel_format_is_a_device_error(self) -> None:
+        with self.assertRaises(CameraDeviceError):
+            self.open_adapter(pixel_format="RGB3")
+
+        self.assertFalse(self.driver.streaming)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,24 +1,42 @@
 import unittest
 
+from app.adapters.audio.alsa_mixer_volume_controller import AlsaMixerVolumeController
 from app.adapters.audio.alsa_volume_controller import AlsaVolumeController
 from app.adapters.audio.factory import create_volume_controller
 from app.adapters.audio.macos_volume_controller import MacOSVolumeController
 from app.exceptions.audio import AudioVolumeUnavailable, AudioVolumeUnsupported
 
 
+def mixer_unavailable() -> AlsaMixerVolumeController:
+    raise AudioVolumeUnavailable("No module named 'alsaaudio'")
+
+
 class TestVolumeControllerFactory(unittest.TestCase):
     def test_selects_macos_controller_when_osascript_exists(self) -> None:
         controller = create_volume_controller("Darwin", lambda command: f"/{command}")
 
         self.assertIsInstance(controller, MacOSVolumeController)
 
+    def test_selects_alsa_mixer_controller_when_available(self) -> None:
+        mixer_controller = object()
+
+        controller = create_volume_controller(
+            "Linux", lambda command: None, lambda: mixer_controller
+        )
+
+        self.assertIs(controller, mixer_controller)
+
     def test_selects_alsa_controller_when_amixer_exists(self) -> None:
-        controller = create_volume_controller("Linux", lambda command: f"/{command}")
+        controller = create_volume_controller(
+            "Linux", lambda command: f"/{command}", mixer_unavailable
+        )
 
         self.assertIsInstance(controller, AlsaVolumeController)
 
     def test_missing_platform_command_is_reported_as_unavailable(self) -> None:
-        controller = create_volume_controller("Linux", lambda command: None)
+        controller = create_volume_controller(
+            "Linux", lambda command: None, mixer_unavailable
+        )
 
         with self.assertRaisesRegex(AudioVolumeUnavailable, "amixer"):
             controller.get_volume()
@@ -1,7 +1,12 @@
+import os
+import select
 import subprocess
+import threading
+import time
 import unittest
 from unittest.mock import patch
 
+from app.adapters.audio.alsa_mixer_volume_controller import AlsaMixerVolumeController
 from app.adapters.audio.alsa_volume_controller import AlsaVolumeController
 from app.adapters.audio.macos_volume_controller import MacOSVolumeController
 from app.exceptions.audio import AudioVolumeError, AudioVolumeUnavailable
@@ -80,6 +85,102 @@ class TestAlsaVolumeController(unittest.TestCase):
             self.controller.get_volume()
 
 
+class FakeMixer:
+    def __init__(self, volume: int) -> None:
+        self.volume = volume
+        self.writes: list[int] = []
+        self.release = threading.Event()
+        self.release.set()
+        self.fail_writes = False
+        self.read_fd, self.write_fd = os.pipe()
+
+    def getvolume(self) -> list[int]:
+        return [self.volume, self.volume]
+
+    def setvolume(self, volume: int) -> None:
+        self.release.wait(timeout=1)
+        if self.fail_writes:
+            raise OSError("Device busy")
+        self.volume = volume
+        self.writes.append(volume)
+
+    def polldescriptors(self) -> list[tuple[int, int]]:
+        return [(self.read_fd, select.POLLIN)]
+
+    def handleevents(self) -> None:
+        os.read(self.read_fd, 1)
+
+    def change_externally(self, volume: int) -> None:
+        self.volume = volume
+        os.write(self.write_fd, b"x")
+
+    def close(self) -> None:
+        os.close(self.read_fd)
+        os.close(self.write_fd)
+
+
+class TestAlsaMixerVolumeController(unittest.TestCase):
+    def setUp(self) -> None:
+        self.mixer = FakeMixer(40)
+        self.controller = AlsaMixerVolumeController(
+            mixer_factory=lambda control: self.mixer
+        )
+        self.addCleanup(self.mixer.close)
+        self.addCleanup(self.controller.close)
+
+    def test_volume_is_read_once_and_cached(self) -> None:
+        self.assertEqual(self.controller.get_volume(), 40)
+        self.mixer.volume = 10
+
+        self.assertEqual(self.controller.get_volume(), 40)
+
+    def test_rapid_requests_apply_only_the_latest(self) -> None:
+        self.mixer.release.clear()
+        for volume in range(10, 60):
+            self.controller.set_volume(volume)
+
+        self.assertEqual(self.controller.get_volume(), 59)
+        self.mixer.release.set()
+        deadline = time.monotonic() + 2
+        while self.mixer.volume != 59 and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+        self.assertEqual(self.mixer.volume, 59)
+        self.assertLessEqual(len(self.mixer.writes), 2)
+
+    def test_external_change_is_reported(self) -> None:
+        changed = threading.Event()
+        received: list[int] = []
+
+        def listener(volume: int) -> None:
+            received.append(volume)
+            changed.set()
+
+        self.controller.get_volume()
+        self.controller.set_change_listener(listener)
+        self.mixer.change_externally(75)
+
+        self.assertTrue(changed.wait(timeout=2))
+        self.assertEqual(received, [75])
+        self.assertEqual(self.controller.get_volume(), 75)
+
+    def test_failed_write_reports_the_actual_volume(self) -> None:
+        changed = threading.Event()
+        received: list[int] = []
+
+        def listener(volume: int) -> None:
+            received.append(volume)
+            changed.set()
+
+        self.controller.set_change_listener(listener)
+        self.mixer.fail_writes = True
+        self.controller.set_volume(90)
+
+        self.assertTrue(changed.wait(timeout=2))
+        self.assertEqual(received, [40])
+        self.assertEqual(self.controller.get_volume(), 40)
+
+
 class TestMacOSVolumeController(unittest.TestCase):
     def setUp(self) -> None:
         self.controller = MacOSVolumeController()
@@ -0,0 +1,45 @@
+import os
+import tempfile
+import time
+import unittest
+
+from app.util.lru_disk_cache import LRUDiskCache
+
+
+class TestLRUDiskCache(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+        self.cache = LRUDiskCache(self.temp_dir.name, max_cache_bytes=1000, name="test")
+
+    def write(self, name: str, size: int, age: float = 0) -> str:
+        path = os.path.join(self.temp_dir.name, name)
+        with open(path, "wb") as f:
+            f.write(b"x" * size)
+        if age:
+            os.utime(path, (time.time() - age, time.time() - age))
+        self.cache.account(size)
+        return path
+
+    def test_evicts_least_recently_used_to_target(self):
+        oldest = self.write("a", 400, age=300)
+        touched = self.write("b", 400, age=200)
+        self.cache.touch(touched)
+
+        newest = self.write("c", 400)
+
+        self.assertFalse(os.path.exists(oldest))
+        self.assertTrue(os.path.exists(touched))
+        self.assertTrue(os.path.exists(newest))
+
+    def test_clear_removes_files(self):
+        path = self.write("a", 900)
+
+        self.cache.clear()
+
+        self.assertFalse(os.path.exists(path))
+        self.assertEqual(self.cache._cache_bytes, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
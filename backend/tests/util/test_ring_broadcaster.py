@@ -0,0 +1,56 @@
+import asyncio
+import threading
+import unittest
+
+from app.util.ring_broadcaster import RingBroadcaster
+
+
+class TestRingBroadcaster(unittest.IsolatedAsyncioTestCase):
+    async def test_every_subscriber_receives_every_item(self):
+        broadcaster: RingBroadcaster[int] = RingBroadcaster(8)
+        first = broadcaster.subscribe()
+        second = broadcaster.subscribe()
+
+        for i in range(5):
+            broadcaster.publish(i)
+        broadcaster.close()
+
+        self.assertEqual([i async for i in first], [0, 1, 2, 3, 4])
+        self.assertEqual([i async for i in second], [0, 1, 2, 3, 4])
+
+    async def test_slow_subscriber_skips_ahead(self):
+        broadcaster: RingBroadcaster[int] = RingBroadcaster(4)
+        subscription = broadcaster.subscribe()
+
+        for i in range(10):
+            broadcaster.publish(i)
+        broadcaster.close()
+
+        self.assertEqual([i async for i in subscription], [6, 7, 8, 9])
+        self.assertEqual(subscription.skipped, 6)
+
+    async def test_publish_from_thread_wakes_subscriber(self):
+        broadcaster: RingBroadcaster[bytes] = RingBroadcaster(4)
+        subscription = broadcaster.subscribe()
+
+        waiter = asyncio.create_task(subscription.get())
+        await asyncio.sleep(0)
+        thread = threading.Thread(target=broadcaster.publish, args=(b"chunk",))
+        thread.start()
+        thread.join()
+
+        self.assertEqual(await asyncio.wait_for(waiter, timeout=1), b"chunk")
+
+    async def test_close_ends_waiting_subscriber(self):
+        broadcaster: RingBroadcaster[int] = RingBroadcaster(4)
+        subscription = broadcaster.subscribe()
+
+        waiter = asyncio.create_task(subscription.get())
+        await asyncio.sleep(0)
+        broadcaster.close()
+
+        self.assertIsNone(await asyncio.wait_for(waiter, timeout=1))
+
+
+if __name__ == "__main__":
+    unittest.main()
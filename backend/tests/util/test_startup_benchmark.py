@@ -0,0 +1,79 @@
+import unittest
+
+from app.util.startup_benchmark import (
+    IMPORT_BUDGETS,
+    ImportBudget,
+    ImportMeasurement,
+    measure_import,
+    parse_importtime,
+)
+
+IMPORTTIME_OUTPUT = """\
+import time: self [us] | cumulative | imported package
+import time:       120 |        120 |     _io
+import time:       300 |        420 |   encodings
+import time:      1500 |       1500 |     numpy
+import time:       200 |       2120 | app.server
+some unrelated warning
+"""
+
+
+class TestParseImporttime(unittest.TestCase):
+    def test_parses_records_and_depth(self) -> None:
+        records = parse_importtime(IMPORTTIME_OUTPUT)
+
+        self.assertEqual(
+            [(r.module, r.self_us, r.cumulative_us, r.depth) for r in records],
+            [
+                ("_io", 120, 120, 2),
+                ("encodings", 300, 420, 1),
+                ("numpy", 1500, 1500, 2),
+                ("app.server", 200, 2120, 0),
+            ],
+        )
+
+
+class TestImportBudget(unittest.TestCase):
+    def setUp(self) -> None:
+        self.measurement = ImportMeasurement(
+            module="app.server",
+            cumulative_us=2120,
+            records=tuple(parse_importtime(IMPORTTIME_OUTPUT)),
+        )
+
+    def test_reports_forbidden_modules_and_slow_imports(self) -> None:
+        budget = ImportBudget(
+            module="app.server", max_ratio=2.0, forbidden=("numpy", "cv2")
+        )
+
+        self.assertEqual(
+            budget.violations(self.measurement, baseline_us=1000),
+            [
+                "app.server imports numpy at startup",
+                "app.server takes 2.12x the fastapi import time, the budget is 2.00x",
+            ],
+        )
+
+    def test_skips_time_check_without_baseline(self) -> None:
+        budget = ImportBudget(module="app.server", max_ratio=1.0, forbidden=("cv2",))
+
+        self.assertEqual(budget.violations(self.measurement), [])
+
+    def test_heaviest(self) -> None:
+        self.assertEqual(
+            [r.module for r in self.measurement.heaviest(2)],
+            ["numpy", "encodings"],
+        )
+
+
+class TestServerImports(unittest.TestCase):
+    def test_servers_defer_heavy_modules(self) -> None:
+        for budget in IMPORT_BUDGETS:
+            with self.subTest(module=budget.module):
+                self.assertEqual(
+                    budget.violations(measure_import(budget.module, runs=1)), []
+                )
+
+
+if __name__ == "__main__":
+    unittest.main()
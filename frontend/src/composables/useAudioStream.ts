@@ -1,16 +1,173 @@
 import { ref } from "vue";
 import { useWebSocket } from "@/composables/useWebsocket";
 
+export type AudioStreamCodec = "pcm" | "mulaw" | "opus";
+
+/**
+ * Format of an encoded audio stream, sent by the server as the first message.
+ */
+export interface AudioStreamFormat {
+  codec: AudioStreamCodec;
+  sample_rate: number;
+  channels: number;
+  frame_size: number;
+  bitrate?: number | null;
+}
+
+interface AudioStreamFormatMessage {
+  type: "format";
+  payload: AudioStreamFormat;
+}
+
+interface AudioChunk {
+  channels: Float32Array<ArrayBuffer>[];
+  sampleRate?: number;
+}
+
+const STREAM_SAMPLE_RATE = 48000;
+const STREAM_CHANNELS = 1;
+const FRAME_MS = 20;
+const OPUS_BITRATE = 32000;
+
+/**
+ * Float samples of all the 256 G.711 µ-law codes.
+ */
+const MULAW_DECODE_TABLE = (() => {
+  const table = new Float32Array(256);
+  for (let code = 0; code < 256; code++) {
+    const u = ~code & 0xff;
+    const exponent = (u >> 4) & 0x07;
+    const mantissa = u & 0x0f;
+    const magnitude = (((mantissa << 3) + 0x84) << exponent) - 0x84;
+    table[code] = (u & 0x80 ? -magnitude : magnitude) / 32768;
+  }
+  return table;
+})();
+
 const createAudioContext = () => {
   return new (window.AudioContext || (window as any).webkitAudioContext)();
 };
 
+const isOpusDecodingSupported = async () => {
+  if (typeof AudioDecoder === "undefined") {
+    return false;
+  }
+  try {
+    const { supported } = await AudioDecoder.isConfigSupported({
+      codec: "opus",
+      sampleRate: STREAM_SAMPLE_RATE,
+      numberOfChannels: STREAM_CHANNELS,
+    });
+    return !!supported;
+  } catch (error) {
+    return false;
+  }
+};
+
+const deinterleave = (samples: Float32Array, channelsCount: number) =>
+  Array.from({ length: channelsCount }, (_, channel) => {
+    const data = new Float32Array(
+      new ArrayBuffer(
+        (samples.length / channelsCount) * Float32Array.BYTES_PER_ELEMENT,
+      ),
+    );
+    for (let i = 0; i < data.length; i++) {
+      data[i] = samples[i * channelsCount + channel];
+    }
+    return data;
+  });
+
+/**
+ * Plays the audio stream of the robot's microphone.
+ *
+ * Requests Opus when the browser can decode it with WebCodecs and µ-law
+ * otherwise. The server describes the stream it actually sends in a `format`
+ * message (it falls back to µ-law when it can't encode Opus), and messages
+ * without a preceding `format` message are raw 16-bit PCM.
+ */
 export const useWebsocketAudio = (url: string = "ws/audio-stream") => {
   const audioContext = ref<AudioContext | null>(null);
-  const audioQueue: Float32Array<ArrayBuffer>[] = [];
+  const audioQueue: AudioChunk[] = [];
   const isPlaying = ref(false);
+  let requestedCodec: AudioStreamCodec = "mulaw";
+  let opusFailed = false;
+  let streamFormat: AudioStreamFormat | null = null;
+  let opusDecoder: AudioDecoder | null = null;
+  let opusTimestamp = 0;
+
+  const enqueue = (chunk: AudioChunk) => {
+    audioQueue.push(chunk);
+
+    if (!isPlaying.value) {
+      processAudioQueue();
+    }
+  };
+
+  const closeOpusDecoder = () => {
+    if (opusDecoder && opusDecoder.state !== "closed") {
+      opusDecoder.close();
+    }
+    opusDecoder = null;
+  };
+
+  const handleOpusDecoderError = (error: DOMException) => {
+    console.error("Opus decoding failed, switching to µ-law", error);
+    closeOpusDecoder();
+    opusFailed = true;
+    requestedCodec = "mulaw";
+    // Reconnects with the new codec
+    ws.value?.close();
+  };
+
+  const createOpusDecoder = (format: AudioStreamFormat) => {
+    const decoder = new AudioDecoder({
+      output: (audioData) => {
+        const channels = Array.from(
+          { length: audioData.numberOfChannels },
+          (_, planeIndex) => {
+            const data = new Float32Array(
+              new ArrayBuffer(
+                audioData.numberOfFrames * Float32Array.BYTES_PER_ELEMENT,
+              ),
+            );
+            audioData.copyTo(data, { planeIndex, format: "f32-planar" });
+            return data;
+          },
+        );
+        enqueue({ channels, sampleRate: audioData.sampleRate });
+        audioData.close();
+      },
+      error: handleOpusDecoderError,
+    });
+    decoder.configure({
+      codec: "opus",
+      sampleRate: format.sample_rate,
+      numberOfChannels: format.channels,
+    });
+    return decoder;
+  };
 
-  const handleOnMessage = (data: ArrayBuffer) => {
+  const handleFormatMessage = (format: AudioStreamFormat) => {
+    closeOpusDecoder();
+    streamFormat = format;
+    opusTimestamp = 0;
+
+    if (format.codec === "opus") {
+      try {
+        opusDecoder = createOpusDecoder(format);
+      } catch (error) {
+        handleOpusDecoderError(error as DOMException);
+      }
+    }
+  };
+
+  const handleOnMessage = (message: AudioStreamFormatMessage) => {
+    if (message?.type === "format") {
+      handleFormatMessage(message.payload);
+    }
+  };
+
+  const decodePCM = (data: ArrayBuffer) => {
     const audioData = new Int16Array(data);
 
     const audioBuffer = new Float32Array(
@@ -20,10 +177,48 @@ export const useWebsocketAudio = (url: string = "ws/audio-stream") => {
       audioBuffer[i] = audioData[i] / 32768;
     }
 
-    audioQueue.push(audioBuffer);
+    enqueue({ channels: [audioBuffer] });
+  };
 
-    if (!isPlaying.value) {
-      processAudioQueue();
+  const decodeMuLaw = (data: ArrayBuffer, format: AudioStreamFormat) => {
+    const codes = new Uint8Array(data);
+
+    const audioBuffer = new Float32Array(
+      new ArrayBuffer(codes.length * Float32Array.BYTES_PER_ELEMENT),
+    );
+    for (let i = 0; i < codes.length; i++) {
+      audioBuffer[i] = MULAW_DECODE_TABLE[codes[i]];
+    }
+
+    enqueue({
+      channels:
+        format.channels > 1
+          ? deinterleave(audioBuffer, format.channels)
+          : [audioBuffer],
+      sampleRate: format.sample_rate,
+    });
+  };
+
+  const decodeOpus = (data: ArrayBuffer, format: AudioStreamFormat) => {
+    if (!opusDecoder || opusDecoder.state !== "configured") {
+      return;
+    }
+    opusDecoder.decode(
+      new EncodedAudioChunk({ type: "key", timestamp: opusTimestamp, data }),
+    );
+    opusTimestamp += (format.frame_size / format.sample_rate) * 1_000_000;
+  };
+
+  const handleOnBinaryMessage = (data: ArrayBuffer) => {
+    switch (streamFormat?.codec) {
+      case "opus":
+        decodeOpus(data, streamFormat);
+        break;
+      case "mulaw":
+        decodeMuLaw(data, streamFormat);
+        break;
+      default:
+        decodePCM(data);
     }
   };
 
@@ -35,19 +230,22 @@ export const useWebsocketAudio = (url: string = "ws/audio-stream") => {
 
     isPlaying.value = true;
 
-    const audioBuffer = audioQueue.shift();
-    if (!audioBuffer || !audioContext.value) {
+    const chunk = audioQueue.shift();
+    if (!chunk || !audioContext.value) {
+      isPlaying.value = false;
       return;
     }
 
     const audioSource = audioContext.value.createBufferSource();
     const audioBufferData = audioContext.value.createBuffer(
-      1,
-      audioBuffer.length,
-      audioContext.value.sampleRate,
+      chunk.channels.length,
+      chunk.channels[0].length,
+      chunk.sampleRate || audioContext.value.sampleRate,
     );
 
-    audioBufferData.copyToChannel(audioBuffer, 0);
+    chunk.channels.forEach((data, channel) => {
+      audioBufferData.copyToChannel(data, channel);
+    });
     audioSource.buffer = audioBufferData;
 
     audioSource.connect(audioContext.value.destination);
@@ -58,9 +256,21 @@ export const useWebsocketAudio = (url: string = "ws/audio-stream") => {
   const { ws, initWS, send, closeWS, cleanup, connected, active, loading } =
     useWebSocket({
       url,
-      binaryType: "arraybuffer",
+      params: () => ({
+        codec: requestedCodec,
+        frame_ms: FRAME_MS,
+        bitrate: OPUS_BITRATE,
+      }),
+      onOpen: async () => {
+        if (!audioContext.value || audioContext.value.state === "closed") {
+          audioContext.value = createAudioContext();
+        }
+      },
       onMessage: handleOnMessage,
+      onBinaryMessage: handleOnBinaryMessage,
       onClose: async () => {
+        closeOpusDecoder();
+        streamFormat = null;
         if (audioContext.value) {
           await audioContext.value.close();
           audioContext.value = null;
@@ -76,6 +286,8 @@ export const useWebsocketAudio = (url: string = "ws/audio-stream") => {
     if (audioContext.value.state === "suspended") {
       await audioContext.value.resume();
     }
+    requestedCodec =
+      !opusFailed && (await isOpusDecodingSupported()) ? "opus" : "mulaw";
     initWS();
   };
 
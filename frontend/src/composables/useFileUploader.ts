@@ -6,6 +6,7 @@ import { ref, unref } from "vue";
 import type { ComputedRef } from "vue";
 import { Nullable } from "@/util/ts-helpers";
 import { appApi } from "@/api";
+import { uploadResumable } from "@/features/files/api";
 
 export interface UploadStore {
   loading?: boolean;
@@ -13,6 +14,11 @@ export interface UploadStore {
 
 export interface Params {
   url: string;
+  /**
+   * The resumable upload URL. When set, files are uploaded in chunks that
+   * survive dropped connections instead of with a single `url` request.
+   */
+  resumableUrl?: ComputedRef<Nullable<string>> | Nullable<string>;
   dir?: ComputedRef<Nullable<string>> | Nullable<string>;
   onFinish?: (files: File[], dir?: Nullable<string>) => void;
   onBeforeStart?: (files: File[], dir?: Nullable<string>) => void;
@@ -31,11 +37,6 @@ export const useFileUploader = (params: Params) => {
 
   const worker = async (file: File, currentDir?: Nullable<string>) => {
     try {
-      const formData = new FormData();
-      formData.append("file", file);
-      if (currentDir) {
-        formData.append("dir", currentDir);
-      }
       const source = CancelToken.source();
       const filepath = [currentDir, file.name].filter((v) => v).join("/");
 
@@ -44,20 +45,38 @@ export const useFileUploader = (params: Params) => {
         cancel: () => source.cancel(),
       };
       const progressFn = messager.makeProgress(`Uploading ${filepath}`);
+      const handleProgress = (loaded: number, total: number) => {
+        const progress = Math.round((loaded * 100) / total);
+
+        if (params.onProgress) {
+          params.onProgress(file, progress, currentDir);
+        }
+
+        if (progress < 100) {
+          progressFn(progress);
+        }
+      };
+      const resumableUrl = unref(params.resumableUrl);
+
+      if (resumableUrl) {
+        return await uploadResumable(
+          resumableUrl,
+          file,
+          currentDir,
+          (loaded) => handleProgress(loaded, file.size || 1),
+          source.token,
+        );
+      }
+
+      const formData = new FormData();
+      formData.append("file", file);
+      if (currentDir) {
+        formData.append("dir", currentDir);
+      }
       const response = await appApi.post(params.url, formData, {
         onUploadProgress: (progressEvent) => {
           if (isNumber(progressEvent.total)) {
-            const progress = Math.round(
-              (progressEvent.loaded * 100) / progressEvent.total,
-            );
-
-            if (params.onProgress) {
-              params.onProgress(file, progress, currentDir);
-            }
-
-            if (progress < 100) {
-              progressFn(progress);
-            }
+            handleProgress(progressEvent.loaded, progressEvent.total);
           }
         },
         cancelToken: source.token,
@@ -12,8 +12,17 @@ export interface WebSocketOptions {
   url: string;
   /** An optional port number for the WebSocket connection. */
   port?: number;
+  /** Returns the query parameters, called on each connection attempt. */
+  params?: () => Record<string, string | number>;
   /** A callback invoked when a message is received from the WebSocket. */
   onMessage?: (message: any) => void;
+  /**
+   * A callback invoked with binary frames when text frames are parsed as JSON.
+   * Setting it switches the binary type to "arraybuffer".
+   */
+  onBinaryMessage?: (data: ArrayBuffer) => void;
+  /** Subprotocols to offer to the server. */
+  protocols?: string | string[];
   /** A callback invoked when the first message is received from the WebSocket. */
   onFirstMessage?: () => void;
   /** The binary type of the WebSocket (e.g., "arraybuffer"). */
@@ -44,6 +53,8 @@ export interface WebSocketModel {
   initWS: () => void;
   /** Sends a message through the WebSocket connection. */
   send: (message: any) => void;
+  /** Sends a binary frame if connected, dropping it otherwise. */
+  sendBinary: (data: ArrayBuffer) => boolean;
   /** Closes the WebSocket connection. */
   closeWS: () => void;
   /** Cleans up the WebSocket resources (e.g., closing the connection). */
@@ -102,8 +113,17 @@ export function useWebSocket(options: WebSocketOptions): WebSocketModel {
     }
   };
 
-  const messageHandler =
-    options.binaryType === "arraybuffer"
+  const handleOnMixedMessage = (event: MessageEvent) => {
+    if (typeof event.data === "string") {
+      handleOnJSONMessage(event);
+    } else if (options.onBinaryMessage) {
+      options.onBinaryMessage(event.data);
+    }
+  };
+
+  const messageHandler = options.onBinaryMessage
+    ? handleOnMixedMessage
+    : options.binaryType === "arraybuffer"
       ? handleOnMessage
       : handleOnJSONMessage;
 
@@ -118,9 +138,14 @@ export function useWebSocket(options: WebSocketOptions): WebSocketModel {
 
     loading.value = true;
 
-    ws.value = new WebSocket(makeWebsocketUrl(options.url, options.port));
+    ws.value = new WebSocket(
+      makeWebsocketUrl(options.url, options.port, options.params?.()),
+      options.protocols,
+    );
 
-    if (options.binaryType) {
+    if (options.onBinaryMessage) {
+      ws.value.binaryType = "arraybuffer";
+    } else if (options.binaryType) {
       ws.value.binaryType = options.binaryType;
     }
 
@@ -198,6 +223,14 @@ export function useWebSocket(options: WebSocketOptions): WebSocketModel {
     }
   };
 
+  const sendBinary = (data: ArrayBuffer) => {
+    if (!connected.value || !ws.value) {
+      return false;
+    }
+    ws.value.send(data);
+    return true;
+  };
+
   const closeWS = () => {
     if (retryTimer.value) {
       clearTimeout(retryTimer.value);
@@ -217,6 +250,7 @@ export function useWebSocket(options: WebSocketOptions): WebSocketModel {
   return {
     initWS,
     send,
+    sendBinary,
     closeWS,
     cleanup,
     retry,
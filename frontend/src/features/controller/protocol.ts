@@ -0,0 +1,106 @@
+/**
+ * Binary protocol for the car control WebSocket.
+ *
+ * Mirrors `backend/app/services/control/control_protocol.py`. All frames are
+ * little-endian with a fixed layout.
+ */
+
+export const BINARY_SUBPROTOCOL = "px-binary.v1";
+
+export const COMMAND_FRAME_SIZE = 28;
+export const ACK_FRAME_SIZE = 32;
+
+export enum ControlOpcode {
+  DRIVE = 0x01,
+  STOP = 0x02,
+  ACK = 0x81,
+}
+
+export enum ControlField {
+  MOTORS = 0x01,
+  STEERING = 0x02,
+  PAN = 0x04,
+  TILT = 0x08,
+}
+
+export interface DriveFields {
+  speed?: number;
+  direction?: number;
+  steering?: number;
+  pan?: number;
+  tilt?: number;
+}
+
+export interface ControlAck {
+  seq: number;
+  clientTs: number;
+  speed: number;
+  direction: number;
+  steering: number;
+  pan: number;
+  tilt: number;
+  /** Milliseconds between the command and its application on the robot. */
+  latency: number | null;
+}
+
+/**
+ * Encodes a drive or stop command. Only the fields that are present are
+ * applied by the robot.
+ */
+export const encodeCommand = (
+  opcode: ControlOpcode.DRIVE | ControlOpcode.STOP,
+  seq: number,
+  clientTs: number,
+  fields: DriveFields = {},
+): ArrayBuffer => {
+  const buffer = new ArrayBuffer(COMMAND_FRAME_SIZE);
+  const view = new DataView(buffer);
+  let mask = 0;
+  if (fields.speed !== undefined || fields.direction !== undefined) {
+    mask |= ControlField.MOTORS;
+  }
+  if (fields.steering !== undefined) {
+    mask |= ControlField.STEERING;
+  }
+  if (fields.pan !== undefined) {
+    mask |= ControlField.PAN;
+  }
+  if (fields.tilt !== undefined) {
+    mask |= ControlField.TILT;
+  }
+
+  view.setUint8(0, opcode);
+  view.setUint8(1, mask);
+  view.setUint32(2, seq >>> 0, true);
+  view.setFloat64(6, clientTs, true);
+  view.setInt8(14, Math.round(fields.speed ?? 0));
+  view.setInt8(15, fields.direction ?? 0);
+  view.setFloat32(16, fields.steering ?? 0, true);
+  view.setFloat32(20, fields.pan ?? 0, true);
+  view.setFloat32(24, fields.tilt ?? 0, true);
+  return buffer;
+};
+
+/**
+ * Decodes an acknowledgement frame, or returns null for other frames.
+ */
+export const decodeAck = (buffer: ArrayBuffer): ControlAck | null => {
+  if (buffer.byteLength !== ACK_FRAME_SIZE) {
+    return null;
+  }
+  const view = new DataView(buffer);
+  if (view.getUint8(0) !== ControlOpcode.ACK) {
+    return null;
+  }
+  const latency = view.getFloat32(28, true);
+  return {
+    seq: view.getUint32(2, true),
+    clientTs: view.getFloat64(6, true),
+    speed: view.getInt8(14),
+    direction: view.getInt8(15),
+    steering: view.getFloat32(16, true),
+    pan: view.getFloat32(20, true),
+    tilt: view.getFloat32(24, true),
+    latency: Number.isNaN(latency) ? null : latency,
+  };
+};
@@ -25,6 +25,13 @@ import { wait } from "@/util/wait";
 import { roundToNearestTen } from "@/util/number";
 import { takePhotoEffect } from "@/util/dom";
 import { useAppSyncStore } from "@/features/syncer";
+import {
+  BINARY_SUBPROTOCOL,
+  ControlOpcode,
+  decodeAck,
+  encodeCommand,
+} from "@/features/controller/protocol";
+import type { DriveFields } from "@/features/controller/protocol";
 
 export const ACCELERATION = 10;
 export const MIN_SPEED = ACCELERATION;
@@ -38,6 +45,7 @@ export interface UpdatePayloadResponse {
   maxSpeed: number;
   distance: number;
   avoidObstacles: boolean;
+  followTarget: boolean;
   autoMeasureDistanceMode: boolean;
   ledBlinking: boolean;
 }
@@ -47,6 +55,10 @@ export interface Modes {
    * Whether avoid obstacles mode is enabled.
    */
   avoidObstacles: boolean;
+  /**
+   * Whether follow target mode is enabled.
+   */
+  followTarget: boolean;
   /**
    * Whether calibration mode is enabled.
    */
@@ -88,6 +100,11 @@ export type UpdateCombinedPayload = Partial<{
 
 export interface StoreState extends Gauges, Modes {
   model: ShallowRef<WebSocketModel> | null;
+  /**
+   * Round-trip milliseconds from sending the latest binary drive command to
+   * receiving its acknowledgement, after it was applied on the robot.
+   */
+  controlRtt: number | null;
 }
 
 const defaultGauges: Gauges = {
@@ -101,6 +118,7 @@ const defaultGauges: Gauges = {
 
 const modes: Modes = {
   avoidObstacles: false,
+  followTarget: false,
   calibrationMode: false,
   ledBlinking: false,
 };
@@ -109,8 +127,11 @@ const defaultState: StoreState = {
   ...defaultGauges,
   ...modes,
   model: null,
+  controlRtt: null,
 } as const;
 
+let controlSeq = 0;
+
 export interface WSMessageData {
   type: string;
   payload: any;
@@ -137,27 +158,49 @@ export const useControllerStore = defineStore("controller", {
 
         switch (type) {
           case "update": {
-            const typedPayload: UpdatePayloadResponse = payload;
+            // Updates carry only the fields that changed since the previous one.
+            const typedPayload: Partial<UpdatePayloadResponse> = payload;
             const shouldSteeringReverse =
               robotStore.data?.steering_servo?.reverse;
             const shouldTiltReverse = robotStore.data?.cam_tilt_servo?.reverse;
             const shouldPanReverse = robotStore.data?.cam_pan_servo.reverse;
-            this.speed = typedPayload.speed;
-            this.direction = typedPayload.direction;
-            this.servoAngle = shouldSteeringReverse
-              ? -typedPayload.servoAngle
-              : typedPayload.servoAngle;
-            this.camTilt = shouldTiltReverse
-              ? -typedPayload.camTilt
-              : typedPayload.camTilt;
-            this.camPan = shouldPanReverse
-              ? -typedPayload.camPan
-              : typedPayload.camPan;
-            this.maxSpeed = typedPayload.maxSpeed;
-            this.avoidObstacles = typedPayload.avoidObstacles;
-            this.ledBlinking = typedPayload.ledBlinking;
-            settingsStore.data.robot.auto_measure_distance_mode =
-              typedPayload.autoMeasureDistanceMode;
+            if (isNumber(typedPayload.speed)) {
+              this.speed = typedPayload.speed;
+            }
+            if (isNumber(typedPayload.direction)) {
+              this.direction = typedPayload.direction;
+            }
+            if (isNumber(typedPayload.servoAngle)) {
+              this.servoAngle = shouldSteeringReverse
+                ? -typedPayload.servoAngle
+                : typedPayload.servoAngle;
+            }
+            if (isNumber(typedPayload.camTilt)) {
+              this.camTilt = shouldTiltReverse
+                ? -typedPayload.camTilt
+                : typedPayload.camTilt;
+            }
+            if (isNumber(typedPayload.camPan)) {
+              this.camPan = shouldPanReverse
+                ? -typedPayload.camPan
+                : typedPayload.camPan;
+            }
+            if (isNumber(typedPayload.maxSpeed)) {
+              this.maxSpeed = typedPayload.maxSpeed;
+            }
+            if (typedPayload.avoidObstacles !== undefined) {
+              this.avoidObstacles = typedPayload.avoidObstacles;
+            }
+            if (typedPayload.followTarget !== undefined) {
+              this.followTarget = typedPayload.followTarget;
+            }
+            if (typedPayload.ledBlinking !== undefined) {
+              this.ledBlinking = typedPayload.ledBlinking;
+            }
+            if (typedPayload.autoMeasureDistanceMode !== undefined) {
+              settingsStore.data.robot.auto_measure_distance_mode =
+                typedPayload.autoMeasureDistanceMode;
+            }
 
             break;
           }
@@ -218,6 +261,13 @@ export const useControllerStore = defineStore("controller", {
             });
             break;
 
+          case "followTarget":
+            this.followTarget = payload;
+            messager.info(`Follow Target: ${payload}`, {
+              immediately: true,
+            });
+            break;
+
           case "robot_partial_settings":
             robotStore.partialData = payload;
             Object.entries(payload).forEach(([key, value]) => {
@@ -274,6 +324,13 @@ export const useControllerStore = defineStore("controller", {
         url: "px/ws",
         port: +(import.meta.env.VITE_WS_APP_PORT || "8001"),
         onMessage: handleMessage,
+        onBinaryMessage: (data: ArrayBuffer) => {
+          const ack = decodeAck(data);
+          if (ack) {
+            this.controlRtt = performance.now() - ack.clientTs;
+          }
+        },
+        protocols: [BINARY_SUBPROTOCOL],
         logPrefix: "px",
         onOpen: async () => {
           await robotStore.fetchData();
@@ -296,6 +353,30 @@ export const useControllerStore = defineStore("controller", {
       this.model?.send(message);
     },
 
+    /**
+     * Sends a drive command as a binary frame if the server accepted the
+     * binary protocol, and as the JSON `fallback` message otherwise.
+     */
+    sendDriveCommand(
+      opcode: ControlOpcode.DRIVE | ControlOpcode.STOP,
+      fields: DriveFields,
+      fallback: any,
+    ): void {
+      if (this.model?.ws?.protocol === BINARY_SUBPROTOCOL) {
+        controlSeq = (controlSeq + 1) >>> 0;
+        const frame = encodeCommand(
+          opcode,
+          controlSeq,
+          performance.now(),
+          fields,
+        );
+        if (this.model.sendBinary(frame)) {
+          return;
+        }
+      }
+      this.sendMessage(fallback);
+    },
+
     resetAll() {
       const settingsStore = useSettingsStore();
 
@@ -306,6 +387,7 @@ export const useControllerStore = defineStore("controller", {
           this.toggleAutoMeasureDistanceMode,
         ],
         [this.avoidObstacles, false, this.toggleAvoidObstaclesMode],
+        [this.followTarget, false, this.toggleFollowTargetMode],
       ] as const;
 
       actionValueLists.forEach(([value, requiredValue, action]) => {
@@ -334,7 +416,11 @@ export const useControllerStore = defineStore("controller", {
           shouldReverse ? -angle : angle,
         ),
       );
-      this.sendMessage({ action: "setCamTiltAngle", payload: nextAngle });
+      this.sendDriveCommand(
+        ControlOpcode.DRIVE,
+        { tilt: nextAngle },
+        { action: "setCamTiltAngle", payload: nextAngle },
+      );
     },
 
     setDirServoAngle(servoAngle: number) {
@@ -345,7 +431,11 @@ export const useControllerStore = defineStore("controller", {
         robotStore.data.steering_servo.max_angle,
         shouldReverse ? -servoAngle : servoAngle,
       );
-      this.sendMessage({ action: "setServoDirAngle", payload: nextAngle });
+      this.sendDriveCommand(
+        ControlOpcode.DRIVE,
+        { steering: nextAngle },
+        { action: "setServoDirAngle", payload: nextAngle },
+      );
     },
 
     setCamPanAngle(servoAngle: number): void {
@@ -358,24 +448,51 @@ export const useControllerStore = defineStore("controller", {
           shouldReverse ? -servoAngle : servoAngle,
         ),
       );
-      this.sendMessage({ action: "setCamPanAngle", payload: nextAngle });
+      this.sendDriveCommand(
+        ControlOpcode.DRIVE,
+        { pan: nextAngle },
+        { action: "setCamPanAngle", payload: nextAngle },
+      );
     },
 
     updateCombined(payload: UpdateCombinedPayload): void {
-      this.sendMessage({ action: "update", payload });
+      const message = { action: "update", payload };
+      if (isNumber(payload.maxSpeed)) {
+        this.sendMessage(message);
+        return;
+      }
+      const fields: DriveFields = {};
+      if (isNumber(payload.speed) || isNumber(payload.direction)) {
+        fields.speed = payload.speed ?? 0;
+        fields.direction = payload.direction ?? 0;
+      }
+      if (isNumber(payload.servoAngle)) {
+        fields.steering = payload.servoAngle;
+      }
+      if (isNumber(payload.camPan)) {
+        fields.pan = payload.camPan;
+      }
+      if (isNumber(payload.camTilt)) {
+        fields.tilt = payload.camTilt;
+      }
+      this.sendDriveCommand(ControlOpcode.DRIVE, fields, message);
     },
 
     move(speed: number, direction: number) {
       const robotStore = useRobotStore();
       speed = constrain(0, this.maxSpeed, robotStore.maxSpeed);
       if (this.speed !== speed || this.direction !== direction) {
-        this.sendMessage({
-          action: "move",
-          payload: {
-            direction,
-            speed,
+        this.sendDriveCommand(
+          ControlOpcode.DRIVE,
+          { speed, direction },
+          {
+            action: "move",
+            payload: {
+              direction,
+              speed,
+            },
           },
-        });
+        );
       }
     },
 
@@ -422,7 +539,7 @@ export const useControllerStore = defineStore("controller", {
       }
     },
     stop() {
-      this.sendMessage({ action: "stop" });
+      this.sendDriveCommand(ControlOpcode.STOP, {}, { action: "stop" });
     },
     increaseMaxSpeed() {
       this.setMaxSpeed(this.maxSpeed + ACCELERATION);
@@ -522,6 +639,9 @@ export const useControllerStore = defineStore("controller", {
     toggleAvoidObstaclesMode() {
       this.sendMessage({ action: "avoidObstacles" });
     },
+    toggleFollowTargetMode() {
+      this.sendMessage({ action: "followTarget" });
+    },
     left() {
       const robotStore = useRobotStore();
       this.setDirServoAngle(
@@ -1,21 +1,51 @@
-import { APIMediaType, BatchFileStatus } from "@/features/files/interface";
+import axios, { isAxiosError } from "axios";
+import type { CancelToken } from "axios";
+import {
+  APIMediaType,
+  BatchFileStatus,
+  FilePageRequest,
+  FilePageResponseModel,
+  GroupedFile,
+  ThumbnailSize,
+  UploadFileResult,
+  UploadSession,
+} from "@/features/files/interface";
 import { retrieveError } from "@/util/error";
+import { wait } from "@/util/wait";
+import { isNumber } from "@/util/guards";
 import {
   mapConcat,
   extractContentDispositionFilename,
+  toLazyTreeNodes,
 } from "@/features/files/util";
 import { Nullable } from "@/util/ts-helpers";
 import { appApi } from "@/api";
 
+/**
+ * Returns the URL of the image. When `size` is given, the URL is of a
+ * downscaled JPEG, which the browser may cache for as long as `version` (the
+ * modification time of the image) stays the same.
+ */
 export const makeImagePreviewURL = (
   path: string,
   mediaType: Nullable<APIMediaType>,
-) =>
-  `${mapConcat(
+  size?: Nullable<ThumbnailSize>,
+  version?: Nullable<number>,
+) => {
+  const url = `${mapConcat(
     ["/api/files/preview-image", mediaType],
     "/",
   )}?filename=${encodeURIComponent(path)}`;
 
+  if (!size) {
+    return url;
+  }
+
+  return isNumber(version)
+    ? `${url}&size=${size}&version=${version}`
+    : `${url}&size=${size}`;
+};
+
 export const makeVideoPreviewURL = (
   path: string,
   mediaType: Nullable<APIMediaType>,
@@ -37,9 +67,158 @@ export const makeAudioURL = (path: string, mediaType: Nullable<APIMediaType>) =>
     "/",
   )}?filename=${encodeURIComponent(path)}`;
 
+export const FILES_PAGE_SIZE = 200;
+
+export const makeFilesPageURL = (mediaType: Nullable<string>) =>
+  mapConcat(["/api/files/list", mediaType, "page"], "/");
+
+/**
+ * Lists the direct children of a directory page by page, calling `onPage` as
+ * each page arrives, so that the first rows are shown before the whole
+ * directory is listed.
+ *
+ * With a media type, the directory is `dir` relative to the media directory,
+ * otherwise it is the absolute `root_dir`. Stops early once `isCurrent`
+ * returns false, e.g. after the user has opened another directory.
+ */
+export const fetchFilePages = async (
+  mediaType: Nullable<string>,
+  params: FilePageRequest,
+  onPage: (page: FilePageResponseModel) => void,
+  isCurrent: () => boolean = () => true,
+) => {
+  let offset: Nullable<number> = 0;
+
+  while (isNumber(offset) && isCurrent()) {
+    const page: FilePageResponseModel =
+      await appApi.post<FilePageResponseModel>(makeFilesPageURL(mediaType), {
+        ...params,
+        ...(mediaType ? { lazy: true } : {}),
+        offset,
+        limit: FILES_PAGE_SIZE,
+      });
+
+    if (!isCurrent()) {
+      return;
+    }
+
+    onPage(page);
+    offset = page.next_offset;
+  }
+};
+
+/**
+ * Returns all the direct children of the directory `path`, as tree nodes
+ * whose own children are loaded on demand.
+ */
+export const fetchChildNodes = async (
+  mediaType: Nullable<string>,
+  params: FilePageRequest,
+  path: string,
+) => {
+  const children: GroupedFile[] = [];
+
+  await fetchFilePages(
+    mediaType,
+    mediaType ? { ...params, dir: path } : { ...params, root_dir: path },
+    (page) => {
+      children.push(...toLazyTreeNodes(page.data));
+    },
+  );
+
+  return children;
+};
+
 export const makeUploadURL = (mediaType: Nullable<APIMediaType>) =>
   mapConcat(["/api/files/upload", mediaType], "/");
 
+export const makeResumableUploadURL = (mediaType: APIMediaType) =>
+  `/api/files/uploads/${mediaType}`;
+
+export const RESUMABLE_UPLOAD_CHUNK_SIZE = 4 * 1024 * 1024;
+export const RESUMABLE_UPLOAD_MAX_RETRIES = 5;
+
+/**
+ * Uploads the file in chunks through the resumable upload API.
+ *
+ * When a chunk fails because of a network error, a timeout or an offset
+ * conflict, the upload waits, asks the server for the current offset and
+ * continues from there, so a dropped Wi-Fi connection does not restart it
+ * from zero. The session is cancelled on the server if the upload is
+ * cancelled or gives up.
+ */
+export const uploadResumable = async (
+  url: string,
+  file: File,
+  dir?: Nullable<string>,
+  onProgress?: (loaded: number) => void,
+  cancelToken?: CancelToken,
+) => {
+  const session = await appApi.post<UploadSession>(
+    url,
+    { filename: file.name, dir, size: file.size },
+    { cancelToken },
+  );
+  const sessionURL = `${url}/${session.upload_id}`;
+  let offset = session.offset;
+  let failures = 0;
+
+  try {
+    while (offset < file.size) {
+      const start = offset;
+      try {
+        const state = await appApi.patch<UploadSession>(
+          sessionURL,
+          file.slice(start, start + RESUMABLE_UPLOAD_CHUNK_SIZE),
+          {
+            cancelToken,
+            timeout: 60000,
+            headers: {
+              "Content-Type": "application/offset+octet-stream",
+              "Upload-Offset": `${start}`,
+            },
+            onUploadProgress: (progressEvent) => {
+              if (onProgress) {
+                onProgress(start + progressEvent.loaded);
+              }
+            },
+          },
+        );
+        offset = state.offset;
+        failures = 0;
+      } catch (error) {
+        const status = isAxiosError(error) ? error.response?.status : null;
+        if (
+          axios.isCancel(error) ||
+          (status && status !== 409) ||
+          ++failures > RESUMABLE_UPLOAD_MAX_RETRIES
+        ) {
+          throw error;
+        }
+        await wait(1000 * failures);
+        try {
+          offset = (
+            await appApi.get<UploadSession>(sessionURL, { cancelToken })
+          ).offset;
+        } catch (stateError) {
+          if (axios.isCancel(stateError)) {
+            throw stateError;
+          }
+        }
+      }
+    }
+
+    return await appApi.post<UploadFileResult>(
+      `${sessionURL}/finalize`,
+      undefined,
+      { cancelToken },
+    );
+  } catch (error) {
+    appApi.delete(sessionURL).catch(() => undefined);
+    throw error;
+  }
+};
+
 export const makeDownloadURL = (
   fileName: string,
   mediaType: Nullable<APIMediaType>,
@@ -4,6 +4,8 @@ import { ValueLabelOption } from "@/types/common";
 
 export type APIMediaType = "image" | "music" | "data" | "video";
 
+export type ThumbnailSize = "thumbnail" | "preview" | "poster";
+
 export interface FilterField {
   value: Nullable<string>;
   match_mode: FilterMatchMode;
@@ -85,8 +87,34 @@ export interface FileFilterRequest {
   search: SearchModel;
   ordering: OrderingModel;
 }
+
+export interface FilePageResponseModel extends FileResponseModel {
+  total: number;
+  offset: number;
+  next_offset: Nullable<number>;
+}
+
+export interface FilePageRequest {
+  filters?: Partial<FileFilterModel>;
+  search?: SearchModel;
+  ordering?: OrderingModel;
+  dir?: Nullable<string>;
+  root_dir?: Nullable<string>;
+}
 export interface BatchFileStatus {
   success: boolean;
   filename: string;
   error: string | null;
 }
+
+export interface UploadSession {
+  upload_id: string;
+  filename: string;
+  offset: number;
+  size: number;
+}
+
+export interface UploadFileResult {
+  success: boolean;
+  filename: string;
+}
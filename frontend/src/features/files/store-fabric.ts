@@ -9,6 +9,8 @@ import {
   batchMoveFiles,
   renameFile,
   makeDir,
+  fetchFilePages,
+  fetchChildNodes,
 } from "@/features/files/api";
 import type {
   FileResponseModel,
@@ -30,7 +32,9 @@ import {
   getBatchFilesErrorMessage,
   mapConcat,
   expandFileName,
+  toLazyTreeNodes,
 } from "@/features/files/util";
+import { findItemInTree } from "@/features/files/components/util";
 import { retrieveError } from "@/util/error";
 
 export interface State {
@@ -100,8 +104,12 @@ export const makeFileStore = (
   initialState?: Partial<
     Pick<State, "filters" | "filter_info" | "ordering" | "search" | "root_dir">
   >,
-) =>
-  defineStore(name, {
+) => {
+  // Incremented by each fetchData call, so that the pages of a superseded
+  // listing are dropped.
+  let fetchGeneration = 0;
+
+  return defineStore(name, {
     state: (): State => ({
       ...cloneDeep(defaultState),
       ...cloneDeep(initialState),
@@ -125,30 +133,91 @@ export const makeFileStore = (
       async fetchData(rootDir?: string) {
         const messager = useMessagerStore();
         const prevRootDir = this.root_dir;
+        const generation = ++fetchGeneration;
+        const isCurrent = () => generation === fetchGeneration;
+        const params = {
+          dir: this.dir,
+          search: this.search,
+          filters: this.filters,
+          ordering: this.ordering,
+          root_dir: rootDir || this.root_dir,
+        };
         try {
           this.loading = true;
           this.emptyMessage = defaultState["emptyMessage"];
-          const response = await appApi.post<FileResponseModel>(
-            mapConcat(["/api/files/list", scope], "/"),
-            {
-              dir: this.dir,
-              search: this.search,
-              filters: this.filters,
-              ordering: this.ordering,
-              root_dir: rootDir || this.root_dir,
+          if (scope && this.search.value) {
+            // Searching has to look into every subdirectory, so the whole
+            // tree is requested at once.
+            const response = await appApi.post<FileResponseModel>(
+              mapConcat(["/api/files/list", scope], "/"),
+              params,
+            );
+            if (isCurrent()) {
+              this.filter_info = response.filter_info;
+              this.data = response.data;
+              this.dir = response.dir;
+              this.root_dir = response.root_dir;
+            }
+            return;
+          }
+
+          let isFirstPage = true;
+          await fetchFilePages(
+            scope,
+            params,
+            (page) => {
+              const rows = toLazyTreeNodes(page.data);
+              if (isFirstPage) {
+                isFirstPage = false;
+                this.filter_info = page.filter_info;
+                this.data = rows;
+                this.dir = page.dir;
+                this.root_dir = page.root_dir;
+                this.loading = false;
+              } else {
+                this.data = [...this.data, ...rows];
+              }
             },
+            isCurrent,
           );
-          this.filter_info = response.filter_info;
-          this.data = response.data;
-          this.dir = response.dir;
-          this.root_dir = response.root_dir;
         } catch (error) {
+          if (!isCurrent()) {
+            return;
+          }
           messager.handleError(error, "Error fetching data");
           const errMsg = retrieveError(error);
           this.emptyMessage = errMsg.text;
           this.root_dir = prevRootDir;
         } finally {
-          this.loading = false;
+          if (isCurrent()) {
+            this.loading = false;
+          }
+        }
+      },
+
+      async fetchChildren(path: string) {
+        const messager = useMessagerStore();
+        const node = findItemInTree<GroupedFile>("path", path, this.data);
+        if (!node || !node.children || node.children.length > 0) {
+          return;
+        }
+        const generation = fetchGeneration;
+        try {
+          const children = await fetchChildNodes(
+            scope,
+            {
+              search: this.search,
+              filters: this.filters,
+              ordering: this.ordering,
+              root_dir: this.root_dir,
+            },
+            path,
+          );
+          if (generation === fetchGeneration) {
+            node.children = children;
+          }
+        } catch (error) {
+          messager.handleError(error, "Error fetching data");
         }
       },
 
@@ -286,5 +355,6 @@ export const makeFileStore = (
       },
     },
   });
+};
 
 export type FileStore = ReturnType<ReturnType<typeof makeFileStore>>;
@@ -3,6 +3,7 @@ import type {
   BatchFileStatus,
   FilterFieldStringArray,
   FilterFieldDatetime,
+  GroupedFile,
 } from "@/features/files/interface";
 import { Nullable } from "@/util/ts-helpers";
 import { allPass } from "@/util/func";
@@ -112,3 +113,12 @@ export const isDateFilter = (filter: unknown): filter is FilterFieldDatetime =>
   isPlainObject(filter) &&
   Object.hasOwn(filter, "constraints") &&
   Array.isArray(filter.constraints);
+
+/**
+ * Gives the non-empty directories of a one-level listing an empty `children`
+ * array, so that they can be expanded and their children loaded on demand.
+ */
+export const toLazyTreeNodes = (files: GroupedFile[]): GroupedFile[] =>
+  files.map((file) =>
+    file.is_dir && file.children_count ? { ...file, children: [] } : file,
+  );
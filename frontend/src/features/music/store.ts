@@ -21,6 +21,11 @@ export interface MusicPlayerInfo {
   is_playing: boolean;
   duration: number;
   mode: MusicMode;
+  /**
+   * Seconds the position advances per second after the state was sent: the
+   * server only publishes changes, so the position is advanced locally.
+   */
+  rate?: number;
 }
 
 export interface PlayMusicResponse {
@@ -51,6 +56,7 @@ const defaultState: State = {
     position: 0.0,
     is_playing: false,
     duration: 0.0,
+    rate: 0.0,
   },
 };
 
@@ -27,6 +27,7 @@ export const defaultKeybindinds: Partial<
   slowdown: ["Space"],
   takePhoto: ["t"],
   toggleAvoidObstaclesMode: ["O"],
+  toggleFollowTargetMode: ["G"],
   toggleCarModelView: ["M"],
   toggleSpeedometerView: ["N"],
   toggleTextInfo: ["I"],
@@ -75,6 +76,7 @@ export const commandLabels: Record<string, string> = {
   increaseQuality: "Increase Video Quality",
   decreaseQuality: "Decrease Video Quality",
   toggleAvoidObstaclesMode: "Toggle Avoid Obstacles Mode",
+  toggleFollowTargetMode: "Toggle Follow Target Mode",
   toggleCalibration: "Toggle Calibration Mode",
   increaseFPS: "Increase FPS",
   decreaseFPS: "Decrease FPS",
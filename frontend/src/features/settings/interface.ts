@@ -73,6 +73,7 @@ export interface Robot {
   max_speed: number;
   auto_measure_distance_mode: boolean;
   auto_measure_distance_delay_ms: number;
+  state_broadcast_rate_hz?: number;
 }
 
 export interface TTS {
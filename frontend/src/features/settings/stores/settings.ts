@@ -70,6 +70,7 @@ export const defaultState: State = {
       max_speed: 80,
       auto_measure_distance_mode: false,
       auto_measure_distance_delay_ms: 1000,
+      state_broadcast_rate_hz: 10,
     },
 
     camera: { ...defaultCameraState.data },
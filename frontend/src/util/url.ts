@@ -3,6 +3,7 @@
  *
  * @param path - The path to append to the base URL.
  * @param port - (Optional) The port to use for the WebSocket connection. If not provided, the default port is used.
+ * @param params - (Optional) The query parameters of the URL.
  * @returns The constructed WebSocket URL as a string.
  *
  * @example
@@ -12,8 +13,15 @@
  *
  * const secureWsUrl = makeWebsocketUrl('/secure-api/socket', 443);
  * console.log(secureWsUrl); // wss://localhost:443/secure-api/socket
+ *
+ * const audioUrl = makeWebsocketUrl('/api/ws/audio', undefined, { codec: 'opus' });
+ * console.log(audioUrl); // ws://localhost/api/ws/audio?codec=opus
  */
-export const makeWebsocketUrl = (path: string, port?: number) => {
+export const makeWebsocketUrl = (
+  path: string,
+  port?: number,
+  params?: Record<string, string | number>,
+) => {
   const protocol = window.location.protocol === "https:" ? "wss:" : "ws:";
   const baseUrl = new URL(window.location.href);
   baseUrl.protocol = protocol;
@@ -23,6 +31,12 @@ export const makeWebsocketUrl = (path: string, port?: number) => {
     baseUrl.port = `${port}`;
   }
 
+  if (params) {
+    baseUrl.search = new URLSearchParams(
+      Object.entries(params).map(([key, value]) => [key, `${value}`]),
+    ).toString();
+  }
+
   return baseUrl.toString();
 };
 